@@ -0,0 +1,49 @@
+"""Benchmark of the AirwayDatabase expanding an ATS route between an entry and exit point. The same
+segment length is expanded on airways of increasing length to show the cost depends only on the segment
+length; expansions are timed with and without the expansion cache.
+
+Run from the repository root: python -m Benchmarks.BenchmarkAirwayExpansion"""
+from Benchmarks.MessageCorpus import time_it
+from F15_Parser.AirwayDatabase import AirwayDatabase
+
+AIRWAY_LENGTHS: [int] = [100, 10000, 1000000]
+"""The number of points on each benchmarked airway"""
+
+SEGMENT_LENGTHS: [int] = [2, 10, 50]
+"""The number of points between the entry and exit point of each benchmarked expansion"""
+
+
+def create_airway(length):
+    # type: (int) -> AirwayDatabase
+    """Creates an airway database with one airway of a given length."""
+    database = AirwayDatabase()
+    for idx in range(0, length):
+        designator = "".join(chr(65 + (idx // 26 ** digit) % 26) for digit in range(0, 5))
+        database.add_point("UL607", designator, 40.0 + idx * 1e-5, 10.0 + idx * 1e-5)
+    return database
+
+
+def run():
+    print("{0:<14}{1:>10}{2:>14}{3:>12}".format("Airway points", "Segment", "Uncached ns", "Cached ns"))
+    for airway_length in AIRWAY_LENGTHS:
+        database = create_airway(airway_length)
+        points = database.get_airway("UL607")
+        for segment_length in SEGMENT_LENGTHS:
+            entry = points[airway_length // 4]
+            exit_point = points[airway_length // 4 + segment_length]
+
+            def uncached():
+                database.expansions.clear()
+                database.expand("UL607", entry, exit_point)
+
+            def cached():
+                database.expand("UL607", entry, exit_point)
+
+            uncached_time = time_it(uncached, 20000)
+            cached_time = time_it(cached, 20000)
+            print("{0:<14}{1:>10}{2:>14.0f}{3:>12.0f}".format(
+                airway_length, segment_length, uncached_time * 1e9, cached_time * 1e9))
+
+
+if __name__ == "__main__":
+    run()
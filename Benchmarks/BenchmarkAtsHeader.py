@@ -0,0 +1,41 @@
+"""Benchmark of the ATS message header parser, parsing headers with 1, 8, 64 and 512 addressees
+and additional addressees; the time per addressee should stay flat as the header grows.
+
+Run from the repository root: python -m Benchmarks.BenchmarkAtsHeader"""
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Benchmarks.MessageCorpus import time_it
+
+ADDRESSEE_COUNTS: [int] = [1, 8, 64, 512]
+"""The number of addressees and additional addressees in the headers parsed"""
+
+REPEAT: int = 200
+"""The number of times each header is parsed per run"""
+
+
+def make_header(addressees):
+    # type: (int) -> str
+    """Returns a multi line ATS header with the given number of addressees and additional addressees."""
+    addresses = " ".join(["EG{0:04d}ZX".format(index % 10000).replace("0", "A") for index in range(addressees)])
+    return "FF " + addresses + "\r\n121212 LOWWZPZX\r\n" + addresses + "\r\n"
+
+
+def parse(message_parser, header):
+    # type: (ParseMessage, str) -> None
+    """Parses an ATS header into a new flight plan record."""
+    fpr = FlightPlanRecord()
+    fpr.set_message_header(header)
+    message_parser.parse_ats_header(fpr)
+
+
+def run():
+    message_parser = ParseMessage()
+    print("{0:<12}{1:>14}{2:>18}".format("Addressees", "Header us", "Per addressee us"))
+    for addressees in ADDRESSEE_COUNTS:
+        header = make_header(addressees)
+        parsed = time_it(lambda: parse(message_parser, header), REPEAT)
+        print("{0:<12}{1:>14.1f}{2:>18.2f}".format(addressees, parsed * 1e6, parsed * 1e6 / addressees))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""Benchmark of deferred geodesy, comparing the bearing / distance and point / bearing / distance
+calculations performed one pair at a time by geographiclib with the vectorised calculations performed
+by VectorGeodesy, and parsing routes with the calculations performed while parsing with parsing in
+deferred geodesy mode followed by a single GeodesyBatch.compute(). Requires NumPy.
+
+Run from the repository root: python -m Benchmarks.BenchmarkBatchGeodesy"""
+import random
+
+from Benchmarks.MessageCorpus import time_it
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Utilities.BatchGeodesy import GeodesyBatch, VectorGeodesy
+from Utilities.Utils import Utils
+
+NUMBER_OF_PAIRS: [int] = [1000, 10000, 100000]
+"""The number of point pairs calculated in each run"""
+
+NUMBER_OF_MESSAGES: int = 2000
+"""The number of messages parsed in deferred geodesy mode before the batch is computed"""
+
+
+def create_messages(number_of_messages):
+    # type: (int) -> [str]
+    """Creates FPL messages whose field 15 contains lat/long and point / bearing / distance points."""
+    generator = random.Random(1)
+    messages = []
+    for idx in range(0, number_of_messages):
+        points = ["{0:02d}{1:02d}N{2:03d}{3:02d}E".format(generator.randrange(40, 60), generator.randrange(0, 60),
+                                                         generator.randrange(0, 30), generator.randrange(0, 60))
+                  for _ in range(0, 20)]
+        points[10] = points[10] + "{0:03d}{1:03d}".format(generator.randrange(0, 360), generator.randrange(1, 200))
+        messages.append("(FPL-TEST{0:04d}-IS-B738/M-S/C-LOWW0800-N0450F350 ".format(idx % 10000) +
+                        " ".join(points) + "-EKCH0200-0)")
+    return messages
+
+
+def parse_messages(parser, messages):
+    # type: (ParseMessage, [str]) -> None
+    """Parses the messages, computing the geodesy batch if the parser has one."""
+    for message in messages:
+        parser.parse_message(FlightPlanRecord(), message)
+    if parser.get_geodesy_batch() is not None:
+        parser.get_geodesy_batch().compute()
+
+
+def run():
+    generator = random.Random(1)
+    utils = Utils()
+    print("{0:<10}{1:>18}{2:>18}{3:>18}{4:>18}".format(
+        "Pairs", "Inverse loop ms", "Inverse batch ms", "Direct loop ms", "Direct batch ms"))
+    for number_of_pairs in NUMBER_OF_PAIRS:
+        pairs = [(generator.uniform(40, 60), generator.uniform(-10, 30), generator.uniform(40, 60),
+                  generator.uniform(-10, 30)) for _ in range(0, number_of_pairs)]
+        columns = list(zip(*pairs))
+        projections = [(pair[0], pair[1], generator.uniform(0, 360), generator.uniform(1000, 400000)) for pair in pairs]
+        projection_columns = list(zip(*projections))
+        repeat = max(1, 10000 // number_of_pairs)
+        inverse_loop = time_it(lambda: [utils.get_bearing_distance_between_points(*pair) for pair in pairs], repeat)
+        inverse_batch = time_it(lambda: VectorGeodesy.inverse(*columns), repeat)
+        direct_loop = time_it(lambda: [utils.get_bearing_distance_projected_point(*projection)
+                                       for projection in projections], repeat)
+        direct_batch = time_it(lambda: VectorGeodesy.direct(*projection_columns), repeat)
+        print("{0:<10}{1:>18.1f}{2:>18.1f}{3:>18.1f}{4:>18.1f}".format(
+            number_of_pairs, inverse_loop * 1e3, inverse_batch * 1e3, direct_loop * 1e3, direct_batch * 1e3))
+
+    messages = create_messages(NUMBER_OF_MESSAGES)
+    immediate_parser = ParseMessage()
+    deferred_parser = ParseMessage()
+    deferred_parser.set_geodesy_batch(GeodesyBatch())
+    immediate = time_it(lambda: parse_messages(immediate_parser, messages), 1)
+    deferred = time_it(lambda: parse_messages(deferred_parser, messages), 1)
+    print("Parse {0} messages of 20 points: calculated while parsing {1:.0f} ms, deferred {2:.0f} ms".format(
+        NUMBER_OF_MESSAGES, immediate * 1e3, deferred * 1e3))
+
+
+if __name__ == "__main__":
+    run()
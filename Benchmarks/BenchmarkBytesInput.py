@@ -0,0 +1,76 @@
+"""Benchmark of end to end throughput parsing messages from a binary stream, (e.g. as received from
+an AFTN interface), comparing decoding each message to a string before parsing, (and encoding it
+again for archiving), with passing the message bytes straight to the parser.
+
+Run from the repository root: python -m Benchmarks.BenchmarkBytesInput"""
+import time
+
+from Benchmarks.MessageCorpus import FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Tokenizer.Tokenize import Tokenize
+
+ETX = b"\x03"
+"""Message separator in the binary stream"""
+
+
+def with_decode(parser, stream, archive):
+    # type: (ParseMessage, bytes, list) -> None
+    for message in memoryview(stream).tobytes().split(ETX)[:-1]:
+        fpr = FlightPlanRecord()
+        text = message.decode("ascii")
+        parser.parse_message(fpr, text)
+        archive.append(fpr.get_message_complete().encode("ascii"))
+
+
+def without_decode(parser, stream, archive):
+    # type: (ParseMessage, bytes, list) -> None
+    view = memoryview(stream)
+    start = 0
+    end = stream.find(ETX, start)
+    while end > -1:
+        fpr = FlightPlanRecord()
+        parser.parse_message(fpr, view[start:end])
+        archive.append(fpr.get_message_bytes())
+        start = end + 1
+        end = stream.find(ETX, start)
+
+
+def tokenize(text):
+    # type: (str | bytes) -> None
+    tokenizer = Tokenize()
+    tokenizer.set_whitespace("()-\r\n\t")
+    tokenizer.set_string_to_tokenize(text)
+    tokenizer.tokenize()
+
+
+def run():
+    parser = ParseMessage()
+    messages = (FPL_MESSAGES + CPL_MESSAGES + CHG_MESSAGES) * 25
+    stream = ETX.join([message.encode("ascii") for message in messages]) + ETX
+
+    print("Stream: " + str(len(messages)) + " messages, " + str(len(stream)) + " bytes")
+    print("{0:<18}{1:>14}{2:>14}".format("Path", "Messages / s", "MB / s"))
+    for name, function in (("decode to str", with_decode), ("bytes input", without_decode)):
+        best = None
+        for _ in range(3):
+            archive = []
+            start = time.perf_counter()
+            function(parser, stream, archive)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print("{0:<18}{1:>14.1f}{2:>14.3f}".format(name, len(messages) / best, len(stream) / best / 1e6))
+
+    # Tokenizer on its own, str loop versus bytes
+    print("{0:<18}{1:>14}".format("Tokenizer", "Messages / s"))
+    for name, data in (("str", messages), ("bytes", [message.encode("ascii") for message in messages])):
+        start = time.perf_counter()
+        for _ in range(5):
+            for item in data:
+                tokenize(item)
+        elapsed = time.perf_counter() - start
+        print("{0:<18}{1:>14.1f}".format(name, 5 * len(data) / elapsed))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,81 @@
+"""Benchmark comparing the memory used to store extracted route sequences as ExtractedRouteSequence
+instances and as ColumnarRouteSequence instances, together with the time to convert between them and
+to read a record member. Memory sizes include all objects reachable from the stored routes, strings
+shared between routes are counted once.
+
+Run from the repository root: python -m Benchmarks.BenchmarkColumnarRoute"""
+import sys
+from array import array
+
+from Benchmarks.BenchmarkF15Iterative import create_route
+from Benchmarks.MessageCorpus import time_it
+from F15_Parser.ColumnarRouteSequence import ColumnarRouteSequence
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+NUMBER_OF_ROUTES: int = 1000
+"""The number of routes stored"""
+
+ROUTE_ELEMENTS: [int] = [10, 50, 200]
+"""The number of field 15 elements in the stored routes"""
+
+
+def deep_size(value, seen):
+    # type: (object, set) -> int
+    """Gets the memory size of an object and all objects reachable from it not already in 'seen'."""
+    if id(value) in seen or isinstance(value, type):
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif not isinstance(value, (str, bytes, int, float, array)):
+        if hasattr(value, "__dict__"):
+            size += deep_size(value.__dict__, seen)
+        for slot in getattr(type(value), "__slots__", ()):
+            size += deep_size(getattr(value, slot), seen)
+    return size
+
+
+def run():
+    parser = ParseMessage()
+    print("{0:<10}{1:>16}{2:>18}{3:>8}{4:>14}{5:>12}{6:>14}{7:>14}".format(
+        "Elements", "ERS bytes/route", "Columnar b/route", "Ratio", "From ERS us", "To ERS us",
+        "ERS get ns", "View get ns"))
+    for elements in ROUTE_ELEMENTS:
+        routes = []
+        for idx in range(0, NUMBER_OF_ROUTES):
+            # Vary the routes so not all strings are shared
+            f15 = create_route(elements).replace("UL", "UL" + str(idx % 50))
+            flight_plan_record = FlightPlanRecord()
+            parser.parse_message(flight_plan_record, "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-" + f15 + "-EKCH0200-0)")
+            routes.append(flight_plan_record.get_extracted_route())
+
+        columnar = [ColumnarRouteSequence.from_ers(ers) for ers in routes]
+        ers_size = deep_size(routes, set()) / NUMBER_OF_ROUTES
+        columnar_size = deep_size(columnar, set()) / NUMBER_OF_ROUTES
+
+        def from_ers():
+            ColumnarRouteSequence.from_ers(routes[0])
+
+        def to_ers():
+            columnar[0].to_ers()
+
+        record = routes[0].get_element_at(2)
+        view = columnar[0].get_element_at(2)
+
+        def ers_get():
+            record.get_speed_si()
+
+        def view_get():
+            view.get_speed_si()
+
+        print("{0:<10}{1:>16.0f}{2:>18.0f}{3:>8.1f}{4:>14.1f}{5:>12.1f}{6:>14.0f}{7:>14.0f}".format(
+            elements, ers_size, columnar_size, ers_size / columnar_size, time_it(from_ers, 200) * 1e6,
+            time_it(to_ers, 200) * 1e6, time_it(ers_get, 100000) * 1e9, time_it(view_get, 100000) * 1e9))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,50 @@
+"""Benchmark of the consistency rule engine, checking parsed messages with the default rules and with
+further rules registered for other message titles, which must not slow the check of the default titles.
+
+Run from the repository root: python -m Benchmarks.BenchmarkConsistency"""
+from Configuration.EnumerationConstants import MessageTitles, FieldIdentifiers, ErrorId
+from IcaoMessageParser.ConsistencyRules import ConsistencyRules, ConsistencyRule
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Benchmarks.MessageCorpus import time_it, FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES
+
+MESSAGES: [str] = FPL_MESSAGES + CPL_MESSAGES + [
+    "(FPL-TEST09-IS-ZZZZ/M-RSZ/C-ZZZZ0800-N0450F350 AAA B9 BBB-ZZZZ0200-PBN/B2C4O1S2 RMK/X)"]
+"""The messages checked, with and without consistency errors"""
+
+REPEAT: int = 200
+"""The number of times the messages are checked per run"""
+
+
+def check_messages(parser, records):
+    # type: (ParseMessage, [(FlightPlanRecord, int)]) -> None
+    """Checks the parsed messages, discarding the errors added by the check."""
+    for flight_plan_record, number_of_errors in records:
+        parser.consistency_check(flight_plan_record)
+        del flight_plan_record.get_erroneous_fields()[number_of_errors:]
+
+
+def run():
+    parser = ParseMessage()
+    records = []
+    for message in MESSAGES + CHG_MESSAGES:
+        flight_plan_record = FlightPlanRecord()
+        parser.parse_message(flight_plan_record, message)
+        records.append((flight_plan_record, len(flight_plan_record.get_erroneous_fields())))
+
+    # A deployment registering rules for titles without default rules
+    extended_parser = ParseMessage()
+    extended_rules = ConsistencyRules()
+    for title in (MessageTitles.CHG, MessageTitles.DLA, MessageTitles.CNL, MessageTitles.ARR):
+        extended_rules.register_rule(ConsistencyRule({title}, (FieldIdentifiers.F7,), lambda facts: True,
+                                                     "", ErrorId.CONSISTENCY_F9B_TYP))
+    extended_parser.set_consistency_rules(extended_rules)
+
+    print("{0:<24}{1:>16}".format("Rules", "us/message"))
+    for name, message_parser in (("Default", parser), ("Further titles", extended_parser)):
+        duration = time_it(lambda: check_messages(message_parser, records), REPEAT) / len(records)
+        print("{0:<24}{1:>16.2f}".format(name, duration * 1e6))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""Benchmark of the field 15 parser comparing the recursive ParseF15 with the table driven
+ParseF15Iterative for routes of increasing length. The recursive parser needs a raised recursion
+limit for the longer routes, the iterative parser does not.
+
+Run from the repository root: python -m Benchmarks.BenchmarkF15Iterative"""
+import sys
+
+from Benchmarks.MessageCorpus import time_it
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15ParseIterative import ParseF15Iterative
+from Tokenizer.Tokenize import Tokenize
+
+ROUTE_ELEMENTS: [int] = [50, 200, 1000, 5000]
+"""The number of field 15 elements in each benchmarked route"""
+
+
+def create_route(elements):
+    # type: (int) -> str
+    """Creates a field 15 with a given number of elements, points alternate with ATS routes,
+    DCT's and speed / level changes."""
+    f15 = ["N0450F350"]
+    for idx in range(0, elements - 1):
+        point = "".join(chr(65 + (idx // 26 ** digit) % 26) for digit in range(0, 4))
+        match idx % 4:
+            case 0 | 2:
+                f15.append(point)
+            case 1:
+                f15.append("UL" + str(idx % 999))
+            case 3:
+                f15.append("DCT" if idx % 8 == 3 else "B9")
+    return " ".join(f15) + " KOK/N0460F370"
+
+
+def run():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 50000))
+    print("{0:<10}{1:>16}{2:>16}{3:>10}".format("Elements", "Recursive us", "Iterative us", "Speedup"))
+    try:
+        for elements in ROUTE_ELEMENTS:
+            tokenizer = Tokenize()
+            tokenizer.set_string_to_tokenize(create_route(elements))
+            tokenizer.set_whitespace(" /\n\t\r")
+            tokenizer.tokenize()
+            tokens = tokenizer.get_tokens()
+
+            def recursive():
+                ParseF15().parse_f15(ExtractedRouteSequence(), tokens)
+
+            def iterative():
+                ParseF15Iterative().parse_f15(ExtractedRouteSequence(), tokens)
+
+            repeat = max(1, 2000 // elements)
+            recursive_time = time_it(recursive, repeat)
+            iterative_time = time_it(iterative, repeat)
+            print("{0:<10}{1:>16.1f}{2:>16.1f}{3:>10.2f}".format(
+                elements, recursive_time * 1e6, iterative_time * 1e6, recursive_time / iterative_time))
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+if __name__ == "__main__":
+    run()
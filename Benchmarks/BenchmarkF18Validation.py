@@ -0,0 +1,66 @@
+"""Benchmark of the field 18 and 19 subfield validation, parsing fields with many keywords and
+validating the subfields saved by the compound field parser with the validator tables.
+
+Run from the repository root: python -m Benchmarks.BenchmarkF18Validation"""
+from Configuration.EnumerationConstants import FieldIdentifiers
+from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from Configuration.SubFieldsInFields import SubFieldsInFields
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseF18 import ParseF18
+from IcaoMessageParser.ParseF19 import ParseF19
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Benchmarks.MessageCorpus import time_it
+
+F18_FIELDS: {str: str} = {
+    "Few keywords": "DOF/230101 REG/GABCD RMK/TCAS",
+    "Many keywords": "PBN/A1B1C1D1L1O1S2 NAV/GPS DAT/V COM/TCAS DOF/230101 REG/GABCD "
+                     "EET/EBUR0030 EHAA0045 EDVV0100 EDWW0115 EKDK0130 ESAA0145 "
+                     "SEL/ABCD TYP/2B738 C172 CODE/ABC123 DLE/LNZ0030 OPR/BAW ORGN/EGLLZPZX PER/C "
+                     "ALTN/EGLL RALT/EGKK TALT/EDDM RIF/DCT LNZ EGLL RMK/TCAS EQUIPPED STS/HAZMAT FFR "
+                     "RVR/200 RFP/Q2 AWR/R4 SRC/FPL SUR/RSP180 IFP/ERRTYPE NON833",
+    "Many errors": "PBN/A1X9 DOF/231301 EET/EBUR0099 EH0045 X9 SEL/AB1 TYP/2B CODE/XYZ DLE/LNZ9999 "
+                   "PER/Z STS/NONE RVR/2000 RFP/Q0 AWR/R SRC/X IFP/ERR ORGN/EGLL",
+}
+"""Field 18 strings with few and many keywords, with and without errors"""
+
+F19_FIELD: str = "E/0200 P/150 R/VE S/M J/L D/2 10 C YELLOW A/WHITE BLUE N/NONE C/SMITH"
+"""A field 19 string containing all keywords"""
+
+MESSAGE: str = "(FPL-TEST01-IS-A320/M-DE2E3FGHIJ1ORWY/LB1-EGLL1200-N0450F350 DVR L9 KONAN-EHAM0100-" + \
+               F18_FIELDS["Many keywords"] + "-" + F19_FIELD + ")"
+"""An FPL with many field 18 and all field 19 keywords"""
+
+REPEAT: int = 1000
+"""The number of times each field is parsed per run"""
+
+
+def parse(parser, field_identifier, text, sfif, sfd):
+    # type: (type, FieldIdentifiers, str, SubFieldsInFields, SubFieldDescriptions) -> ParseF18 | ParseF19
+    """Parses a field into a new flight plan record."""
+    fpr = FlightPlanRecord()
+    fpr.add_icao_field(field_identifier, text, 0, len(text))
+    field_parser = parser(fpr, sfif, sfd)
+    field_parser.parse_field()
+    return field_parser
+
+
+def run():
+    sfif = SubFieldsInFields()
+    sfd = SubFieldDescriptions()
+    print("{0:<16}{1:>10}{2:>14}{3:>16}".format("Field", "Keywords", "Parse us", "Validate us"))
+    fields = [(name, ParseF18, FieldIdentifiers.F18, text) for name, text in F18_FIELDS.items()]
+    fields.append(("Field 19", ParseF19, FieldIdentifiers.F19, F19_FIELD))
+    for name, parser, field_identifier, text in fields:
+        field_parser = parse(parser, field_identifier, text, sfif, sfd)
+        keywords = len(field_parser.get_flight_plan_record().get_icao_field(field_identifier).get_subfield_dictionary())
+        parsed = time_it(lambda: parse(parser, field_identifier, text, sfif, sfd), REPEAT)
+        validated = time_it(field_parser.validate_subfields, REPEAT)
+        print("{0:<16}{1:>10}{2:>14.1f}{3:>16.1f}".format(name, keywords, parsed * 1e6, validated * 1e6))
+
+    message_parser = ParseMessage()
+    parsed = time_it(lambda: message_parser.parse_message(FlightPlanRecord(), MESSAGE), REPEAT)
+    print("Parse an FPL with many field 18 and 19 keywords: {0:.0f} us".format(parsed * 1e6))
+
+
+if __name__ == "__main__":
+    run()
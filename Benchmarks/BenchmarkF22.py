@@ -0,0 +1,51 @@
+"""Benchmark of the field 22 parser, parsing a field 22 with a single subfield and with 15 subfields,
+with and without errors, and CHG messages containing them.
+
+Run from the repository root: python -m Benchmarks.BenchmarkF22"""
+from Configuration.EnumerationConstants import FieldIdentifiers
+from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from Configuration.SubFieldsInFields import SubFieldsInFields
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseF22 import ParseF22
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Benchmarks.MessageCorpus import time_it
+
+F22_FIELDS: {str: str} = {
+    "1 subfield": "16/EGFF0130",
+    "15 subfields": "3/FPL-5/INCERFA/EGLLZZZZ/LAST CONTACT-7/TEST01/A1234-8/IS-9/B738/M-10/SDE3FGHIJ1RWY/LB1-"
+                    "13/LOWW0800-14/LNZ/1200F350F310A-15/N0450F350 PNT B9 LNZ-16/EGFF0130 EGGW-17/EGLL1200-"
+                    "18/DOF/221212 RMK/TCAS-19/E/0300 P/3-20/OPS PILOT 1200 121.5 LNZ RESCUE FUEL NIL-"
+                    "21/1200 121.5 LNZ 1300 ALL NIL",
+    "15 with errors": "3/FPLX-5/INCERFA/EGLLZZZZ/LAST CONTACT-7/TEST01/A123X-8/XS-9/B738/Q-10/SDE3FGHIJ1RWY/LB1-"
+                      "13/LOWW08-14/LNZ/1200F350F310A-15/N0450F350 PNT F*F LNZ-16/EGFF0130 EGGW-17/EGLL1200-"
+                      "18/DOF/221312 RMK/TCAS-19/E/0399 P/3-20/OPS PILOT 1200 121.5 LNZ RESCUE FUEL NIL-"
+                      "21/1200 121.5 LNZ 1300 ALL NIL",
+}
+"""Field 22 strings with a single subfield and 15 subfields, with and without errors"""
+
+REPEAT: int = 500
+"""The number of times each field is parsed per run"""
+
+
+def parse(text, sfif, sfd):
+    # type: (str, SubFieldsInFields, SubFieldDescriptions) -> None
+    """Parses a field 22 into a new flight plan record."""
+    fpr = FlightPlanRecord()
+    fpr.add_icao_field(FieldIdentifiers.F22, text, 0, len(text))
+    ParseF22(fpr, sfif, sfd).parse_field()
+
+
+def run():
+    sfif = SubFieldsInFields()
+    sfd = SubFieldDescriptions()
+    message_parser = ParseMessage()
+    print("{0:<18}{1:>14}{2:>14}".format("Field 22", "Field us", "CHG us"))
+    for name, text in F22_FIELDS.items():
+        message = "(CHG-TEST01-EGLL0800-LOWW0200-221012-" + text + ")"
+        field = time_it(lambda: parse(text, sfif, sfd), REPEAT)
+        chg = time_it(lambda: message_parser.parse_message(FlightPlanRecord(), message), REPEAT)
+        print("{0:<18}{1:>14.1f}{2:>14.1f}".format(name, field * 1e6, chg * 1e6))
+
+
+if __name__ == "__main__":
+    run()
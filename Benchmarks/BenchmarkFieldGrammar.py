@@ -0,0 +1,69 @@
+"""Benchmark of the basic field parsers, comparing well-formed fields parsed with a single match of the
+compiled field grammar with the same fields tokenized and parsed subfield by subfield, and parsing the
+message corpus with and without the field grammars.
+
+Run from the repository root: python -m Benchmarks.BenchmarkFieldGrammar"""
+import importlib
+
+from Benchmarks.MessageCorpus import FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES, time_it
+from Configuration.EnumerationConstants import FieldIdentifiers
+from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from Configuration.SubFieldsInFields import SubFieldsInFields
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+FIELDS: {str: str} = {
+    "F3": "FPLAA/BB001CC/DD002",
+    "F5": "INCERFA/EGLLZZZZ/LAST CONTACT 1200",
+    "F7": "TEST01/A1234",
+    "F8": "IS",
+    "F9": "2B738/M",
+    "F10": "SDE3FGHIJ1J2J3J4J5RWXY/LB1D1",
+    "F13": "LOWW0800",
+    "F14": "LNZ/1200F350F310A",
+    "F16": "EKCH0200 EDDF EDDM",
+    "F17": "EGLL1200 LAST CONTACT",
+    "F20": "OPS PILOT 1200 121.5 LNZ RESCUE FUEL NIL",
+    "F21": "1200 121.5 LNZ 1300 ALL NIL",
+    "F80": "S",
+    "F81": "W/EQ/Y",
+}
+"""A well-formed field for each basic field parser, keyed on the field identifier name"""
+
+REPEAT: int = 2000
+"""The number of times each field is parsed per run"""
+
+
+def parse(parser, sfif, sfd, field, text):
+    # type: (type, SubFieldsInFields, SubFieldDescriptions, str, str) -> None
+    """Parses a field into a new flight plan record."""
+    fpr = FlightPlanRecord()
+    fpr.add_icao_field(FieldIdentifiers[field], text, 0, len(text))
+    parser(fpr, sfif, sfd).parse_field()
+
+
+def run():
+    sfif = SubFieldsInFields()
+    sfd = SubFieldDescriptions()
+    print("{0:<8}{1:>18}{2:>18}{3:>10}".format("Field", "Subfields us", "Grammar us", "Speedup"))
+    for field, text in FIELDS.items():
+        parser = getattr(importlib.import_module("IcaoMessageParser.Parse" + field), "Parse" + field)
+        subfield_parser = type("Subfield" + parser.__name__, (parser,), {"FIELD_GRAMMAR": None})
+        subfields = time_it(lambda: parse(subfield_parser, sfif, sfd, field, text), REPEAT)
+        grammar = time_it(lambda: parse(parser, sfif, sfd, field, text), REPEAT)
+        print("{0:<8}{1:>18.1f}{2:>18.1f}{3:>9.1f}x".format(field, subfields * 1e6, grammar * 1e6, subfields / grammar))
+
+    messages = FPL_MESSAGES + CPL_MESSAGES + CHG_MESSAGES
+    parser = ParseMessage()
+    grammar = time_it(lambda: [parser.parse_message(FlightPlanRecord(), message) for message in messages], 200)
+    compiled = dict(ParseFieldsCommon.COMPILED_FIELD_GRAMMARS)
+    ParseFieldsCommon.COMPILED_FIELD_GRAMMARS.update(dict.fromkeys(compiled))
+    subfields = time_it(lambda: [parser.parse_message(FlightPlanRecord(), message) for message in messages], 200)
+    ParseFieldsCommon.COMPILED_FIELD_GRAMMARS.update(compiled)
+    print("Parse {0} messages: subfield by subfield {1:.0f} us, field grammars {2:.0f} us per message".format(
+        len(messages), subfields * 1e6 / len(messages), grammar * 1e6 / len(messages)))
+
+
+if __name__ == "__main__":
+    run()
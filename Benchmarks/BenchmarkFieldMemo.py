@@ -0,0 +1,43 @@
+"""Benchmark of the field memo, comparing parsing a corpus of messages whose basic fields repeat
+with and without the subfields and errors of repeated fields rebuilt from a FieldMemo, and printing
+the hit rate per field.
+
+Run from the repository root: python -m Benchmarks.BenchmarkFieldMemo"""
+from Benchmarks.MessageCorpus import FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES, time_it
+from IcaoMessageParser.FieldMemo import FieldMemo
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+MESSAGES: [str] = FPL_MESSAGES + CPL_MESSAGES + CHG_MESSAGES
+"""The messages parsed per run"""
+
+REPEAT: int = 200
+"""The number of times the messages are parsed per run"""
+
+
+def parse_all(parser):
+    # type: (ParseMessage) -> None
+    for message in MESSAGES:
+        parser.parse_message(FlightPlanRecord(), message)
+
+
+def run():
+    parser = ParseMessage()
+    parser.compile_parse_plans()
+    memo = FieldMemo()
+    parser_with_memo = ParseMessage()
+    parser_with_memo.set_field_memo(memo)
+    without_memo = time_it(lambda: parse_all(parser), REPEAT)
+    with_memo = time_it(lambda: parse_all(parser_with_memo), REPEAT)
+    print("{0:<24}{1:>12.1f} us per message".format("Without memo", without_memo * 1e6 / len(MESSAGES)))
+    print("{0:<24}{1:>12.1f} us per message".format("With memo", with_memo * 1e6 / len(MESSAGES)))
+    print("{0:<24}{1:>11.1f}x".format("Speedup", without_memo / with_memo))
+    print()
+    print("{0:<12}{1:>12}{2:>12}{3:>12}".format("Field", "Hits", "Misses", "Hit rate"))
+    for field_identifier, (hits, misses, hit_rate) in sorted(memo.get_statistics().items(),
+                                                           key=lambda item: item[0].value):
+        print("{0:<12}{1:>12}{2:>12}{3:>11.1%}".format(field_identifier.name, hits, misses, hit_rate))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,40 @@
+"""Benchmark of the geodesy backends, comparing the ellipsoidal geographiclib calculations with the
+spherical approximation for the bearing / distance between points and point / bearing / distance
+projections, and parsing messages with each backend selected.
+
+Run from the repository root: python -m Benchmarks.BenchmarkGeodesyBackends"""
+import random
+
+from Benchmarks.BenchmarkBatchGeodesy import create_messages, parse_messages
+from Benchmarks.MessageCorpus import time_it
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Utilities.GeodesyBackends import EllipsoidalGeodesy, SphericalGeodesy
+
+NUMBER_OF_PAIRS: int = 10000
+"""The number of point pairs calculated in each run"""
+
+NUMBER_OF_MESSAGES: int = 500
+"""The number of messages parsed with each backend"""
+
+
+def run():
+    generator = random.Random(1)
+    pairs = [(generator.uniform(40, 60), generator.uniform(-10, 30), generator.uniform(40, 60),
+              generator.uniform(-10, 30)) for _ in range(0, NUMBER_OF_PAIRS)]
+    projections = [(pair[0], pair[1], generator.uniform(0, 360), generator.uniform(1000, 400000)) for pair in pairs]
+    messages = create_messages(NUMBER_OF_MESSAGES)
+    print("{0:<20}{1:>14}{2:>14}{3:>20}".format("Backend", "Inverse us", "Direct us", "Parse message us"))
+    for backend in [EllipsoidalGeodesy(), SphericalGeodesy()]:
+        inverse = time_it(lambda: [backend.get_bearing_distance_between_points(*pair) for pair in pairs], 1)
+        direct = time_it(lambda: [backend.get_bearing_distance_projected_point(*projection)
+                                  for projection in projections], 1)
+        parser = ParseMessage()
+        parser.set_geodesy_backend(backend)
+        parse = time_it(lambda: parse_messages(parser, messages), 1)
+        print("{0:<20}{1:>14.2f}{2:>14.2f}{3:>20.1f}".format(
+            type(backend).__name__, inverse / NUMBER_OF_PAIRS * 1e6, direct / NUMBER_OF_PAIRS * 1e6,
+            parse / NUMBER_OF_MESSAGES * 1e6))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""Benchmark of the NavigationDatabase used to resolve field 15 points; a database of 300,000 points
+is generated and the start-up time to load the CSV file, to convert it to a binary index and to open
+the memory mapped binary index is measured. Lookups are timed with databases of 1,000 and 300,000
+points to show the lookup cost does not depend on the number of points.
+
+Run from the repository root: python -m Benchmarks.BenchmarkNavigationDatabase"""
+import os
+import random
+import tempfile
+import time
+
+from Benchmarks.MessageCorpus import time_it
+from F15_Parser.NavigationDatabase import NavigationDatabase, NavigationPointTypes
+
+NUMBER_OF_POINTS: [int] = [1000, 300000]
+"""The number of points in each benchmarked database"""
+
+
+def create_points(number_of_points):
+    # type: (int) -> [(str, NavigationPointTypes, float, float)]
+    """Creates a list of points with five letter designators at random positions."""
+    generator = random.Random(34)
+    points = []
+    for idx in range(0, number_of_points):
+        designator = "".join(chr(65 + (idx // 26 ** digit) % 26) for digit in range(0, 5))
+        points.append((designator, NavigationPointTypes.SIGNIFICANT_POINT,
+                       generator.uniform(-90.0, 90.0), generator.uniform(-180.0, 180.0)))
+    return points
+
+
+def write_csv(file_name, points):
+    # type: (str, [(str, NavigationPointTypes, float, float)]) -> None
+    """Writes a list of points to a CSV file."""
+    with open(file_name, "w") as file:
+        file.write("designator,type,latitude,longitude\n")
+        for designator, point_type, latitude, longitude in points:
+            file.write("{0},{1},{2:.6f},{3:.6f}\n".format(designator, point_type.name, latitude, longitude))
+
+
+def run():
+    with tempfile.TemporaryDirectory() as directory:
+        print("{0:<10}{1:>14}{2:>16}{3:>14}{4:>14}".format(
+            "Points", "Load CSV ms", "Write index ms", "Open index ms", "Lookup ns"))
+        for number_of_points in NUMBER_OF_POINTS:
+            points = create_points(number_of_points)
+            csv_file = os.path.join(directory, "points" + str(number_of_points) + ".csv")
+            binary_file = os.path.join(directory, "points" + str(number_of_points) + ".bin")
+            write_csv(csv_file, points)
+
+            start = time.perf_counter()
+            NavigationDatabase.load_csv(csv_file)
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            NavigationDatabase.write_binary(csv_file, binary_file)
+            write_time = time.perf_counter() - start
+
+            def open_index():
+                NavigationDatabase.open(binary_file).close()
+
+            open_time = time_it(open_index, 100)
+
+            database = NavigationDatabase.open(binary_file)
+            designators = [points[idx][0] for idx in range(0, number_of_points, max(1, number_of_points // 1000))]
+
+            def lookup():
+                for designator in designators:
+                    database.resolve(designator, False, 48.0, 14.0)
+
+            lookup_time = time_it(lookup, 20) / len(designators)
+            database.close()
+            print("{0:<10}{1:>14.1f}{2:>16.1f}{3:>14.3f}{4:>14.0f}".format(
+                number_of_points, load_time * 1e3, write_time * 1e3, open_time * 1e3, lookup_time * 1e9))
+
+
+if __name__ == "__main__":
+    run()
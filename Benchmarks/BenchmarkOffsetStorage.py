@@ -0,0 +1,61 @@
+"""Benchmark comparing the memory retained by parsed flight plan records when the field text is
+copied into each record (the default) and when records are stored as offsets into the original
+message, (FlightPlanRecord.set_offset_storage()).
+
+Run from the repository root: python -m Benchmarks.BenchmarkOffsetStorage"""
+import gc
+import tracemalloc
+
+from Benchmarks.MessageCorpus import FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES, time_it
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+def parse_corpus(parser, messages, offset_storage):
+    # type: (ParseMessage, [str], bool) -> [FlightPlanRecord]
+    records = []
+    for message in messages:
+        fpr = FlightPlanRecord()
+        fpr.set_offset_storage(offset_storage)
+        parser.parse_message(fpr, message)
+        records.append(fpr)
+    return records
+
+
+def count_text_copies(fpr):
+    # type: (FlightPlanRecord) -> int
+    """Counts the strings held by the message, field, subfield and error records of a flight plan."""
+    copies = 0 if fpr.message_header is None else 1
+    copies += 0 if fpr.message_body is None else 1
+    for field_record in fpr.icao_fields.values():
+        copies += 0 if field_record.field_text is None else 1
+        for subfield_list in field_record.get_subfield_dictionary().values():
+            copies += len([subfield for subfield in subfield_list if subfield.field_text is not None])
+    copies += len([error for error in fpr.get_erroneous_fields() if error.field_text is not None])
+    if fpr.get_f22_flight_plan() is not None:
+        copies += count_text_copies(fpr.get_f22_flight_plan())
+    return copies
+
+
+def run():
+    parser = ParseMessage()
+    # Copy the messages so each record references its own message as it would in a flight store
+    messages = [(message + " ")[:-1] for message in (FPL_MESSAGES + CPL_MESSAGES + CHG_MESSAGES) * 60]
+
+    print("Corpus: " + str(len(messages)) + " FPL / CPL / CHG messages")
+    print("{0:<10}{1:>16}{2:>18}{3:>16}".format("Storage", "Retained (kB)", "Copies / message", "Parse (us)"))
+    for name, offset_storage in (("copy", False), ("offset", True)):
+        gc.collect()
+        tracemalloc.start()
+        records = parse_corpus(parser, messages, offset_storage)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        copies = sum([count_text_copies(fpr) for fpr in records]) / len(records)
+        parse_time = time_it(lambda: parse_corpus(parser, messages[0:40], offset_storage), 1) / 40
+        print("{0:<10}{1:>16.1f}{2:>18.1f}{3:>16.1f}".format(
+            name, retained / 1024, copies, parse_time * 1e6))
+
+
+if __name__ == "__main__":
+    run()
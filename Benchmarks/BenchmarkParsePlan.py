@@ -0,0 +1,57 @@
+"""Benchmark of the compiled parse plans, comparing parsing messages of each title with the field
+parsers created from their parse plans with the field parsers created from their classes, reading the
+configuration data for each field, as done before parse plans.
+
+Run from the repository root: python -m Benchmarks.BenchmarkParsePlan"""
+from Benchmarks.MessageCorpus import time_it
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParsePlan import FieldParsePlan
+
+MESSAGES: {str: str} = {
+    "FPL": "(FPL-TEST01-IS-B737/M-DFGHIORWY/LB1-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200 EGGW-STS/HOSP "
+           "DOF/221212 RMK/FIRST PBN/B1D1-E/0300 P/3)",
+    "CPL": "(CPL-TEST01-IS-B737/M-S/C-EGLL0800-PNT/1234F350F200A-N0450F350 PNT B9 NMB-LOWL0100 LOWZ LOWG-0)",
+    "CHG": "(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 LNZ-8/IS-9/B738/M)",
+    "ACH": "(ACH-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130)",
+    "ARR": "(ARR-TEST01-EGLL0800-LOWW0200-RGRG0200 DEN HELDER-221013)",
+    "DEP": "(DEP-TEST01-EGLL0800-LOWL-221013)",
+    "DLA": "(DLA-TEST01-EGLL0800-LOWL-221013)",
+    "CNL": "(CNL-TEST01-EGLL0800-LOWL-221013)",
+    "EST": "(EST-TEST01-EGLL0800-PNT/1234F350F200A-LOWL0100 LOWZ LOWG)",
+    "SPL": "(SPL-TEST01-EGLL0800-LOWL0100 LOWZ LOWG-0-E/1235)",
+    "CDN": "(CDN-TEST01-EGLL0800-LOWL0100 LOWZ LOWG-221013)",
+    "ACP": "(ACP-TEST01-EGLL0800-LOWL0100 LOWZ LOWG)",
+    "ACT": "(ACT-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+    "ABI": "(ABI-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/BERT0900)",
+    "REV": "(REV-TEST01-SAGE-PNT/1234F350F200A-LOWL)",
+    "MAC": "(MAC-TEST01-SAGE-HELP-LOWL)",
+}
+"""A message for each message title benchmarked, keyed on the message title"""
+
+REPEAT: int = 500
+"""The number of times each message is parsed per run"""
+
+
+class ParseMessageWithoutPlans(ParseMessage):
+    """Creates each field parser from its class, reading the configuration data for each field"""
+
+    def parse_field(self, flight_plan_record, field_identifier, field_parser):
+        if isinstance(field_parser, FieldParsePlan):
+            field_parser = field_parser.get_field_parser()
+        super().parse_field(flight_plan_record, field_identifier, field_parser)
+
+
+def run():
+    parser = ParseMessage()
+    parser.compile_parse_plans()
+    parser_without_plans = ParseMessageWithoutPlans()
+    print("{0:<8}{1:>18}{2:>18}{3:>10}".format("Title", "Classes us", "Parse plan us", "Speedup"))
+    for title, message in MESSAGES.items():
+        classes = time_it(lambda: parser_without_plans.parse_message(FlightPlanRecord(), message), REPEAT)
+        plans = time_it(lambda: parser.parse_message(FlightPlanRecord(), message), REPEAT)
+        print("{0:<8}{1:>18.1f}{2:>18.1f}{3:>9.1f}x".format(title, classes * 1e6, plans * 1e6, classes / plans))
+
+
+if __name__ == "__main__":
+    run()
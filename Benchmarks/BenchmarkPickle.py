@@ -0,0 +1,67 @@
+"""Benchmark comparing the pickle size and dump / load times of flight plan records using the
+flat tuple state implemented by FlightPlanRecord, FieldRecord, ExtractedRouteSequence etc. against
+the default instance dictionary pickling used before the flat state was introduced.
+
+Run from the repository root: python -m Benchmarks.BenchmarkPickle"""
+import copyreg
+import io
+import pickle
+
+from Benchmarks.MessageCorpus import FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES, time_it
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, FieldRecord, SubFieldRecord, ErrorRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+DEFAULT_PICKLED_CLASSES = (FlightPlanRecord, FieldRecord, SubFieldRecord, ErrorRecord,
+                           ExtractedRouteSequence, ExtractedRouteRecord)
+
+
+def set_instance_dictionary(obj, state):
+    # type: (object, dict) -> None
+    """State setter restoring an instance dictionary, mimics the default unpickling behaviour."""
+    obj.__dict__.update(state)
+
+
+class DefaultPickler(pickle.Pickler):
+    """A pickler that ignores the flat tuple state and pickles the record classes with their
+    instance dictionary, i.e. the pickling behaviour before the flat tuple state was added."""
+
+    def reducer_override(self, obj):
+        if type(obj) in DEFAULT_PICKLED_CLASSES:
+            return copyreg.__newobj__, (type(obj),), dict(vars(obj)), None, None, set_instance_dictionary
+        return NotImplemented
+
+
+def default_dumps(obj):
+    # type: (object) -> bytes
+    stream = io.BytesIO()
+    DefaultPickler(stream, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return stream.getvalue()
+
+
+def flat_dumps(obj):
+    # type: (object) -> bytes
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def run():
+    parser = ParseMessage()
+    records = []
+    for message in (FPL_MESSAGES + CPL_MESSAGES + CHG_MESSAGES) * 20:
+        fpr = FlightPlanRecord()
+        parser.parse_message(fpr, message)
+        records.append(fpr)
+
+    print("Corpus: " + str(len(records)) + " FPL / CPL / CHG flight plan records")
+    print("{0:<10}{1:>14}{2:>14}{3:>14}".format("Method", "Bytes", "Dump (us)", "Load (us)"))
+    for name, dumps in (("default", default_dumps), ("flat", flat_dumps)):
+        data = dumps(records)
+        dump_time = time_it(lambda: dumps(records), 10) / len(records)
+        load_time = time_it(lambda: pickle.loads(data), 10) / len(records)
+        print("{0:<10}{1:>14}{2:>14.2f}{3:>14.2f}".format(
+            name, len(data), dump_time * 1e6, load_time * 1e6))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,50 @@
+"""Benchmark of re-parsing a message after a single field has been edited, comparing a full parse
+of the edited message with ReParseMessage.reparse_message() for an edit in each field of the message.
+
+Run from the repository root: python -m Benchmarks.BenchmarkReParse"""
+import pickle
+
+from Benchmarks.MessageCorpus import FPL_MESSAGES, time_it
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ReParseMessage import ReParseMessage
+
+EDITS: [(str, str, str)] = [
+    ("F7", "TEST01", "TEST99"),
+    ("F9", "B737/M", "A320/M"),
+    ("F13", "LOWW0800", "LOWW0900"),
+    ("F15", "PNT B9 LNZ", "PNT B9 KOK"),
+    ("F16", "EGLL0200", "EGLL0300"),
+    ("F18", "RMK/FIRST", "RMK/CORRECTED"),
+    ("F19", "E/0300", "E/0400"),
+]
+"""Field name, text replaced and replacement text for each edit"""
+
+
+def run():
+    message = FPL_MESSAGES[0]
+    parser = ParseMessage()
+    reparser = ReParseMessage()
+    parsed = FlightPlanRecord()
+    parser.parse_message(parsed, message)
+
+    print("{0:<8}{1:>16}{2:>16}{3:>10}".format("Edit", "Full parse us", "Re-parse us", "Speedup"))
+    for name, old, new in EDITS:
+        offset = message.find(old)
+        edited_message = message[0:offset] + new + message[offset + len(old):]
+
+        def full_parse():
+            parser.parse_message(FlightPlanRecord(), edited_message)
+
+        def reparse():
+            # Re-parse a copy of the parsed record, the copy is made outside the timed call
+            reparser.reparse_message(copies.pop(), offset, len(old), new)
+
+        copies = [pickle.loads(state) for state in [pickle.dumps(parsed)] * 100]
+        full = time_it(full_parse, 20)
+        incremental = time_it(reparse, 20)
+        print("{0:<8}{1:>16.1f}{2:>16.1f}{3:>10.1f}".format(name, full * 1e6, incremental * 1e6, full / incremental))
+
+
+if __name__ == "__main__":
+    run()
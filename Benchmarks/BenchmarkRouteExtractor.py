@@ -0,0 +1,63 @@
+"""Benchmark of the standalone route extraction API, extracting the routes of a route catalogue
+with RouteExtractor sequentially and in parallel, compared with wrapping each route in an FPL and
+parsing the message as was needed before RouteExtractor was added.
+
+Run from the repository root: python -m Benchmarks.BenchmarkRouteExtractor"""
+import os
+import random
+import time
+
+from F15_Parser.RouteExtractor import RouteExtractor
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+NUMBER_OF_ROUTES: int = 1000000
+"""The number of routes in the route catalogue"""
+
+NUMBER_OF_WRAPPED_ROUTES: int = 10000
+"""The number of routes wrapped in an FPL, the time for the catalogue is extrapolated"""
+
+
+def create_routes(number_of_routes):
+    """Generates catalogue routes of 5 to 15 points drawn from a set of 2000 points and 200 ATS routes."""
+    generator = random.Random(1)
+    points = ["".join(chr(65 + generator.randrange(0, 26)) for _ in range(0, 5)) for _ in range(0, 2000)]
+    airways = [generator.choice(["UL", "UN", "L", "M", "T"]) + str(generator.randrange(1, 999)) for _ in range(0, 200)]
+    for _ in range(0, number_of_routes):
+        elements = ["N0{0:03d}F{1:03d}".format(generator.randrange(380, 500), generator.randrange(250, 410, 10))]
+        for _ in range(0, generator.randrange(5, 15)):
+            elements.append(generator.choice(points))
+            elements.append(generator.choice(airways) if generator.random() < 0.7 else "DCT")
+        elements.append(generator.choice(points))
+        yield " ".join(elements)
+
+
+def extract(routes, processes):
+    # type: (iter, int | None) -> (float, int)
+    """Extracts all the routes and returns the elapsed time and number of routes with errors."""
+    start = time.perf_counter()
+    errors = 0
+    for ers in RouteExtractor().extract_routes(routes, processes):
+        if ers.get_number_of_errors() > 0:
+            errors += 1
+    return time.perf_counter() - start, errors
+
+
+def run():
+    parser = ParseMessage()
+    start = time.perf_counter()
+    for f15 in create_routes(NUMBER_OF_WRAPPED_ROUTES):
+        parser.parse_message(FlightPlanRecord(), "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-" + f15 + "-EKCH0200-0)")
+    wrapped = (time.perf_counter() - start) / NUMBER_OF_WRAPPED_ROUTES
+    print("Wrapped in an FPL: {0:.1f} us per route, {1:.0f} s for {2} routes (extrapolated)".format(
+        wrapped * 1e6, wrapped * NUMBER_OF_ROUTES, NUMBER_OF_ROUTES))
+
+    for processes in [1, None]:
+        elapsed, errors = extract(create_routes(NUMBER_OF_ROUTES), processes)
+        print("RouteExtractor, {0} process(es): {1:.1f} us per route, {2:.0f} s for {3} routes, {4} with errors".format(
+            processes if processes is not None else os.cpu_count(), elapsed / NUMBER_OF_ROUTES * 1e6, elapsed,
+            NUMBER_OF_ROUTES, errors))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,60 @@
+"""Benchmark of the RouteSpatialIndex with 10k, 100k and 1M stored routes; each route has four points
+in a region the size of Europe. The time to load the routes, to query a small and a large box, a
+polygon sector and to delete and re-insert a route are measured.
+
+Run from the repository root: python -m Benchmarks.BenchmarkRouteSpatialIndex"""
+import random
+import time
+
+from Benchmarks.MessageCorpus import time_it
+from IcaoMessageParser.RouteSpatialIndex import RouteSpatialIndex
+
+NUMBER_OF_ROUTES: [int] = [10000, 100000, 1000000]
+"""The number of routes in each benchmarked index"""
+
+
+def create_route(generator):
+    # type: (random.Random) -> ([float], [float])
+    """Creates a route of four points, each point up to two degrees from the previous point."""
+    latitudes = [generator.uniform(35.0, 65.0)]
+    longitudes = [generator.uniform(-10.0, 30.0)]
+    for _ in range(0, 3):
+        latitudes.append(latitudes[-1] + generator.uniform(-2.0, 2.0))
+        longitudes.append(longitudes[-1] + generator.uniform(-2.0, 2.0))
+    return latitudes, longitudes
+
+
+def run():
+    print("{0:<10}{1:>10}{2:>14}{3:>14}{4:>14}{5:>18}".format(
+        "Routes", "Load s", "Small box ms", "Large box ms", "Polygon ms", "Delete/insert us"))
+    for number_of_routes in NUMBER_OF_ROUTES:
+        generator = random.Random(36)
+        routes = [create_route(generator) for _ in range(0, number_of_routes)]
+        index = RouteSpatialIndex()
+        start = time.perf_counter()
+        for message_id, (latitudes, longitudes) in enumerate(routes):
+            index.insert_points(message_id, latitudes, longitudes)
+        load_time = time.perf_counter() - start
+
+        def small_box():
+            index.query_box(50.0, 10.0, 51.0, 11.0)
+
+        def large_box():
+            index.query_box(45.0, 0.0, 50.0, 10.0)
+
+        def polygon():
+            index.query_polygon([(48.0, 9.0), (52.0, 8.0), (53.0, 13.0), (49.0, 14.0)])
+
+        def delete_insert():
+            index.delete(0)
+            index.insert_points(0, routes[0][0], routes[0][1])
+
+        repeat = max(1, 100000 // number_of_routes)
+        print("{0:<10}{1:>10.2f}{2:>14.2f}{3:>14.2f}{4:>14.2f}{5:>18.1f}".format(
+            number_of_routes, load_time, time_it(small_box, repeat) * 1e3, time_it(large_box, repeat) * 1e3,
+            time_it(polygon, repeat) * 1e3, time_it(delete_insert, 1000) * 1e6))
+        del index
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,100 @@
+"""Benchmark of the field parsers shared by all parse plans, comparing the number of field parsers
+created and the peak memory per message when parsing with the shared field parsers with creating a
+field parser from its class for each field, as done before parse plans, and with copying the field
+parser of the parse plan for each field, as done before the field parsers were shared.
+
+Run from the repository root: python -m Benchmarks.BenchmarkSharedParsers"""
+import tracemalloc
+
+from Benchmarks.MessageCorpus import time_it, FPL_MESSAGES, CPL_MESSAGES, CHG_MESSAGES
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParsePlan import FieldParsePlan
+
+MESSAGES: [str] = FPL_MESSAGES + CPL_MESSAGES + CHG_MESSAGES + [
+    "(ARR-TEST01-EGLL0800-LOWW0200-RGRG0200 DEN HELDER-221013)",
+    "(ACT-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+]
+"""The messages parsed per run"""
+
+REPEAT: int = 10
+"""The number of times the messages are parsed per run"""
+
+
+class ParseMessageWithoutPlans(ParseMessage):
+    """Creates each field parser from its class, reading the configuration data for each field"""
+
+    def parse_field(self, flight_plan_record, field_identifier, field_parser):
+        if isinstance(field_parser, FieldParsePlan):
+            field_parser = field_parser.get_field_parser()
+        super().parse_field(flight_plan_record, field_identifier, field_parser)
+
+
+class ParseMessageCopyingParsers(ParseMessage):
+    """Copies the field parser of the parse plan for each field, binding it to the flight plan record"""
+
+    def parse_field(self, flight_plan_record, field_identifier, field_parser):
+        if isinstance(field_parser, FieldParsePlan):
+            field_parser = field_parser.__call__
+        super().parse_field(flight_plan_record, field_identifier, field_parser)
+
+
+def parse_messages(parser):
+    # type: (ParseMessage) -> None
+    for message in MESSAGES:
+        parser.parse_message(FlightPlanRecord(), message)
+
+
+def count_field_parsers(parsers):
+    # type: ({str: ParseMessage}) -> {str: float}
+    """Returns the number of field parsers created per message by each message parser; the field parsers
+    are counted by overriding ParseFieldsCommon.__new__, which cannot be undone, so this is measured last"""
+    created = [0]
+
+    def counting_new(cls, *args, **kwargs):
+        created[0] += 1
+        return object.__new__(cls)
+    ParseFieldsCommon.__new__ = counting_new
+    counts = {}
+    for name, parser in parsers.items():
+        created[0] = 0
+        parse_messages(parser)
+        counts[name] = created[0] / len(MESSAGES)
+    return counts
+
+
+def peak_memory(parser):
+    # type: (ParseMessage) -> float
+    """Returns the peak memory traced while parsing a message in KiB, averaged over the messages"""
+    total = 0
+    tracemalloc.start()
+    for message in MESSAGES:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        parser.parse_message(FlightPlanRecord(), message)
+        total += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return total / len(MESSAGES) / 1024
+
+
+def run():
+    parsers = {"Classes": ParseMessageWithoutPlans(),
+               "Copied": ParseMessageCopyingParsers(),
+               "Shared": ParseMessage()}
+    memory = {}
+    durations = {}
+    for name, parser in parsers.items():
+        parser.compile_parse_plans()
+        parse_messages(parser)
+        memory[name] = peak_memory(parser)
+        durations[name] = time_it(lambda: parse_messages(parser), REPEAT) / len(MESSAGES)
+    counts = count_field_parsers(parsers)
+    print("{0:<10}{1:>18}{2:>16}{3:>16}".format("Parsers", "Parsers/message", "Peak KiB", "us/message"))
+    for name in parsers:
+        print("{0:<10}{1:>18.1f}{2:>16.1f}{3:>16.1f}".format(name, counts[name], memory[name],
+                                                            durations[name] * 1e6))
+
+
+if __name__ == "__main__":
+    run()
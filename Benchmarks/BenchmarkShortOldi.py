@@ -0,0 +1,37 @@
+"""Benchmark of the short OLDI fast path, comparing the latency of parsing the short, high frequency
+OLDI messages of each title with the fast path and with the generic path.
+
+Run from the repository root: python -m Benchmarks.BenchmarkShortOldi"""
+from Benchmarks.MessageCorpus import time_it
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+MESSAGES: {str: str} = {
+    "LAM": "(LAML/E012E/L001)",
+    "SBY": "(SBYAA/BB001CC/DD002)",
+    "ACP": "(ACPAA/LL098-TEST01-SAGE-LOWL-13/KATE0900)",
+    "ABI": "(ABIAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+    "ACT": "(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+    "REV": "(REVAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+    "MAC": "(MACAA/LL098-TEST01-SAGE-LOWL-PETE-13/KATE0900)",
+}
+"""A message for each short OLDI message title, keyed on the message title"""
+
+REPEAT: int = 2000
+"""The number of times each message is parsed per run"""
+
+
+def run():
+    parser = ParseMessage()
+    parser.compile_parse_plans()
+    generic_parser = ParseMessage()
+    generic_parser.set_short_oldi_fast_path(False)
+    print("{0:<8}{1:>18}{2:>18}{3:>10}".format("Title", "Generic us", "Fast path us", "Speedup"))
+    for title, message in MESSAGES.items():
+        generic = time_it(lambda: generic_parser.parse_message(FlightPlanRecord(), message), REPEAT)
+        fast = time_it(lambda: parser.parse_message(FlightPlanRecord(), message), REPEAT)
+        print("{0:<8}{1:>18.1f}{2:>18.1f}{3:>9.1f}x".format(title, generic * 1e6, fast * 1e6, generic / fast))
+
+
+if __name__ == "__main__":
+    run()
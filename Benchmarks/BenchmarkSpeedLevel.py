@@ -0,0 +1,63 @@
+"""Benchmark of converting field 15 speeds and levels to SI units, comparing a conversion calculated
+for every element with the conversions looked up by SpeedLevelConversions.
+
+Run from the repository root: python -m Benchmarks.BenchmarkSpeedLevel"""
+from Benchmarks.MessageCorpus import time_it
+from Utilities.Constants import Constants
+from Utilities.SpeedLevelConversions import SpeedLevelConversions
+from Utilities.Utils import Utils
+
+SPEED_LEVELS: [(str, str)] = [("N0450", "F350"), ("K0830", "S1130"), ("M082", "F370"), ("N0120", "A045"),
+                              ("M079", "F310"), ("N0480", "M0840"), ("M085", "F390"), ("N0250", "F120")]
+"""The speed and level pairs converted"""
+
+
+def calculate(speed_string, level_string):
+    # type: (str, str) -> (int, int)
+    """Converts a speed and level as calculated before the conversions were looked up."""
+    level = int(level_string[1:])
+    match level_string[0:1]:
+        case "A" | "F":
+            level = (level * 100) * Constants.FEET_TO_METERS
+        case "S" | "M":
+            level = level * 10
+    level_si = int(level + 0.5)
+    speed = int(speed_string[1:])
+    match speed_string[0:1]:
+        case "K":
+            speed = speed * Constants.KMH_TO_METERS_SECOND
+        case "N":
+            speed = speed * Constants.KNOTS_TO_METERS_SECOND
+        case "M":
+            speed = Utils.mach_to_ms_speed(speed, level_si)
+    return int(speed + 0.5), level_si
+
+
+def look_up(speed_string, level_string):
+    # type: (str, str) -> (int, int)
+    """Converts a speed and level using SpeedLevelConversions."""
+    level_si = SpeedLevelConversions.level_to_si(level_string)[0]
+    return SpeedLevelConversions.speed_to_si(speed_string, level_si), level_si
+
+
+def run():
+    for speed_string, level_string in SPEED_LEVELS:
+        assert calculate(speed_string, level_string) == look_up(speed_string, level_string)
+
+    def calculate_all():
+        for speed, level in SPEED_LEVELS:
+            calculate(speed, level)
+
+    def look_up_all():
+        for speed, level in SPEED_LEVELS:
+            look_up(speed, level)
+
+    calculated = time_it(calculate_all, 20000) / len(SPEED_LEVELS)
+    looked_up = time_it(look_up_all, 20000) / len(SPEED_LEVELS)
+    print("{0:<12}{1:>16}".format("Conversion", "ns per element"))
+    print("{0:<12}{1:>16.0f}".format("Calculated", calculated * 1e9))
+    print("{0:<12}{1:>16.0f}".format("Looked up", looked_up * 1e9))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,64 @@
+"""Benchmark of the 4D trajectory stage, comparing a per point Python loop over the extracted route
+records with TrajectoryBuilder for routes of increasing length, and resampling a batch of trajectories
+one at a time with resampling the batch in a single call. Requires NumPy.
+
+Run from the repository root: python -m Benchmarks.BenchmarkTrajectory"""
+from Benchmarks.MessageCorpus import time_it
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.Trajectory import TrajectoryBuilder
+
+ROUTE_POINTS: [int] = [50, 500, 5000]
+"""The number of lat/long points in each benchmarked route"""
+
+
+def create_flight_plan(points):
+    # type: (int) -> FlightPlanRecord
+    """Parses an FPL whose field 15 contains a given number of lat/long points."""
+    route = " ".join(["{0:02d}{1:02d}N{2:03d}{3:02d}E".format(40 + (idx // 60) % 20, idx % 60, idx // 60 % 90, idx % 60)
+                      for idx in range(0, points)])
+    fpr = FlightPlanRecord()
+    ParseMessage().parse_message(fpr, "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 " + route + "-EKCH0200-0)")
+    return fpr
+
+
+def python_loop(fpr):
+    # type: (FlightPlanRecord) -> []
+    """Calculates the distance along route and elapsed time over each point one record at a time."""
+    times = []
+    distance = 0.0
+    elapsed = 0.0
+    previous = None
+    for record in fpr.get_extracted_route().get_all_elements():
+        if not record.is_lat_long_valid():
+            continue
+        if previous is not None:
+            distance += previous.get_distance()
+            elapsed += previous.get_distance() / previous.get_speed_si()
+        times.append((distance, elapsed))
+        previous = record
+    return times
+
+
+def run():
+    builder = TrajectoryBuilder()
+    print("{0:<8}{1:>16}{2:>16}{3:>16}".format("Points", "Python loop us", "Build us", "Resample us"))
+    for points in ROUTE_POINTS:
+        fpr = create_flight_plan(points)
+        trajectory = builder.build_flight_plan(fpr)
+        repeat = max(1, 5000 // points)
+        loop_time = time_it(lambda: python_loop(fpr), repeat)
+        build_time = time_it(lambda: builder.build_flight_plan(fpr), repeat)
+        resample_time = time_it(lambda: builder.resample(trajectory, 60), repeat)
+        print("{0:<8}{1:>16.1f}{2:>16.1f}{3:>16.1f}".format(
+            points, loop_time * 1e6, build_time * 1e6, resample_time * 1e6))
+
+    trajectories = [builder.build_flight_plan(create_flight_plan(50))] * 1000
+    one_at_a_time = time_it(lambda: [builder.resample(trajectory, 60) for trajectory in trajectories], 1)
+    batch = time_it(lambda: builder.resample_batch(trajectories, 60), 1)
+    print("Resample 1000 routes of 50 points: one at a time {0:.1f} ms, batch {1:.1f} ms".format(
+        one_at_a_time * 1e3, batch * 1e3))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,48 @@
+"""Sample messages and helpers shared by the benchmark scripts in this package. The benchmarks
+are run from the repository root, e.g. 'python -m Benchmarks.BenchmarkPickle'."""
+import time
+
+FPL_MESSAGES: [str] = [
+    "FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n"
+    "(FPL-TEST01-IS-B737/M-DFGHIORWY/LB1-LOWW0800-N0450F350 4620N07805W/N0450F350 PNT B9 LNZ "
+    "DCT 4620N07805W-EGLL0200 EGGW-STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND PBN/B1D1-E/0300 P/3)",
+    "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0)",
+    "(FPL-TEST03-VS-C172/L-S/C-LOWL0800-N0100VFR PNT DCT LNZ-LOWS0100-DOF/221212)",
+    "(FPL-TEST04-IS-A320/M-DE2E3FGHIJ1ORWY/LB1-EGLL1200-N0450F350 DVR L9 KONAN UL607 KOK "
+    "UL607 SPI T180 NIK-EHAM0100 EBBR-PBN/B1D1O1S1 DOF/230101 REG/GABCD EET/EBUR0030 "
+    "SEL/ABCD RMK/TCAS-E/0200 P/150 R/VE S/M J/L D/2 10 C YELLOW A/WHITE BLUE N/NONE C/SMITH)",
+    "(FPL-TEST05-IS-B738/M-S/C-LOWW0800-N0450F350 5030N01000E 5130N01100E/N0460F370 "
+    "5230N01200E 5330N01300E-EKCH0200-0)",
+]
+"""A small corpus of FPL messages exercising most fields, field 18 keywords and field 15 points"""
+
+CPL_MESSAGES: [str] = [
+    "(CPL-TEST01-IS-B737/M-S/C-EGLL0800-PNT/1234F350F200A-N0450F350 PNT B9 NMB-LOWL0100 LOWZ LOWG-0)",
+    "(CPL-TEST02-IS-A320/M-DFGHIORWY/LB1-EGLL0800-KONAN/1210F370-N0450F370 KONAN UL607 KOK-EHAM0100-"
+    "PBN/B1D1 DOF/230101 RMK/CPL TEST)",
+]
+"""A small corpus of CPL messages"""
+
+CHG_MESSAGES: [str] = [
+    "(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 LNZ-8/IS-9/B738/M)",
+]
+"""A small corpus of CHG messages containing field 22"""
+
+
+def time_it(function, repeat):
+    # type: (callable, int) -> float
+    """Calls 'function' 'repeat' times and returns the best time of five runs in seconds
+    for a single call.
+
+    :param function: The function to time, called without arguments;
+    :param repeat: The number of calls per run;
+    :return: The best time per call in seconds;"""
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        elapsed = (time.perf_counter() - start) / repeat
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
@@ -85,10 +85,8 @@ class MessageTitles(IntEnum):
     @staticmethod
     def get_message_title(message_title):
         # type: (str) -> MessageTitles
-        for title in MessageTitles:
-            if title.name == message_title:
-                return title
-        return MessageTitles.UNKNOWN
+        # Look the title up in the name to member mapping created with the enumeration
+        return MessageTitles.__members__.get(message_title, MessageTitles.UNKNOWN)
 
 
 class FieldIdentifiers(IntEnum):
@@ -297,6 +295,14 @@ class MessageTypes(IntEnum):
     UNKNOWN = auto()
 
 
+class DifferenceTypes(IntEnum):
+    """Enumeration to identify the type of difference between a field, subfield or extracted route
+    record in two flight plan records, see the CompareFlightPlans class."""
+    ADDED = 0
+    REMOVED = auto()
+    CHANGED = auto()
+
+
 class AdjacentUnits(IntEnum):
     """Enumeration to identify an adjacent unit for OLDI messages. The field content for OLDI
     messages varies depending on the adjacent unit that an OLDI message is exchanged over.
@@ -313,10 +319,8 @@ class AdjacentUnits(IntEnum):
     @staticmethod
     def get_adjacent_unit(adjacent_unit_name):
         # type: (str) -> AdjacentUnits
-        for unit in AdjacentUnits:
-            if unit.name == adjacent_unit_name:
-                return unit
-        return AdjacentUnits.DEFAULT
+        # Look the unit up in the name to member mapping created with the enumeration
+        return AdjacentUnits.__members__.get(adjacent_unit_name, AdjacentUnits.DEFAULT)
 
 
 class ErrorId(IntEnum):
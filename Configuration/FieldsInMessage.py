@@ -1017,3 +1017,14 @@ class FieldsInMessage:
         if adj_unit is None:
             return None
         return adj_unit.get(message_title)
+
+    # Gets the field content descriptions for all message titles, message types and
+    # adjacent unit identifiers.
+    # Arguments
+    # ----------
+    # return:           A list of MessageDescription instances.
+    def get_message_descriptions(self):
+        # type: () -> [MessageDescription]
+        return [md for adjacent_units in self.message_content.values()
+                for message_titles in adjacent_units.values()
+                for md in message_titles.values()]
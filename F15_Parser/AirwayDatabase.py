@@ -0,0 +1,317 @@
+import copy
+import csv
+from collections.abc import Iterable
+
+from F15_Parser.ErrorMessageDefinitions import ErrorMessages
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from Utilities.Utils import Utils
+
+
+class AirwayDatabase:
+    """This class is a local database of ATS routes (airways) used to expand the ATS route connectors in
+    an extracted route sequence into the points the airway passes through, see expand_ers().
+
+    The airways are prepared as a CSV file with one airway point per line; each line contains the airway
+    designator, the point designator and optionally the point latitude and longitude in decimal degrees,
+    e.g. 'UL607,KOK,51.0944,2.6528'. The points of an airway are given in order along the airway; an
+    optional header line starting with 'airway' is skipped.
+
+    Each airway is stored as an ordered list of its points together with a map from a point designator
+    to its position in the list; expanding an airway between an entry and exit point is two map lookups
+    and a slice of the list, the cost is proportional to the number of points between the entry and exit
+    point and not to the length of the airway. Expansions are cached per airway, entry and exit point, up
+    to MAXIMUM_CACHED_EXPANSIONS expansions."""
+
+    ATS_ROUTE_SUB_TYPES: frozenset = frozenset([TokenSubType.F15_SB_ATS, TokenSubType.F15_SB_ATS_OLD,
+                                                TokenSubType.F15_SB_ATS_TURK, TokenSubType.F15_SB_ATS_RUS])
+    """The token sub types of the ATS route connectors that are expanded"""
+
+    MAXIMUM_CACHED_EXPANSIONS: int = 10000
+    """The maximum number of expansions stored in expansions, the cache is emptied when full"""
+
+    airway_points: dict = None
+    """The points of each airway keyed on the airway designator, each point is a tuple containing the point
+    designator, latitude, longitude and a boolean set True if the latitude / longitude are known"""
+
+    airway_positions: dict = None
+    """The position of each point in its airway, keyed on the airway designator, each value is a dictionary
+    mapping a point designator to the index of the point in airway_points"""
+
+    expansions: dict = None
+    """Cached expansions keyed on a tuple of the airway, entry and exit point designators, an airway
+    that does not exist or an entry or exit point not on the airway is not cached"""
+
+    def __init__(self, airways=None):
+        # type: (dict | None) -> None
+        """Constructor that sets up the database from a dictionary of airways, see also load_csv().
+
+        :param airways: Optional, a dictionary keyed on the airway designator, each value is a list of
+               points in order along the airway, each point given as a designator or as a tuple of the
+               designator, latitude and longitude;
+        :return: None
+        """
+        self.airway_points = {}
+        self.airway_positions = {}
+        self.expansions = {}
+        if airways is not None:
+            for airway, points in airways.items():
+                for point in points:
+                    if isinstance(point, str):
+                        self.add_point(airway, point)
+                    else:
+                        self.add_point(airway, point[0], point[1], point[2])
+
+    @staticmethod
+    def load_csv(file_name):
+        # type: (str) -> AirwayDatabase
+        """Loads the airways from a CSV file, see the class description for the CSV format.
+
+        :param file_name: The CSV file name;
+        :return: An AirwayDatabase instance
+        """
+        with open(file_name, newline="") as file:
+            return AirwayDatabase.read_csv_lines(file)
+
+    @staticmethod
+    def read_csv_lines(lines):
+        # type: (Iterable[str]) -> AirwayDatabase
+        """Loads the airways from lines of CSV text.
+
+        :param lines: The CSV lines, e.g. an open file;
+        :return: An AirwayDatabase instance
+        """
+        database = AirwayDatabase()
+        for row in csv.reader(lines):
+            if len(row) == 0 or row[0].strip().lower() == "airway":
+                continue
+            match len(row):
+                case 2:
+                    database.add_point(row[0].strip(), row[1].strip())
+                case 4:
+                    database.add_point(row[0].strip(), row[1].strip(), float(row[2]), float(row[3]))
+                case _:
+                    raise ValueError("Expecting 2 or 4 columns in airway database line " + str(row))
+        return database
+
+    def add_point(self, airway, designator, latitude=None, longitude=None):
+        # type: (str, str, float | None, float | None) -> None
+        """Appends a point to the end of an airway, the airway is created if it does not exist.
+
+        :param airway: The airway designator, e.g. UL607;
+        :param designator: The point designator, e.g. KOK;
+        :param latitude: Optional, the latitude of the point;
+        :param longitude: Optional, the longitude of the point;
+        :return: None
+        """
+        points = self.airway_points.setdefault(airway, [])
+        positions = self.airway_positions.setdefault(airway, {})
+        # A point occurring more than once on an airway is found at its first occurrence
+        positions.setdefault(designator, len(points))
+        if latitude is None or longitude is None:
+            points.append((designator, 0.0, 0.0, False))
+        else:
+            points.append((designator, latitude, longitude, True))
+        self.expansions.clear()
+
+    def get_airway(self, airway):
+        # type: (str) -> [str]
+        """Gets the point designators of an airway in order along the airway.
+
+        :param airway: The airway designator;
+        :return: A list of point designators, an empty list if the airway does not exist
+        """
+        return [point[0] for point in self.airway_points.get(airway, [])]
+
+    def get_number_of_airways(self):
+        # type: () -> int
+        """Gets the number of airways in the database
+        :return: The number of airways"""
+        return len(self.airway_points)
+
+    def get_number_of_cached_expansions(self):
+        # type: () -> int
+        """Gets the number of expansions stored in the cache
+        :return: The number of cached expansions"""
+        return len(self.expansions)
+
+    def is_point_on_airway(self, airway, designator):
+        # type: (str, str) -> bool
+        """Checks if a point is on an airway.
+
+        :param airway: The airway designator;
+        :param designator: The point designator;
+        :return: True if the point is on the airway, False otherwise
+        """
+        return designator in self.airway_positions.get(airway, {})
+
+    def expand(self, airway, entry, exit_point):
+        # type: (str, str, str) -> tuple | None
+        """Expands an airway between an entry and exit point; the airway may be flown in either direction.
+
+        :param airway: The airway designator;
+        :param entry: The designator of the point the airway is joined at;
+        :param exit_point: The designator of the point the airway is left at;
+        :return: A tuple containing the entry point, the points between the entry and exit point in the
+                 order they are flown and the exit point, each point is a tuple containing the point
+                 designator, latitude, longitude and a boolean set True if the latitude / longitude
+                 are known; None if the airway does not exist or the entry or exit point are not on it
+        """
+        key = (airway, entry, exit_point)
+        try:
+            return self.expansions[key]
+        except KeyError:
+            pass
+        positions = self.airway_positions.get(airway)
+        if positions is None:
+            return None
+        entry_idx = positions.get(entry)
+        exit_idx = positions.get(exit_point)
+        if entry_idx is None or exit_idx is None:
+            return None
+        points = self.airway_points[airway]
+        if entry_idx <= exit_idx:
+            expansion = tuple(points[entry_idx:exit_idx + 1])
+        else:
+            expansion = tuple(points[exit_idx:entry_idx + 1][::-1])
+        if len(self.expansions) >= self.MAXIMUM_CACHED_EXPANSIONS:
+            self.expansions.clear()
+        self.expansions[key] = expansion
+        return expansion
+
+    def expand_ers(self, ers):
+        # type: (ExtractedRouteSequence) -> ExtractedRouteSequence
+        """Creates a copy of an extracted route sequence with every ATS route connector followed by
+        records for the points the airway passes through between its entry and exit points. The
+        inserted records are of base type F15_POINT and sub type F15_SB_PRP, they have the text
+        indices, speed, level and flight rules of the ATS route record they expand.
+
+        The latitude / longitude from the airway database is assigned to the inserted points and to the
+        entry and exit points if they do not already have a position, the bearing / distance between
+        the points are set as done by the field 15 parser.
+
+        An error is added to the extracted route sequence returned for an ATS route not in the database
+        and for an entry or exit point not on the ATS route, the ATS route is not expanded. The extracted
+        route sequence given is not changed.
+
+        :param ers: An extracted route sequence output by the field 15 parser;
+        :return: A new extracted route sequence with the ATS routes expanded
+        """
+        expanded = ExtractedRouteSequence()
+        expanded.extracted_route_records = []
+        expanded.error_records = [copy.copy(error_record) for error_record in ers.get_all_errors()]
+        expanded.set_derived_flight_rules(ers.get_derived_flight_rules())
+        originals = [copy.copy(record) for record in ers.get_all_elements()]
+        records = expanded.extracted_route_records
+        # The ranges of records whose bearing / distance are changed by an expansion
+        changed = []
+        for idx, record in enumerate(originals):
+            records.append(record)
+            if record.get_sub_type() not in self.ATS_ROUTE_SUB_TYPES or idx == 0 or idx + 1 >= len(originals):
+                continue
+            entry = originals[idx - 1]
+            exit_record = originals[idx + 1]
+            if entry.get_base_type() is not TokenBaseType.F15_POINT or \
+                    exit_record.get_base_type() is not TokenBaseType.F15_POINT:
+                # Syntax errors are reported by the field 15 parser
+                continue
+            expansion = self.expand(record.get_name(), entry.get_name(), exit_record.get_name())
+            if expansion is None:
+                self.add_expansion_errors(expanded, record, entry, exit_record)
+                continue
+
+            first_changed = max(0, len(records) - 4)
+            if not entry.is_lat_long_valid() and expansion[0][3]:
+                self.set_position(entry, expansion[0])
+            for point in expansion[1:-1]:
+                inserted = copy.copy(record)
+                inserted.set_name(point[0])
+                inserted.set_base_type(TokenBaseType.F15_POINT)
+                inserted.set_sub_type(TokenSubType.F15_SB_PRP)
+                inserted.set_bearing(0.0)
+                inserted.set_distance(0.0)
+                inserted.set_lat_long_valid(False)
+                if point[3]:
+                    self.set_position(inserted, point)
+                records.append(inserted)
+            if not exit_record.is_lat_long_valid() and expansion[-1][3]:
+                self.set_position(exit_record, expansion[-1])
+            # The exit point and the two records following it are appended next
+            changed.append((first_changed, len(records) + 3))
+
+        for first, last in changed:
+            self.assign_azimuth_distance(records[first:last])
+        return expanded
+
+    def add_expansion_errors(self, ers, record, entry, exit_record):
+        # type: (ExtractedRouteSequence, ExtractedRouteRecord, ExtractedRouteRecord, ExtractedRouteRecord) -> None
+        """Adds the errors for an ATS route that could not be expanded.
+
+        :param ers: The extracted route sequence the errors are added to;
+        :param record: The ATS route record;
+        :param entry: The point record preceding the ATS route;
+        :param exit_record: The point record following the ATS route;
+        :return: None
+        """
+        if record.get_name() not in self.airway_points:
+            self.add_error(ers, record, 56)
+            return
+        for point in [entry, exit_record]:
+            if not self.is_point_on_airway(record.get_name(), point.get_name()):
+                self.add_error(ers, point, 57)
+
+    @staticmethod
+    def add_error(ers, record, error_number):
+        # type: (ExtractedRouteSequence, ExtractedRouteRecord, int) -> None
+        """Adds an error for an extracted route record to an extracted route sequence.
+
+        :param ers: The extracted route sequence the error is added to;
+        :param record: The erroneous record;
+        :param error_number: An index to an error message defined in the ErrorMessageDefinitions class;
+        :return: None
+        """
+        ers.add_error(record.get_name(), record.get_start_index(), record.get_end_index(),
+                      record.get_base_type(), record.get_sub_type(), ErrorMessages.error_messages[error_number])
+
+    @staticmethod
+    def set_position(record, point):
+        # type: (ExtractedRouteRecord, tuple) -> None
+        """Assigns the latitude / longitude of an airway point to an extracted route record.
+
+        :param record: The extracted route record;
+        :param point: An airway point tuple, see expand();
+        :return: None
+        """
+        record.set_latitude(point[1])
+        record.set_longitude(point[2])
+        record.set_lat_long_valid(True)
+
+    @staticmethod
+    def assign_azimuth_distance(records):
+        # type: ([ExtractedRouteRecord]) -> None
+        """Sets the bearing / distance between points with a valid latitude / longitude that follow one
+        another or are separated by one connector, the bearing / distance is set at the first point; this
+        is the same rule as used by the field 15 parser.
+
+        :param records: The extracted route records;
+        :return: None
+        """
+        # The bearing / distance of the last two records may be to a point following the records
+        for record in records[:-2]:
+            record.set_bearing(0.0)
+            record.set_distance(0.0)
+        utils = Utils()
+        for idx in range(1, len(records)):
+            record = records[idx]
+            if not record.is_lat_long_valid():
+                continue
+            previous = records[idx - 1]
+            if not previous.is_lat_long_valid():
+                if idx < 2 or not records[idx - 2].is_lat_long_valid():
+                    continue
+                previous = records[idx - 2]
+            azimuth_distance = utils.get_bearing_distance_between_points(
+                previous.get_latitude(), previous.get_longitude(), record.get_latitude(), record.get_longitude())
+            previous.set_bearing(azimuth_distance[0])
+            previous.set_distance(azimuth_distance[1])
@@ -0,0 +1,444 @@
+import struct
+import sys
+from array import array
+
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+
+
+class ColumnarRecords:
+    """This class stores a list of extracted route records column by column, one column per
+    ExtractedRouteRecord member in the order of ExtractedRouteRecord.STATE_ATTRIBUTES. Each column is
+    stored with the smallest of these encodings:
+        - Constant: All records have the same value, the value is stored once;
+        - Dictionary: The distinct values of the column are stored once and each record stores the
+          index of its value as a 1, 2 or 4 byte integer; all strings use this encoding and are
+          interned, (sys.intern()), so routes share the same point names, speeds, levels etc.;
+        - Plain: Integer and float members stored as 2 or 4 byte integers or 8 byte floats, (e.g. the
+          text indices and the latitude / longitude of a route given as latitude / longitude points).
+    The encoded columns are stored in a single bytes object preceded by a layout giving the encoding and
+    location of each column; the distinct values of all columns are stored in a single tuple. Values are
+    returned with the type they have in an ExtractedRouteRecord.
+
+    The members are declared as __slots__ to keep the size of an instance small:
+        - count: The number of records;
+        - data: The layout followed by the encoded columns, a bytearray once a value is written in place;
+        - values: The distinct values of the dictionary and constant encoded columns."""
+
+    __slots__ = ("count", "data", "values")
+
+    CONSTANT: int = 0
+    """Encoding of a column with the same value for all records"""
+
+    PLAIN: int = 1
+    """Encoding of a column stored as an array of values"""
+
+    DICTIONARY: int = 2
+    """Encoding of a column stored as an array of indices into the distinct values"""
+
+    LAYOUT: struct.Struct = struct.Struct("=BcII")
+    """The layout of a column; encoding, array type code, byte offset of the array in the data and
+    offset of the first distinct value in the values"""
+
+    STRUCTS: dict = {type_code: struct.Struct("=" + type_code) for type_code in "BHIid"}
+    """Structures used to read a single array item keyed on the array type code"""
+
+    NUMBER_OF_MEMBERS: int = len(ExtractedRouteRecord.STATE_ATTRIBUTES)
+    """The number of columns"""
+
+    def __init__(self, states=()):
+        # type: ([tuple]) -> None
+        """Constructor that encodes a list of records.
+
+        :param states: A list of record members as returned by ExtractedRouteRecord.__getstate__();
+        :return: None
+        """
+        self.encode(states)
+
+    def __len__(self):
+        # type: () -> int
+        return self.count
+
+    def encode(self, states, plain_member=-1):
+        # type: ([tuple], int) -> None
+        """Encodes a list of records replacing the records stored.
+
+        :param states: A list of record members as returned by ExtractedRouteRecord.__getstate__();
+        :param plain_member: The index of a member stored as a plain array if its values can be, whatever
+               the size of the other encodings, (see set_value()), -1 to store every member with the
+               smallest encoding;
+        :return: None
+        """
+        self.count = len(states)
+        if self.count == 0:
+            self.data = b""
+            self.values = ()
+            return
+        layout = []
+        arrays = []
+        values = []
+        offset = self.LAYOUT.size * self.NUMBER_OF_MEMBERS
+        for member, column in enumerate(zip(*states)):
+            # Distinct values keyed on the type and value, e.g. 0, 0.0 and False are distinct
+            distinct = {}
+            for value in column:
+                distinct.setdefault((value.__class__, value), len(distinct))
+            plain_type_code = self.plain_type_code(column) if member == plain_member else None
+            if plain_type_code is None and len(distinct) == 1:
+                layout.append(self.LAYOUT.pack(self.CONSTANT, b"B", 0, len(values)))
+                values.append(self.intern(column[0]))
+                continue
+
+            if plain_type_code is None:
+                plain_type_code = self.plain_type_code(column)
+            index_type_code = "B" if len(distinct) <= 0x100 else "H" if len(distinct) <= 0x10000 else "I"
+            # A distinct value costs a reference and, unless a string, the value object
+            dictionary_size = len(distinct) * (8 if column[0].__class__ is str else 32) + \
+                array(index_type_code).itemsize * self.count
+            if plain_type_code is not None and (member == plain_member or
+                                                array(plain_type_code).itemsize * self.count < dictionary_size):
+                encoded = array(plain_type_code, column)
+                layout.append(self.LAYOUT.pack(self.PLAIN, plain_type_code.encode(), offset, 0))
+            else:
+                encoded = array(index_type_code, [distinct[(value.__class__, value)] for value in column])
+                layout.append(self.LAYOUT.pack(self.DICTIONARY, index_type_code.encode(), offset, len(values)))
+                values.extend([self.intern(value) for _, value in distinct])
+            arrays.append(encoded.tobytes())
+            offset += len(arrays[-1])
+        self.data = b"".join(layout + arrays)
+        self.values = tuple(values)
+
+    @staticmethod
+    def intern(value):
+        # type: (object) -> object
+        """Interns a string value so identical strings in all routes are stored once.
+
+        :param value: A record member value;
+        :return: The interned string or the value if not a string
+        """
+        return sys.intern(value) if value.__class__ is str else value
+
+    @staticmethod
+    def plain_type_code(column):
+        # type: (tuple) -> str | None
+        """Gets the array type code used to store a column of values as a plain array.
+
+        :param column: The values of a record member for all records;
+        :return: 'd' for a column of floats, 'H' or 'i' for a column of integers that fit in 2 or 4 bytes
+                 or None if the values cannot be stored as a plain array
+        """
+        value_type = column[0].__class__
+        if any(value.__class__ is not value_type for value in column):
+            return None
+        if value_type is float:
+            return "d"
+        if value_type is int:
+            if 0 <= min(column) and max(column) <= 0xffff:
+                return "H"
+            if -0x80000000 <= min(column) and max(column) <= 0x7fffffff:
+                return "i"
+        return None
+
+    def get_value(self, index, member):
+        # type: (int, int) -> object
+        """Gets the value of a record member.
+
+        :param index: The record index;
+        :param member: The member index in ExtractedRouteRecord.STATE_ATTRIBUTES;
+        :return: The member value
+        """
+        encoding, type_code, offset, value_offset = self.LAYOUT.unpack_from(self.data, self.LAYOUT.size * member)
+        if encoding == self.CONSTANT:
+            return self.values[value_offset]
+        item = self.STRUCTS[type_code.decode()]
+        value = item.unpack_from(self.data, offset + item.size * index)[0]
+        if encoding == self.PLAIN:
+            return value
+        return self.values[value_offset + value]
+
+    def get_column(self, member):
+        # type: (int) -> list
+        """Gets the values of a record member for all records.
+
+        :param member: The member index in ExtractedRouteRecord.STATE_ATTRIBUTES;
+        :return: A list of values
+        """
+        encoding, type_code, offset, value_offset = self.LAYOUT.unpack_from(self.data, self.LAYOUT.size * member)
+        if encoding == self.CONSTANT:
+            return [self.values[value_offset]] * self.count
+        encoded = array(type_code.decode())
+        encoded.frombytes(self.data[offset:offset + encoded.itemsize * self.count])
+        if encoding == self.PLAIN:
+            return encoded.tolist()
+        values = self.values
+        return [values[value_offset + value] for value in encoded]
+
+    def get_states(self):
+        # type: () -> [tuple]
+        """Gets the members of all records.
+        :return: A list of record members in the format returned by ExtractedRouteRecord.__getstate__()"""
+        if self.count == 0:
+            return []
+        return list(zip(*[self.get_column(member) for member in range(0, self.NUMBER_OF_MEMBERS)]))
+
+    def set_value(self, index, member, value):
+        # type: (int, int, object) -> None
+        """Sets the value of a record member. The value is written in place if the encoding of the member
+        can hold it, i.e. a plain array of the values type and range or a dictionary already containing the
+        value; otherwise the columns are encoded again with the member stored as a plain array if its values
+        can be, so that setting the member of each record in turn, (e.g. writing back bearings), only
+        encodes the columns once.
+
+        :param index: The record index;
+        :param member: The member index in ExtractedRouteRecord.STATE_ATTRIBUTES;
+        :param value: The value;
+        :return: None
+        """
+        encoding, type_code, offset, value_offset = self.LAYOUT.unpack_from(self.data, self.LAYOUT.size * member)
+        type_code = type_code.decode()
+        if encoding == self.CONSTANT:
+            stored = self.values[value_offset]
+            if stored.__class__ is value.__class__ and stored == value:
+                return
+        elif encoding == self.PLAIN:
+            # A plain 'i' column also holds the integers stored in a 'H' column
+            value_type_code = self.plain_type_code((value,))
+            if value_type_code == type_code or (value_type_code == "H" and type_code == "i"):
+                self.write_item(type_code, offset, index, value)
+                return
+        else:
+            position = self.find_value(member, value_offset, value)
+            if position >= 0:
+                self.write_item(type_code, offset, index, position)
+                return
+
+        states = self.get_states()
+        state = list(states[index])
+        state[member] = value
+        states[index] = tuple(state)
+        self.encode(states, member)
+
+    def find_value(self, member, value_offset, value):
+        # type: (int, int, object) -> int
+        """Finds a value in the distinct values of a dictionary encoded member.
+
+        :param member: The member index in ExtractedRouteRecord.STATE_ATTRIBUTES;
+        :param value_offset: The offset of the first distinct value of the member in the values;
+        :param value: The value to find;
+        :return: The index of the value in the distinct values of the member, -1 if not found
+        """
+        # The distinct values of the member end where the values of the next member that has any start
+        end = len(self.values)
+        for next_member in range(member + 1, self.NUMBER_OF_MEMBERS):
+            encoding, _, _, next_value_offset = self.LAYOUT.unpack_from(self.data, self.LAYOUT.size * next_member)
+            if encoding != self.PLAIN:
+                end = next_value_offset
+                break
+        position = value_offset
+        while True:
+            try:
+                position = self.values.index(value, position, end)
+            except ValueError:
+                return -1
+            # Equal values of another type, e.g. 0, 0.0 and False, are distinct
+            if self.values[position].__class__ is value.__class__:
+                return position - value_offset
+            position += 1
+
+    def write_item(self, type_code, offset, index, item):
+        # type: (str, int, int, int | float) -> None
+        """Writes an item of an encoded column in place.
+
+        :param type_code: The array type code of the column;
+        :param offset: The byte offset of the column in the data;
+        :param index: The record index;
+        :param item: The value of a plain column or the index into the distinct values of a dictionary column;
+        :return: None
+        """
+        if self.data.__class__ is not bytearray:
+            self.data = bytearray(self.data)
+        structure = self.STRUCTS[type_code]
+        structure.pack_into(self.data, offset + structure.size * index, item)
+
+
+class ColumnarRouteRecord:
+    """This class is a lightweight view of one record of a ColumnarRouteSequence providing the getters,
+    setters and formatting methods of ExtractedRouteRecord; the view holds only a reference to the
+    columns and the record index, values are read from and written to the columns."""
+
+    __slots__ = ("records", "index")
+
+    def __init__(self, records, index):
+        # type: (ColumnarRecords, int) -> None
+        """Constructor for a view of a record.
+
+        :param records: The columns containing the record;
+        :param index: The record index;
+        :return: None
+        """
+        self.records = records
+        self.index = index
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        return isinstance(other, ColumnarRouteRecord) and self.records is other.records and \
+            self.index == other.index
+
+    def __hash__(self):
+        # type: () -> int
+        return hash((id(self.records), self.index))
+
+    def to_extracted_route_record(self):
+        # type: () -> ExtractedRouteRecord
+        """Creates an ExtractedRouteRecord containing a copy of this record.
+        :return: An ExtractedRouteRecord instance"""
+        record = ExtractedRouteRecord.__new__(ExtractedRouteRecord)
+        record.__setstate__(tuple(self.records.get_value(self.index, member)
+                                  for member in range(0, ColumnarRecords.NUMBER_OF_MEMBERS)))
+        return record
+
+    # The formatting methods only use the getters, they are shared with ExtractedRouteRecord
+    print_record = ExtractedRouteRecord.print_record
+    to_string = ExtractedRouteRecord.to_string
+    as_xml = ExtractedRouteRecord.as_xml
+
+
+def _add_accessors():
+    # type: () -> None
+    """Adds a getter and setter to ColumnarRouteRecord for each member of ExtractedRouteRecord with
+    the names of the ExtractedRouteRecord getters and setters, e.g. get_speed() and set_speed()."""
+    for member, attribute in enumerate(ExtractedRouteRecord.STATE_ATTRIBUTES):
+        name = "name" if attribute == "string" else attribute
+        getter_name = "is_" + name if attribute == "lat_long_valid" else "get_" + name
+
+        def getter(self, member=member):
+            return self.records.get_value(self.index, member)
+
+        def setter(self, value, member=member):
+            self.records.set_value(self.index, member, value)
+
+        getter.__name__ = getter_name
+        getter.__doc__ = getattr(ExtractedRouteRecord, getter_name).__doc__
+        setter.__name__ = "set_" + name
+        setter.__doc__ = getattr(ExtractedRouteRecord, "set_" + name).__doc__
+        setattr(ColumnarRouteRecord, getter_name, getter)
+        setattr(ColumnarRouteRecord, "set_" + name, setter)
+
+
+_add_accessors()
+
+
+class ColumnarRouteSequence:
+    """This class is a compact, read mostly representation of an ExtractedRouteSequence intended for
+    storing a large number of routes; the records are stored column by column, see ColumnarRecords.
+    A route of 50 elements uses less than a tenth of the memory of an ExtractedRouteSequence.
+
+    The records are accessed through ColumnarRouteRecord views that provide the ExtractedRouteRecord
+    getters and setters, this class provides the ExtractedRouteSequence getters. An
+    ExtractedRouteSequence is converted with from_ers() and converted back with to_ers().
+
+    The members are declared as __slots__ to keep the size of an instance small:
+        - elements: The extracted route records;
+        - errors: The error records;
+        - derived_flight_rules: The flight rules derived from parsing field 15."""
+
+    __slots__ = ("elements", "errors", "derived_flight_rules")
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor for an empty route sequence, see from_ers().
+        :return: None"""
+        self.elements = ColumnarRecords()
+        self.errors = ColumnarRecords()
+        self.derived_flight_rules = ""
+
+    @staticmethod
+    def from_ers(ers):
+        # type: (ExtractedRouteSequence) -> ColumnarRouteSequence
+        """Converts an extracted route sequence.
+
+        :param ers: The extracted route sequence;
+        :return: A ColumnarRouteSequence containing the same records
+        """
+        sequence = ColumnarRouteSequence()
+        sequence.elements.encode([record.__getstate__() for record in ers.get_all_elements()])
+        sequence.errors.encode([record.__getstate__() for record in ers.get_all_errors()])
+        sequence.derived_flight_rules = ers.get_derived_flight_rules()
+        return sequence
+
+    def to_ers(self):
+        # type: () -> ExtractedRouteSequence
+        """Converts this route sequence to an extracted route sequence.
+        :return: An ExtractedRouteSequence containing the same records"""
+        ers = ExtractedRouteSequence()
+        ers.extracted_route_records = ExtractedRouteSequence.unpack_records(
+            tuple(value for state in self.elements.get_states() for value in state))
+        ers.error_records = ExtractedRouteSequence.unpack_records(
+            tuple(value for state in self.errors.get_states() for value in state))
+        ers.set_derived_flight_rules(self.derived_flight_rules)
+        return ers
+
+    def as_xml(self):
+        # type: () -> str
+        """This method generates an XML string containing a complete ERS, see ExtractedRouteSequence.as_xml()
+        :return: The XML string"""
+        return self.to_ers().as_xml()
+
+    def get_all_elements(self):
+        # type: () -> [ColumnarRouteRecord]
+        """Gets views of all extracted route records
+        :return: A list of ColumnarRouteRecord views"""
+        return [ColumnarRouteRecord(self.elements, index) for index in range(0, len(self.elements))]
+
+    def get_all_errors(self):
+        # type: () -> [ColumnarRouteRecord]
+        """Gets views of all error records
+        :return: A list of ColumnarRouteRecord views"""
+        return [ColumnarRouteRecord(self.errors, index) for index in range(0, len(self.errors))]
+
+    def get_derived_flight_rules(self):
+        # type: () -> str
+        """Gets the flight rules derived from parsing field 15
+        :return: The flight rules, 'I', 'V', 'Y' or 'Z'"""
+        return self.derived_flight_rules
+
+    def get_element_at(self, index):
+        # type: (int) -> ColumnarRouteRecord | None
+        """Gets a view of the extracted route record at an index.
+
+        :param index: The record index;
+        :return: A ColumnarRouteRecord view or None if the index is out of range
+        """
+        if index < 0 or index >= len(self.elements):
+            return None
+        return ColumnarRouteRecord(self.elements, index)
+
+    def get_first_element(self):
+        # type: () -> ColumnarRouteRecord | None
+        """Gets a view of the first extracted route record
+        :return: A ColumnarRouteRecord view or None if there are no records"""
+        return self.get_element_at(0)
+
+    def get_last_element(self):
+        # type: () -> ColumnarRouteRecord | None
+        """Gets a view of the last extracted route record
+        :return: A ColumnarRouteRecord view or None if there are no records"""
+        return self.get_element_at(len(self.elements) - 1)
+
+    def get_number_of_elements(self):
+        # type: () -> int
+        """Gets the number of extracted route records
+        :return: The number of records"""
+        return len(self.elements)
+
+    def get_number_of_errors(self):
+        # type: () -> int
+        """Gets the number of error records
+        :return: The number of error records"""
+        return len(self.errors)
+
+    def get_previous_to_last_element(self):
+        # type: () -> ColumnarRouteRecord | None
+        """Gets a view of the extracted route record before the last record
+        :return: A ColumnarRouteRecord view or None if there are fewer than two records"""
+        return self.get_element_at(len(self.elements) - 2)
@@ -57,5 +57,7 @@ class ErrorMessages:
         53: "Add crossing point between previous ATS route and '!'",
         54: "Add APF between previous ATS route and STAR '!'",
         55: "The SPEED/LEVEL '!' cannot follow an ATS route",
-        56: ""
+        56: "The ATS route '!' is not in the airway database",
+        57: "The point '!' is not on the ATS route it is connected to",
+        58: ""
     }
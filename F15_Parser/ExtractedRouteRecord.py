@@ -78,6 +78,14 @@ class ExtractedRouteRecord:
     lat_long_valid: bool = False
     """Indicates if a latitude and longitude are available for a point"""
 
+    STATE_ATTRIBUTES: tuple = ("string", "start_index", "end_index", "base_type", "sub_type",
+                               "altitude", "altitude_si", "speed", "speed_si", "break_text",
+                               "flight_rules", "error_text", "stay_time", "altitude_cruise_to",
+                               "altitude_cruise_to_si", "latitude", "longitude", "bearing",
+                               "distance", "lat_long_valid")
+    """The class members packed (in this order) into a flat tuple when a record is pickled,
+    see __getstate__() and __setstate__()"""
+
     def __init__(self, string="", start_index=0, end_index=0, base_type=0, sub_type=0):
         # type: (str, int, int, TokenBaseType, TokenSubType) -> None
         """Creates a route element with its text, start, end index and both element types.
@@ -96,6 +104,31 @@ class ExtractedRouteRecord:
         self.base_type = base_type
         self.sub_type = sub_type
 
+    def __getstate__(self):
+        # type: () -> tuple
+        """Packs all class members into a flat tuple for pickling; the tuple is ordered as
+        defined in STATE_ATTRIBUTES. A flat tuple avoids pickling the member names with every
+        record as is the case with the default instance dictionary.
+
+            :return: A tuple containing all class members"""
+        return (self.string, self.start_index, self.end_index, self.base_type, self.sub_type,
+                self.altitude, self.altitude_si, self.speed, self.speed_si, self.break_text,
+                self.flight_rules, self.error_text, self.stay_time, self.altitude_cruise_to,
+                self.altitude_cruise_to_si, self.latitude, self.longitude, self.bearing,
+                self.distance, self.lat_long_valid)
+
+    def __setstate__(self, state):
+        # type: (tuple) -> None
+        """Restores all class members from a flat tuple created by __getstate__().
+
+            :param state: A tuple containing all class members ordered as defined in STATE_ATTRIBUTES
+            :return: None"""
+        (self.string, self.start_index, self.end_index, self.base_type, self.sub_type,
+         self.altitude, self.altitude_si, self.speed, self.speed_si, self.break_text,
+         self.flight_rules, self.error_text, self.stay_time, self.altitude_cruise_to,
+         self.altitude_cruise_to_si, self.latitude, self.longitude, self.bearing,
+         self.distance, self.lat_long_valid) = state
+
     #
     def append_break_text(self, break_text):
         # type: (str) -> None
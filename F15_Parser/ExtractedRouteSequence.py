@@ -29,6 +29,44 @@ class ExtractedRouteSequence:
         # Create a dummy record that will be used for the ADEP
         self.add_dummy_adep_ades("ADEP")
 
+    def __getstate__(self):
+        # type: () -> tuple
+        """Packs the extracted route sequence into flat tuples for pickling. The members of every
+        extracted route record are stored one after another in a single tuple, (the same is done
+        for the error records), the records are rebuilt from these tuples by __setstate__().
+
+            :return: A tuple containing the derived flight rules, a flat tuple of all extracted route
+                     records and a flat tuple of all error records;"""
+        return (self.derived_flight_rules,
+                tuple([member for record in self.extracted_route_records for member in record.__getstate__()]),
+                tuple([member for record in self.error_records for member in record.__getstate__()]))
+
+    def __setstate__(self, state):
+        # type: (tuple) -> None
+        """Restores the extracted route sequence from the flat tuples created by __getstate__().
+
+            :param state: A tuple as returned by __getstate__();
+            :return: None"""
+        self.derived_flight_rules = state[0]
+        self.extracted_route_records = self.unpack_records(state[1])
+        self.error_records = self.unpack_records(state[2])
+
+    @staticmethod
+    def unpack_records(flat_records):
+        # type: (tuple) -> [ExtractedRouteRecord]
+        """Rebuilds a list of extracted route records from a flat tuple of record members.
+
+            :param flat_records: A flat tuple of record members, each record occupies
+                   len(ExtractedRouteRecord.STATE_ATTRIBUTES) consecutive entries;
+            :return: A list of ExtractedRouteRecord instances;"""
+        records = []
+        stride = len(ExtractedRouteRecord.STATE_ATTRIBUTES)
+        for idx in range(0, len(flat_records), stride):
+            record = ExtractedRouteRecord.__new__(ExtractedRouteRecord)
+            record.__setstate__(flat_records[idx:idx + stride])
+            records.append(record)
+        return records
+
     def add_dummy_adep_ades(self, aero):
         # type: (str) -> ExtractedRouteRecord
         """Creates and adds a dummy record for the ADEP or ADES. The extracted route sequence always starts
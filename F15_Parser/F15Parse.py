@@ -3,11 +3,15 @@ import copy
 from F15_Parser.ErrorMessageDefinitions import ErrorMessages
 from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
 from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.NavigationDatabase import NavigationDatabase
 from F15_Parser.F15TokenSyntaxDescriptions import TokenSubType, TokenBaseType, F15TokenSyntaxDefinition
 from Tokenizer.Tokens import Tokens
 from Tokenizer.Token import Token
+from Utilities.BatchGeodesy import GeodesyBatch
+from Utilities.GeodesyBackends import GeodesyBackend, EllipsoidalGeodesy
 from Utilities.Utils import Utils
 from Utilities.Constants import Constants
+from Utilities.SpeedLevelConversions import SpeedLevelConversions
 
 
 class ParseF15:
@@ -49,6 +53,35 @@ class ParseF15:
         - "O": "OAT" - Used to indicated Operational Air Traffic (OAT) section of a flight plan;
         - "S": "IFPS" - Used to indicate a 'break' in the IFR routing as determined by EUROCONTROL"""
 
+    navigation_database: NavigationDatabase | None = None
+    """An optional navigation database used to resolve the position of published route points and
+    aerodromes, None if these are not resolved"""
+
+    geodesy_batch: GeodesyBatch | None = None
+    """An optional batch the bearing / distance calculations are added to instead of being performed
+    while parsing, (deferred geodesy mode), None to perform the calculations while parsing"""
+
+    geodesy_backend: GeodesyBackend = EllipsoidalGeodesy()
+    """The geodesy backend performing the bearing / distance calculations while parsing, not used in
+    deferred geodesy mode where the calculations are always ellipsoidal"""
+
+    def __init__(self, navigation_database=None, geodesy_batch=None, geodesy_backend=None):
+        # type: (NavigationDatabase | None, GeodesyBatch | None, GeodesyBackend | None) -> None
+        """Constructor for the field 15 parser.
+
+        :param navigation_database: Optional, a navigation database used to resolve the position of
+               published route points and aerodromes;
+        :param geodesy_batch: Optional, a batch collecting the bearing / distance calculations that are
+               performed when GeodesyBatch.compute() is called rather than while parsing;
+        :param geodesy_backend: Optional, the geodesy backend performing the bearing / distance
+               calculations, EllipsoidalGeodesy if not given;
+        :return: None
+        """
+        self.navigation_database = navigation_database
+        self.geodesy_batch = geodesy_batch
+        if geodesy_backend is not None:
+            self.geodesy_backend = geodesy_backend
+
     def parse_f15(self, ers, tokens):
         # type: (ExtractedRouteSequence, Tokens) -> bool
         """Entry point for the field 15 parser. Field 15 must start with one of two
@@ -205,27 +238,15 @@ class ParseF15:
             ex_route_rec.set_altitude_cruise_to(altitude_string)
         else:
             ex_route_rec.set_altitude(altitude_string)
-        altitude = int(altitude_string[1:])
-        altitude_type = altitude_string[0:1]
-        match altitude_type:
-            # Types 'F' and 'S' are pressure flight levels in imperial ('F') or SI ('S') units
-            # Types 'A' and 'M' are altitudes in imperial ('A') or SI ('M') units
-            case "A":
-                # A = Altitude in hundreds of feet, e.g. A045 = 4,500 feet (1,372 Meters)
-                altitude = (altitude * 100) * Constants.FEET_TO_METERS
-            case "F":
-                # F = Flight Level in hundreds of feet, e.g. F350 = 35,000 feet (10,668 Meters)
-                if altitude % 5 != 0:
-                    self.add_error_no_re_sync(ers, token, 40)
-                altitude = (altitude * 100) * Constants.FEET_TO_METERS
-            case "S" | "M":
-                # S = Flight Level in tens of meters, e.g. S1130 = 11,300 meters
-                # M = Altitude in tens of meters, e.g. M0840 = 8,400 meters
-                altitude = altitude * 10
+        # The conversion to meters is looked up, see SpeedLevelConversions
+        altitude_si, valid = SpeedLevelConversions.level_to_si(altitude_string)
+        if not valid:
+            # Flight levels must be a multiple of 5
+            self.add_error_no_re_sync(ers, token, 40)
         if cruise:
-            ex_route_rec.set_altitude_cruise_to_si(int(altitude + 0.5))
+            ex_route_rec.set_altitude_cruise_to_si(altitude_si)
         else:
-            ex_route_rec.set_altitude_si(int(altitude + 0.5))
+            ex_route_rec.set_altitude_si(altitude_si)
 
     def assign_azimuth_distance_between_points(self, ers):
         # type: (ExtractedRouteSequence) -> None
@@ -292,6 +313,8 @@ class ParseF15:
             - Lat/Long Degrees: Latitude degrees checked for max 90 and longitude degrees max 180 degrees;
             - Lat/Long Degrees & Minutes: Latitude degrees checked for max 90, minutes 59 and longitude
               degrees max 180, minutes 59;
+        If a navigation database is set, the positions of published route points, (including the point of
+        a point / bearing / distance), and aerodromes are looked up in the navigation database.
 
         :param ers: An ExtractedRouteSequence class instance that any erroneous token are saved to;
         :param token: The point token being semantically checked;
@@ -301,13 +324,19 @@ class ParseF15:
         sub_type = token.get_token_sub_type()
         ex_route_rec = ers.get_last_element()
         match sub_type:
+            case TokenSubType.F15_SB_PRP | TokenSubType.F15_SB_PRP_AERO:
+                # Published route point or aerodrome, resolved from the navigation database
+                if self.resolve_named_point(ers, ex_route_rec, token_string, sub_type):
+                    self.assign_azimuth_distance_between_points(ers)
             case TokenSubType.F15_SB_PRP_BD:
                 # Point followed by Bearing Distance
                 if not Utils.is_degree_semantics(token_string[-6:-3], 360):
                     self.add_error_no_re_sync(ers, token, 46)
-                    # To populate the lat/long properly, the lat/long for the
-                    # point is needed, which we currently do not have.
-                    # Nothing to do for now.
+                # To populate the lat/long properly, the lat/long for the
+                # point is needed, this is only available from a navigation database.
+                if self.resolve_named_point(ers, ex_route_rec, token_string[:-6], sub_type):
+                    self.resolve_real_bd_point(
+                        ers, ex_route_rec, float(token_string[-6:-3]), float(token_string[-3:]))
             case TokenSubType.F15_SB_LL_DEG:
                 # Lat/Long in Degrees
                 self.assign_ll_deg(ers, token, ex_route_rec, token_string)
@@ -436,20 +465,9 @@ class ParseF15:
         """
         ex_route_rec.set_speed(speed_string)
 
-        # Need the altitude in meters for Mach calculation
-        altitude_si = ex_route_rec.get_altitude_si()
-        speed = int(speed_string[1:])
-        speed_type = speed_string[0:1]
-        match speed_type:
-            case "K":
-                # Kilometers / hour
-                speed = speed * Constants.KMH_TO_METERS_SECOND
-            case "N":
-                # Knots
-                speed = speed * Constants.KNOTS_TO_METERS_SECOND
-            case "M":
-                speed = Utils.mach_to_ms_speed(speed, altitude_si)
-        ex_route_rec.set_speed_si(int(speed + 0.5))
+        # Need the altitude in meters for Mach calculation, the conversion is looked up,
+        # see SpeedLevelConversions
+        ex_route_rec.set_speed_si(SpeedLevelConversions.speed_to_si(speed_string, ex_route_rec.get_altitude_si()))
 
     def assign_speed_altitude(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -468,9 +486,38 @@ class ParseF15:
                be extracted from;
         :return: None
         """
+        if not self.set_speed_altitude(ers, token):
+            return
+
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return
+
+        # If there is only one ERS record it has to be the ADEP record, i.e. the
+        # next token is the first element following the first SPEED / LEVEL
+        # element. Otherwise, we are processing an element after a SPEED / LEVEL
+        # somewhere else in field 15.
+        if ers.get_number_of_elements() == 1:
+            self.post_adep(ers, tokens, next_token)
+        else:
+            # Go to post point processing as a rule change to IFR is terminated
+            # with a point
+            self.post_point(ers, tokens, next_token)
+
+    def set_speed_altitude(self, ers, token):
+        # type: (ExtractedRouteSequence, Token) -> bool
+        """This method applies the speed and altitude of a speed / altitude element to the last ERS
+        record and sets IFR rules on the record, see assign_speed_altitude().
+
+        :param ers: An ExtractedRouteSequence class instance containing a point in
+               the last ERS record that the speed and altitude will be written to;
+        :param token: The speed / altitude token from which the speed and altitude will
+               be extracted from;
+        :return: True if the speed and altitude were applied, False otherwise
+        """
         ex_route_rec = ers.get_last_element()
         if ex_route_rec is None:
-            return
+            return False
         token_string = token.get_token_string()
         sub_type = token.get_token_sub_type()
         match sub_type:
@@ -487,25 +534,11 @@ class ParseF15:
             case _:
                 self.assign_altitude(ers, token, ex_route_rec, "X000", False)
                 self.assign_speed(ex_route_rec, "X0000")
-                return
+                return False
 
         # As this is a speed altitude element, the rules must be IFR
         ex_route_rec.set_flight_rules(self.RULES["I"])
-
-        next_token = tokens.get_next_token()
-        if next_token is None:
-            return
-
-        # If there is only one ERS record it has to be the ADEP record, i.e. the
-        # next token is the first element following the first SPEED / LEVEL
-        # element. Otherwise, we are processing an element after a SPEED / LEVEL
-        # somewhere else in field 15.
-        if ers.get_number_of_elements() == 1:
-            self.post_adep(ers, tokens, next_token)
-        else:
-            # Go to post point processing as a rule change to IFR is terminated
-            # with a point
-            self.post_point(ers, tokens, next_token)
+        return True
 
     def assign_speed_altitude_altitude(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -522,9 +555,30 @@ class ParseF15:
                be extracted from;
         :return: None
         """
+        if not self.set_speed_altitude_altitude(ers, token):
+            return
+
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return
+
+        self.post_point(ers, tokens, next_token)
+
+    def set_speed_altitude_altitude(self, ers, token):
+        # type: (ExtractedRouteSequence, Token) -> bool
+        """This method applies the speed and altitudes of the speed / altitude / altitude part of a cruise
+        climb element to the last ERS record and sets IFR rules on the record, see
+        assign_speed_altitude_altitude().
+
+        :param ers: An ExtractedRouteSequence class instance containing a point in
+               the last ERS record that the speed and altitude will be written to.
+        :param token: The speed / altitude token from which the speed and altitude will
+               be extracted from;
+        :return: True if the speed and altitudes were applied, False otherwise
+        """
         ex_route_rec = ers.get_last_element()
         if ex_route_rec is None:
-            return
+            return False
         token_string = token.get_token_string()
         sub_type = token.get_token_sub_type()
         match sub_type:
@@ -567,16 +621,11 @@ class ParseF15:
             case _:
                 self.assign_altitude(ers, token, ex_route_rec, "X000", False)
                 self.assign_speed(ex_route_rec, "X000")
-                return
+                return False
 
         # As this is a speed altitude element, the rules must be IFR
         ex_route_rec.set_flight_rules(self.RULES["I"])
-
-        next_token = tokens.get_next_token()
-        if next_token is None:
-            return
-
-        self.post_point(ers, tokens, next_token)
+        return True
 
     def assign_speed_altitude_plus(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -593,9 +642,30 @@ class ParseF15:
                be extracted from;
         :return: None
         """
+        if not self.set_speed_altitude_plus(ers, token):
+            return
+
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return
+
+        self.post_point(ers, tokens, next_token)
+
+    def set_speed_altitude_plus(self, ers, token):
+        # type: (ExtractedRouteSequence, Token) -> bool
+        """This method applies the speed and altitude of the speed / altitude / plus part of a cruise
+        climb element to the last ERS record and sets IFR rules on the record, see
+        assign_speed_altitude_plus().
+
+        :param ers: An ExtractedRouteSequence class instance containing a point in
+               the last ERS record that the speed and altitude will be written to.
+        :param token: The speed / altitude token from which the speed and altitude will
+               be extracted from;
+        :return: True if the speed and altitude were applied, False otherwise
+        """
         ex_route_rec = ers.get_last_element()
         if ex_route_rec is None:
-            return
+            return False
         token_string = token.get_token_string()
         sub_type = token.get_token_sub_type()
         match sub_type:
@@ -620,16 +690,11 @@ class ParseF15:
             case _:
                 self.assign_altitude(ers, token, ex_route_rec, "X000", False)
                 self.assign_speed(ex_route_rec, "X000")
-                return
+                return False
 
         # As this is a speed altitude element, the rules must be IFR
         ex_route_rec.set_flight_rules(self.RULES["I"])
-
-        next_token = tokens.get_next_token()
-        if next_token is None:
-            return
-
-        self.post_point(ers, tokens, next_token)
+        return True
 
     def assign_speed_vfr(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -644,11 +709,29 @@ class ParseF15:
         :param token: The speed / VFR token from which the speed will be extracted from;
         :return: None
         """
+        if not self.set_speed_vfr(ers, token):
+            return
+
+        token = tokens.get_next_token()
+        if token is None:
+            return
+        self.break_text_save(ers, tokens, token)
+
+    def set_speed_vfr(self, ers, token):
+        # type: (ExtractedRouteSequence, Token) -> bool
+        """This method appends the VFR rule change record for a speed / VFR element to the ERS and
+        applies the speed to the VFR record and the preceding point, see assign_speed_vfr().
+
+        :param ers: An ExtractedRouteSequence class instance containing a point in the last ERS record
+               that the speed will be written to and a new VFR record will be appended to.
+        :param token: The speed / VFR token from which the speed will be extracted from;
+        :return: True if the VFR record was appended, False otherwise
+        """
         # Get the last ERS record which will be a point at which the VFR
         # rule change is taking place.
         point_ex_route_rec = ers.get_last_element()
         if point_ex_route_rec is None:
-            return
+            return False
 
         # Create a copy of the SPEED/VFR token and change the name to 'VFR'
         vfr_token = copy.deepcopy(token)
@@ -677,11 +760,7 @@ class ParseF15:
         point_ex_route_rec.set_speed_si(ex_route_rec.get_speed_si())
         point_ex_route_rec.set_altitude(ex_route_rec.get_altitude())
         point_ex_route_rec.set_altitude_si(ex_route_rec.get_altitude_si())
-
-        token = tokens.get_next_token()
-        if token is None:
-            return
-        self.break_text_save(ers, tokens, token)
+        return True
 
     def break_end(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1230,9 +1309,7 @@ class ParseF15:
         ers.get_last_element().set_flight_rules(self.RULES["I"])
 
         # Check lat/long and bearing distance semantics
-        if token.get_token_sub_type() != TokenSubType.F15_SB_PRP and \
-                token.get_token_sub_type() != TokenSubType.F15_SB_PRP_AERO:
-            self.assign_lat_long_bearing_distance(ers, token)
+        self.assign_lat_long_bearing_distance(ers, token)
 
         next_token = tokens.get_next_token()
         if next_token is None:
@@ -1240,6 +1317,38 @@ class ParseF15:
 
         self.post_point(ers, tokens, next_token)
 
+    def resolve_named_point(self, ers, ex_route_rec, designator, sub_type):
+        # type: (ExtractedRouteSequence, ExtractedRouteRecord, str, TokenSubType) -> bool
+        """This method looks up the position of a published route point or aerodrome in the navigation
+        database and assigns it to an ERS record; if the designator is found more than once, the position
+        closest to the previous point with a valid latitude / longitude is assigned.
+
+        :param ers: The complete extracted route sequence;
+        :param ex_route_rec: The extracted route record the position is assigned to;
+        :param designator: The designator of the point or aerodrome, e.g. 'LNZ' or 'LOWW';
+        :param sub_type: The token sub type of the point;
+        :return: True if the position was assigned, False if there is no navigation database or the
+                 designator is not found in the navigation database
+        """
+        if self.navigation_database is None:
+            return False
+        latitude = None
+        longitude = None
+        for idx in range(ers.get_number_of_elements() - 2, -1, -1):
+            previous = ers.get_element_at(idx)
+            if previous.is_lat_long_valid():
+                latitude = previous.get_latitude()
+                longitude = previous.get_longitude()
+                break
+        position = self.navigation_database.resolve(
+            designator, sub_type is TokenSubType.F15_SB_PRP_AERO, latitude, longitude)
+        if position is None:
+            return False
+        ex_route_rec.set_latitude(position[0])
+        ex_route_rec.set_longitude(position[1])
+        ex_route_rec.set_lat_long_valid(True)
+        return True
+
     def resolve_real_bd_point(self, ers, ex_route_rec, bearing, distance):
         # type: (ExtractedRouteSequence, ExtractedRouteRecord, float, float) -> None
         """This method calculates the coordinates for a point given by a Lat / Long / Bearing / Distance
@@ -1251,7 +1360,11 @@ class ParseF15:
         :param distance: The distance along the bearing where the point lies;
         :return: None
         """
-        result = Utils().get_bearing_distance_projected_point(
+        if self.geodesy_batch is not None:
+            self.geodesy_batch.add_projection(ex_route_rec, bearing, distance * Constants.NM_TO_METERS)
+            self.assign_azimuth_distance_between_points(ers)
+            return
+        result = self.geodesy_backend.get_bearing_distance_projected_point(
             ex_route_rec.get_latitude(), ex_route_rec.get_longitude(),
             bearing, distance * Constants.NM_TO_METERS)
         ex_route_rec.set_latitude(result[0])
@@ -1397,17 +1510,20 @@ class ParseF15:
             case _:
                 self.add_error_and_re_sync(ers, tokens, next_token, 0)
 
-    @staticmethod
-    def set_azimuth_and_distance(point_1, point_2):
+    def set_azimuth_and_distance(self, point_1, point_2):
         # type: (ExtractedRouteRecord, ExtractedRouteRecord) -> None
-        """This method sets a bearing / azimuth and distance from a point 'point_1' to point 'point_2'.
+        """This method sets a bearing / azimuth and distance from a point 'point_1' to point 'point_2';
+        in deferred geodesy mode the calculation is added to the geodesy batch instead.
 
         :param point_1: The point that will have the bearing / azimuth and distance set that provides the
                azimuth and distance from this point to point_2.
         :param point_2: The second point to calculate the azimuth and distance to.
         :return: None
         """
-        azimuth_distance = Utils().get_bearing_distance_between_points(
+        if self.geodesy_batch is not None:
+            self.geodesy_batch.add_azimuth_distance(point_1, point_2)
+            return
+        azimuth_distance = self.geodesy_backend.get_bearing_distance_between_points(
             point_1.get_latitude(), point_1.get_longitude(),
             point_2.get_latitude(), point_2.get_longitude())
         point_1.set_bearing(azimuth_distance[0])
@@ -1639,9 +1755,7 @@ class ParseF15:
         ex_route_rec = self.add_record(ers, token)
 
         # Check lat/long and bearing distance semantics
-        if token.get_token_sub_type() != TokenSubType.F15_SB_PRP and \
-                token.get_token_sub_type() != TokenSubType.F15_SB_PRP_AERO:
-            self.assign_lat_long_bearing_distance(ers, token)
+        self.assign_lat_long_bearing_distance(ers, token)
 
         # As this rule change is VFR to IFR and this is a speed altitude element,
         # the rules must be IFR
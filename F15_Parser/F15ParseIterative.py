@@ -0,0 +1,680 @@
+from enum import IntEnum
+
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import TokenSubType, TokenBaseType
+from Tokenizer.Tokens import Tokens
+from Tokenizer.Token import Token
+
+
+class F15ParserStates(IntEnum):
+    """The states of the table driven field 15 parser; each state selects the next parser
+    step from the base type of the token following the element just processed."""
+    POST_ADEP = 0
+    """The first SPEED/LEVEL has been applied to the ADEP"""
+    POST_POINT = 1
+    """A point, (or the speed / level applied at a point) has been processed"""
+    POST_SID = 2
+    """An SID has been processed"""
+    POST_ROUTE = 3
+    """An ATS route has been processed"""
+    POST_DCT = 4
+    """A DCT has been processed"""
+    POST_STAY_TIME = 5
+    """A STAY/HHMM has been processed"""
+    POST_C = 6
+    """A 'C' has been processed, it may be the start of a cruise climb element"""
+    POST_SLASH = 7
+    """A '/' following a point has been processed"""
+    RE_SYNC = 8
+    """An error has been reported, the parser is re-synchronising"""
+    RE_SYNC_SLASH = 9
+    """A '/' has been skipped while re-synchronising"""
+
+
+class ParseF15Iterative(ParseF15):
+    """This class parses an ICAO field 15 producing exactly the same extracted route sequence and
+    errors as the ParseF15 class it subclasses. ParseF15 implements the field 15 grammar as a set of
+    mutually recursive 'node' methods, the recursion depth grows with the number of field 15 elements
+    and a long route (several hundred elements) exceeds the Python recursion limit.
+
+    This class runs the grammar as a loop over 'steps' instead:
+        - A step processes one element, (e.g. saves a point) and returns the next step to run as a
+          tuple of the step method and the token it processes, or None if nothing follows;
+        - The next step is mostly determined by a state and the base type of the next token, these
+          are looked up in the TRANSITIONS table, falling back to DEFAULT_TRANSITIONS for a state;
+        - A few ParseF15 nodes continue processing after a nested node has returned, (e.g. saving
+          break text after an error); such continuations are pushed on a stack that is popped each
+          time the current chain of steps ends.
+
+    Apart from the entry point, the data related methods of ParseF15 are re-used unchanged, the
+    recursive ParseF15 node methods are not called by this class."""
+
+    def add_error_and_re_sync(self, ers, tokens, token, error_number):
+        # type: (ExtractedRouteSequence, Tokens, Token, int) -> None
+        """This method overrides ParseF15.add_error_and_re_sync() to re-synchronise the parser by
+        running the parser steps iteratively.
+
+        :param ers: An instance of ExtractedRouteSequence class into which the erroneous token is being stored;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser;
+        :param token: The erroneous token;
+        :param error_number: An integer value representing an index to an error message
+               defined in the ErrorMessageDefinitions class.
+        :return: None
+        """
+        self.run(ers, tokens, self.error(ers, token, error_number))
+
+    def assign_speed_altitude(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method overrides ParseF15.assign_speed_altitude() to parse the remainder of field 15
+        iteratively.
+
+        :param ers: An ExtractedRouteSequence class instance containing a point in
+               the last ERS record that the speed and altitude will be written to;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser;
+        :param token: The speed / altitude token from which the speed and altitude will
+               be extracted from;
+        :return: None
+        """
+        self.run(ers, tokens, (ParseF15Iterative.step_speed_altitude, token))
+
+    def assign_speed_vfr(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method overrides ParseF15.assign_speed_vfr() to parse the remainder of field 15
+        iteratively.
+
+        :param ers: An ExtractedRouteSequence class instance containing a point in the last ERS record
+               that the speed will be written to and a new VFR record will be appended to.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser;
+        :param token: The speed / VFR token from which the speed will be extracted from;
+        :return: None
+        """
+        self.run(ers, tokens, (ParseF15Iterative.step_speed_vfr, token))
+
+    def run(self, ers, tokens, step):
+        # type: (ExtractedRouteSequence, Tokens, tuple | None) -> None
+        """This method runs parser steps until no steps remain; each step returns the next step
+        to run, when a step returns None the last continuation pushed on the stack is run.
+
+        :param ers: An instance of ExtractedRouteSequence class being populated by the parser;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser;
+        :param step: The first step to run, a tuple of the step method and its token, or None;
+        :return: None
+        """
+        stack = [step]
+        while len(stack) > 0:
+            step = stack.pop()
+            while step is not None:
+                step = step[0](self, ers, tokens, step[1], stack)
+
+    def dispatch(self, ers, state, token):
+        # type: (ExtractedRouteSequence, F15ParserStates, Token) -> tuple
+        """This method looks up the step to run for a token in a given state, an error is added
+        to the ERS if the token is not allowed in the state.
+
+        :param ers: An instance of ExtractedRouteSequence class being populated by the parser;
+        :param state: The current parser state;
+        :param token: The token to process in the given state;
+        :return: The next step to run
+        """
+        transition = self.TRANSITIONS.get((state, token.get_token_base_type()))
+        if transition is None:
+            transition = self.DEFAULT_TRANSITIONS[state]
+        if transition[0] is None:
+            return self.error(ers, token, transition[1])
+        return transition[0], token
+
+    def dispatch_next(self, ers, tokens, state):
+        # type: (ExtractedRouteSequence, Tokens, F15ParserStates) -> tuple | None
+        """This method gets the next token and looks up the step to run for the token in a given state.
+
+        :param ers: An instance of ExtractedRouteSequence class being populated by the parser;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser;
+        :param state: The current parser state;
+        :return: The next step to run or None if there are no more tokens
+        """
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return None
+        return self.dispatch(ers, state, next_token)
+
+    def error(self, ers, token, error_number):
+        # type: (ExtractedRouteSequence, Token, int) -> tuple
+        """This method adds an error record to the ERS, the next step re-synchronises the parser.
+
+        :param ers: An instance of ExtractedRouteSequence class into which the erroneous token is being stored;
+        :param token: The erroneous token;
+        :param error_number: An integer value representing an index to an error message
+               defined in the ErrorMessageDefinitions class.
+        :return: The re-synchronisation step
+        """
+        self.add_error_no_re_sync(ers, token, error_number)
+        return ParseF15Iterative.step_re_sync, None
+
+    # The parser steps; each step has the signature (self, ers, tokens, token, stack) and returns
+    # the next step as a (step, token) tuple or None. See the ParseF15 node method of the same name
+    # for the details of the processing carried out by each step.
+
+    def step_break_end(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.break_end()"""
+        rule_change_point = tokens.peek_next_token(1)
+        if rule_change_point is None:
+            return None
+        if rule_change_point.get_token_base_type() != TokenBaseType.F15_POINT:
+            return None
+
+        if token.get_token_sub_type() == TokenSubType.F15_SB_IFR:
+            slash_token = tokens.peek_next_token(2)
+            if slash_token is None:
+                return self.error(ers, rule_change_point, 22)
+            if slash_token.get_token_base_type() != TokenBaseType.F15_SLASH:
+                return None
+            speed_level_token = tokens.peek_next_token(3)
+            if speed_level_token is None:
+                return self.error(ers, rule_change_point, 22)
+            if speed_level_token.get_token_base_type() == TokenBaseType.F15_SPEED_ALTITUDE:
+                stack.append((ParseF15Iterative.step_break_end_point, None))
+                return ParseF15Iterative.step_v_to_i_rule_change, None
+            if speed_level_token.get_token_base_type() == TokenBaseType.F15_SPEED_VFR:
+                stack.append((ParseF15Iterative.step_break_end_point, None))
+                return ParseF15Iterative.step_v_to_i_to_v_rule_change, None
+            return self.error(ers, rule_change_point, 22)
+
+        return self.step_break_end_point(ers, tokens, None, stack)
+
+    def step_break_end_point(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token | None, list) -> tuple | None
+        """Processes the point following a 'break' end, see ParseF15.break_end()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return None
+        return ParseF15Iterative.step_point, next_token
+
+    def step_break_end_error(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.break_end_error()"""
+        subtype = token.get_token_sub_type()
+        if subtype is TokenSubType.F15_SB_IFR:
+            return self.error(ers, token, 6)
+        if subtype is TokenSubType.F15_SB_GAT:
+            return self.error(ers, token, 7)
+        if subtype is TokenSubType.F15_SB_IFPSTART:
+            return self.error(ers, token, 8)
+        return None
+
+    def step_break_start(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.break_start()"""
+        self.add_record(ers, token)
+        ex_route_rec = ers.get_last_element()
+        match token.get_token_sub_type():
+            case TokenSubType.F15_SB_OAT:
+                ex_route_rec.set_flight_rules(self.RULES["O"])
+            case TokenSubType.F15_SB_VFR:
+                ex_route_rec.set_flight_rules(self.RULES["V"])
+            case TokenSubType.F15_SB_IFPSTOP:
+                ex_route_rec.set_flight_rules(self.RULES["S"])
+
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return None
+        if next_token.get_token_base_type() is TokenBaseType.F15_TOO_LONG:
+            return self.error(ers, next_token, 4)
+        return ParseF15Iterative.step_break_text_save, next_token
+
+    def step_break_text_save(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.break_text_save(); an element that is too long is reported and then
+        saved as break text once the parser has re-synchronised."""
+        if token.get_token_base_type() is TokenBaseType.F15_TOO_LONG:
+            stack.append((ParseF15Iterative.step_break_text_append, token))
+            return self.error(ers, token, 4)
+        return self.step_break_text_append(ers, tokens, token, stack)
+
+    def step_break_text_append(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """Saves a token as break text, see ParseF15.break_text_save()"""
+        ers.get_last_element().append_break_text(token.get_token_string())
+
+        sub_type = token.get_token_sub_type()
+        cur_break_type = ers.get_last_element().get_flight_rules()
+        if (sub_type is TokenSubType.F15_SB_IFR and cur_break_type is self.RULES["V"]) or \
+                (sub_type is TokenSubType.F15_SB_GAT and cur_break_type is self.RULES["O"]) or \
+                (sub_type is TokenSubType.F15_SB_IFPSTART and cur_break_type is self.RULES["S"]):
+            # Possible end of the break section, break text saving continues afterwards
+            stack.append((ParseF15Iterative.step_break_text_next, None))
+            return ParseF15Iterative.step_break_end, token
+        return self.step_break_text_next(ers, tokens, None, stack)
+
+    def step_break_text_next(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token | None, list) -> tuple | None
+        """Continues saving break text with the next token, see ParseF15.break_text_save()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return None
+        return ParseF15Iterative.step_break_text_save, next_token
+
+    def step_cruise_climb_c(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.cruise_climb_c()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            self.add_record(ers, token)
+            return None
+
+        if next_token.get_token_base_type() is TokenBaseType.F15_SLASH:
+            slash_token = next_token
+            next_token = tokens.get_next_token()
+            if next_token is None:
+                self.add_record(ers, token)
+                return self.error(ers, slash_token, 52)
+            return ParseF15Iterative.step_cruise_climb_point, next_token
+
+        transition = self.TRANSITIONS.get((F15ParserStates.POST_C, next_token.get_token_base_type()))
+        if transition is None:
+            # Any other element reports the 'C'
+            return self.error(ers, token, self.DEFAULT_TRANSITIONS[F15ParserStates.POST_C][1])
+        if transition[0] is None:
+            return self.error(ers, next_token, transition[1])
+        if transition[0] is not ParseF15Iterative.step_break_end_error:
+            # The 'C' is not followed by a '/', store the 'C' as a point
+            self.add_record(ers, token)
+        return transition[0], next_token
+
+    def step_cruise_climb_point(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.cruise_climb_point()"""
+        self.add_record(ers, token)
+        self.assign_lat_long_bearing_distance(ers, token)
+
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return self.error(ers, token, 27)
+        if next_token.get_token_base_type() is not TokenBaseType.F15_SLASH:
+            # Processing of the speed / level continues once the parser has re-synchronised
+            stack.append((ParseF15Iterative.step_cruise_climb_speed, token))
+            return self.error(ers, next_token, 26)
+        return self.step_cruise_climb_speed(ers, tokens, token, stack)
+
+    def step_cruise_climb_speed(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """Processes the speed / level of a cruise climb element, see ParseF15.cruise_climb_point()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return self.error(ers, token, 28)
+
+        # The element following the speed / level is processed as a point afterwards
+        stack.append((ParseF15Iterative.step_break_end_point, None))
+        base_type = next_token.get_token_base_type()
+        if base_type is TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE:
+            return ParseF15Iterative.step_speed_altitude_altitude, next_token
+        if base_type is TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
+            return ParseF15Iterative.step_speed_altitude_plus, next_token
+        return self.error(ers, next_token, 29)
+
+    def step_dct(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.dct()"""
+        self.add_record(ers, token)
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_DCT)
+
+    def step_forward_slash(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.forward_slash()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return self.error(ers, token, 20)
+        return self.dispatch(ers, F15ParserStates.POST_SLASH, next_token)
+
+    def step_point(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.point()"""
+        self.add_record(ers, token)
+        ers.get_last_element().set_flight_rules(self.RULES["I"])
+        self.assign_lat_long_bearing_distance(ers, token)
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_POINT)
+
+    def step_post_point_route(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """Processes a route following a point, see ParseF15.post_point()"""
+        if ers.get_last_element().get_sub_type() in self.LAT_LONG_SUB_TYPES:
+            return self.error(ers, token, 47)
+        return ParseF15Iterative.step_route, token
+
+    def step_post_sid(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token | None, list) -> tuple | None
+        """See ParseF15.post_sid()"""
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_SID)
+
+    def step_re_sync(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token | None, list) -> tuple | None
+        """See ParseF15.re_sync_parser_after_error()"""
+        return self.dispatch_next(ers, tokens, F15ParserStates.RE_SYNC)
+
+    def step_re_sync_slash(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """Skips a '/' while re-synchronising, see ParseF15.re_sync_parser_after_error()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return self.error(ers, token, 25)
+        return self.dispatch(ers, F15ParserStates.RE_SYNC_SLASH, next_token)
+
+    def step_route(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.route()"""
+        self.add_record(ers, token)
+        ers.get_last_element().set_flight_rules(self.RULES["I"])
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_ROUTE)
+
+    def step_route_point(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """Processes a point following a route, see ParseF15.route(); a Lat/Long point following a route
+        is reported and then processed as a point once the parser has re-synchronised."""
+        if token.get_token_sub_type() in self.LAT_LONG_SUB_TYPES:
+            stack.append((ParseF15Iterative.step_point, token))
+            return self.error(ers, token, 48)
+        return ParseF15Iterative.step_point, token
+
+    def step_sid(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.sid()"""
+        self.add_record(ers, token)
+        if ers.get_number_of_elements() != 2:
+            return self.error(ers, token, 30)
+        sid_rec = ers.get_element_at(1)
+        sid_rec.set_base_type(TokenBaseType.F15_SID)
+        if sid_rec.get_name() == "SID":
+            sid_rec.set_sub_type(TokenSubType.F15_SB_SID_LITERAL)
+        else:
+            sid_rec.set_sub_type(TokenSubType.F15_SB_SID)
+        return ParseF15Iterative.step_post_sid, None
+
+    def step_sid_star(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.sid_star()"""
+        ex_route_rec = self.add_record(ers, token)
+        if ers.get_number_of_elements() == 2:
+            ex_route_rec.set_base_type(TokenBaseType.F15_SID)
+            if token.get_token_string() == "SID":
+                ex_route_rec.set_sub_type(TokenSubType.F15_SB_SID_LITERAL)
+            else:
+                ex_route_rec.set_sub_type(TokenSubType.F15_SB_SID)
+            return ParseF15Iterative.step_post_sid, None
+        return self.star_or_error(ers, tokens, token, ex_route_rec)
+
+    def step_speed_altitude(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.assign_speed_altitude()"""
+        if not self.set_speed_altitude(ers, token):
+            return None
+        if ers.get_number_of_elements() == 1:
+            return self.dispatch_next(ers, tokens, F15ParserStates.POST_ADEP)
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_POINT)
+
+    def step_speed_altitude_altitude(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.assign_speed_altitude_altitude()"""
+        if not self.set_speed_altitude_altitude(ers, token):
+            return None
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_POINT)
+
+    def step_speed_altitude_plus(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.assign_speed_altitude_plus()"""
+        if not self.set_speed_altitude_plus(ers, token):
+            return None
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_POINT)
+
+    def step_speed_vfr(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.assign_speed_vfr()"""
+        if not self.set_speed_vfr(ers, token):
+            return None
+        return self.step_break_text_next(ers, tokens, None, stack)
+
+    def step_star(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.star()"""
+        return self.star_or_error(ers, tokens, token, self.add_record(ers, token))
+
+    def step_stay(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.stay()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return self.error(ers, token, 35)
+        if next_token.get_token_base_type() is not TokenBaseType.F15_SLASH:
+            return self.error(ers, next_token, 36)
+        current_token = next_token
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return self.error(ers, current_token, 37)
+        if next_token.get_token_base_type() is not TokenBaseType.F15_STAY_TIME:
+            return self.error(ers, next_token, 38)
+        return ParseF15Iterative.step_stay_time, next_token
+
+    def step_stay_time(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.stay_time()"""
+        ers.get_last_element().set_stay_time(token.get_token_string())
+        return self.dispatch_next(ers, tokens, F15ParserStates.POST_STAY_TIME)
+
+    def step_truncate(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token, list) -> tuple | None
+        """See ParseF15.truncate()"""
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            return None
+        return self.error(ers, next_token, 19)
+
+    def step_v_to_i_rule_change(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token | None, list) -> tuple | None
+        """See ParseF15.v_to_i_rule_change()"""
+        token = tokens.get_next_token()
+        ex_route_rec = self.add_record(ers, token)
+        self.assign_lat_long_bearing_distance(ers, token)
+        ex_route_rec.set_flight_rules(self.RULES["I"])
+        tokens.get_next_token()
+        return ParseF15Iterative.step_speed_altitude, tokens.get_next_token()
+
+    def step_v_to_i_to_v_rule_change(self, ers, tokens, token, stack):
+        # type: (ExtractedRouteSequence, Tokens, Token | None, list) -> tuple | None
+        """See ParseF15.v_to_i_to_v_rule_change()"""
+        token = tokens.get_next_token()
+        ex_route_rec = self.add_record(ers, token)
+        ex_route_rec.set_flight_rules(self.RULES["I"])
+        tokens.get_next_token()
+        return ParseF15Iterative.step_speed_vfr, tokens.get_next_token()
+
+    def star_or_error(self, ers, tokens, token, ex_route_rec):
+        # type: (ExtractedRouteSequence, Tokens, Token, ExtractedRouteRecord) -> tuple | None
+        """Sets the STAR type on the last ERS record if it is the last field 15 element, otherwise
+        the element following the STAR is reported, see ParseF15.star().
+
+        :param ers: An instance of ExtractedRouteSequence class being populated by the parser;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser;
+        :param token: The STAR token;
+        :param ex_route_rec: The ERS record saved for the STAR token;
+        :return: The next step to run or None
+        """
+        if tokens.peek_next_token(1) is not None:
+            return self.error(ers, tokens.peek_next_token(1), 34)
+        ex_route_rec.set_base_type(TokenBaseType.F15_STAR)
+        if token.get_token_string() == "STAR":
+            ex_route_rec.set_sub_type(TokenSubType.F15_SB_STAR_LITERAL)
+        else:
+            ex_route_rec.set_sub_type(TokenSubType.F15_SB_STAR)
+        return None
+
+    LAT_LONG_SUB_TYPES: frozenset = frozenset([TokenSubType.F15_SB_PRP_BD, TokenSubType.F15_SB_LL_DEG,
+                                               TokenSubType.F15_SB_LL_MIN, TokenSubType.F15_SB_LLBD_DEG,
+                                               TokenSubType.F15_SB_LLBD_MIN])
+    """Point sub types that cannot precede or follow an ATS route"""
+
+    _ERROR_3 = (None, 3)
+    _ERROR_4 = (None, 4)
+    _ERROR_9 = (None, 9)
+    _ERROR_10 = (None, 10)
+
+    STATE_TABLES: dict = {
+        F15ParserStates.POST_ADEP: {
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_SLASH: (None, 23),
+            TokenBaseType.F15_BREAK_START: (None, 23),
+            TokenBaseType.F15_SPEED_VFR: (None, 23),
+            TokenBaseType.F15_SPEED_ALTITUDE: (None, 23),
+            TokenBaseType.F15_BREAK_END: (None, 23),
+            TokenBaseType.F15_STAY: (None, 23),
+            TokenBaseType.F15_C: (None, 23),
+            TokenBaseType.F15_DCT: (step_dct, 0),
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_ROUTE: (None, 24),
+            TokenBaseType.F15_SID_STAR: (step_sid_star, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: _ERROR_9,
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: _ERROR_9,
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_STAY_TIME: _ERROR_10,
+            TokenBaseType.F15_SID: (step_sid, 0),
+            TokenBaseType.F15_STAR: (step_star, 0)},
+        F15ParserStates.POST_POINT: {
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_SLASH: (step_forward_slash, 0),
+            TokenBaseType.F15_BREAK_START: (step_break_start, 0),
+            TokenBaseType.F15_SPEED_VFR: (None, 5),
+            TokenBaseType.F15_SPEED_ALTITUDE: (None, 5),
+            TokenBaseType.F15_BREAK_END: (step_break_end_error, 0),
+            TokenBaseType.F15_DCT: (step_dct, 0),
+            TokenBaseType.F15_STAY: (step_stay, 0),
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_C: (step_cruise_climb_c, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_ROUTE: (step_post_point_route, 0),
+            TokenBaseType.F15_SID_STAR: (step_sid_star, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: _ERROR_9,
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: _ERROR_9,
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_STAY_TIME: _ERROR_10,
+            TokenBaseType.F15_SID: (step_sid, 0),
+            TokenBaseType.F15_STAR: (step_star, 0)},
+        F15ParserStates.POST_SID: {
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_ROUTE: (step_route, 0),
+            TokenBaseType.F15_SID_STAR: (step_sid_star, 0),
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_SID: (None, 32),
+            TokenBaseType.F15_STAR: (step_star, 0)},
+        F15ParserStates.POST_ROUTE: {
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_SLASH: (None, 12),
+            TokenBaseType.F15_BREAK_START: (None, 13),
+            TokenBaseType.F15_SPEED_VFR: (None, 13),
+            TokenBaseType.F15_SPEED_ALTITUDE: (None, 55),
+            TokenBaseType.F15_BREAK_END: (step_break_end_error, 0),
+            TokenBaseType.F15_DCT: (None, 14),
+            TokenBaseType.F15_STAY: (None, 15),
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_C: (step_cruise_climb_c, 0),
+            TokenBaseType.F15_POINT: (step_route_point, 0),
+            TokenBaseType.F15_ROUTE: (None, 53),
+            TokenBaseType.F15_SID_STAR: (None, 54),
+            TokenBaseType.F15_STAR: (None, 54),
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: _ERROR_9,
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: _ERROR_9,
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_STAY_TIME: _ERROR_10,
+            TokenBaseType.F15_SID: (None, 30)},
+        F15ParserStates.POST_DCT: {
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_C: (step_cruise_climb_c, 0)},
+        F15ParserStates.POST_STAY_TIME: {
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_BREAK_START: (step_break_start, 0),
+            TokenBaseType.F15_BREAK_END: (step_break_end_error, 0),
+            TokenBaseType.F15_DCT: (step_dct, 0),
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_C: (step_cruise_climb_c, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_ROUTE: (step_route, 0),
+            TokenBaseType.F15_SID_STAR: (step_sid_star, 0),
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_SID: (step_sid, 0),
+            TokenBaseType.F15_STAR: (step_star, 0)},
+        F15ParserStates.POST_C: {
+            # The '/' is processed by step_cruise_climb_c(), the 'C' is stored as a point for all
+            # other element types that are not errors
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_BREAK_START: (step_break_start, 0),
+            TokenBaseType.F15_SPEED_VFR: (None, 5),
+            TokenBaseType.F15_SPEED_ALTITUDE: (None, 5),
+            TokenBaseType.F15_BREAK_END: (step_break_end_error, 0),
+            TokenBaseType.F15_DCT: (step_dct, 0),
+            TokenBaseType.F15_STAY: (step_stay, 0),
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_C: (step_cruise_climb_c, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_ROUTE: (step_route, 0),
+            TokenBaseType.F15_SID_STAR: (step_sid_star, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: _ERROR_9,
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: _ERROR_9,
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_STAY_TIME: _ERROR_10,
+            TokenBaseType.F15_SID: (step_sid, 0),
+            TokenBaseType.F15_STAR: (step_star, 0)},
+        F15ParserStates.POST_SLASH: {
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_SLASH: (None, 16),
+            TokenBaseType.F15_SPEED_VFR: (step_speed_vfr, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE: (step_speed_altitude, 0),
+            TokenBaseType.F15_TOO_LONG: _ERROR_4},
+        F15ParserStates.RE_SYNC: {
+            TokenBaseType.F15_UNKNOWN: _ERROR_3,
+            TokenBaseType.F15_SLASH: (step_re_sync_slash, 0),
+            TokenBaseType.F15_BREAK_START: (step_break_start, 0),
+            TokenBaseType.F15_SPEED_VFR: (step_speed_vfr, 0),
+            TokenBaseType.F15_BREAK_END: (step_break_end, 0),
+            TokenBaseType.F15_DCT: (step_dct, 0),
+            TokenBaseType.F15_STAY: (step_stay, 0),
+            TokenBaseType.F15_TRUNCATE: (step_truncate, 0),
+            TokenBaseType.F15_C: (step_cruise_climb_c, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_ROUTE: (step_route, 0),
+            TokenBaseType.F15_SID_STAR: (step_sid_star, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE: (step_speed_altitude, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: (step_speed_altitude_altitude, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: (step_speed_altitude_plus, 0),
+            TokenBaseType.F15_TOO_LONG: _ERROR_4,
+            TokenBaseType.F15_STAY_TIME: _ERROR_10,
+            TokenBaseType.F15_SID: (step_sid, 0),
+            TokenBaseType.F15_STAR: (step_star, 0)},
+        F15ParserStates.RE_SYNC_SLASH: {
+            TokenBaseType.F15_SPEED_VFR: (step_speed_vfr, 0),
+            TokenBaseType.F15_POINT: (step_point, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE: (step_speed_altitude, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: (step_speed_altitude_altitude, 0),
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: (step_speed_altitude_plus, 0)},
+    }
+    """The allowed element types and resulting step for each parser state, a transition is a tuple of
+    the step to run and an error number; if the step is None the error is reported for the token"""
+
+    TRANSITIONS: dict = {(state, base_type): transition
+                         for state, table in STATE_TABLES.items() for base_type, transition in table.items()}
+    """The STATE_TABLES transitions keyed on (F15ParserStates, TokenBaseType)"""
+
+    DEFAULT_TRANSITIONS: dict = {
+        F15ParserStates.POST_ADEP: (None, 0),
+        F15ParserStates.POST_POINT: (None, 0),
+        F15ParserStates.POST_SID: (None, 31),
+        F15ParserStates.POST_ROUTE: (None, 0),
+        F15ParserStates.POST_DCT: (None, 21),
+        F15ParserStates.POST_STAY_TIME: (None, 39),
+        F15ParserStates.POST_C: (None, 0),
+        F15ParserStates.POST_SLASH: (None, 50),
+        F15ParserStates.RE_SYNC: (None, 0),
+        F15ParserStates.RE_SYNC_SLASH: (None, 11),
+    }
+    """The transition for element types not in the table of a parser state"""
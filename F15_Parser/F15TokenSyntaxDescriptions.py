@@ -161,6 +161,14 @@ class F15TokenSyntaxDefinition:
     MAX_TOKEN_LENGTH: int = 25
     """Maximum length of a single token"""
 
+    MAXIMUM_CACHED_TOKEN_TYPES: int = 100000
+    """The maximum number of token strings stored in TOKEN_TYPES, the table is emptied when full"""
+
+    TOKEN_TYPES: dict = {}
+    """The token descriptions already found keyed on the token string; field 15 tokens such as route
+    points, ATS routes and speed / levels recur in many routes and are matched against the regular
+    expressions once, the table is shared by all instances"""
+
     F15_SB_CONFIGURATION: [str, TokenBaseType, TokenSubType] = list([
         # Regular expression, base type ID, subtype ID...
         # FIXED Text types
@@ -391,6 +399,21 @@ class F15TokenSyntaxDefinition:
                is a field 15 element such as a point, or route element etc.
         :return: A list containing a single 'record' from the F15_SB_CONFIGURATION base and subtype definitions.
         """
+        item = self.TOKEN_TYPES.get(token_string)
+        if item is not None:
+            return item
+        item = self.match_token_type(token_string)
+        if len(self.TOKEN_TYPES) >= self.MAXIMUM_CACHED_TOKEN_TYPES:
+            self.TOKEN_TYPES.clear()
+        self.TOKEN_TYPES[token_string] = item
+        return item
+
+    def match_token_type(self, token_string):
+        # type: (str) -> [str, TokenBaseType, TokenSubType]
+        """Matches a token against the token descriptions in turn, (see get_token_type()).
+        :param token_string: The string being analysed;
+        :return: A list containing a single 'record' from the F15_SB_CONFIGURATION base and subtype definitions.
+        """
         for item in self.F15_SB_CONFIGURATION:
             if re.fullmatch(item[self.TOKEN_REGEXP_IDX], token_string):
                 return item
@@ -0,0 +1,314 @@
+import csv
+import io
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable
+from enum import IntEnum
+
+
+class NavigationPointTypes(IntEnum):
+    """The types of point stored in a NavigationDatabase"""
+    SIGNIFICANT_POINT = 0
+    """A published significant point, e.g. a five letter name code"""
+    NAVAID = 1
+    """A radio navigation aid, e.g. a VOR or NDB"""
+    AERODROME = 2
+    """An aerodrome identified by its ICAO location indicator"""
+
+
+class NavigationDatabase:
+    """This class is a local reference database of significant points, navaids and aerodromes used to
+    resolve named field 15 points to a latitude / longitude, see ParseF15.
+
+    The reference data is prepared as a CSV file with one point per line, each line containing the point
+    designator, the point type (one of the NavigationPointTypes names) and the latitude and longitude in
+    decimal degrees, e.g. 'LNZ,NAVAID,48.2325,14.1094'; an optional header line starting with 'designator'
+    is skipped. The CSV file is converted once into a compact binary index file, see write_binary(),
+    which is memory mapped when opened, opening the index does not read the points and takes the same
+    time for any number of points. A CSV file can also be loaded directly, see load_csv().
+
+    The binary index file comprises a 24 byte header followed by these arrays:
+        - Latitudes: One 8 byte float per point;
+        - Longitudes: One 8 byte float per point;
+        - Hash table: A power of 2 number of 4 byte slots, each slot contains a point index or -1 for an
+          empty slot, points are located by the CRC-32 of the designator using linear probing;
+        - Designator offsets: One 4 byte offset per point plus one, point 'n' has its designator stored
+          from offset 'n' up to offset 'n + 1' in the designators;
+        - Point types: One byte per point;
+        - Designators: All point designators, ASCII encoded.
+    The lookup cost is independent of the number of points in the database. Several points can have the
+    same designator, (designators are not unique world-wide), all are returned by lookup().
+
+    Instances are read only once created and can be shared by several threads and parsers."""
+
+    MAGIC: bytes = b"ICAONAV1"
+    """Identifies a binary index file"""
+
+    HEADER: struct.Struct = struct.Struct("<8sIIII")
+    """The binary header; magic, number of points, number of hash table slots, length of the
+    designators in bytes, and a byte order marker"""
+
+    BYTE_ORDER_MARKER: int = 0x01020304 if sys.byteorder == "little" else 0x04030201
+    """Identifies the byte order of the arrays in the binary file, the header is always little endian"""
+
+    number_of_points: int = 0
+    """The number of points in the database"""
+
+    number_of_slots: int = 0
+    """The number of slots in the hash table"""
+
+    latitudes = None
+    """The point latitudes, indexed by point index"""
+
+    longitudes = None
+    """The point longitudes, indexed by point index"""
+
+    slots = None
+    """The hash table slots containing point indices"""
+
+    designator_offsets = None
+    """The offsets of the point designators in the designators"""
+
+    point_types = None
+    """The point types, indexed by point index"""
+
+    designators = None
+    """The designators of all points"""
+
+    memory_map: mmap.mmap | None = None
+    """The memory map of the binary file if opened from a binary file"""
+
+    file_name: str | None = None
+    """The binary index file name if opened from a binary file"""
+
+    data: bytes | None = None
+    """The binary index if not opened from a binary file"""
+
+    def __init__(self, data):
+        # type: (bytes | mmap.mmap) -> None
+        """Constructor that sets up the database from the content of a binary index file; use one
+        of the open(), load_csv() or from_points() methods to create an instance.
+
+        :param data: The content of a binary index file, either bytes or a memory mapped file;
+        :return: None
+        """
+        magic, self.number_of_points, self.number_of_slots, designators_length, marker = \
+            self.HEADER.unpack_from(data, 0)
+        if magic != self.MAGIC:
+            raise ValueError("The data is not a navigation database binary index")
+
+        offset = self.HEADER.size
+        n = self.number_of_points
+        sections = [("latitudes", "d", n), ("longitudes", "d", n), ("slots", "i", self.number_of_slots),
+                    ("designator_offsets", "I", n + 1), ("point_types", "B", n)]
+        if marker == self.BYTE_ORDER_MARKER:
+            # The arrays can be used in place
+            view = memoryview(data)
+            for name, type_code, length in sections:
+                size = array(type_code).itemsize * length
+                setattr(self, name, view[offset:offset + size].cast(type_code))
+                offset += size
+            self.designators = view[offset:offset + designators_length]
+        else:
+            # The binary file was written on a machine with a different byte order
+            for name, type_code, length in sections:
+                values = array(type_code)
+                values.frombytes(data[offset:offset + values.itemsize * length])
+                values.byteswap()
+                setattr(self, name, values)
+                offset += values.itemsize * length
+            self.designators = memoryview(bytes(data[offset:offset + designators_length]))
+        if isinstance(data, mmap.mmap):
+            self.memory_map = data
+        else:
+            self.data = data
+
+    @staticmethod
+    def open(file_name):
+        # type: (str) -> NavigationDatabase
+        """Opens a binary index file created by write_binary(), the file is memory mapped.
+
+        :param file_name: The binary index file name;
+        :return: A NavigationDatabase instance
+        """
+        with open(file_name, "rb") as file:
+            database = NavigationDatabase(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        database.file_name = file_name
+        return database
+
+    @staticmethod
+    def load_csv(file_name):
+        # type: (str) -> NavigationDatabase
+        """Loads a CSV file into memory, see the class description for the CSV format.
+
+        :param file_name: The CSV file name;
+        :return: A NavigationDatabase instance
+        """
+        return NavigationDatabase(NavigationDatabase.build(NavigationDatabase.read_csv(file_name)))
+
+    @staticmethod
+    def from_points(points):
+        # type: ([(str, NavigationPointTypes, float, float)]) -> NavigationDatabase
+        """Creates an in memory database from a list of points.
+
+        :param points: A list of tuples containing the designator, point type, latitude and longitude;
+        :return: A NavigationDatabase instance
+        """
+        return NavigationDatabase(NavigationDatabase.build(points))
+
+    @staticmethod
+    def write_binary(csv_file_name, binary_file_name):
+        # type: (str, str) -> int
+        """Converts a CSV file into a binary index file.
+
+        :param csv_file_name: The CSV file name;
+        :param binary_file_name: The binary index file name;
+        :return: The number of points written
+        """
+        points = NavigationDatabase.read_csv(csv_file_name)
+        with open(binary_file_name, "wb") as file:
+            file.write(NavigationDatabase.build(points))
+        return len(points)
+
+    @staticmethod
+    def read_csv(file_name):
+        # type: (str) -> [(str, NavigationPointTypes, float, float)]
+        """Reads the points from a CSV file.
+
+        :param file_name: The CSV file name;
+        :return: A list of tuples containing the designator, point type, latitude and longitude
+        """
+        with open(file_name, newline="") as file:
+            return NavigationDatabase.read_csv_lines(file)
+
+    @staticmethod
+    def read_csv_lines(lines):
+        # type: (Iterable[str]) -> [(str, NavigationPointTypes, float, float)]
+        """Reads the points from lines of CSV text.
+
+        :param lines: The CSV lines, e.g. an open file;
+        :return: A list of tuples containing the designator, point type, latitude and longitude
+        """
+        points = []
+        for row in csv.reader(lines):
+            if len(row) == 0 or row[0].strip().lower() == "designator":
+                continue
+            if len(row) != 4:
+                raise ValueError("Expecting 4 columns in navigation database line " + str(row))
+            points.append((row[0].strip(), NavigationPointTypes[row[1].strip()], float(row[2]), float(row[3])))
+        return points
+
+    @staticmethod
+    def build(points):
+        # type: ([(str, NavigationPointTypes, float, float)]) -> bytes
+        """Builds the content of a binary index file from a list of points.
+
+        :param points: A list of tuples containing the designator, point type, latitude and longitude;
+        :return: The binary index
+        """
+        n = len(points)
+        number_of_slots = 8
+        while number_of_slots < 2 * n:
+            number_of_slots *= 2
+        mask = number_of_slots - 1
+
+        slots = array("i", [-1]) * number_of_slots
+        designator_offsets = array("I", [0])
+        designators = io.BytesIO()
+        for idx, (designator, point_type, latitude, longitude) in enumerate(points):
+            encoded = designator.encode("ascii")
+            designators.write(encoded)
+            designator_offsets.append(designator_offsets[-1] + len(encoded))
+            slot = zlib.crc32(encoded) & mask
+            while slots[slot] != -1:
+                slot = (slot + 1) & mask
+            slots[slot] = idx
+
+        designator_bytes = designators.getvalue()
+        data = io.BytesIO()
+        data.write(NavigationDatabase.HEADER.pack(NavigationDatabase.MAGIC, n, number_of_slots, len(designator_bytes),
+                                                  NavigationDatabase.BYTE_ORDER_MARKER))
+        data.write(array("d", [point[2] for point in points]).tobytes())
+        data.write(array("d", [point[3] for point in points]).tobytes())
+        data.write(slots.tobytes())
+        data.write(designator_offsets.tobytes())
+        data.write(array("B", [int(point[1]) for point in points]).tobytes())
+        data.write(designator_bytes)
+        return data.getvalue()
+
+    def __reduce__(self):
+        """Pickles the database, e.g. to pass it to another process; a database opened from a binary
+        index file is pickled as its file name and opened again when unpickled, otherwise the binary
+        index is pickled.
+        :return: The callable and arguments recreating the database"""
+        if self.file_name is not None:
+            return NavigationDatabase.open, (self.file_name,)
+        return NavigationDatabase, (bytes(self.data),)
+
+    def close(self):
+        # type: () -> None
+        """Closes the memory map of a database opened from a binary index file.
+        :return: None"""
+        if self.memory_map is not None:
+            self.latitudes = self.longitudes = self.slots = None
+            self.designator_offsets = self.point_types = self.designators = None
+            self.memory_map.close()
+            self.memory_map = None
+
+    def get_number_of_points(self):
+        # type: () -> int
+        """Gets the number of points in the database
+        :return: The number of points"""
+        return self.number_of_points
+
+    def lookup(self, designator):
+        # type: (str) -> [(NavigationPointTypes, float, float)]
+        """Looks up all points with a designator.
+
+        :param designator: The point designator, e.g. LNZ;
+        :return: A list of tuples containing the point type, latitude and longitude of each
+                 point with the designator, an empty list if there are none
+        """
+        points = []
+        if self.number_of_points == 0:
+            return points
+        encoded = designator.encode("ascii", "replace")
+        mask = self.number_of_slots - 1
+        slot = zlib.crc32(encoded) & mask
+        idx = self.slots[slot]
+        while idx != -1:
+            if self.designators[self.designator_offsets[idx]:self.designator_offsets[idx + 1]] == encoded:
+                points.append((NavigationPointTypes(self.point_types[idx]), self.latitudes[idx], self.longitudes[idx]))
+            slot = (slot + 1) & mask
+            idx = self.slots[slot]
+        return points
+
+    def resolve(self, designator, aerodrome, latitude=None, longitude=None):
+        # type: (str, bool, float | None, float | None) -> (float, float) | None
+        """Resolves a designator to a position; if several points have the designator the point
+        closest to a given position is returned, (e.g. the previous point on a route).
+
+        :param designator: The point designator, e.g. LNZ;
+        :param aerodrome: True to resolve an aerodrome, False to resolve a significant point or navaid;
+        :param latitude: Optional, the latitude of the position used to choose between points;
+        :param longitude: Optional, the longitude of the position used to choose between points;
+        :return: A tuple containing the latitude and longitude or None if the designator is not found
+        """
+        best = None
+        best_distance = 0.0
+        for point_type, point_latitude, point_longitude in self.lookup(designator):
+            if (point_type is NavigationPointTypes.AERODROME) != aerodrome:
+                continue
+            if latitude is None or longitude is None:
+                return point_latitude, point_longitude
+            # An approximate distance is sufficient to choose between points with the same designator
+            delta_longitude = abs(point_longitude - longitude) % 360.0
+            delta_longitude = min(delta_longitude, 360.0 - delta_longitude)
+            distance = (point_latitude - latitude) ** 2 + delta_longitude ** 2
+            if best is None or distance < best_distance:
+                best = (point_latitude, point_longitude)
+                best_distance = distance
+        return best
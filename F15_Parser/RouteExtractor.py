@@ -0,0 +1,114 @@
+import multiprocessing
+from collections.abc import Iterable, Iterator
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15ParseIterative import ParseF15Iterative
+from F15_Parser.NavigationDatabase import NavigationDatabase
+from Tokenizer.Tokenize import Tokenize
+from Utilities.GeodesyBackends import GeodesyBackend
+
+
+class RouteExtractor:
+    """This class extracts routes from field 15 strings that are not part of a message, e.g. routes from
+    a route catalogue or an RPL file, without wrapping each route in an FPL.
+
+    Each field 15 string is tokenized with the same whitespace as ParseF15x and parsed by a single
+    field 15 parser instance reused for all routes; the result is an ExtractedRouteSequence identical to
+    the one a message parser stores in a flight plan record for the same field 15. Errors are reported
+    per route in the ExtractedRouteSequence of each route, (see ExtractedRouteSequence.get_all_errors()),
+    the token indices of the errors are offsets into the field 15 string of the route.
+
+    The routes can be extracted by several processes in parallel, (see extract_routes()); each process
+    has its own extractor created with the same navigation database and geodesy backend.
+
+    An instance is not thread safe, use one instance per thread."""
+
+    WHITESPACE: str = " /\n\t\r"
+    """The field 15 whitespace, the same as used by ParseF15x"""
+
+    DEFAULT_CHUNK_SIZE: int = 500
+    """The default number of routes sent to a process at a time when extracting routes in parallel"""
+
+    navigation_database: NavigationDatabase | None = None
+    """An optional navigation database used to resolve the position of published route points"""
+
+    geodesy_backend: GeodesyBackend | None = None
+    """An optional geodesy backend performing the bearing / distance calculations"""
+
+    tokenizer: Tokenize = None
+    """The tokenizer reused for all routes"""
+
+    parser: ParseF15Iterative = None
+    """The field 15 parser reused for all routes"""
+
+    worker: "RouteExtractor" = None
+    """The extractor used by a process extracting routes in parallel"""
+
+    def __init__(self, navigation_database=None, geodesy_backend=None):
+        # type: (NavigationDatabase | None, GeodesyBackend | None) -> None
+        """Constructor for a route extractor.
+
+        :param navigation_database: Optional, a navigation database used to resolve the position of
+               published route points and aerodromes;
+        :param geodesy_backend: Optional, the geodesy backend performing the bearing / distance
+               calculations, EllipsoidalGeodesy if not given;
+        :return: None
+        """
+        self.navigation_database = navigation_database
+        self.geodesy_backend = geodesy_backend
+        self.tokenizer = Tokenize()
+        self.tokenizer.set_whitespace(self.WHITESPACE)
+        self.parser = ParseF15Iterative(navigation_database, None, geodesy_backend)
+
+    def extract_route(self, f15):
+        # type: (str) -> ExtractedRouteSequence
+        """Extracts the route from a field 15 string.
+
+        :param f15: The field 15 string, e.g. 'N0450F350 PNT B9 LNZ';
+        :return: The extracted route sequence containing the route and any errors found
+        """
+        self.tokenizer.set_string_to_tokenize(f15)
+        self.tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        self.parser.parse_f15(ers, self.tokenizer.get_tokens())
+        return ers
+
+    def extract_routes(self, routes, processes=1, chunk_size=DEFAULT_CHUNK_SIZE):
+        # type: (Iterable[str], int, int) -> Iterator[ExtractedRouteSequence]
+        """Extracts the routes from field 15 strings, yielding one extracted route sequence per
+        field 15 string in the same order as the field 15 strings.
+
+        :param routes: An iterable of field 15 strings, consumed lazily;
+        :param processes: The number of processes extracting the routes, 1 to extract the routes in
+               this process, None to use one process per CPU;
+        :param chunk_size: The number of routes sent to a process at a time when extracting in parallel;
+        :return: An iterator over the extracted route sequences
+        """
+        if processes == 1:
+            for f15 in routes:
+                yield self.extract_route(f15)
+            return
+        with multiprocessing.Pool(processes, RouteExtractor.initialise_worker,
+                                  (self.navigation_database, self.geodesy_backend)) as pool:
+            yield from pool.imap(RouteExtractor.extract_worker_route, routes, chunk_size)
+
+    @staticmethod
+    def initialise_worker(navigation_database, geodesy_backend):
+        # type: (NavigationDatabase | None, GeodesyBackend | None) -> None
+        """Creates the extractor used by a process extracting routes in parallel.
+
+        :param navigation_database: The navigation database, or None;
+        :param geodesy_backend: The geodesy backend, or None;
+        :return: None
+        """
+        RouteExtractor.worker = RouteExtractor(navigation_database, geodesy_backend)
+
+    @staticmethod
+    def extract_worker_route(f15):
+        # type: (str) -> ExtractedRouteSequence
+        """Extracts a route in a process extracting routes in parallel.
+
+        :param f15: The field 15 string;
+        :return: The extracted route sequence
+        """
+        return RouteExtractor.worker.extract_route(f15)
@@ -1,5 +1,6 @@
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
 from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ReParseMessage import ReParseMessage
 
 
 class IcaoAtsMessageParser:
@@ -60,12 +61,13 @@ class IcaoAtsMessageParser:
     """Handle to the ICAO message parser"""
 
     def parse_message_p1(self, icao_message):
-        # type: (str) -> FlightPlanRecord
+        # type: (str | bytes | bytearray | memoryview) -> FlightPlanRecord
         """Parses a message and returns a flight plan record. The caller need not supply a
         flight plan record instance as this method instantiates a new flight plan record and
         returns it to the caller.
 
-        :param icao_message: A string containing the message to parse;
+        :param icao_message: A string containing the message to parse, may also be given as
+               bytes, a bytearray or a memoryview;
         :return: An instance of FlightPlanRecord containing the parsed fields from the messages
                  along with any error found;
         """
@@ -74,18 +76,35 @@ class IcaoAtsMessageParser:
         return flight_plan_record
 
     def parse_message_p2(self, flight_plan_record, icao_message):
-        # type: (FlightPlanRecord, str) -> bool
+        # type: (FlightPlanRecord, str | bytes | bytearray | memoryview) -> bool
         """Parses a message and populates the flight plan record passed in as a parameter to this
         method. The caller must supply a flight plan record instance that will be populated by the
         parser.
 
         :param flight_plan_record: The flight plan record that the parsed message will be written
                to along with any errors detected during parsing;
-        :param icao_message: A string containing the message to parse;
+        :param icao_message: A string containing the message to parse, may also be given as
+               bytes, a bytearray or a memoryview;
         :return: True if no errors are detected, False otherwise;
         """
         return self.get_icao_message_parser().parse_message(flight_plan_record, icao_message)
 
+    def reparse_message(self, flight_plan_record, offset, deleted_length, inserted_text):
+        # type: (FlightPlanRecord, int, int, str) -> bool
+        """Re-parses a message after an edit to the message text, e.g. a user correcting an erroneous
+        field. Only the fields changed by the edit are parsed again, see ReParseMessage, with the settings
+        of the ICAO message parser stored by this class. The flight plan record is updated and is identical
+        to the record obtained by parsing the edited message.
+
+        :param flight_plan_record: A flight plan record populated by parse_message_p1() or parse_message_p2();
+        :param offset: The zero based index in the complete message where the edit starts;
+        :param deleted_length: The number of characters deleted from the message at 'offset';
+        :param inserted_text: The text inserted into the message at 'offset';
+        :return: True if no errors are detected, False otherwise;
+        """
+        return ReParseMessage(self.get_icao_message_parser()).reparse_message(
+            flight_plan_record, offset, deleted_length, inserted_text)
+
     def get_icao_message_parser(self):
         # type: () -> ParseMessage
         """Returns an instance of the ICAO message parser stored by this class;
@@ -0,0 +1,173 @@
+from collections import Counter
+from difflib import SequenceMatcher
+
+from Configuration.EnumerationConstants import DifferenceTypes, FieldIdentifiers
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from IcaoMessageParser.FlightPlanDifferences import DifferenceRecord, FlightPlanDifferences, RouteDifferenceRecord
+from IcaoMessageParser.FlightPlanRecord import FieldRecord, FlightPlanRecord
+
+
+class CompareFlightPlans:
+    """This class compares two flight plan records, e.g. a stored flight plan and a refiled FPL,
+    and reports the fields and subfields that have been added, removed or changed in the 'new'
+    flight plan record along with the differences between the extracted routes.
+
+    The comparison works as follows:
+        - If the messages in both flight plan records are identical there are no differences;
+        - Fields are compared by their text, a field with identical text in both records is
+          skipped without comparing its subfields;
+        - For a changed field the subfields are compared by their SubFieldIdentifiers; subfields
+          that may be repeated, (e.g. F18 STS/ and RMK/) are compared as multisets, i.e. the order of
+          repeated subfields is irrelevant;
+        - The extracted routes are compared record by record if field 15 differs, records are
+          aligned on their route element text and type before comparing the attributes derived
+          from field 15.
+
+    Field and subfield start and end indices are not compared, these change whenever the length
+    of a preceding field changes.
+
+    This class contains no state and is thread safe."""
+
+    ROUTE_ATTRIBUTES: tuple = tuple([attribute for attribute in ExtractedRouteRecord.STATE_ATTRIBUTES
+                                     if attribute != "start_index" and attribute != "end_index"])
+    """The ExtractedRouteRecord attributes compared when comparing extracted routes"""
+
+    def compare(self, old_flight_plan_record, new_flight_plan_record, fields_in_new_only=False):
+        # type: (FlightPlanRecord, FlightPlanRecord, bool) -> FlightPlanDifferences
+        """This method is the entry point to compare two flight plan records.
+
+        :param old_flight_plan_record: The flight plan record being compared against, e.g. a stored flight plan;
+        :param new_flight_plan_record: The flight plan record compared, e.g. a refiled FPL;
+        :param fields_in_new_only: Optional, if True fields that are in the old flight plan record but are
+               not in the new flight plan record are not reported as removed, e.g. to compare a stored
+               flight plan with the F22 flight plan record of a CHG message;
+        :return: An instance of FlightPlanDifferences containing all the differences found
+        """
+        differences = FlightPlanDifferences()
+
+        # Identical messages parse to identical flight plan records
+        if old_flight_plan_record.get_message_complete() == new_flight_plan_record.get_message_complete() and \
+                old_flight_plan_record.get_message_complete() != "":
+            return differences
+
+        old_fields = old_flight_plan_record.icao_fields
+        new_fields = new_flight_plan_record.icao_fields
+        for field_id, new_field in new_fields.items():
+            old_field = old_fields.get(field_id)
+            if old_field is None:
+                differences.add_field_difference(DifferenceRecord(
+                    DifferenceTypes.ADDED, field_id, None, None, new_field.get_field_text()))
+            elif old_field.get_field_text() != new_field.get_field_text():
+                differences.add_field_difference(DifferenceRecord(
+                    DifferenceTypes.CHANGED, field_id, None, old_field.get_field_text(), new_field.get_field_text()))
+                self.compare_subfields(differences, field_id, old_field, new_field)
+
+        if not fields_in_new_only:
+            for field_id, old_field in old_fields.items():
+                if field_id not in new_fields:
+                    differences.add_field_difference(DifferenceRecord(
+                        DifferenceTypes.REMOVED, field_id, None, old_field.get_field_text(), None))
+
+        # Compare the extracted routes if field 15 is not identical
+        old_f15 = old_fields.get(FieldIdentifiers.F15)
+        new_f15 = new_fields.get(FieldIdentifiers.F15)
+        if old_f15 is None and new_f15 is None:
+            return differences
+        if old_f15 is not None and new_f15 is not None and old_f15.get_field_text() == new_f15.get_field_text():
+            return differences
+        if new_f15 is None and fields_in_new_only:
+            return differences
+        self.compare_extracted_routes(differences,
+                                      old_flight_plan_record.get_extracted_route(),
+                                      new_flight_plan_record.get_extracted_route())
+        return differences
+
+    @staticmethod
+    def compare_subfields(differences, field_id, old_field, new_field):
+        # type: (FlightPlanDifferences, FieldIdentifiers, FieldRecord, FieldRecord) -> None
+        """This method compares the subfields of a field that differs between two flight plan records.
+        A subfield present once in both fields with a different text is reported as changed; otherwise
+        the subfields are compared as a multiset of their texts and the texts removed and added are
+        reported.
+
+        :param differences: The differences found so far, differences found are added to this instance;
+        :param field_id: The field identifier of the field being compared;
+        :param old_field: The field in the old flight plan record;
+        :param new_field: The field in the new flight plan record;
+        :return: None
+        """
+        old_subfields = old_field.get_subfield_dictionary()
+        new_subfields = new_field.get_subfield_dictionary()
+        subfield_ids = list(new_subfields.keys()) + [key for key in old_subfields.keys() if key not in new_subfields]
+        for subfield_id in subfield_ids:
+            old_texts = [subfield.get_field_text() for subfield in old_subfields.get(subfield_id, [])]
+            new_texts = [subfield.get_field_text() for subfield in new_subfields.get(subfield_id, [])]
+            if old_texts == new_texts:
+                continue
+            if len(old_texts) == 1 and len(new_texts) == 1:
+                differences.add_field_difference(DifferenceRecord(
+                    DifferenceTypes.CHANGED, field_id, subfield_id, old_texts[0], new_texts[0]))
+                continue
+
+            # Compare as multisets, the order of repeated subfields is irrelevant
+            old_counter = Counter(old_texts)
+            new_counter = Counter(new_texts)
+            for text in (old_counter - new_counter).elements():
+                differences.add_field_difference(DifferenceRecord(
+                    DifferenceTypes.REMOVED, field_id, subfield_id, text, None))
+            for text in (new_counter - old_counter).elements():
+                differences.add_field_difference(DifferenceRecord(
+                    DifferenceTypes.ADDED, field_id, subfield_id, None, text))
+
+    def compare_extracted_routes(self, differences, old_route, new_route):
+        # type: (FlightPlanDifferences, ExtractedRouteSequence | None, ExtractedRouteSequence | None) -> None
+        """This method compares two extracted routes record by record. The records are aligned
+        on their route element text and type using the longest matching sequences; records only in the
+        old route are reported as removed, records only in the new route are reported as added. Aligned
+        records, (or records replaced by one another) with different attributes are reported as changed
+        together with the names of the attributes that differ.
+
+        :param differences: The differences found so far, differences found are added to this instance;
+        :param old_route: The extracted route in the old flight plan record or None;
+        :param new_route: The extracted route in the new flight plan record or None;
+        :return: None
+        """
+        old_records = [] if old_route is None else old_route.get_all_elements()
+        new_records = [] if new_route is None else new_route.get_all_elements()
+
+        # Align the records on the route element text and type, then compare the aligned records
+        matcher = SequenceMatcher(None,
+                                  [(record.get_name(), record.base_type, record.sub_type) for record in old_records],
+                                  [(record.get_name(), record.base_type, record.sub_type) for record in new_records],
+                                  autojunk=False)
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            # Aligned or replaced records are compared, any surplus records are removed or added
+            compared = min(old_end - old_start, new_end - new_start) if tag in ("equal", "replace") else 0
+            for idx in range(0, compared):
+                old_key = self.route_record_key(old_records[old_start + idx])
+                new_key = self.route_record_key(new_records[new_start + idx])
+                if old_key == new_key:
+                    continue
+                differences.add_route_difference(RouteDifferenceRecord(
+                    DifferenceTypes.CHANGED,
+                    old_records[old_start + idx].get_name(),
+                    new_records[new_start + idx].get_name(),
+                    old_start + idx,
+                    new_start + idx,
+                    tuple([attribute for attribute, old_value, new_value in zip(self.ROUTE_ATTRIBUTES, old_key, new_key)
+                           if old_value != new_value])))
+            for idx in range(old_start + compared, old_end):
+                differences.add_route_difference(RouteDifferenceRecord(
+                    DifferenceTypes.REMOVED, old_records[idx].get_name(), None, idx, None, ()))
+            for idx in range(new_start + compared, new_end):
+                differences.add_route_difference(RouteDifferenceRecord(
+                    DifferenceTypes.ADDED, None, new_records[idx].get_name(), None, idx, ()))
+
+    def route_record_key(self, record):
+        # type: (ExtractedRouteRecord) -> tuple
+        """Gets the values of the attributes of an extracted route record that are compared.
+
+        :param record: The extracted route record;
+        :return: A tuple containing the values of the attributes in ROUTE_ATTRIBUTES"""
+        return tuple([getattr(record, attribute) for attribute in self.ROUTE_ATTRIBUTES])
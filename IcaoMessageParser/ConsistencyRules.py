@@ -0,0 +1,364 @@
+import re
+
+from Configuration.EnumerationConstants import MessageTitles, FieldIdentifiers, SubFieldIdentifiers, ErrorId, \
+    FlightRules
+from Configuration.ErrorMessages import ErrorMessages
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.Utils import Utils
+
+
+class ConsistencyFacts:
+    """This class holds the facts of a flight plan record the consistency rules are evaluated on, (see
+    ConsistencyRules). The facts are decoded once per message, the F10a letters and the F18 PBN indicators
+    into sets so that each rule is evaluated with set operations instead of scanning the field text."""
+
+    PBN_INDICATOR: re.Pattern = re.compile("[A-Z][0-9]")
+    """The syntax of a F18 PBN indicator, a letter followed by a digit"""
+
+    flight_plan_record: FlightPlanRecord = None
+    """The flight plan record being checked"""
+
+    error_messages: ErrorMessages = None
+    """Configuration data containing all the error messages"""
+
+    f10a: {str} = None
+    """The letters in F10a, empty if F10a is absent"""
+
+    pbn: {str} = None
+    """The indicators in the first F18 PBN subfield, empty if there is no PBN subfield"""
+
+    f18: {SubFieldIdentifiers} = None
+    """The F18 subfields in the flight plan record, empty if F18 is absent"""
+
+    def __init__(self, flight_plan_record, error_messages):
+        # type: (FlightPlanRecord, ErrorMessages) -> None
+        """Constructor decoding the facts of a flight plan record.
+
+        :param flight_plan_record: The flight plan record being checked;
+        :param error_messages: Configuration data containing all the error messages;
+        :return: None
+        """
+        self.flight_plan_record = flight_plan_record
+        self.error_messages = error_messages
+        self.f10a = set(self.get_subfield_text(FieldIdentifiers.F10, SubFieldIdentifiers.F10a))
+        self.pbn = set(self.PBN_INDICATOR.findall(
+            self.get_subfield_text(FieldIdentifiers.F18, SubFieldIdentifiers.F18pbn)))
+        f18 = flight_plan_record.get_icao_field(FieldIdentifiers.F18)
+        self.f18 = set() if f18 is None else set(f18.get_subfield_dictionary())
+
+    def get_subfield_text(self, field_id, subfield_id):
+        # type: (FieldIdentifiers, SubFieldIdentifiers) -> str
+        """Returns the text of the first subfield of a field.
+
+        :param field_id: The field identifier;
+        :param subfield_id: The subfield identifier;
+        :return: The text of the subfield, an empty string if the subfield is absent
+        """
+        subfield = self.flight_plan_record.get_icao_subfield(field_id, subfield_id)
+        return "" if subfield is None else subfield.get_field_text()
+
+
+class ConsistencyRule:
+    """This class is a consistency rule between the fields of a message, (see ConsistencyRules). A rule
+    applies to a set of message titles when all its required fields are present in the flight plan record;
+    its predicate is evaluated on the facts of the flight plan record and an error is reported if the
+    predicate is not satisfied."""
+
+    titles: frozenset = None
+    """The message titles the rule applies to"""
+
+    required_fields: (FieldIdentifiers,) = None
+    """The fields that must be present in the flight plan record for the rule to apply"""
+
+    predicate: callable = None
+    """Returns True if the facts of a flight plan record satisfy the rule, called with a ConsistencyFacts"""
+
+    erroneous_field_text: str = ""
+    """The text replacing the '!' in the error message"""
+
+    error_id: ErrorId = None
+    """The error reported if the rule is not satisfied"""
+
+    def __init__(self, titles, required_fields, predicate, erroneous_field_text="", error_id=None):
+        # type: ({MessageTitles}, (FieldIdentifiers,), callable, str, ErrorId | None) -> None
+        """Constructor for a consistency rule.
+
+        :param titles: The message titles the rule applies to;
+        :param required_fields: The fields that must be present for the rule to apply;
+        :param predicate: Returns True if the ConsistencyFacts passed to it satisfy the rule;
+        :param erroneous_field_text: The text replacing the '!' in the error message;
+        :param error_id: The error reported if the rule is not satisfied;
+        :return: None
+        """
+        self.titles = frozenset(titles)
+        self.required_fields = tuple(required_fields)
+        self.predicate = predicate
+        self.erroneous_field_text = erroneous_field_text
+        self.error_id = error_id
+
+    def applies(self, flight_plan_record):
+        # type: (FlightPlanRecord) -> bool
+        """Checks if all the required fields of the rule are present in a flight plan record.
+
+        :param flight_plan_record: The flight plan record being checked;
+        :return: True if the rule applies to the flight plan record, False otherwise
+        """
+        for field_id in self.required_fields:
+            if flight_plan_record.get_icao_field(field_id) is None:
+                return False
+        return True
+
+    def check(self, facts):
+        # type: (ConsistencyFacts) -> bool
+        """Evaluates the rule and reports an error to the flight plan record if the rule is not satisfied.
+
+        :param facts: The facts of the flight plan record being checked;
+        :return: False if errors are detected, True if all is OK;
+        """
+        if self.predicate(facts):
+            return True
+        Utils.add_error(facts.flight_plan_record, self.erroneous_field_text, 0, 0,
+                        facts.error_messages, self.error_id)
+        return False
+
+
+class PbnConsistencyRule(ConsistencyRule):
+    """This class is a consistency rule between the F18 PBN indicators and F10a; if PBN contains one or more
+    of the indicators of the rule then F10a must contain one or more of the letters of the rule. The default
+    rules can be read from the table below, (see ConsistencyRules.RULES):
+             | B1| B2| B3| B4| B5| C1| C2| C3| C4| D1| D2| D3| D4| O1| O2| O3| O4|
+          D  | X |   | X | X |   | X |   | X | X | X |   | X | X | X |   | X | X |
+          G  | X | X |   |   |   | X | X |   |   | X | X |   |   | X | X |   |   |
+          I  | X |   |   |   | X | X |   |   | X | X |   |   | X | X |   |   | X |
+         O|S | X |   |   | X |   |   |   |   |   |   |   |   |   |   |   |   |   |
+          R  | X | X | X | X | X |   |   |   |   |   |   |   |   |   |   |   |   |"""
+
+    indicators: frozenset = None
+    """The PBN indicators requiring one of the letters in F10a"""
+
+    letters: frozenset = None
+    """The letters F10a must contain one or more of"""
+
+    def __init__(self, titles, indicators, letters, error_id):
+        # type: ({MessageTitles}, {str}, {str}, ErrorId) -> None
+        """Constructor for a PBN consistency rule.
+
+        :param titles: The message titles the rule applies to;
+        :param indicators: The PBN indicators requiring one of the letters in F10a;
+        :param letters: The letters F10a must contain one or more of;
+        :param error_id: The error reported if the rule is not satisfied;
+        :return: None
+        """
+        super().__init__(titles, (FieldIdentifiers.F10,), self.is_satisfied, "'PBN'", error_id)
+        self.indicators = frozenset(indicators)
+        self.letters = frozenset(letters)
+
+    def is_satisfied(self, facts):
+        # type: (ConsistencyFacts) -> bool
+        """The predicate of the rule.
+
+        :param facts: The facts of the flight plan record being checked;
+        :return: True if PBN contains none of the indicators or F10a contains one of the letters
+        """
+        return facts.pbn.isdisjoint(self.indicators) or not facts.f10a.isdisjoint(self.letters)
+
+
+class FlightRulesConsistencyRule(ConsistencyRule):
+    """This class is the consistency rule between the flight rules given in F8a and the flight rules derived
+    from the F15 extracted route; it sets the derived flight rules of the flight plan record and reports one
+    of several errors, so it is evaluated by check() instead of a predicate."""
+
+    def __init__(self, titles):
+        # type: ({MessageTitles}) -> None
+        """Constructor for the flight rules consistency rule.
+
+        :param titles: The message titles the rule applies to;
+        :return: None
+        """
+        super().__init__(titles, (), None)
+
+    def check(self, facts):
+        # type: (ConsistencyFacts) -> bool
+        """Checks the flight rules given in F8a against the rules derived from the F15 extracted route.
+
+        :param facts: The facts of the flight plan record being checked;
+        :return: False if errors are detected, True if all is OK;
+        """
+        flight_plan_record = facts.flight_plan_record
+
+        # If there is no extracted route bail out
+        if flight_plan_record.get_extracted_route() is None:
+            return True
+
+        # Get the derived flight rules from the extracted route and set the derived rules
+        # to the flight plan record
+        derived_rules = FlightRules.get_flight_rules(
+            flight_plan_record.get_extracted_route().get_derived_flight_rules())
+        flight_plan_record.set_derived_flight_rules(derived_rules)
+
+        # Get the flight rules from field 8
+        f8a = facts.get_subfield_text(FieldIdentifiers.F8, SubFieldIdentifiers.F8a)
+        if f8a == "":
+            if derived_rules is not FlightRules.UNKNOWN:
+                # Error, derived rules exist, nothing in Field 8a
+                Utils.add_error(flight_plan_record, derived_rules.name, 0, 0,
+                                facts.error_messages, ErrorId.CONSISTENCY_F8_F8A_UNKNOWN)
+                return False
+        elif derived_rules is FlightRules.UNKNOWN:
+            # Error, derived rules unknown but Field 8a has a rule assigned
+            Utils.add_error(flight_plan_record, f8a, 0, 0,
+                            facts.error_messages, ErrorId.CONSISTENCY_F8_DERIVED_UNKNOWN)
+            return False
+        elif FlightRules.get_flight_rules(f8a) is not derived_rules:
+            # Error, both flight rules available but different
+            Utils.add_error(flight_plan_record, derived_rules.name, 0, 0,
+                            facts.error_messages, ErrorId.CONSISTENCY_F8_F8_DERIVED_DIFFERENT)
+            return False
+
+        return True
+
+
+class ConsistencyRules:
+    """This class is the rule engine performing the consistency checks between the fields of a message,
+    (see ParseMessage.consistency_check()). The rules are declared once and compiled into a list of rules per
+    message title; checking a message evaluates the rules of its title in the order they are declared, on
+    the facts of the flight plan record decoded once, (see ConsistencyFacts). A message whose title has no
+    rules is not decoded at all.
+
+    Further rules can be added with register_rule(), e.g. by a deployment with local conventions; a rule
+    is only evaluated for the titles it applies to, so rules for other titles do not slow the check of the
+    default titles. The rules can be shared by several message parsers and threads; register the rules
+    before the engine is used. An engine shared by default, (see ParseMessage.consistency_rules), is read
+    only, rules are registered with a copy of it, (see copy() and ParseMessage.register_consistency_rule())."""
+
+    TITLES: frozenset = frozenset((MessageTitles.AFP, MessageTitles.ALR, MessageTitles.APL,
+                                   MessageTitles.CPL, MessageTitles.FPL))
+    """The message titles containing both field 10 and field 18 and/or field 8 and field 15"""
+
+    RULES: (ConsistencyRule,) = (
+        # The flight rules in F8a must match the rules derived from F15
+        FlightRulesConsistencyRule(TITLES),
+        # If F10a contains the letter 'Z' then one or more of the F18 subfields 'COM', 'NAV' or 'DAT'
+        # must be present
+        ConsistencyRule(TITLES, (FieldIdentifiers.F10,),
+                        lambda facts: "Z" not in facts.f10a or not facts.f18.isdisjoint(
+                            {SubFieldIdentifiers.F18com, SubFieldIdentifiers.F18nav, SubFieldIdentifiers.F18dat}),
+                        "'COM', 'NAV' or 'DAT'", ErrorId.CONSISTENCY_F10_Z),
+        # If F10a contains the letter 'R' then F18 'PBN' must contain one or more of the indicators
+        # 'B1', 'B2', 'B3', 'B4' or 'B5'
+        ConsistencyRule(TITLES, (FieldIdentifiers.F10,),
+                        lambda facts: "R" not in facts.f10a or not facts.pbn.isdisjoint({"B1", "B2", "B3", "B4", "B5"}),
+                        "'PBN'", ErrorId.CONSISTENCY_F10_R),
+        # If F18 'PBN' contains one or more of the indicators then F10a must contain one or more of the letters
+        PbnConsistencyRule(TITLES, {"B1", "B3", "B4", "C1", "C3", "C4", "D1", "D3", "D4", "O1", "O3", "O4"},
+                           {"D"}, ErrorId.CONSISTENCY_PBN_D),
+        PbnConsistencyRule(TITLES, {"B1", "B2", "C1", "C2", "D1", "D2", "O1", "O2"}, {"G"}, ErrorId.CONSISTENCY_PBN_G),
+        PbnConsistencyRule(TITLES, {"B1", "B5", "C1", "C4", "D1", "D4", "O1", "O4"}, {"I"}, ErrorId.CONSISTENCY_PBN_I),
+        PbnConsistencyRule(TITLES, {"B1", "B4"}, {"O", "S"}, ErrorId.CONSISTENCY_PBN_OS),
+        PbnConsistencyRule(TITLES, {"B1", "B2", "B3", "B4", "B5"}, {"R"}, ErrorId.CONSISTENCY_PBN_R),
+        # If F9b, F13a or F16a contain 'ZZZZ' then F18 must contain the subfield 'TYP', 'DEP' or 'DEST'
+        ConsistencyRule(TITLES, (FieldIdentifiers.F10, FieldIdentifiers.F9),
+                        lambda facts: SubFieldIdentifiers.F18typ in facts.f18 or
+                        facts.get_subfield_text(FieldIdentifiers.F9, SubFieldIdentifiers.F9b) != "ZZZZ",
+                        "", ErrorId.CONSISTENCY_F9B_TYP),
+        ConsistencyRule(TITLES, (FieldIdentifiers.F10, FieldIdentifiers.F13),
+                        lambda facts: SubFieldIdentifiers.F18dep in facts.f18 or
+                        facts.get_subfield_text(FieldIdentifiers.F13, SubFieldIdentifiers.F13a) != "ZZZZ",
+                        "", ErrorId.CONSISTENCY_F13A_DEP),
+        ConsistencyRule(TITLES, (FieldIdentifiers.F10, FieldIdentifiers.F16),
+                        lambda facts: SubFieldIdentifiers.F18dest in facts.f18 or
+                        facts.get_subfield_text(FieldIdentifiers.F16, SubFieldIdentifiers.F16a) != "ZZZZ",
+                        "", ErrorId.CONSISTENCY_F16A_DEST))
+    """The default consistency rules, in the order they are evaluated"""
+
+    rules: [ConsistencyRule] = None
+    """The rules of this engine, in the order they are evaluated"""
+
+    rules_by_title: {MessageTitles: (ConsistencyRule,)} = None
+    """The rules compiled per message title, a title without rules is not present"""
+
+    read_only: bool = False
+    """True if no further rules can be registered with this engine"""
+
+    def __init__(self, rules=RULES, read_only=False):
+        # type: ((ConsistencyRule,), bool) -> None
+        """Constructor compiling a list of rules.
+
+        :param rules: The rules, in the order they are evaluated, the default rules if not given;
+        :param read_only: True if no further rules can be registered with this engine;
+        :return: None
+        """
+        self.rules = list(rules)
+        self.read_only = read_only
+        self.compile_rules()
+
+    def check(self, flight_plan_record, error_messages):
+        # type: (FlightPlanRecord, ErrorMessages) -> bool
+        """Evaluates the rules of the message title of a flight plan record, reporting an error to the flight
+        plan record for each rule that is not satisfied.
+
+        :param flight_plan_record: The flight plan record being checked;
+        :param error_messages: Configuration data containing all the error messages;
+        :return: False if errors are detected, True if all is OK;
+        """
+        rules = self.rules_by_title.get(flight_plan_record.get_message_title())
+        if rules is None:
+            return True
+        facts = ConsistencyFacts(flight_plan_record, error_messages)
+        result = True
+        for rule in rules:
+            if rule.applies(flight_plan_record) and not rule.check(facts):
+                result = False
+        return result
+
+    def compile_rules(self):
+        # type: () -> None
+        """Compiles the rules into a list of rules per message title.
+
+        :return: None
+        """
+        rules_by_title = {}
+        for rule in self.rules:
+            for title in rule.titles:
+                rules_by_title.setdefault(title, []).append(rule)
+        self.rules_by_title = {title: tuple(rules) for title, rules in rules_by_title.items()}
+
+    def copy(self):
+        # type: () -> ConsistencyRules
+        """Returns an engine with the rules of this engine that further rules can be registered with.
+
+        :return: A new ConsistencyRules instance
+        """
+        return ConsistencyRules(self.rules)
+
+    def get_rules(self, message_title=None):
+        # type: (MessageTitles | None) -> (ConsistencyRule,)
+        """Returns the rules of a message title or all the rules of this engine.
+
+        :param message_title: The message title or None for all the rules;
+        :return: The rules in the order they are evaluated
+        """
+        if message_title is None:
+            return tuple(self.rules)
+        return self.rules_by_title.get(message_title, ())
+
+    def is_read_only(self):
+        # type: () -> bool
+        """Returns whether further rules can be registered with this engine.
+
+        :return: True if this engine is read only, False otherwise
+        """
+        return self.read_only
+
+    def register_rule(self, rule):
+        # type: (ConsistencyRule) -> None
+        """Adds a rule evaluated after the rules already registered for its message titles.
+
+        :param rule: The rule to add;
+        :return: None
+        :raises ValueError: If this engine is read only
+        """
+        if self.read_only:
+            raise ValueError("The consistency rules are read only, register the rule with a copy of the rules")
+        self.rules.append(rule)
+        self.compile_rules()
@@ -0,0 +1,197 @@
+import threading
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+
+
+class FieldMemo:
+    """This class is an optional, bounded memo of parsed fields used by ParseMessage.parse_field(), (see
+    ParseMessage.set_field_memo()). Many field values, e.g. 'B737/M', 'S/C', 'IS', aerodrome / time pairs
+    and field 18 keyword blocks, repeat across thousands of messages; the subfields and errors of a field
+    only depend on the field text, so they are parsed once and rebuilt from the memo for every further
+    occurrence of the same field text.
+
+    An entry is keyed on the field identifier and field text and holds the subfields and errors added
+    to the flight plan record by the field parser, with their start and end index stored relative to
+    the start of the field. On a hit, the subfields and errors are added to the flight plan record at
+    the position of the field being parsed in O(number of subfields + errors), without tokenizing or
+    checking the syntax of the field.
+
+    Only fields whose parser has no effect on the flight plan record other than adding subfields and
+    errors are memoised, (see ParseFieldsCommon.MEMOISABLE). The memo holds up to 'maximum_size'
+    entries; when full, the least recently used entry is discarded. The number of hits and misses is
+    counted per field identifier, (see get_hit_rate()).
+
+    A memo can be shared by several message parsers and threads, access to the entries is serialised."""
+
+    DEFAULT_MAXIMUM_SIZE: int = 4096
+    """The default maximum number of entries held by a memo"""
+
+    maximum_size: int = DEFAULT_MAXIMUM_SIZE
+    """The maximum number of entries held by this memo"""
+
+    entries: {(FieldIdentifiers, str): (((SubFieldIdentifiers, str, int, int),), ((str, str, int, int),))} = None
+    """The memoised fields keyed on the field identifier and field text, in least recently used order;
+    each entry holds the subfields as (subfield identifier, text, start, end) and the errors as (text,
+    error message, start, end), the start and end index relative to the start of the field"""
+
+    hits: {FieldIdentifiers: int} = None
+    """The number of fields rebuilt from the memo keyed on the field identifier"""
+
+    misses: {FieldIdentifiers: int} = None
+    """The number of fields parsed because they were not in the memo keyed on the field identifier"""
+
+    lock: threading.Lock = None
+    """Serialises access to the entries and statistics"""
+
+    def __init__(self, maximum_size=DEFAULT_MAXIMUM_SIZE):
+        # type: (int) -> None
+        """Constructor for an empty memo.
+
+        :param maximum_size: The maximum number of entries held by this memo, at least 1;
+        :return: None
+        """
+        if maximum_size < 1:
+            raise ValueError("The maximum size of a field memo must be at least 1, not " + str(maximum_size))
+        self.maximum_size = maximum_size
+        self.entries = {}
+        self.hits = {}
+        self.misses = {}
+        self.lock = threading.Lock()
+
+    def clear(self):
+        # type: () -> None
+        """Discards all entries and statistics.
+
+        :return: None
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+    def get_hit_rate(self, field_identifier=None):
+        # type: (FieldIdentifiers | None) -> float
+        """Returns the fraction of fields rebuilt from this memo.
+
+        :param field_identifier: The field identifier or None for all fields;
+        :return: The hits divided by the hits and misses, 0.0 if no field was looked up
+        """
+        hits = self.get_hits(field_identifier)
+        lookups = hits + self.get_misses(field_identifier)
+        return hits / lookups if lookups > 0 else 0.0
+
+    def get_hits(self, field_identifier=None):
+        # type: (FieldIdentifiers | None) -> int
+        """Returns the number of fields rebuilt from this memo.
+
+        :param field_identifier: The field identifier or None for all fields;
+        :return: The number of hits
+        """
+        if field_identifier is None:
+            return sum(self.hits.values())
+        return self.hits.get(field_identifier, 0)
+
+    def get_maximum_size(self):
+        # type: () -> int
+        """Returns the maximum number of entries held by this memo.
+
+        :return: The maximum number of entries
+        """
+        return self.maximum_size
+
+    def get_misses(self, field_identifier=None):
+        # type: (FieldIdentifiers | None) -> int
+        """Returns the number of fields parsed because they were not in this memo.
+
+        :param field_identifier: The field identifier or None for all fields;
+        :return: The number of misses
+        """
+        if field_identifier is None:
+            return sum(self.misses.values())
+        return self.misses.get(field_identifier, 0)
+
+    def get_size(self):
+        # type: () -> int
+        """Returns the number of entries held by this memo.
+
+        :return: The number of entries
+        """
+        return len(self.entries)
+
+    def get_statistics(self):
+        # type: () -> {FieldIdentifiers: (int, int, float)}
+        """Returns the statistics of every field looked up in this memo.
+
+        :return: A dictionary keyed on the field identifier containing the hits, misses and hit rate
+        """
+        with self.lock:
+            field_identifiers = list(self.misses.keys() | self.hits.keys())
+        return {field_identifier: (self.get_hits(field_identifier), self.get_misses(field_identifier),
+                                   self.get_hit_rate(field_identifier))
+                for field_identifier in field_identifiers}
+
+    def restore(self, flight_plan_record, field_identifier):
+        # type: (FlightPlanRecord, FieldIdentifiers) -> bool
+        """Rebuilds the subfields and errors of a field from this memo if the field text is memoised.
+        The field must have been added to the flight plan record, the subfields and errors are added
+        at the start index of the field.
+
+        :param flight_plan_record: The flight plan record containing the field;
+        :param field_identifier: The field identifier of the field;
+        :return: True if the field was rebuilt, False if the field must be parsed, (see save())
+        """
+        field_record = flight_plan_record.get_icao_field(field_identifier)
+        key = (field_identifier, field_record.get_field_text())
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                self.misses[field_identifier] = self.misses.get(field_identifier, 0) + 1
+                return False
+            # Re-insert the entry as the most recently used
+            self.entries[key] = entry
+            self.hits[field_identifier] = self.hits.get(field_identifier, 0) + 1
+
+        field_start = field_record.get_start_index()
+        for subfield_id, text, start_index, end_index in entry[0]:
+            flight_plan_record.add_icao_subfield(
+                field_identifier, subfield_id, text, start_index + field_start, end_index + field_start)
+        for text, error_message, start_index, end_index in entry[1]:
+            flight_plan_record.add_erroneous_field(
+                text, error_message, start_index + field_start, end_index + field_start)
+        return True
+
+    def save(self, flight_plan_record, field_identifier, first_error):
+        # type: (FlightPlanRecord, FieldIdentifiers, int) -> None
+        """Saves the subfields and errors of a field just parsed to this memo, discarding the least
+        recently used entry if the memo is full. A field with an error positioned outside the field
+        is not saved.
+
+        :param flight_plan_record: The flight plan record containing the parsed field;
+        :param field_identifier: The field identifier of the field;
+        :param first_error: The index of the first error added by the field parser;
+        :return: None
+        """
+        field_record = flight_plan_record.get_icao_field(field_identifier)
+        field_start = field_record.get_start_index()
+        field_end = field_record.get_end_index()
+        erroneous_fields = flight_plan_record.get_erroneous_fields()[first_error:]
+        for error in erroneous_fields:
+            if error.get_start_index() < field_start or error.get_end_index() > field_end:
+                # The error is not positioned within the field, (e.g. the F19 'D' errors are relative to
+                # the subfield), it cannot be moved to another occurrence of the field so the field
+                # is not memoised
+                return
+        subfields = tuple((subfield_id, subfield.get_field_text(),
+                           subfield.get_start_index() - field_start, subfield.get_end_index() - field_start)
+                          for subfield_id, subfield_list in field_record.get_subfield_dictionary().items()
+                          for subfield in subfield_list)
+        errors = tuple((error.get_field_text(), error.get_error_message(),
+                        error.get_start_index() - field_start, error.get_end_index() - field_start)
+                       for error in erroneous_fields)
+        key = (field_identifier, field_record.get_field_text())
+        with self.lock:
+            if key not in self.entries and len(self.entries) >= self.maximum_size:
+                # Discard the least recently used entry
+                del self.entries[next(iter(self.entries))]
+            self.entries[key] = (subfields, errors)
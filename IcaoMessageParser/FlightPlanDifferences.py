@@ -0,0 +1,244 @@
+import os
+
+from Configuration.EnumerationConstants import DifferenceTypes, FieldIdentifiers, SubFieldIdentifiers
+
+
+class DifferenceRecord:
+    """This class stores a single difference between a field or subfield in two flight plan records.
+    A difference is either a field or subfield that has been added to, removed from or changed in the
+    'new' flight plan record with respect to the 'old' flight plan record.
+
+    The class members are all strings, integers or enumeration values so that instances of this class
+    can be pickled; see also as_list() for a representation containing strings and integers only."""
+
+    difference_type: DifferenceTypes = DifferenceTypes.CHANGED
+    """The type of difference, one of the enumeration values from the DifferenceTypes class"""
+
+    field_id: FieldIdentifiers = FieldIdentifiers.PRIORITY_INDICATOR
+    """The identifier of the field that differs or that contains the subfield that differs"""
+
+    subfield_id: SubFieldIdentifiers | None = None
+    """The identifier of the subfield that differs, None for a difference in the field itself"""
+
+    old_text: str | None = None
+    """The field or subfield text in the old flight plan record, None if the field or subfield was added"""
+
+    new_text: str | None = None
+    """The field or subfield text in the new flight plan record, None if the field or subfield was removed"""
+
+    def __init__(self, difference_type, field_id, subfield_id, old_text, new_text):
+        # type: (DifferenceTypes, FieldIdentifiers, SubFieldIdentifiers | None, str | None, str | None) -> None
+        """Constructor that initializes all class members
+
+            :param difference_type: The type of difference as defined in the DifferenceTypes class
+            :param field_id: ICAO field identifier as defined in the EnumerationConstants.FieldIdentifiers class
+            :param subfield_id: ICAO subfield identifier as defined in the SubFieldIdentifiers class or None
+            :param old_text: The text in the old flight plan record or None if the text was added
+            :param new_text: The text in the new flight plan record or None if the text was removed
+            :return: None"""
+        self.difference_type = difference_type
+        self.field_id = field_id
+        self.subfield_id = subfield_id
+        self.old_text = old_text
+        self.new_text = new_text
+
+    def get_difference_type(self):
+        # type: () -> DifferenceTypes
+        """Gets the type of difference
+        :return: One of the enumeration values from the DifferenceTypes class"""
+        return self.difference_type
+
+    def get_field_id(self):
+        # type: () -> FieldIdentifiers
+        """Gets the identifier of the field that differs or contains the subfield that differs
+        :return: An enumeration value from the FieldIdentifiers class"""
+        return self.field_id
+
+    def get_new_text(self):
+        # type: () -> str | None
+        """Gets the text in the new flight plan record
+        :return: The text in the new flight plan record or None if the field or subfield was removed"""
+        return self.new_text
+
+    def get_old_text(self):
+        # type: () -> str | None
+        """Gets the text in the old flight plan record
+        :return: The text in the old flight plan record or None if the field or subfield was added"""
+        return self.old_text
+
+    def get_subfield_id(self):
+        # type: () -> SubFieldIdentifiers | None
+        """Gets the identifier of the subfield that differs
+        :return: An enumeration value from the SubFieldIdentifiers class or None for a field difference"""
+        return self.subfield_id
+
+    def as_list(self):
+        # type: () -> []
+        """Gets this difference as a list containing strings, integers and None only, e.g. for
+        conversion to JSON; the list contains the difference type name, the field identifier name,
+        the subfield identifier name (or None), the old text and the new text.
+
+        :return: A list representing this difference"""
+        return [self.difference_type.name,
+                self.field_id.name,
+                None if self.subfield_id is None else self.subfield_id.name,
+                self.old_text,
+                self.new_text]
+
+    def difference_as_xml(self):
+        # type: () -> str
+        """This method returns an XML representation of the contents of this class.
+
+        :return: An XML representation of the contents of this class as a string"""
+        return "      <difference type=\"" + self.difference_type.name + \
+               "\" field=\"" + self.field_id.name + \
+               ("" if self.subfield_id is None else "\" subfield=\"" + self.subfield_id.name) + "\">" + \
+               ("" if self.old_text is None else "<old>" + self.old_text + "</old>") + \
+               ("" if self.new_text is None else "<new>" + self.new_text + "</new>") + "</difference>"
+
+
+class RouteDifferenceRecord(DifferenceRecord):
+    """This class stores a single difference between the extracted route records of two flight plan
+    records. The field identifier is always F15 and the texts are the route element texts. The index
+    of the route record in the old and / or new extracted route sequence is stored along with the
+    names of the ExtractedRouteRecord attributes that differ for a changed record.
+
+    This class subclasses the DifferenceRecord class."""
+
+    old_index: int | None = None
+    """The index of the record in the old extracted route sequence, None if the record was added"""
+
+    new_index: int | None = None
+    """The index of the record in the new extracted route sequence, None if the record was removed"""
+
+    attributes: tuple = ()
+    """The names of the ExtractedRouteRecord attributes that differ for a changed record"""
+
+    def __init__(self, difference_type, old_text, new_text, old_index, new_index, attributes):
+        # type: (DifferenceTypes, str | None, str | None, int | None, int | None, tuple) -> None
+        """Constructor that initializes all class members
+
+            :param difference_type: The type of difference as defined in the DifferenceTypes class
+            :param old_text: The route element text in the old extracted route or None if the record was added
+            :param new_text: The route element text in the new extracted route or None if the record was removed
+            :param old_index: The index of the record in the old extracted route or None
+            :param new_index: The index of the record in the new extracted route or None
+            :param attributes: The names of the ExtractedRouteRecord attributes that differ
+            :return: None"""
+        super().__init__(difference_type, FieldIdentifiers.F15, None, old_text, new_text)
+        self.old_index = old_index
+        self.new_index = new_index
+        self.attributes = attributes
+
+    def get_attributes(self):
+        # type: () -> tuple
+        """Gets the names of the ExtractedRouteRecord attributes that differ for a changed record
+        :return: A tuple of attribute names, empty for added or removed records"""
+        return self.attributes
+
+    def get_new_index(self):
+        # type: () -> int | None
+        """Gets the index of the record in the new extracted route sequence
+        :return: The index of the record in the new extracted route or None if the record was removed"""
+        return self.new_index
+
+    def get_old_index(self):
+        # type: () -> int | None
+        """Gets the index of the record in the old extracted route sequence
+        :return: The index of the record in the old extracted route or None if the record was added"""
+        return self.old_index
+
+    def as_list(self):
+        # type: () -> []
+        """Gets this difference as a list containing strings, integers and None only; the list
+        contains the entries described in DifferenceRecord.as_list() followed by the old index,
+        the new index and a list of the attribute names that differ.
+
+        :return: A list representing this difference"""
+        return super().as_list() + [self.old_index, self.new_index, list(self.attributes)]
+
+    def difference_as_xml(self):
+        # type: () -> str
+        """This method returns an XML representation of the contents of this class.
+
+        :return: An XML representation of the contents of this class as a string"""
+        return "      <route_difference type=\"" + self.difference_type.name + \
+               ("" if self.old_index is None else "\" old_index=\"" + str(self.old_index)) + \
+               ("" if self.new_index is None else "\" new_index=\"" + str(self.new_index)) + \
+               ("" if len(self.attributes) == 0 else "\" attributes=\"" + " ".join(self.attributes)) + "\">" + \
+               ("" if self.old_text is None else "<old>" + self.old_text + "</old>") + \
+               ("" if self.new_text is None else "<new>" + self.new_text + "</new>") + "</route_difference>"
+
+
+class FlightPlanDifferences:
+    """This class contains the differences between two flight plan records as created by the
+    CompareFlightPlans class. Differences in fields and subfields are stored as DifferenceRecord's
+    in the order of the fields in the new flight plan record followed by the fields removed from the
+    old flight plan record; differences in the extracted routes are stored as RouteDifferenceRecord's
+    in route order."""
+
+    field_differences: [DifferenceRecord] = []
+    """A list containing zero or more differences between fields and subfields"""
+
+    route_differences: [RouteDifferenceRecord] = []
+    """A list containing zero or more differences between extracted route records"""
+
+    def __init__(self):
+        """Constructor that initialises all members in this class to empty lists."""
+        self.field_differences = []
+        self.route_differences = []
+
+    def add_field_difference(self, difference):
+        # type: (DifferenceRecord) -> None
+        """Adds a field or subfield difference.
+            :param difference: The difference to add
+            :return: None"""
+        self.field_differences.append(difference)
+
+    def add_route_difference(self, difference):
+        # type: (RouteDifferenceRecord) -> None
+        """Adds an extracted route difference.
+            :param difference: The difference to add
+            :return: None"""
+        self.route_differences.append(difference)
+
+    def as_list(self):
+        # type: () -> []
+        """Gets all differences as a list of lists containing strings, integers and None only, see
+        DifferenceRecord.as_list() and RouteDifferenceRecord.as_list(); field differences are followed
+        by the route differences.
+
+        :return: A list of lists, an empty list is returned if there are no differences"""
+        return [difference.as_list() for difference in self.field_differences + self.route_differences]
+
+    def as_xml(self):
+        # type: () -> str
+        """This method returns an XML representation of the differences.
+
+        :return: An XML representation of the differences as an XML string"""
+        return "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\" ?>" + os.linesep + \
+               "<flight_plan_differences>" + os.linesep + \
+               "".join([difference.difference_as_xml() + os.linesep
+                        for difference in self.field_differences + self.route_differences]) + \
+               "</flight_plan_differences>"
+
+    def get_field_differences(self, field_id=None):
+        # type: (FieldIdentifiers | None) -> [DifferenceRecord]
+        """Gets the field and subfield differences, optionally for a single field.
+            :param field_id: Optional, ICAO field identifier to get the differences for
+            :return: A list of zero or more DifferenceRecord's"""
+        if field_id is None:
+            return self.field_differences
+        return [difference for difference in self.field_differences if difference.get_field_id() is field_id]
+
+    def get_route_differences(self):
+        # type: () -> [RouteDifferenceRecord]
+        """Gets the extracted route differences.
+            :return: A list of zero or more RouteDifferenceRecord's"""
+        return self.route_differences
+
+    def has_differences(self):
+        # type: () -> bool
+        """Checks if any differences were found.
+            :return: True if any differences were found, False otherwise"""
+        return len(self.field_differences) > 0 or len(self.route_differences) > 0
@@ -41,10 +41,18 @@ class SubFieldRecord:
     are stored as part of their parent ICAO fields in a FieldRecord.
 
     There are no 'setter' methods in this class as the constructor initialises all members on class
-    instantiation making this class effectively 'read' only."""
+    instantiation making this class effectively 'read' only.
 
-    field_text: str = ""
-    """A string that is the subfield, i.e. 'LOWL', '0234' etc."""
+    If the record is created with the original message and the subfield text is the text between the
+    start and end index of the message, only the indices and a reference to the message are stored;
+    the subfield text is then sliced from the message when it is accessed by get_field_text()."""
+
+    field_text: str | None = ""
+    """A string that is the subfield, i.e. 'LOWL', '0234' etc. or None if the subfield text
+    is recovered from 'message' using the start and end index."""
+
+    message: str | None = None
+    """The original message when this record is stored as offsets into the message, None otherwise."""
 
     start_index: int = 0
     """An integer representing the zero based index for the start of the subfield in the original message string."""
@@ -52,23 +60,42 @@ class SubFieldRecord:
     end_index: int = 0
     """An integer representing the zero based index for the end of the subfield in the original message string."""
 
-    def __init__(self, field_text, start_index, end_index):
-        # type: (str, int, int) -> None
+    def __init__(self, field_text, start_index, end_index, message=None):
+        # type: (str | None, int, int, str | None) -> None
         """Constructor that initializes all class members
 
-        :param field_text: A string that is the subfield, i.e. 'LOWL', '0234' etc.
+        :param field_text: A string that is the subfield, i.e. 'LOWL', '0234' etc.; may be None if
+                           'message' is given, the subfield text is then always taken from the message.
         :param start_index: An integer representing the zero based index for the start of the
                             subfield in the original message string.
         :param end_index: An integer representing the zero based index for the end of the
-                          subfield in the original message string."""
-        self.field_text = field_text
+                          subfield in the original message string.
+        :param message: Optional, the original message; if the subfield text is found in the message
+                        between the start and end index, only the indices are stored and the
+                        subfield text is not copied."""
         self.start_index = start_index
         self.end_index = end_index
+        if message is not None and (field_text is None or (
+                end_index - start_index == len(field_text) and message.startswith(field_text, start_index))):
+            self.field_text = None
+            self.message = message
+        else:
+            self.field_text = field_text
+            self.message = None
+
+    def __reduce__(self):
+        # type: () -> tuple
+        """Reduces this class to its constructor arguments for pickling.
+
+        :return: A tuple containing this class and its constructor arguments"""
+        return self.__class__, (self.get_field_text(), self.start_index, self.end_index)
 
     def get_field_text(self):
         # type: () -> str
         """Gets the subfield text as it appears in the original message
         :return: The subfield text"""
+        if self.field_text is None:
+            return self.message[self.start_index:self.end_index]
         return self.field_text
 
     def get_start_index(self):
@@ -121,17 +148,38 @@ class FieldRecord(SubFieldRecord):
     this dictionary are enumeration values from the EnumerationConstants.SubFieldIdentifiers
     class."""
 
-    def __init__(self, field_text, start_index, end_index):  # , field_identifier):
-        # type: (str, int, int) -> None
+    def __init__(self, field_text, start_index, end_index, message=None):  # , field_identifier):
+        # type: (str | None, int, int, str | None) -> None
         """Constructor that initializes all the sub_fields class member with an
         empty subfield dictionary and a fully populated ICAO field.
             :param field_text: The ICAO field as it appears in a message
             :param start_index: The zero based start index of the ICAO fields position in the original message string
             :param end_index: The zero based end index of the ICAO fields position in the original message string
+            :param message: Optional, the original message to store the field as offsets, see SubFieldRecord
             :return: None"""
-        super().__init__(field_text, start_index, end_index)
+        super().__init__(field_text, start_index, end_index, message)
         self.subfields = {}
 
+    def __reduce__(self):
+        # type: () -> tuple
+        """Reduces this class to its constructor arguments for pickling; the subfields are packed
+        into a flat tuple holding the subfield identifier, text, start and end index for each
+        subfield, see __setstate__().
+
+        :return: A tuple containing this class, its constructor arguments and the packed subfields"""
+        return FieldRecord, (self.get_field_text(), self.start_index, self.end_index), \
+            tuple([member for subfield_id, subfield_list in self.subfields.items() for subfield in subfield_list
+                   for member in (subfield_id, subfield.get_field_text(), subfield.start_index, subfield.end_index)])
+
+    def __setstate__(self, state):
+        # type: (tuple) -> None
+        """Restores the subfields from the flat tuple created by __reduce__().
+
+        :param state: A flat tuple holding the subfield identifier, text, start and end index for each subfield
+        :return: None"""
+        for idx in range(0, len(state), 4):
+            self.add_subfield(state[idx], SubFieldRecord(state[idx + 1], state[idx + 2], state[idx + 3]))
+
     def add_subfield(self, icao_subfield_id, subfield):
         # type: (SubFieldIdentifiers, SubFieldRecord) -> None
         """Adds an ICAO subfield to this ICAO field record
@@ -222,24 +270,39 @@ class ErrorRecord(SubFieldRecord):
     error_message: str = ""
     """Contains the error message associated with the erroneous token."""
 
-    def __init__(self, erroneous_field_text, error_message, start_index, end_index):
-        # type: (str, str, int, int) -> None
+    def __init__(self, erroneous_field_text, error_message, start_index, end_index, message=None):
+        # type: (str | None, str, int, int, str | None) -> None
         """Constructor that initializes all the subFieldRecord class members and in
          addition, sets the error message associated with the subfield information in this class.
             :param erroneous_field_text: The ICAO subfield as it appears in a message
             :param error_message: The error message
             :param start_index: The zero based start index of the ICAO subfields position in the original message string
             :param end_index: The zero based end index of the ICAO subfields position in the original message string
+            :param message: Optional, the original message to store the field as offsets, see SubFieldRecord
             :return: None"""
-        super().__init__(erroneous_field_text, start_index, end_index)
+        super().__init__(erroneous_field_text, start_index, end_index, message)
         self.error_message = error_message
 
+    def __reduce__(self):
+        # type: () -> tuple
+        """Reduces this class to its constructor arguments for pickling.
+
+        :return: A tuple containing this class and its constructor arguments"""
+        return ErrorRecord, (self.get_field_text(), self.error_message, self.start_index, self.end_index)
+
     def get_error_message(self):
         # type: () -> str
         """Gets the error message reported on this subfield
         :return: The error message"""
         return self.error_message
 
+    def set_error_message(self, error_message):
+        # type: (str) -> None
+        """Sets the error message reported on this subfield, (see FlightPlanRecord.move_erroneous_fields())
+        :param error_message: The error message
+        :return: None"""
+        self.error_message = error_message
+
     def field_error_as_xml(self):
         # type: () -> str
         """This method returns an XML representation of the contents of this class.
@@ -259,11 +322,33 @@ class FlightPlanRecord:
     message_complete: str = ""
     """A string that is the complete message as input to the ICAO message parser"""
 
-    message_header: str = ""
-    """A string that is the message header as input to the ICAO message parser"""
+    message_bytes: bytes | None = None
+    """The message as received when a message is parsed from bytes, (e.g. IA-5 / ASCII text from an
+    AFTN interface); None if the message was parsed from a string. All indices stored in this record
+    are byte offsets into this message."""
+
+    message_header: str | None = ""
+    """A string that is the message header as input to the ICAO message parser, None if the header
+    is stored as an offset into the complete message, (see offset_storage)"""
+
+    message_body: str | None = ""
+    """A string that is the message body; it is this data that represents a flight plan. None if the
+    body is stored as an offset into the complete message, (see offset_storage)"""
+
+    header_length: int = 0
+    """The length of the message header when the header is stored as an offset into the complete message"""
 
-    message_body: str = ""
-    """A string that is the message body; it is this data that represents a flight plan"""
+    body_start_index: int = 0
+    """The start index of the message body when the body is stored as an offset into the complete message"""
+
+    offset_storage: bool = False
+    """When True, the message header, body and the text of all fields, subfields and errors are stored as
+    offsets into a single message string instead of being copied; the text is sliced from the message
+    when it is accessed."""
+
+    offset_message: str | None = None
+    """The message that fields, subfields and errors are stored as offsets into when offset storage is
+    enabled; this is the complete message, or for an F22 flight plan, the message of the parent flight plan."""
 
     sender_adjacent_unit_name: AdjacentUnits = None
     """The adjacent unit senders name extracted from ICAO field 3b for OLDI messages"""
@@ -301,10 +386,16 @@ class FlightPlanRecord:
     derived_flight_rules: FlightRules = FlightRules.UNKNOWN
     """The flight rules as derived from Field 15 route extraction processing;"""
 
+    field_error_ranges: (FieldIdentifiers, (int, int)) = {}
+    """A dictionary containing, for each field parsed from the message body, the index of the first
+    and one past the last ErrorRecord in erroneous_fields added by the field's parser. The key to this
+    dictionary are enumeration values from the EnumerationConstants.FieldIdentifiers class."""
+
     def __init__(self):
         """Constructor that initialises all members in this class, strings are set to empty
         strings, data structures are set to None or empty lists / dictionaries."""
         self.message_complete = ""
+        self.message_bytes = None
         self.message_header = ""
         self.message_body = ""
         self.icao_fields = {}
@@ -316,6 +407,179 @@ class FlightPlanRecord:
         self.sender_adjacent_unit_name = AdjacentUnits.DEFAULT
         self.message_title = MessageTitles.UNKNOWN
         self.derived_flight_rules = FlightRules.UNKNOWN
+        self.field_error_ranges = {}
+        self.header_length = 0
+        self.body_start_index = 0
+        self.offset_storage = False
+        self.offset_message = None
+
+    def __getstate__(self):
+        # type: () -> tuple
+        """Packs this flight plan record into flat tuples for pickling, see pack_state().
+
+        :return: A tuple containing the message and the packed state of this flight plan record"""
+        if self.message_bytes is not None:
+            # The message text is decoded from the bytes when the record is restored
+            return self.message_bytes, self.pack_state(self.message_complete)
+        return self.message_complete, self.pack_state(self.message_complete)
+
+    def __setstate__(self, state):
+        # type: (tuple) -> None
+        """Restores this flight plan record from the tuple created by __getstate__().
+
+        :param state: A tuple as returned by __getstate__()
+        :return: None"""
+        self.__init__()
+        if isinstance(state[0], bytes):
+            self.message_bytes = state[0]
+            self.unpack_state(state[1], state[0].decode("latin-1"))
+        else:
+            self.unpack_state(state[1], state[0])
+
+    def pack_state(self, message):
+        # type: (str) -> tuple
+        """Packs this flight plan record into flat tuples. The message text is stored once; the
+        message header and body are stored as the length of the header if they are a split of the
+        complete message. The field, subfield and error texts are stored as None if they are
+        identical to the text between their start and end index in the message, they are sliced
+        back out of the message when the record is restored. All fields, subfields and errors are
+        each packed into a single flat tuple.
+
+        The F22 flight plan record is packed into the state of this record using the message
+        text from this record, (the F22 fields are indexed into the same message).
+
+        :param message: The message that the field, subfield and error indices refer to
+        :return: A tuple containing the complete state of this flight plan record"""
+        message_header = self.get_message_header()
+        message_body = self.get_message_body()
+        if message_header + message_body == self.message_complete:
+            header_body = len(message_header)
+        else:
+            header_body = (message_header, message_body)
+
+        fields = []
+        subfields = []
+        for field_id, field_record in self.icao_fields.items():
+            number_of_subfields = 0
+            for subfield_id, subfield_list in field_record.get_subfield_dictionary().items():
+                for subfield in subfield_list:
+                    subfields.extend((subfield_id,
+                                      self.pack_text(message, subfield.get_field_text(),
+                                                     subfield.start_index, subfield.end_index),
+                                      subfield.start_index,
+                                      subfield.end_index))
+                    number_of_subfields += 1
+            fields.extend((field_id,
+                           self.pack_text(message, field_record.get_field_text(),
+                                          field_record.start_index, field_record.end_index),
+                           field_record.start_index,
+                           field_record.end_index,
+                           number_of_subfields))
+
+        errors = []
+        for error_record in self.erroneous_fields:
+            errors.extend((self.pack_text(message, error_record.get_field_text(),
+                                          error_record.start_index, error_record.end_index),
+                           error_record.error_message,
+                           error_record.start_index,
+                           error_record.end_index))
+
+        if self.f22_flight_plan is None:
+            f22_state = None
+        else:
+            f22_state = self.f22_flight_plan.pack_state(message)
+
+        return (self.message_complete if self.message_complete != message else None,
+                self.offset_storage,
+                header_body,
+                self.message_type,
+                self.message_title,
+                self.sender_adjacent_unit_name,
+                self.receiver_adjacent_unit_name,
+                self.derived_flight_rules,
+                tuple(fields),
+                tuple(subfields),
+                tuple(errors),
+                tuple([member for field_id, error_range in self.field_error_ranges.items()
+                       for member in (field_id, error_range[0], error_range[1])]),
+                self.extracted_route,
+                f22_state)
+
+    def unpack_state(self, state, message):
+        # type: (tuple, str) -> None
+        """Restores this flight plan record from the tuples created by pack_state().
+
+        :param state: A tuple as returned by pack_state()
+        :param message: The message that the field, subfield and error indices refer to
+        :return: None"""
+        (message_complete, offset_storage, header_body, self.message_type, self.message_title,
+         self.sender_adjacent_unit_name, self.receiver_adjacent_unit_name, self.derived_flight_rules,
+         fields, subfields, errors, field_error_ranges, self.extracted_route, f22_state) = state
+
+        self.offset_storage = offset_storage
+        self.message_complete = message if message_complete is None else message_complete
+        if isinstance(header_body, int):
+            self.set_message_header(self.message_complete[0:header_body])
+            self.set_message_body(self.message_complete[header_body:])
+        else:
+            self.set_message_header(header_body[0])
+            self.set_message_body(header_body[1])
+
+        # With offset storage the records reference the message, texts stored
+        # as None are then never sliced out of the message
+        offset_message = None
+        if offset_storage:
+            offset_message = message
+            self.offset_message = message
+
+        # The records are rebuilt in line rather than with the 'add' methods, this method
+        # is called for every record received from a worker process
+        sf_start = 0
+        for idx in range(0, len(fields), 5):
+            text, start_index, end_index = fields[idx + 1:idx + 4]
+            field_record = FieldRecord(message[start_index:end_index] if text is None and not offset_storage else text,
+                                       start_index, end_index, offset_message)
+            sf_end = sf_start + 4 * fields[idx + 4]
+            subfield_dictionary = field_record.subfields
+            for sf_idx in range(sf_start, sf_end, 4):
+                subfield_id, text, start_index, end_index = subfields[sf_idx:sf_idx + 4]
+                subfield = SubFieldRecord(message[start_index:end_index] if text is None and not offset_storage
+                                          else text, start_index, end_index, offset_message)
+                if subfield_id in subfield_dictionary:
+                    subfield_dictionary[subfield_id].append(subfield)
+                else:
+                    subfield_dictionary[subfield_id] = [subfield]
+            sf_start = sf_end
+            self.icao_fields[fields[idx]] = field_record
+
+        for idx in range(0, len(errors), 4):
+            text, error_message, start_index, end_index = errors[idx:idx + 4]
+            self.erroneous_fields.append(ErrorRecord(
+                message[start_index:end_index] if text is None and not offset_storage else text,
+                error_message, start_index, end_index, offset_message))
+
+        for idx in range(0, len(field_error_ranges), 3):
+            self.field_error_ranges[field_error_ranges[idx]] = field_error_ranges[idx + 1:idx + 3]
+
+        if f22_state is not None:
+            self.f22_flight_plan = FlightPlanRecord()
+            self.f22_flight_plan.unpack_state(f22_state, message)
+
+    @staticmethod
+    def pack_text(message, text, start_index, end_index):
+        # type: (str, str, int, int) -> str | None
+        """Returns None if 'text' can be recovered from the message using its start and end index,
+        otherwise 'text' is returned as it must be stored in its own right; see unpack_state().
+
+        :param message: The message that the start and end index refer to
+        :param text: The field, subfield or erroneous field text
+        :param start_index: The zero based start index of the text in the message
+        :param end_index: The zero based end index of the text in the message
+        :return: None if the text is identical to the message text between the start and end index,
+                 'text' otherwise"""
+        if message[start_index:end_index] == text:
+            return None
+        return text
 
     def add_erroneous_field(self, erroneous_field_text, error_text, start_index, end_index):
         # type: (str, str, int, int) -> None
@@ -329,7 +593,7 @@ class FlightPlanRecord:
             :param end_index: The zero based end index of the ICAO subfields position in the original message string
             :return: None"""
         self.erroneous_fields.append(ErrorRecord(
-            erroneous_field_text, error_text, start_index, end_index))
+            erroneous_field_text, error_text, start_index, end_index, self.offset_message))
 
     def add_extracted_route(self, extracted_route):
         # type: (ExtractedRouteSequence) -> None
@@ -350,7 +614,7 @@ class FlightPlanRecord:
             :param start_index: The zero based start index of the ICAO fields position in the original message string
             :param end_index: The zero based end index of the ICAO fields position in the original message string
             :return: None"""
-        self.icao_fields[field_id] = FieldRecord(field, start_index, end_index)
+        self.icao_fields[field_id] = FieldRecord(field, start_index, end_index, self.offset_message)
 
     def add_icao_subfield(self, field_id, subfield_id, field, start_index, end_index):
         # type: (FieldIdentifiers, SubFieldIdentifiers, str, int, int) -> None
@@ -364,7 +628,8 @@ class FlightPlanRecord:
             :param start_index: The zero based start index of the ICAO subfields position in the original message string
             :param end_index: The zero based end index of the ICAO subfields position in the original message string
             :return: None"""
-        self.get_icao_field(field_id).add_subfield(subfield_id, SubFieldRecord(field, start_index, end_index))
+        self.get_icao_field(field_id).add_subfield(
+            subfield_id, SubFieldRecord(field, start_index, end_index, self.offset_message))
 
     def as_xml(self):
         # type: () -> str
@@ -498,6 +763,18 @@ class FlightPlanRecord:
         :return: An instance of this class that contains F22 fields extracted from a flight plan field 22"""
         return self.f22_flight_plan
 
+    def get_field_error_range(self, field_id):
+        # type: (FieldIdentifiers) -> (int, int) | None
+        """Gets the range of ErrorRecord's in the list of erroneous fields that were reported by the
+        parser for a given field.
+
+            :param field_id: ICAO field identifier as defined in the EnumerationConstants.FieldIdentifiers class
+            :return: A tuple with the index of the first and one past the last ErrorRecord reported for
+                     the field or None if the field was not parsed"""
+        if field_id not in self.field_error_ranges:
+            return None
+        return self.field_error_ranges[field_id]
+
     def get_icao_field(self, field_id):
         # type: (FieldIdentifiers) -> FieldRecord | None
         """Gets an ICAO field from this flight plan record
@@ -526,6 +803,8 @@ class FlightPlanRecord:
         # type: () -> str
         """Gets the complete ICAO message body
             :return: The ICAO message body as input for parsing"""
+        if self.message_body is None:
+            return self.message_complete[self.body_start_index:]
         return self.message_body
 
     def get_message_complete(self):
@@ -534,10 +813,19 @@ class FlightPlanRecord:
             :return: The ICAO message as input for parsing"""
         return self.message_complete
 
+    def get_message_bytes(self):
+        # type: () -> bytes | None
+        """Gets the message as received if it was parsed from bytes; this can be archived as is
+        without encoding the message text again.
+            :return: The message bytes or None if the message was parsed from a string"""
+        return self.message_bytes
+
     def get_message_header(self):
         # type: () -> str
         """Gets the ICAO message header (if present)
             :return: The ICAO message header as input for parsing"""
+        if self.message_header is None:
+            return self.message_complete[0:self.header_length]
         return self.message_header
 
     def get_message_title(self):
@@ -556,6 +844,13 @@ class FlightPlanRecord:
             :return: Message type as one of the enumeration values from the EnumerationConstants.MessageTypes class"""
         return self.message_type
 
+    def get_offset_message(self):
+        # type: () -> str | None
+        """Gets the message that fields, subfields and errors are stored as offsets into.
+
+            :return: The message if offset storage is enabled, None otherwise"""
+        return self.offset_message
+
     def get_receiver_adjacent_unit_name(self):
         # type: () -> AdjacentUnits
         """Gets the receiver adjacent unit name as extracted from ICAO field 3b; stored
@@ -570,6 +865,28 @@ class FlightPlanRecord:
             :return: Adjacent unit name as an enumeration value from EnumerationConstants.AdjacentUnits"""
         return self.sender_adjacent_unit_name
 
+    def is_offset_storage(self):
+        # type: () -> bool
+        """Checks if this flight plan record stores its message and field text as offsets into
+        the original message, see set_offset_storage().
+
+            :return: True if offset storage is enabled, False otherwise"""
+        return self.offset_storage
+
+    def move_erroneous_fields(self, flight_plan_record, error_message_prefix):
+        # type: (FlightPlanRecord, str) -> None
+        """Moves the erroneous fields of another flight plan record to this flight plan record, e.g. the
+        errors of the fields in a field 22 parsed into their own flight plan record. The error records are
+        moved rather than copied, the error message of each is prefixed to identify where the error was found.
+            :param flight_plan_record: The flight plan record the erroneous fields are moved from, it
+                   contains no erroneous fields afterwards
+            :param error_message_prefix: The text inserted before each error message, e.g. 'F22 - '
+            :return: None"""
+        for error_record in flight_plan_record.erroneous_fields:
+            error_record.set_error_message(error_message_prefix + error_record.get_error_message())
+        self.erroneous_fields.extend(flight_plan_record.erroneous_fields)
+        flight_plan_record.erroneous_fields = []
+
     def set_derived_flight_rules(self, derived_flight_rules):
         # type: (FlightRules) -> None
         """Set the flight rules from F15 parsing; this is not the rules from F8, this is the rules
@@ -589,13 +906,30 @@ class FlightPlanRecord:
             :return: None"""
         self.f22_flight_plan = f22_flight_plan
 
+    def set_field_error_range(self, field_id, first_error, last_error):
+        # type: (FieldIdentifiers, int, int) -> None
+        """Sets the range of ErrorRecord's in the list of erroneous fields that were reported by the
+        parser for a given field.
+
+            :param field_id: ICAO field identifier as defined in the EnumerationConstants.FieldIdentifiers class
+            :param first_error: The index of the first ErrorRecord reported for the field
+            :param last_error: The index one past the last ErrorRecord reported for the field
+            :return: None"""
+        self.field_error_ranges[field_id] = (first_error, last_error)
+
     def set_message_body(self, message_body):
         # type: (str) -> None
         """Stores the message body as received in the message being parsed,
-        the message body is defined ICAO DOC 4444 and the OLDI 4.2 specification
+        the message body is defined ICAO DOC 4444 and the OLDI 4.2 specification. With offset
+        storage enabled, only the start index of the body is stored if the body is the end of
+        the complete message.
             :param message_body: The ICAO message body
             :return: None"""
-        self.message_body = message_body
+        if self.offset_storage and self.message_complete.endswith(message_body):
+            self.message_body = None
+            self.body_start_index = len(self.message_complete) - len(message_body)
+        else:
+            self.message_body = message_body
 
     def set_message_complete(self, message_complete):
         # type: (str) -> None
@@ -604,14 +938,28 @@ class FlightPlanRecord:
             :param message_complete: The ICAO message being stored
             :return: None"""
         self.message_complete = message_complete
+        if self.offset_storage:
+            self.offset_message = message_complete
+
+    def set_message_bytes(self, message_bytes):
+        # type: (bytes | None) -> None
+        """Stores the message as received when a message is parsed from bytes.
+            :param message_bytes: The message as received
+            :return: None"""
+        self.message_bytes = message_bytes
 
     def set_message_header(self, message_header):
         # type: (str) -> None
         """Stores the message header (if present) as received in the message being parsed,
-        the message header is defined ICAO Annex 10, Vol II
+        the message header is defined ICAO Annex 10, Vol II. With offset storage enabled, only
+        the length of the header is stored if the header is the start of the complete message.
             :param message_header: The ICAO message header
             :return: None"""
-        self.message_header = message_header
+        if self.offset_storage and self.message_complete.startswith(message_header):
+            self.message_header = None
+            self.header_length = len(message_header)
+        else:
+            self.message_header = message_header
 
     def set_message_title(self, message_title):
         # type: (MessageTitles) -> None
@@ -631,6 +979,29 @@ class FlightPlanRecord:
             :return: None"""
         self.message_type = message_type
 
+    def set_offset_message(self, offset_message):
+        # type: (str | None) -> None
+        """Sets the message that fields, subfields and errors are stored as offsets into; this is
+        used for an F22 flight plan record that is indexed into the message of its parent flight plan.
+
+            :param offset_message: The message the fields are indexed into, None disables offset storage
+            :return: None"""
+        self.offset_storage = offset_message is not None
+        self.offset_message = offset_message
+
+    def set_offset_storage(self, offset_storage):
+        # type: (bool) -> None
+        """Enables or disables offset storage. When enabled, the message header, body and the text of
+        all fields, subfields and errors are not copied; records keep their start and end index plus a
+        reference to the original message and the text is sliced from the message when accessed. Texts
+        that are not identical to the message text between their start and end index are still stored.
+        This must be set before the message is parsed into this flight plan record.
+
+            :param offset_storage: True to store records as offsets into the message, False to store copies
+            :return: None"""
+        self.offset_storage = offset_storage
+        self.offset_message = self.message_complete if offset_storage else None
+
     def set_receiver_adjacent_unit_name(self, receiver_adjacent_unit_name):
         # type: (AdjacentUnits) -> None
         """Sets the receiver adjacent unit name as extracted from ICAO field 3b; stored
@@ -8,6 +8,9 @@ from IcaoMessageParser.Utils import Utils
 
 class ParseF14(ParseFieldsCommon):
 
+    FIELD_GRAMMAR: str = "<F14a>~<F14ab>~<F14b><F14c>[<F14d>[<F14e>]]"
+    """The layout of a well-formed field 14, (see ParseFieldsCommon.compile_field_grammar())"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 14.
@@ -28,6 +31,10 @@ class ParseF14(ParseFieldsCommon):
     def parse_field(self):
         # type: () -> None
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
@@ -1,15 +1,17 @@
-import F15_Parser
 from Configuration.EnumerationConstants import FieldIdentifiers, ErrorId
 from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
 from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
 from Configuration.SubFieldsInFields import SubFieldsInFields
 from Configuration.SubFieldDescriptions import SubFieldDescriptions
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
-from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15ParseIterative import ParseF15Iterative
 
 
 class ParseF15x(ParseFieldsCommon):
 
+    MEMOISABLE: bool = False
+    """Field 15 also adds the extracted route to the flight plan record"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 15.
@@ -37,7 +39,8 @@ class ParseF15x(ParseFieldsCommon):
         ers = ExtractedRouteSequence()
 
         # Create a field 15 parser
-        f15parser = F15_Parser.F15Parse.ParseF15()
+        f15parser = ParseF15Iterative(
+            self.get_navigation_database(), self.get_geodesy_batch(), self.get_geodesy_backend())
 
         # Parse field 15
         f15parser.parse_f15(ers, self.get_tokens())
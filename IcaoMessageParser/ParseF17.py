@@ -8,6 +8,9 @@ from IcaoMessageParser.Utils import Utils
 
 class ParseF17(ParseFieldsCommon):
 
+    FIELD_GRAMMAR: str = "<F17a>~<F17b>[ <F17c>...]"
+    """The layout of a well-formed field 17, (see ParseFieldsCommon.compile_field_grammar())"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 17.
@@ -28,6 +31,10 @@ class ParseF17(ParseFieldsCommon):
     def parse_field(self):
         # type: () -> None
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
@@ -15,6 +15,9 @@ class ParseF20(ParseFieldsCommon):
     - Configuration data defining the subfields that a field comprises,
       see configuration data in the SubFieldDescriptions class"""
 
+    FIELD_GRAMMAR: str = "<F20a> <F20b> <F20c> <F20d> <F20e> <F20f> <F20g> <F20h>"
+    """The layout of a well-formed field 20, (see ParseFieldsCommon.compile_field_grammar())"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 20.
@@ -37,6 +40,10 @@ class ParseF20(ParseFieldsCommon):
         configuration data and to tokenize the field.
             :return: None"""
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
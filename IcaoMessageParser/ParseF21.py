@@ -15,6 +15,9 @@ class ParseF21(ParseFieldsCommon):
     - Configuration data defining the subfields that a field comprises,
       see configuration data in the SubFieldDescriptions class"""
 
+    FIELD_GRAMMAR: str = "<F21a> <F21b> <F21c> <F21d> <F21e> <F21f>"
+    """The layout of a well-formed field 21, (see ParseFieldsCommon.compile_field_grammar())"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 21.
@@ -37,6 +40,10 @@ class ParseF21(ParseFieldsCommon):
         configuration data and to tokenize the field.
             :return: None"""
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
@@ -16,7 +16,8 @@ from IcaoMessageParser.ParseF20 import ParseF20
 from IcaoMessageParser.ParseF21 import ParseF21
 from IcaoMessageParser.ParseF80 import ParseF80
 from IcaoMessageParser.ParseF81 import ParseF81
-from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
+from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon, FieldParseContext
+from IcaoMessageParser.ParsePlan import FieldParsePlan
 from Configuration.SubFieldsInFields import SubFieldsInFields
 from Configuration.SubFieldDescriptions import SubFieldDescriptions
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
@@ -33,6 +34,37 @@ class ParseF22(ParseFieldsCommon):
     - Configuration data defining the subfields that a field comprises,
       see configuration data in the SubFieldDescriptions class"""
 
+    SUBFIELD_PARSERS: {SubFieldIdentifiers: (FieldIdentifiers, type | None)} = {
+        SubFieldIdentifiers.F22_f3: (FieldIdentifiers.F3, ParseF3),
+        SubFieldIdentifiers.F22_f5: (FieldIdentifiers.F5, ParseF5),
+        SubFieldIdentifiers.F22_f7: (FieldIdentifiers.F7, ParseF7),
+        SubFieldIdentifiers.F22_f8: (FieldIdentifiers.F8, ParseF8),
+        SubFieldIdentifiers.F22_f9: (FieldIdentifiers.F9, ParseF9),
+        SubFieldIdentifiers.F22_f10: (FieldIdentifiers.F10, ParseF10),
+        SubFieldIdentifiers.F22_f13: (FieldIdentifiers.F13, ParseF13),
+        SubFieldIdentifiers.F22_f14: (FieldIdentifiers.F14, ParseF14),
+        SubFieldIdentifiers.F22_f15: (FieldIdentifiers.F15, ParseF15x),
+        SubFieldIdentifiers.F22_f16: (FieldIdentifiers.F16, ParseF16),
+        SubFieldIdentifiers.F22_f17: (FieldIdentifiers.F17, ParseF17),
+        SubFieldIdentifiers.F22_f18: (FieldIdentifiers.F18, ParseF18),
+        SubFieldIdentifiers.F22_f19: (FieldIdentifiers.F19, ParseF19),
+        SubFieldIdentifiers.F22_f20: (FieldIdentifiers.F20, ParseF20),
+        SubFieldIdentifiers.F22_f21: (FieldIdentifiers.F21, ParseF21),
+        SubFieldIdentifiers.F22_f22: (FieldIdentifiers.F22, None),
+        SubFieldIdentifiers.F22_f80: (FieldIdentifiers.F80, ParseF80),
+        SubFieldIdentifiers.F22_f81: (FieldIdentifiers.F81, ParseF81)}
+    """The field identifier and field parser class parsing each F22 subfield, None for this class"""
+
+    COMPILED_SUBFIELD_PARSERS: {type: {SubFieldIdentifiers: FieldParsePlan}} = {}
+    """The field parse plans of the F22 subfields keyed on the field 22 parser class, each a table
+    keyed on the F22 subfield identifier, shared by all field 22 parsers"""
+
+    MEMOISABLE: bool = False
+    """Field 22 also sets the field 22 flight plan record of the flight plan record"""
+
+    sfif: SubFieldsInFields = None
+    """Configuration data defining the subfields in a field, used to compile the F22 subfield parsers"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 22.
@@ -46,6 +78,22 @@ class ParseF22(ParseFieldsCommon):
                          "-\n\t\r",  # Whitespace to tokenize the field
                          sfif.get_field_content_description(FieldIdentifiers.F22),  # Subfields in this field
                          sfif.get_field_errors(FieldIdentifiers.F22))  # Errors associated with this field
+        self.sfif = sfif
+
+    def get_subfield_parsers(self):
+        # type: () -> {SubFieldIdentifiers: FieldParsePlan}
+        """This method returns the field parse plans parsing the F22 subfields, compiling them the first
+        time they are needed by any instance of this field parser class. The plans share the configuration
+        data of the field parsers so no configuration data is read when parsing the F22 subfields.
+            :return: A dictionary of field parse plans keyed on the F22 subfield identifier"""
+        subfield_parsers = self.COMPILED_SUBFIELD_PARSERS.get(type(self))
+        if subfield_parsers is None:
+            subfield_parsers = {}
+            for subfield_id, (field_identifier, field_parser) in self.SUBFIELD_PARSERS.items():
+                subfield_parsers[subfield_id] = FieldParsePlan(
+                    field_identifier, type(self) if field_parser is None else field_parser, self.sfif, self.sfd)
+            self.COMPILED_SUBFIELD_PARSERS[type(self)] = subfield_parsers
+        return subfield_parsers
 
     def parse_field(self):
         # type: () -> None
@@ -63,8 +111,7 @@ class ParseF22(ParseFieldsCommon):
             return
 
         # Get the start index for F22 in the message as a whole
-        start_offset_index = self.get_flight_plan_record().get_icao_field(
-            self.get_field_identifier()).get_start_index()
+        start_offset_index = self.get_field_start_index()
 
         data_found = False
         for token in self.get_tokens().get_tokens():
@@ -135,8 +182,9 @@ class ParseF22(ParseFieldsCommon):
                 * Parse the subfield as is done fo any flight plan field;
             - The 'new' flight plan now contains all the F22 subfields as fields with their respective
               subfields along with any errors;
-            - Check if there are any errors, if there are, copy them from the new flight plan
+            - Check if there are any errors, if there are, move them from the new flight plan
               into the flight plan record this field parser is working on;
+        The F22 subfields are parsed by the field parse plans of the fields, (see get_subfield_parsers()).
         When looping over the F22 subfields, the F22 subfield enumeration values are used as the loop range;
         this ensures when looping over the F22 subfields that only F22 subfields are 'addressed' and reduces
         the processing time by limiting the number of enumerations to the F22 subset;
@@ -146,26 +194,6 @@ class ParseF22(ParseFieldsCommon):
             :param start_offset_index: The start index of F22 in the message as a whole
             :return: None
         """
-        # Set up a dictionary of field parser callbacks...
-        parse_field_x = {SubFieldIdentifiers.F22_f3: [FieldIdentifiers.F3, ParseF3],
-                         SubFieldIdentifiers.F22_f5: [FieldIdentifiers.F5, ParseF5],
-                         SubFieldIdentifiers.F22_f7: [FieldIdentifiers.F7, ParseF7],
-                         SubFieldIdentifiers.F22_f8: [FieldIdentifiers.F8, ParseF8],
-                         SubFieldIdentifiers.F22_f9: [FieldIdentifiers.F9, ParseF9],
-                         SubFieldIdentifiers.F22_f10: [FieldIdentifiers.F10, ParseF10],
-                         SubFieldIdentifiers.F22_f13: [FieldIdentifiers.F13, ParseF13],
-                         SubFieldIdentifiers.F22_f14: [FieldIdentifiers.F14, ParseF14],
-                         SubFieldIdentifiers.F22_f15: [FieldIdentifiers.F15, ParseF15x],
-                         SubFieldIdentifiers.F22_f16: [FieldIdentifiers.F16, ParseF16],
-                         SubFieldIdentifiers.F22_f17: [FieldIdentifiers.F17, ParseF17],
-                         SubFieldIdentifiers.F22_f18: [FieldIdentifiers.F18, ParseF18],
-                         SubFieldIdentifiers.F22_f19: [FieldIdentifiers.F19, ParseF19],
-                         SubFieldIdentifiers.F22_f20: [FieldIdentifiers.F20, ParseF20],
-                         SubFieldIdentifiers.F22_f21: [FieldIdentifiers.F21, ParseF21],
-                         SubFieldIdentifiers.F22_f22: [FieldIdentifiers.F22, ParseF22],
-                         SubFieldIdentifiers.F22_f80: [FieldIdentifiers.F80, ParseF80],
-                         SubFieldIdentifiers.F22_f81: [FieldIdentifiers.F81, ParseF81]}
-
         # Get the field 22 FieldRecord that contains zero or more F22 subfields
         field_record = self.get_flight_plan_record().get_icao_field(self.get_field_identifier())
 
@@ -176,10 +204,15 @@ class ParseF22(ParseFieldsCommon):
         # a new one, it will be populated by all the fields found in the field 22 being parsed.
         new_fpr = FlightPlanRecord()
 
+        # The F22 fields are indexed into the same message as this flight plan, share
+        # the message if this flight plan stores its fields as offsets
+        new_fpr.set_offset_message(self.get_flight_plan_record().get_offset_message())
+
         # Add the new flight plan to the flight plan instance in this class;
         self.get_flight_plan_record().set_f22_flight_plan(new_fpr)
 
         # Loop over the dictionary of subfields and parse each individual subfield
+        subfield_parsers = self.get_subfield_parsers()
         for subfield_key, subfield_list in subfield_dictionary.items():
             # Make sure subfield identifiers are valid F22 subfield enumeration values
             if subfield_start <= subfield_key <= subfield_end:
@@ -193,25 +226,21 @@ class ParseF22(ParseFieldsCommon):
                                    ErrorId.F22_FIELD_DUPLICATED)
 
                 # Loop over the list of subfields and parse the field;
+                field_plan = subfield_parsers[subfield_key]
                 for subfield in subfield_list:
                     new_fpr.add_icao_field(
-                        parse_field_x[subfield_key][0],
+                        field_plan.get_field_identifier(),
                         subfield.get_field_text(),
                         subfield.get_start_index(),
                         subfield.get_end_index())
-                    pfx = parse_field_x[subfield_key][1](new_fpr, SubFieldsInFields(), self.sfd)
-                    pfx.parse_field()
+                    field_plan.parse(FieldParseContext(
+                        new_fpr, subfield.get_field_text(), subfield.get_start_index(),
+                        self.get_navigation_database(), self.get_geodesy_batch(), self.get_geodesy_backend()))
 
         # Check if the new flight plan contains any errors
         if new_fpr.errors_detected():
-            # Errors were detected, copy them into the flight plan record of this
-            # instance
-            for error_records in new_fpr.get_erroneous_fields():
-                self.get_flight_plan_record().add_erroneous_field(
-                    error_records.get_field_text(),
-                    "F22 - " + error_records.get_error_message(),
-                    error_records.get_start_index(),
-                    error_records.get_end_index())
+            # Errors were detected, move them into the flight plan record of this instance
+            self.get_flight_plan_record().move_erroneous_fields(new_fpr, "F22 - ")
 
         # Check if the extracted route in the new flight plan contains amy errors
         if new_fpr.get_extracted_route() is not None:
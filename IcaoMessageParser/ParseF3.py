@@ -13,6 +13,12 @@ class ParseF3(ParseFieldsCommon):
     an index into identifying the field content for a given message
     title, type and unit combination."""
 
+    FIELD_GRAMMAR: str = "<F3a>[<F3b1>~<F3b2>~<F3b3><F3b4>[<F3c1>~<F3c2>~<F3c3><F3c4>]]"
+    """The layout of a well-formed field 3, (see ParseFieldsCommon.compile_field_grammar())"""
+
+    MEMOISABLE: bool = False
+    """Field 3 also sets the message title and adjacent units of the flight plan record"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 3.
@@ -31,6 +37,19 @@ class ParseF3(ParseFieldsCommon):
     def parse_field(self):
         # type: () -> None
 
+        # Parse a well-formed field with a single match
+        match = self.match_field_grammar()
+        if match is not None:
+            self.save_field_grammar(match)
+            self.get_flight_plan_record().set_message_title(MessageTitles.get_message_title(match.group("F3a")))
+            if match.group("F3b1") is not None:
+                # Save the adjacent unit sender and receiver
+                self.get_flight_plan_record().set_sender_adjacent_unit_name(
+                    AdjacentUnits.get_adjacent_unit(match.group("F3b1")))
+                self.get_flight_plan_record().set_receiver_adjacent_unit_name(
+                    AdjacentUnits.get_adjacent_unit(match.group("F3b3")))
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
@@ -7,6 +7,9 @@ from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
 
 class ParseF80(ParseFieldsCommon):
 
+    FIELD_GRAMMAR: str = "<F80a>"
+    """The layout of a well-formed field 80, (see ParseFieldsCommon.compile_field_grammar())"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 80.
@@ -27,6 +30,10 @@ class ParseF80(ParseFieldsCommon):
     def parse_field(self):
         # type: () -> None
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
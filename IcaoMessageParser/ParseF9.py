@@ -1,4 +1,4 @@
-from Configuration.EnumerationConstants import FieldIdentifiers
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
 from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
 from Configuration.SubFieldsInFields import SubFieldsInFields
 from Configuration.SubFieldDescriptions import SubFieldDescriptions
@@ -9,6 +9,12 @@ from Tokenizer.Token import Token
 
 class ParseF9(ParseFieldsCommon):
 
+    FIELD_GRAMMAR: str = "[<F9a>~]<F9b>~<F9bc>~<F9c>"
+    """The layout of a well-formed field 9, (see ParseFieldsCommon.compile_field_grammar())"""
+
+    FIELD_GRAMMAR_DEFAULTS: {SubFieldIdentifiers: str} = {SubFieldIdentifiers.F9a: "00"}
+    """The number of aircraft saved when F9a is absent from a well-formed field"""
+
     def __init__(self, flight_plan_record, sfif, sfd):
         # type: (FlightPlanRecord, SubFieldsInFields, SubFieldDescriptions) -> None
         """Constructor to set up the field parser for ICAO field 9.
@@ -29,6 +35,10 @@ class ParseF9(ParseFieldsCommon):
     def parse_field(self):
         # type: () -> None
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
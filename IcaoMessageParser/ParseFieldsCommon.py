@@ -1,6 +1,8 @@
 import re
+import threading
 
 from Configuration.ErrorMessages import ErrorMessages
+from IcaoMessageParser.SubFieldValidators import SubFieldValidator
 from IcaoMessageParser.Utils import Utils
 from Tokenizer.Token import Token
 from Tokenizer.Tokenize import Tokenize
@@ -8,6 +10,78 @@ from Tokenizer.Tokens import Tokens
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
 from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers, ErrorId
 from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from F15_Parser.NavigationDatabase import NavigationDatabase
+from Utilities.BatchGeodesy import GeodesyBatch
+from Utilities.GeodesyBackends import GeodesyBackend
+
+
+class FieldParseContext:
+    """This class is the state of parsing a single field, passed to the field parser shared by all messages
+    parsed in a process, (see ParseFieldsCommon.parse()). The context holds the flight plan record being
+    populated with the text of the field and its start index in the message, the tokens of the field are
+    added by the field parser when first needed. The optional navigation database, geodesy batch and
+    geodesy backend used by the field 15 parser are passed with the context.
+
+    A context is created for each field parsed and is only used by the thread parsing the field."""
+
+    flight_plan_record: FlightPlanRecord = None
+    """Flight plan record into which the extracted subfields and field will be written"""
+
+    field_text: str = ""
+    """The text of the field being parsed"""
+
+    start_index: int = 0
+    """The zero based start index of the field in the message"""
+
+    tokens: Tokens = None
+    """Tokens extracted from the field being parsed, tokenized when first needed"""
+
+    navigation_database: NavigationDatabase = None
+    """An optional navigation database used by the field 15 parser to resolve published route points
+    and aerodromes, None if not used"""
+
+    geodesy_batch: GeodesyBatch = None
+    """An optional batch the field 15 parser adds its bearing / distance calculations to, (deferred
+    geodesy mode), None to perform the calculations while parsing"""
+
+    geodesy_backend: GeodesyBackend = None
+    """An optional geodesy backend used by the field 15 parser for the bearing / distance calculations,
+    None to use the default ellipsoidal calculations"""
+
+    def __init__(self, flight_plan_record, field_text, start_index,
+                 navigation_database=None, geodesy_batch=None, geodesy_backend=None):
+        # type: (FlightPlanRecord, str, int, NavigationDatabase | None, GeodesyBatch | None, GeodesyBackend | None) -> None
+        """Constructor for the context of parsing a field.
+            :param flight_plan_record: The flight plan record containing the field and populated by the field parser
+            :param field_text: The text of the field
+            :param start_index: The zero based start index of the field in the message
+            :param navigation_database: A NavigationDatabase instance or None to not resolve positions
+            :param geodesy_batch: A GeodesyBatch instance or None to perform the calculations while parsing
+            :param geodesy_backend: A GeodesyBackend instance or None to use the default backend
+            :return: None"""
+        self.flight_plan_record = flight_plan_record
+        self.field_text = field_text
+        self.start_index = start_index
+        self.navigation_database = navigation_database
+        self.geodesy_batch = geodesy_batch
+        self.geodesy_backend = geodesy_backend
+
+    @staticmethod
+    def for_field(flight_plan_record, field_identifier,
+                  navigation_database=None, geodesy_batch=None, geodesy_backend=None):
+        # type: (FlightPlanRecord, FieldIdentifiers, NavigationDatabase | None, GeodesyBatch | None, GeodesyBackend | None) -> FieldParseContext
+        """Creates the context of parsing a field that has been added to a flight plan record.
+            :param flight_plan_record: The flight plan record containing the field
+            :param field_identifier: The field identifier of the field
+            :param navigation_database: A NavigationDatabase instance or None to not resolve positions
+            :param geodesy_batch: A GeodesyBatch instance or None to perform the calculations while parsing
+            :param geodesy_backend: A GeodesyBackend instance or None to use the default backend
+            :return: The context of parsing the field"""
+        field_record = flight_plan_record.get_icao_field(field_identifier)
+        if field_record is None:
+            return FieldParseContext(flight_plan_record, "", 0, navigation_database, geodesy_batch, geodesy_backend)
+        return FieldParseContext(flight_plan_record, field_record.get_field_text(), field_record.get_start_index(),
+                                 navigation_database, geodesy_batch, geodesy_backend)
 
 
 class ParseFieldsCommon:
@@ -29,6 +103,12 @@ class ParseFieldsCommon:
       All subfields are stored in the flight plan record.
       Program entry point for the compound field parser is self.parse_compound_field_common() in this class.
 
+    A field parser holds the configuration data of its field only and is shared by all messages parsed in
+    a process, (see ParsePlan.FieldParsePlan); the state of parsing a field is passed to parse() as a
+    FieldParseContext that is visible to the thread parsing the field only, so a field parser can be used
+    from several threads at the same time. A field parser constructed with a flight plan record parses
+    the field of that flight plan record with parse_field().
+
     This parser copies all the fields into the Flight Plan Record (FPR), an instance of the FlightPlanRecord class.
     This is done by adding instances of the 'FieldRecord' class for each field parsed. The 'FieldRecord' class
     stores one or more individual subfields (instances of SubFiledRecord) that a field is comprised off. For
@@ -37,11 +117,44 @@ class ParseFieldsCommon:
     for each field.
     """
 
-    tokens: Tokens = None
-    """Tokens extracted from the ICAO field being parsed"""
+    FIELD_GRAMMAR: str | None = None
+    """The layout of a well-formed field used to compile a single regular expression validating and
+    splitting the whole field, (see compile_field_grammar()); None if the field is only parsed subfield
+    by subfield"""
 
-    flight_plan_record: FlightPlanRecord = None
-    """Flight plan record into which the extracted subfields and field will be written"""
+    FIELD_GRAMMAR_DEFAULTS: {SubFieldIdentifiers: str} = {}
+    """The text saved for a subfield that is absent from a well-formed field, keyed on the subfield
+    identifier; these subfields are saved at the start of the field the same as the subfield by subfield
+    parser does"""
+
+    MEMOISABLE: bool = True
+    """True if this field parser has no effect on the flight plan record other than adding the subfields
+    of the field and errors, so the field can be rebuilt from a memo of previously parsed fields with the
+    same text, (see FieldMemo)"""
+
+    COMPILED_FIELD_GRAMMARS: {type: re.Pattern | None} = {}
+    """The compiled field grammars keyed on the field parser class, shared by all field parsers"""
+
+    COMPILED_FIELD_GRAMMAR_GROUPS: {type: ((SubFieldIdentifiers, int | None),)} = {}
+    """The group number of each subfield in the compiled field grammar keyed on the field parser class,
+    in the same order as the subfields in the field, None for a subfield not in the field grammar"""
+
+    COMPILED_SUBFIELD_PATTERNS: {SubFieldIdentifiers: re.Pattern} = {}
+    """The compiled subfield syntax keyed on the subfield identifier, shared by all field parsers"""
+
+    COMPILED_SUBFIELD_VALIDATORS: {type: {SubFieldIdentifiers: SubFieldValidator}} = {}
+    """The validators of the compound field subfields keyed on the field parser class, each a
+    table keyed on the subfield identifier, shared by all field parsers"""
+
+    whitespace: str = None
+    """The whitespace characters used to tokenize the field being parsed"""
+
+    context: FieldParseContext = None
+    """The context of parsing the field of the flight plan record this field parser was constructed with,
+    None for a field parser shared by all messages"""
+
+    local: threading.local = None
+    """The context of the field being parsed by each thread using this field parser, (see parse())"""
 
     sub_field_list: [SubFieldIdentifiers] = None
     """List of subfields in the ICAO field being parsed"""
@@ -64,8 +177,9 @@ class ParseFieldsCommon:
         """This constructor sets up an instance of a field parser with all data needed to parse a given field.
         This base class tokenizes a field and stores its field identifier, the subfields that the field
         comprises and a list of errors associated with each subfield should an error be detected.
-            :param flight_plan_record: An instance of FlightPlanRecord that this parser write its date to,
-                   this includes the fields and subfields parsed along with any associated errors.
+            :param flight_plan_record: An instance of FlightPlanRecord containing the field that this parser
+                   writes its data to, this includes the fields and subfields parsed along with any associated
+                   errors; None for a field parser shared by all messages, (see parse()).
             :param sfd: Configuration data that describes individual subfields that includes the regular expression
                    used to parse individual subfields.
             :param field_identifier: An enumeration value from the FieldIdentifiers class that identifies the
@@ -79,18 +193,15 @@ class ParseFieldsCommon:
                    message for each subfield as well as some generic messages relating to none-syntactical
                    errors such as field / subfields missing etc.
             :return: None"""
-        # Save the field to the FPR
-        self.flight_plan_record = flight_plan_record
         self.sfd = sfd
         self.field_identifier = field_identifier
         self.sub_field_list = sub_field_list
         self.error_list = error_list
-        tokenize = Tokenize()
-        tokenize.set_string_to_tokenize(self.flight_plan_record.get_icao_field(self.field_identifier).get_field_text())
-        tokenize.set_whitespace(whitespace)
-        tokenize.tokenize()
-        self.tokens = tokenize.get_tokens()
+        self.whitespace = whitespace
         self.error_messages = ErrorMessages()
+        self.local = threading.local()
+        if flight_plan_record is not None:
+            self.set_flight_plan_record(flight_plan_record)
 
     def add_error(self, erroneous_field_text, start_index, end_index, error_id):
         # type: (str, int, int, ErrorId) -> None
@@ -101,12 +212,11 @@ class ParseFieldsCommon:
             :param end_index: The end index of the erroneous fields location in the original field string
             :param error_id: The error number given as an enumeration value from the ErrorID class
             :return: None"""
-        Utils.add_error(self.flight_plan_record,
+        context = self.get_context()
+        Utils.add_error(context.flight_plan_record,
                         erroneous_field_text,
-                        start_index + self.get_flight_plan_record().get_icao_field(
-                            self.get_field_identifier()).get_start_index(),
-                        end_index + self.get_flight_plan_record().get_icao_field(
-                            self.get_field_identifier()).get_start_index(),
+                        start_index + context.start_index,
+                        end_index + context.start_index,
                         self.error_messages,
                         error_id)
 
@@ -151,6 +261,63 @@ class ParseFieldsCommon:
                            concatenated[2],
                            self.get_too_many_subfields_error())
 
+    def compile_field_grammar(self):
+        # type: () -> re.Pattern | None
+        """This method compiles the field grammar of this field, (FIELD_GRAMMAR), into a single anchored
+        regular expression with a named group for each subfield, the groups are named after the
+        SubFieldIdentifiers enumeration names and use the subfield syntax from the SubFieldDescriptions
+        configuration data. The field grammar is written as:
+
+        - <F13a>   A subfield given as its SubFieldIdentifiers name, the subfield must be a single token;
+        - <F5c>... A subfield followed by any number of extra tokens conforming to the syntax of the
+                   subfield, (see parse_extra_optional_tokens());
+        - ~        Optional whitespace, the subfields either side are either separate tokens or are
+                   joined in one token that this field parser splits;
+        - ' '      Whitespace, the subfields either side are separate tokens;
+        - [...]    Optional subfields, either all or none of them are present.
+
+        A field matching the expression is parsed without errors with the subfields being the named groups,
+        the expression is conservative and a field not matching it is parsed subfield by subfield.
+            :return: The compiled regular expression or None if this field has no field grammar or
+                     a subfield syntax cannot be restricted to a single token"""
+        if self.FIELD_GRAMMAR is None:
+            return None
+        separators = "[" + re.escape(self.whitespace.replace("/", "")) + "]"
+        token_separators = "[" + re.escape(self.whitespace) + "]"
+        pattern = ""
+        for item in re.finditer(r"<(\w+)>(\.\.\.)?|.", self.FIELD_GRAMMAR):
+            match item.group(0):
+                case "~":
+                    pattern += separators + "*"
+                case " ":
+                    pattern += separators + "+"
+                case "[":
+                    pattern += "(?:"
+                case "]":
+                    # Lazy, so an absent optional subfield does not match an empty string
+                    pattern += ")??"
+                case _:
+                    subfield_id = SubFieldIdentifiers[item.group(1)]
+                    syntax = self.get_token_syntax(subfield_id)
+                    if syntax is None:
+                        return None
+                    pattern += "(?P<" + subfield_id.name + ">" + syntax + ")"
+                    if item.group(2) is not None:
+                        # Extra tokens have to follow whitespace or a '/' token
+                        extra = "(?<=" + token_separators + ")" + syntax
+                        if "/" in self.whitespace and self.is_subfield_syntax(subfield_id, "/"):
+                            extra = "(?:/|" + extra + ")"
+                        pattern += "(?:" + separators + "*" + extra + ")*"
+        return re.compile(r"\A" + separators + "*" + pattern + separators + r"*\Z")
+
+    def compile_subfield_validators(self):
+        # type: () -> {SubFieldIdentifiers: SubFieldValidator}
+        """This method creates the validators of the subfields of a compound field, (see validate_subfields()).
+        Compound field parsers override this method, subfields without a validator are not validated
+        other than by the compound field parser.
+            :return: A dictionary of validators keyed on the subfield identifier"""
+        return {}
+
     def concatenate_token_text(self, first_extra_index, num_tokens):
         # type: (int, int) -> [str, int, int]
         """This method concatenates the text from several tokens/subfields; this is required
@@ -160,7 +327,6 @@ class ParseFieldsCommon:
             :param num_tokens: The last token index that is to be concatenated
             :return: A list containing the concatenated text of the subfields with their start and end index
                      of their location in the original field text"""
-        extra_string = ""
         start_index = self.get_tokens().get_token_at(first_extra_index).get_token_start_index()
         end_index = self.get_tokens().get_token_at(first_extra_index).get_token_end_index()
 
@@ -169,11 +335,21 @@ class ParseFieldsCommon:
             return [self.get_tokens().get_token_at(first_extra_index).get_token_string(),
                     start_index, end_index]
 
-        for extra_index in range(first_extra_index, num_tokens):
-            extra_string = extra_string + self.get_tokens().get_token_at(extra_index).get_token_string() + " "
-            end_index = self.get_tokens().get_token_at(extra_index).get_token_end_index()
+        extra_tokens = [self.get_tokens().get_token_at(extra_index)
+                        for extra_index in range(first_extra_index, num_tokens)]
+        extra_string = "".join([token.get_token_string() + " " for token in extra_tokens])
+        if len(extra_tokens) > 0:
+            end_index = extra_tokens[-1].get_token_end_index()
         return [extra_string.rstrip(" ").replace(" /", "/").replace("/ ", "/"), start_index, end_index]
 
+    def get_context(self):
+        # type: () -> FieldParseContext
+        """This method returns the context of the field being parsed, (see parse()).
+            :return: The context of the field being parsed by the current thread, or the context of the
+                     field of the flight plan record this field parser was constructed with"""
+        context = getattr(self.local, "context", None)
+        return self.context if context is None else context
+
     def get_error_list(self):
         # type: () -> [ErrorId]
         """This method returns a list of enumeration values from the ErrorId class; each list entry
@@ -203,7 +379,19 @@ class ParseFieldsCommon:
         """This method returns the flight plan record that is being used by this parser to
         write all parsed fields, subfields and associated error messages.
             :return: An instance of FlightPlanRecord that is the flight plan record used by this parser."""
-        return self.flight_plan_record
+        return self.get_context().flight_plan_record
+
+    def get_field_start_index(self):
+        # type: () -> int
+        """This method returns the start index of the field being parsed in the message.
+            :return: The zero based start index of the field"""
+        return self.get_context().start_index
+
+    def get_field_text(self):
+        # type: () -> str
+        """This method returns the text of the field being parsed.
+            :return: The field text"""
+        return self.get_context().field_text
 
     def get_last_subfield_error(self):
         # type: () -> ErrorId
@@ -229,6 +417,48 @@ class ParseFieldsCommon:
             :return: An enumeration value from the ErrorId class identifying a unique error message."""
         return self.get_error_message_at_idx(len(self.error_list) - 2)
 
+    def get_field_grammar(self):
+        # type: () -> re.Pattern | None
+        """This method returns the compiled field grammar of this field, compiling it the first time
+        it is needed by any instance of this field parser class.
+            :return: The compiled regular expression or None if the field has no field grammar"""
+        if type(self) not in self.COMPILED_FIELD_GRAMMARS:
+            self.COMPILED_FIELD_GRAMMARS[type(self)] = self.compile_field_grammar()
+        return self.COMPILED_FIELD_GRAMMARS[type(self)]
+
+    def get_field_grammar_groups(self):
+        # type: () -> ((SubFieldIdentifiers, int | None),)
+        """This method returns the group number of each subfield in the compiled field grammar, (see
+        save_field_grammar()), so a match is read by group number rather than by group name.
+            :return: A tuple of subfield identifier and group number pairs in the same order as the
+                     subfields in the field, the group number is None for a subfield not in the field grammar"""
+        groups = self.COMPILED_FIELD_GRAMMAR_GROUPS.get(type(self))
+        if groups is None:
+            group_index = self.get_field_grammar().groupindex
+            groups = tuple((subfield_id, group_index.get(subfield_id.name))
+                           for subfield_id in self.get_sub_field_list())
+            self.COMPILED_FIELD_GRAMMAR_GROUPS[type(self)] = groups
+        return groups
+
+    def get_geodesy_batch(self):
+        # type: () -> GeodesyBatch | None
+        """This method returns the batch the field 15 bearing / distance calculations are added to.
+            :return: A GeodesyBatch instance or None if the calculations are performed while parsing"""
+        return self.get_context().geodesy_batch
+
+    def get_geodesy_backend(self):
+        # type: () -> GeodesyBackend | None
+        """This method returns the geodesy backend used by the field 15 parser.
+            :return: A GeodesyBackend instance or None if the default backend is used"""
+        return self.get_context().geodesy_backend
+
+    def get_navigation_database(self):
+        # type: () -> NavigationDatabase | None
+        """This method returns the navigation database used to resolve the position of field 15
+        published route points and aerodromes.
+            :return: A NavigationDatabase instance or None if no navigation database is set"""
+        return self.get_context().navigation_database
+
     def get_sub_field_list(self):
         # type: () -> [SubFieldIdentifiers]
         """This method returns a list of enumeration values from the SubFieldIdentifiers class; each list
@@ -239,6 +469,17 @@ class ParseFieldsCommon:
                      for a field"""
         return self.sub_field_list
 
+    def get_subfield_validators(self):
+        # type: () -> {SubFieldIdentifiers: SubFieldValidator}
+        """This method returns the validators of the subfields of this compound field, creating them the
+        first time they are needed by any instance of this field parser class.
+            :return: A dictionary of validators keyed on the subfield identifier"""
+        validators = self.COMPILED_SUBFIELD_VALIDATORS.get(type(self))
+        if validators is None:
+            validators = self.compile_subfield_validators()
+            self.COMPILED_SUBFIELD_VALIDATORS[type(self)] = validators
+        return validators
+
     def get_token_at_idx(self, idx):
         # type(int) -> Token
         """This method returns a token/subfield from the list of tokens generated when this class
@@ -247,14 +488,52 @@ class ParseFieldsCommon:
             :param idx: The zero based index into the list of tokens to be retrieved.
             :return: A Token class instance representing a single subfield of a field or None
             if the index provided by the parameter idx is out of range."""
-        return self.tokens.get_token_at(idx)
+        return self.get_tokens().get_token_at(idx)
+
+    def get_subfield_pattern(self, subfield_id):
+        # type: (SubFieldIdentifiers) -> re.Pattern
+        """This method returns the compiled syntax of a subfield, compiling it the first time it is
+        needed by any field parser.
+            :param subfield_id: The subfield identifier as an enumeration value of the SubFieldIdentifiers class
+            :return: The compiled regular expression of the subfield syntax"""
+        pattern = self.COMPILED_SUBFIELD_PATTERNS.get(subfield_id)
+        if pattern is None:
+            pattern = re.compile(self.sfd.get_subfield_description(subfield_id).get_field_syntax())
+            self.COMPILED_SUBFIELD_PATTERNS[subfield_id] = pattern
+        return pattern
+
+    def get_token_syntax(self, subfield_id):
+        # type: (SubFieldIdentifiers) -> str | None
+        """This method returns the syntax of a subfield restricted to a single token of this field.
+        Free text subfields whose syntax is a character class including whitespace are restricted to
+        a non-empty sequence of the characters that are not whitespace.
+            :param subfield_id: The subfield identifier as an enumeration value of the SubFieldIdentifiers class
+            :return: A regular expression matching a single token or None if the subfield syntax
+                     cannot be restricted to a single token"""
+        syntax = self.sfd.get_subfield_description(subfield_id).get_field_syntax()
+        if not any(self.is_subfield_syntax(subfield_id, character)
+                   for character in self.whitespace if character != "/"):
+            return "(?:" + syntax + ")"
+        free_text = re.fullmatch(r"\[([^]]+)]\*", syntax)
+        if free_text is None:
+            return None
+        return "(?:(?![" + re.escape(self.whitespace) + "])[" + free_text.group(1) + "])+"
 
     def get_tokens(self):
         # type: () -> Tokens
         """This method return a list of token/subfields derived from the field being parsed; the token
         list includes the 'forward slash' ('/') as a token.
         :return: A list of Token instances"""
-        return self.tokens
+        context = self.get_context()
+        if context.tokens is None:
+            # Tokenize the field the first time the tokens are needed, a field matching
+            # the field grammar is never tokenized
+            tokenize = Tokenize()
+            tokenize.set_string_to_tokenize(context.field_text)
+            tokenize.set_whitespace(self.whitespace)
+            tokenize.tokenize()
+            context.tokens = tokenize.get_tokens()
+        return context.tokens
 
     def get_too_many_subfields_error(self):
         # type: () -> ErrorId
@@ -297,6 +576,74 @@ class ParseFieldsCommon:
                             return keyword
         return SubFieldIdentifiers.ANYTHING
 
+    def parse(self, context):
+        # type: (FieldParseContext) -> None
+        """This method parses a field with this field parser shared by all messages; the context is only
+        visible to the calling thread while the field is parsed, so several threads can parse fields with
+        the same field parser at the same time. A field parser may also be called again by the same thread
+        while parsing a field, e.g. a field 22 containing a field 22.
+            :param context: The context of the field to parse
+            :return: None"""
+        previous_context = getattr(self.local, "context", None)
+        self.local.context = context
+        try:
+            self.parse_field()
+        finally:
+            self.local.context = previous_context
+
+    def set_flight_plan_record(self, flight_plan_record):
+        # type: (FlightPlanRecord) -> None
+        """This method sets the flight plan record containing the field this parser parses with
+        parse_field() and writes the parsed field to; the field must have been added to the flight
+        plan record.
+            :param flight_plan_record: An instance of FlightPlanRecord
+            :return: None"""
+        self.context = FieldParseContext.for_field(flight_plan_record, self.field_identifier)
+
+    def set_geodesy_batch(self, geodesy_batch):
+        # type: (GeodesyBatch | None) -> None
+        """This method sets the batch the field 15 bearing / distance calculations are added to.
+            :param geodesy_batch: A GeodesyBatch instance or None to perform the calculations while parsing
+            :return: None"""
+        self.get_context().geodesy_batch = geodesy_batch
+
+    def set_geodesy_backend(self, geodesy_backend):
+        # type: (GeodesyBackend | None) -> None
+        """This method sets the geodesy backend used by the field 15 parser.
+            :param geodesy_backend: A GeodesyBackend instance or None to use the default backend
+            :return: None"""
+        self.get_context().geodesy_backend = geodesy_backend
+
+    def set_navigation_database(self, navigation_database):
+        # type: (NavigationDatabase | None) -> None
+        """This method sets the navigation database used to resolve the position of field 15
+        published route points and aerodromes.
+            :param navigation_database: A NavigationDatabase instance or None to not resolve positions
+            :return: None"""
+        self.get_context().navigation_database = navigation_database
+
+    def is_subfield_syntax(self, subfield_id, text):
+        # type: (SubFieldIdentifiers, str) -> bool
+        """This method checks if a text conforms to the syntax of a subfield.
+            :param subfield_id: The subfield identifier as an enumeration value of the SubFieldIdentifiers class
+            :param text: The text to check
+            :return: True if the text conforms to the subfield syntax, False otherwise"""
+        return self.get_subfield_pattern(subfield_id).fullmatch(text) is not None
+
+    def match_field_grammar(self):
+        # type: () -> re.Match | None
+        """This method matches the field text against the field grammar, (see compile_field_grammar()).
+            :return: The match if the field is well-formed, None if the field has to be parsed subfield
+                     by subfield"""
+        field_grammar = self.get_field_grammar()
+        if field_grammar is None:
+            return None
+        match = field_grammar.match(self.get_field_text())
+        if match is None or "" in match.groupdict().values():
+            # Subfields have to be non-empty tokens
+            return None
+        return match
+
     def no_tokens(self):
         # type: () -> bool
         """This method returns True if the list of tokens is zero, i.e. there are no tokens to parse.
@@ -327,7 +674,7 @@ class ParseFieldsCommon:
         subfield_id = None
 
         # Get the compound field string, this includes all subfields and is the text as it appears in a message
-        fxx_field_text = self.get_flight_plan_record().get_icao_field(self.get_field_identifier()).get_field_text()
+        fxx_field_text = self.get_field_text()
 
         # Looping over a compound field is implemented as a simple state machine that has the following states.
         in_known_field = False  # Processing a known keyword '/' sequence
@@ -464,10 +811,10 @@ class ParseFieldsCommon:
             :return: None"""
         subfield_id = self.get_sub_field_list()[len(self.get_sub_field_list()) - 1]
         # Get the regular expression for the last subfield definition
-        regexp = self.sfd.get_subfield_description(subfield_id).get_field_syntax()
+        regexp = self.get_subfield_pattern(subfield_id)
         for idx in range(len(self.sub_field_list), self.get_tokens().get_number_of_tokens()):
             token_to_parse = self.get_tokens().get_token_at(idx)
-            if re.fullmatch(regexp, token_to_parse.get_token_string()) is None:
+            if regexp.fullmatch(token_to_parse.get_token_string()) is None:
                 # Report an error
                 self.add_error(token_to_parse.get_token_string(),
                                token_to_parse.get_token_start_index(),
@@ -484,6 +831,10 @@ class ParseFieldsCommon:
         any extra fields present.
             :return: None"""
 
+        # Parse a well-formed field with a single match
+        if self.parse_field_grammar():
+            return
+
         # Check if the field contains anything at all...
         if self.no_tokens():
             self.add_error("", 0, 0, self.get_missing_subfield_error())
@@ -503,6 +854,18 @@ class ParseFieldsCommon:
         # Parse any extra tokens that may be present
         self.check_if_tokens_left_over()
 
+    def parse_field_grammar(self):
+        # type: () -> bool
+        """This method parses a well-formed field with a single match of the field grammar, saving
+        the subfields to the flight plan record, (see compile_field_grammar()).
+            :return: True if the field is well-formed and has been saved, False if the field has to be
+                     parsed subfield by subfield"""
+        match = self.match_field_grammar()
+        if match is None:
+            return False
+        self.save_field_grammar(match)
+        return True
+
     def parse_field_base(self):
         # type: () -> int
         """This method loops over the subfields tokenized from a field and parses each subfield.
@@ -513,10 +876,10 @@ class ParseFieldsCommon:
         - The field identifier for this field, self.field_identifier: FieldIdentifiers
         - List of subfields describing this fields content, self.sub_field_list: [SubFieldIdentifiers]
         - List of error messages associated with each subfield, self.error_list: [ErrorId]
-        - List of subfields to parse, self.tokens: Tokens
+        - List of subfields to parse, self.get_tokens(): Tokens
 
-        Errors and successfully parsed fields and subfields are written to the flight plan record also stored in
-        this class when instantiated (self.flight_plan_record: FlightPlanRecord)
+        Errors and successfully parsed fields and subfields are written to the flight plan record of the field
+        being parsed, (self.get_flight_plan_record(): FlightPlanRecord)
             :return: None"""
 
         idx = 0
@@ -537,8 +900,8 @@ class ParseFieldsCommon:
                 break
             else:
                 # Get the regular expression for the subfield being parsed
-                regexp = self.sfd.get_subfield_description(subfield_id).get_field_syntax()
-                if re.fullmatch(regexp, token_to_parse.get_token_string()) is None:
+                regexp = self.get_subfield_pattern(subfield_id)
+                if regexp.fullmatch(token_to_parse.get_token_string()) is None:
                     # Report an error
                     self.add_error(token_to_parse.get_token_string(),
                                    token_to_parse.get_token_start_index(),
@@ -555,12 +918,10 @@ class ParseFieldsCommon:
                                      self.get_tokens().get_token_at(idx).get_token_string(),
                                      # Add the header field start index to the individual field start index
                                      self.get_tokens().get_token_at(idx).get_token_start_index() +
-                                     self.get_flight_plan_record().get_icao_field(
-                                         self.get_field_identifier()).get_start_index(),
+                                     self.get_field_start_index(),
                                      # Add the header field start index to the individual field end index
                                      self.get_tokens().get_token_at(idx).get_token_end_index() +
-                                     self.get_flight_plan_record().get_icao_field(
-                                         self.get_field_identifier()).get_start_index())
+                                     self.get_field_start_index())
             idx += 1
             if idx > self.get_tokens().get_number_of_tokens():
                 # Bail out if we have no more tokens left
@@ -587,12 +948,28 @@ class ParseFieldsCommon:
         # Token idx 0 is the keyword, token idx 1 is the '/'
         start_idx = tokens[1].get_token_end_index()
         end_idx = tokens[len(tokens) - 1].get_token_end_index()
-        start_offset = self.get_flight_plan_record().get_icao_field(self.get_field_identifier()).get_start_index()
+        start_offset = self.get_field_start_index()
         self.get_flight_plan_record().add_icao_subfield(self.get_field_identifier(), subfield_id,
                                                         field_text[start_idx:end_idx],
                                                         start_idx + start_offset,
                                                         end_idx + start_offset)
 
+    def save_field_grammar(self, match):
+        # type: (re.Match) -> None
+        """This method saves the subfields of a field matching the field grammar to the flight plan record,
+        the subfields are saved in the same order and with the same indices as the subfield by subfield parser.
+            :param match: The field grammar match, (see match_field_grammar())
+            :return: None"""
+        field_start = self.get_field_start_index()
+        for subfield_id, group in self.get_field_grammar_groups():
+            start_idx, end_idx = match.span(group) if group is not None else (-1, -1)
+            if start_idx > -1:
+                self.add_subfield_to_fpr(subfield_id, match.group(group),
+                                         start_idx + field_start, end_idx + field_start)
+            elif subfield_id in self.FIELD_GRAMMAR_DEFAULTS:
+                self.add_subfield_to_fpr(subfield_id, self.FIELD_GRAMMAR_DEFAULTS[subfield_id],
+                                         field_start, field_start)
+
     def split_and_insert_token(self, insert_index, split_index):
         # type: (int, int) -> None
         """This method splits data in a token and creates a new token so that the subfields can be parsed
@@ -628,3 +1005,18 @@ class ParseFieldsCommon:
             self.get_tokens().get_token_at(insert_index + 1).get_token_string()[split_index:])
         self.get_tokens().get_token_at(insert_index + 1).set_token_start_index(
             self.get_tokens().get_token_at(insert_index + 1).get_token_start_index() + split_index)
+
+    def validate_subfields(self):
+        # type: () -> None
+        """This method validates the subfields of a compound field saved in the flight plan record by
+        parse_compound_field_common(). Each subfield present is validated by the validator of its subfield
+        identifier, (see compile_subfield_validators()), in the order the subfields were saved.
+            :return: None"""
+        validators = self.get_subfield_validators()
+        flight_plan_record = self.get_flight_plan_record()
+        field_record = flight_plan_record.get_icao_field(self.get_field_identifier())
+        for subfield_id, subfields in field_record.get_subfield_dictionary().items():
+            validator = validators.get(subfield_id)
+            if validator is not None:
+                for subfield in subfields:
+                    validator.validate(flight_plan_record, subfield)
@@ -1,22 +1,29 @@
 import re
 
-from Configuration.EnumerationConstants import MessageTypes, MessageTitles, AdjacentUnits, ErrorId, FieldIdentifiers, \
-    SubFieldIdentifiers, FlightRules
+from Configuration.EnumerationConstants import MessageTypes, MessageTitles, AdjacentUnits, ErrorId, FieldIdentifiers
 from Configuration.ErrorMessages import ErrorMessages
 from Configuration.FieldsInMessage import FieldsInMessage
 from Configuration.SubFieldsInFields import SubFieldsInFields
 from Configuration.SubFieldDescriptions import SubFieldDescriptions
 from Configuration.MessageDescription import MessageDescription
+from F15_Parser.NavigationDatabase import NavigationDatabase
+from IcaoMessageParser.ConsistencyRules import ConsistencyRules, ConsistencyRule
+from IcaoMessageParser.FieldMemo import FieldMemo
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
 from IcaoMessageParser.ParseAdditionalAddressee import ParseAdditionalAddressee
 from IcaoMessageParser.ParseAddressee import ParseAddressee
 from IcaoMessageParser.ParseF3 import ParseF3
-from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
+from IcaoMessageParser.ParseFieldsCommon import FieldParseContext
 from IcaoMessageParser.ParseFilingTime import ParseFilingTime
 from IcaoMessageParser.ParseOriginator import ParseOriginator
+from IcaoMessageParser.ParsePlan import ParsePlan, FieldParsePlan
 from IcaoMessageParser.ParsePriorityIndicator import ParsePriorityIndicator
+from IcaoMessageParser.ShortOldiParser import ShortOldiParser
 from IcaoMessageParser.Utils import Utils
+from Tokenizer.Token import Token
 from Tokenizer.Tokenize import Tokenize, Tokens
+from Utilities.BatchGeodesy import GeodesyBatch
+from Utilities.GeodesyBackends import GeodesyBackend
 
 
 class ParseMessage:
@@ -61,6 +68,52 @@ class ParseMessage:
     EM: ErrorMessages = ErrorMessages()
     """Configuration data containing all the error messages"""
 
+    F3_PARSER: FieldParsePlan = FieldParsePlan(FieldIdentifiers.F3, ParseF3, SFIF, SFD)
+    """The plan to parse field 3, parsed before the message description is known"""
+
+    HEADER_PARSERS: (FieldParsePlan,) = (
+        FieldParsePlan(FieldIdentifiers.PRIORITY_INDICATOR, ParsePriorityIndicator, SFIF, SFD),
+        FieldParsePlan(FieldIdentifiers.ADDRESS, ParseAddressee, SFIF, SFD),
+        FieldParsePlan(FieldIdentifiers.FILING_TIME, ParseFilingTime, SFIF, SFD),
+        FieldParsePlan(FieldIdentifiers.ORIGINATOR, ParseOriginator, SFIF, SFD))
+    """The plans to parse the ATS header fields, in the order the fields are parsed"""
+
+    ADDITIONAL_ADDRESSEE_PARSER: FieldParsePlan = FieldParsePlan(
+        FieldIdentifiers.ADADDRESS, ParseAdditionalAddressee, SFIF, SFD)
+    """The plan to parse the ATS header additional addressee field, parsed if the field is present"""
+
+    SHORT_OLDI_PARSER: ShortOldiParser = ShortOldiParser(FIM)
+    """The fast path recognising the short, high frequency OLDI messages, (see parse_short_oldi())"""
+
+    PARSE_PLANS: {MessageDescription: ParsePlan} = {}
+    """The parse plans compiled from the message descriptions in FIM, keyed on the message description,
+    (see get_parse_plan())"""
+
+    navigation_database: NavigationDatabase = None
+    """An optional navigation database used to resolve the position of field 15 published route points
+    and aerodromes, None if positions are not resolved"""
+
+    geodesy_batch: GeodesyBatch = None
+    """An optional batch the field 15 bearing / distance calculations are added to, (deferred geodesy
+    mode), None to perform the calculations while parsing"""
+
+    geodesy_backend: GeodesyBackend = None
+    """An optional geodesy backend performing the field 15 bearing / distance calculations, None to
+    use the default ellipsoidal calculations, (see GeodesyBackend)"""
+
+    short_oldi_fast_path: bool = True
+    """True to parse short OLDI messages with the fast path, False to parse all messages with the generic
+    path, (see parse_short_oldi())"""
+
+    consistency_rules: ConsistencyRules = ConsistencyRules(read_only=True)
+    """The rule engine performing the consistency checks, (see consistency_check()); the default engine is
+    read only and shared by all message parsers, a parser registering a rule gets its own copy, (see
+    register_consistency_rule())"""
+
+    field_memo: FieldMemo = None
+    """An optional memo the subfields and errors of repetitive fields are rebuilt from instead of
+    parsing the field, None to parse every field, (see FieldMemo)"""
+
     def consistency_check(self, flight_plan_record):
         # type: (FlightPlanRecord) -> bool
         """This method performs consistency checking between various fields, that includes:
@@ -81,6 +134,8 @@ class ParseMessage:
               'D4', 'O1' or 'O4', then F10a must contain the letter 'I';
             - If F18 'PBN' contains one or more of the indicators 'C1', 'C4', 'D1', 'D4', 'O1'
               or 'O4', then F10a must contain the letter 'D';
+            - If F9b, F13a or F16a contain 'ZZZZ' then F18 must contain the subfield 'TYP', 'DEP' or
+              'DEST' respectively;
 
         These consistency checks are only carried out on message titles defined to contain both field 10
         and field 18, and/or field 8 and 15. These messages are:
@@ -90,271 +145,13 @@ class ParseMessage:
             - CPL
             - FPL
 
-        :param flight_plan_record: Flight plan record used for checking consistency;
-        :return: False if errors are detected, True if all is OK;
-        """
-        if flight_plan_record.get_message_title() is not MessageTitles.AFP and \
-                flight_plan_record.get_message_title() is not MessageTitles.ALR and \
-                flight_plan_record.get_message_title() is not MessageTitles.APL and \
-                flight_plan_record.get_message_title() is not MessageTitles.CPL and \
-                flight_plan_record.get_message_title() is not MessageTitles.FPL:
-            return True
-
-        # Consistency check the flight rules in F8a and those derived from F15
-        result1: bool = self.consistency_check_flight_rules(flight_plan_record)
-
-        # Check if the flight plan contains f10
-        if flight_plan_record.get_icao_field(FieldIdentifiers.F10) is None:
-            return result1
-
-        # Get field 10a
-        if flight_plan_record.get_icao_subfield(FieldIdentifiers.F10, SubFieldIdentifiers.F10a) is None:
-            f10a = ""
-        else:
-            f10a = flight_plan_record.get_icao_subfield(FieldIdentifiers.F10, SubFieldIdentifiers.F10a).get_field_text()
-
-        # Check various field 10 consistency checks
-        result2 = self.consistency_check_f10a_r(flight_plan_record, f10a)
-        result3 = self.consistency_check_f10a_z(flight_plan_record, f10a)
-        result4 = self.consistency_check_pbn(flight_plan_record, f10a)
-        result5 = self.consistency_check_f9b_dep(flight_plan_record)
-        result6 = self.consistency_check_f13a_dep(flight_plan_record)
-        result7 = self.consistency_check_f16a_dep(flight_plan_record)
-
-        return result1 or result2 or result3 or result4 or result5 or result6 or result7
-
-    def consistency_check_pbn(self, flight_plan_record, f10a):
-        # type: (FlightPlanRecord, str) -> bool
-        """This method consistency checks that one of the following dealing with the field
-        18 PBN subfield:
-            - If F18 contains the subfield 'PBN', F10a must contain an 'R';
-            - If F18 'PBN' contains one or more of the indicators 'B1', 'B2', 'C1', 'C2', 'D1',
-              'D2', 'O1' or 'O2', then F10a must contain the letter 'G';
-            - If F18 'PBN' contains one or more of the indicators 'B1', 'B3', 'C1', 'C3', 'D1',
-              'D3', 'O1' or 'O3', then F10a must contain the letter 'D';
-            - If F18 'PBN' contains one or more of the indicators 'B1' or 'B4', then F10a must
-              contain either an O' or 'S' and a 'D';
-            - If F18 'PBN' contains one or more of the indicators 'B1', 'B5', 'C1', 'C4', 'D1',
-              'D4', 'O1' or 'O4', then F10a must contain the letter 'I';
-            - If F18 'PBN' contains one or more of the indicators 'C1', 'C4', 'D1', 'D4', 'O1'
-              or 'O4', then F10a must contain the letter 'D';
-        Another way to simplify the logic is to use a table to identify the permutations:
-             | B1| B2| B3| B4| B5| C1| C2| C3| C4| D1| D2| D3| D4| O1| O2| O3| O4|
-          D  | X |   | X | X |   | X |   | X | X | X |   | X | X | X |   | X | X |
-          G  | X | X |   |   |   | X | X |   |   | X | X |   |   | X | X |   |   |
-          I  | X |   |   |   | X | X |   |   | X | X |   |   | X | X |   |   | X |
-         O|S | X |   |   | X |   |   |   |   |   |   |   |   |   |   |   |   |   |
-          R  | X | X | X | X | X |   |   |   |   |   |   |   |   |   |   |   |   |
-
-        :param flight_plan_record: Flight plan record used for checking consistency;
-        :param f10a: The contents of field 10a;
-        :return: False if errors are detected, True if all is OK;
-        """
-        result = True
-        pbn = flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18pbn)
-        if pbn is not None:
-            if len(re.findall("B1|B3|B4|C1|C3|C4|D1|D3|D4|O1|O3|O4", pbn.get_field_text())) != 0:
-                if f10a.find("D") == -1:
-                    # Missing 'D' in field 10a, error
-                    Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_PBN_D)
-                    result = False
-            if len(re.findall("B1|B2|C1|C2|D1|D2|O1|O2", pbn.get_field_text())) != 0:
-                if f10a.find("G") == -1:
-                    # Missing 'G' in field 10a, error
-                    Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_PBN_G)
-                    result = False
-            if len(re.findall("B1|B5|C1|C4|D1|D4|O1|O4", pbn.get_field_text())) != 0:
-                if f10a.find("I") == -1:
-                    # Missing 'I' in field 10a, error
-                    Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_PBN_I)
-                    result = False
-            if len(re.findall("B1|B4", pbn.get_field_text())) != 0:
-                if len(re.findall("[OS]", f10a)) == 0:
-                    # Missing 'O' and 'S' in field 10a, error
-                    Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_PBN_OS)
-                    result = False
-            if len(re.findall("B[1-5]", pbn.get_field_text())) != 0:
-                if f10a.find("R") == -1:
-                    # Missing 'R' in field 10a, error
-                    Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_PBN_R)
-                    result = False
-
-        return result
-
-    def consistency_check_f9b_dep(self, flight_plan_record):
-        # type: (FlightPlanRecord) -> bool
-        """This method consistency checks that if F9b contains 'ZZZZ' that there is
-        a field 18 TYP subfield;
-
-        :param flight_plan_record: Flight plan record used for checking consistency;
-        :return: False if errors are detected, True if all is OK;
-        """
-        # Check if the flight plan contains f9
-        if flight_plan_record.get_icao_field(FieldIdentifiers.F9) is None:
-            return True
-
-        # Get field 9b
-        if flight_plan_record.get_icao_subfield(FieldIdentifiers.F9, SubFieldIdentifiers.F9b) is None:
-            f9b = ""
-        else:
-            f9b = flight_plan_record.get_icao_subfield(FieldIdentifiers.F9, SubFieldIdentifiers.F9b).get_field_text()
-
-        # Check if field 9b contains 'ZZZZ'
-        if f9b == "ZZZZ":
-            if flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18typ) is None:
-                # Missing field 18 subfield TYP, error
-                Utils.add_error(flight_plan_record, "", 0, 0, self.EM, ErrorId.CONSISTENCY_F9B_TYP)
-                return False
-
-        return True
-
-    def consistency_check_f10a_r(self, flight_plan_record, f10a):
-        # type: (FlightPlanRecord, str) -> bool
-        """This method consistency checks that if F10a contains the letter 'R' then the F18
-        'PBN' subfield must be present and contain one or more of the indicators
-        'B1', 'B2', 'B3', 'B4' or 'B5';;
+        The checks are the rules of the consistency rule engine of this parser, further rules can be
+        registered with this parser, (see ConsistencyRules and register_consistency_rule()).
 
         :param flight_plan_record: Flight plan record used for checking consistency;
-        :param f10a: The contents of field 10a;
         :return: False if errors are detected, True if all is OK;
         """
-        # Check if field 10a contains an 'Z'
-        if f10a.find("Z") > -1:
-            if flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18com) is None and \
-                    flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18nav) is None and \
-                    flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18dat) is None:
-                # Missing field 18 subfields, error
-                Utils.add_error(flight_plan_record, "'COM', 'NAV' or 'DAT'", 0, 0,
-                                self.EM, ErrorId.CONSISTENCY_F10_Z)
-                return False
-
-        return True
-
-    def consistency_check_f10a_z(self, flight_plan_record, f10a):
-        # type: (FlightPlanRecord, str) -> bool
-        """This method consistency checks that if F10a contains the letter 'Z' then one or
-        more of the F18 subfields 'COM', 'NAV' or 'DAT' must be present;
-
-        :param flight_plan_record: Flight plan record used for checking consistency;
-        :param f10a: The contents of field 10a;
-        :return: False if errors are detected, True if all is OK;
-        """
-        # Check if field 10a contains an 'R'
-        if f10a.find("R") > -1:
-            pbn = flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18pbn)
-            if pbn is None:
-                # Missing field 18 PBN subfield, error
-                Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_F10_R)
-                return False
-            else:
-                if len(re.findall("B[1-5]", pbn.get_field_text())) == 0:
-                    # Missing field 18 PBN B[1-5] indicators, error
-                    Utils.add_error(flight_plan_record, "'PBN'", 0, 0, self.EM, ErrorId.CONSISTENCY_F10_R)
-                    return False
-
-        return True
-
-    def consistency_check_f13a_dep(self, flight_plan_record):
-        # type: (FlightPlanRecord) -> bool
-        """This method consistency checks that if F13a contains 'ZZZZ' that there is
-        a field 18 DEP subfield;
-
-        :param flight_plan_record: Flight plan record used for checking consistency;
-        :return: False if errors are detected, True if all is OK;
-        """
-        # Check if the flight plan contains f13
-        if flight_plan_record.get_icao_field(FieldIdentifiers.F13) is None:
-            return True
-
-        # Get field 13a
-        if flight_plan_record.get_icao_subfield(FieldIdentifiers.F13, SubFieldIdentifiers.F13a) is None:
-            f13a = ""
-        else:
-            f13a = flight_plan_record.get_icao_subfield(FieldIdentifiers.F13, SubFieldIdentifiers.F13a).get_field_text()
-
-        # Check if field 13a contains an 'ZZZZ'
-        if f13a == "ZZZZ":
-            if flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18dep) is None:
-                # Missing field 18 subfield DEP, error
-                Utils.add_error(flight_plan_record, "", 0, 0,
-                                self.EM, ErrorId.CONSISTENCY_F13A_DEP)
-                return False
-
-        return True
-
-    def consistency_check_f16a_dep(self, flight_plan_record):
-        # type: (FlightPlanRecord) -> bool
-        """This method consistency checks that if F16a contains 'ZZZZ' that there is
-        a field 18 DEST subfield;
-
-        :param flight_plan_record: Flight plan record used for checking consistency;
-        :return: False if errors are detected, True if all is OK;
-        """
-        # Check if the flight plan contains f16
-        if flight_plan_record.get_icao_field(FieldIdentifiers.F16) is None:
-            return True
-
-        # Get field 16a
-        if flight_plan_record.get_icao_subfield(FieldIdentifiers.F16, SubFieldIdentifiers.F16a) is None:
-            f16a = ""
-        else:
-            f16a = flight_plan_record.get_icao_subfield(FieldIdentifiers.F16, SubFieldIdentifiers.F16a).get_field_text()
-
-        # Check if field 16a contains an 'ZZZZ'
-        if f16a == "ZZZZ":
-            if flight_plan_record.get_icao_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18dest) is None:
-                # Missing field 18 subfield DEST, error
-                Utils.add_error(flight_plan_record, "", 0, 0,
-                                self.EM, ErrorId.CONSISTENCY_F16A_DEST)
-                return False
-
-        return True
-
-    def consistency_check_flight_rules(self, flight_plan_record):
-        # type: (FlightPlanRecord) -> bool
-        """This method consistency checks the flight rules given in Field 8a and
-        the rules derived from parsing and generated the extracted route from F15.
-
-        :param flight_plan_record: Flight plan record used for checking the flight rules consistency;
-        :return: False if errors are detected, True if all is OK;
-        """
-        # If there is no extracted route bail out
-        if flight_plan_record.get_extracted_route() is None:
-            return True
-
-        # Get the derived flight rules from the extracted route and set the derived rules
-        # to the flight plan record
-        flight_plan_record.set_derived_flight_rules(
-            FlightRules.get_flight_rules(
-                flight_plan_record.get_extracted_route().get_derived_flight_rules()))
-
-        # Get the flight rules from field 8
-        if flight_plan_record.get_icao_subfield(FieldIdentifiers.F8, SubFieldIdentifiers.F8a) is None:
-            f8a = ""
-        else:
-            f8a = flight_plan_record.get_icao_subfield(FieldIdentifiers.F8, SubFieldIdentifiers.F8a).get_field_text()
-
-        # Get the derived flight rules
-        derived_rules = flight_plan_record.get_derived_flight_rules()
-        if f8a == "":
-            if derived_rules is not FlightRules.UNKNOWN:
-                # Error, derived rules exist, nothing in Field 8a
-                Utils.add_error(flight_plan_record, derived_rules.name, 0, 0,
-                                self.EM, ErrorId.CONSISTENCY_F8_F8A_UNKNOWN)
-                return False
-        elif derived_rules is FlightRules.UNKNOWN:
-            if f8a != "":
-                # Error, derived rules unknown but Field 8a has a rule assigned
-                Utils.add_error(flight_plan_record, f8a, 0, 0,
-                                self.EM, ErrorId.CONSISTENCY_F8_DERIVED_UNKNOWN)
-                return False
-        elif FlightRules.get_flight_rules(f8a) is not derived_rules:
-            # Error, both flight rules available but different
-            Utils.add_error(flight_plan_record, derived_rules.name, 0, 0,
-                            self.EM, ErrorId.CONSISTENCY_F8_F8_DERIVED_DIFFERENT)
-            return False
-
-        return True
+        return self.consistency_rules.check(flight_plan_record, self.EM)
 
     @staticmethod
     def correct_ers_indices(flight_plan_record):
@@ -386,6 +183,25 @@ class ParseMessage:
             ers_error.set_start_index(ers_error.get_start_index() + f15_field_start_index)
             ers_error.set_end_index(ers_error.get_end_index() + f15_field_start_index)
 
+    @staticmethod
+    def decode_message(flight_plan_record, message):
+        # type: (FlightPlanRecord, bytes | bytearray | memoryview) -> str
+        """This method decodes a message received as bytes. The bytes are stored in the FPR so they can
+        be archived without encoding the message text again, (a bytearray or memoryview is copied to
+        bytes as the caller may re-use its buffer). The message is decoded as 'latin-1' which maps every
+        byte to exactly one character; IA-5 / ASCII text decodes unchanged and never raises a decoding
+        error. As a consequence all start and end indices stored in the FPR are byte offsets into the
+        message as received.
+
+        :param flight_plan_record: The Flight Plan Record into which the message bytes are stored;
+        :param message: The message as received;
+        :return: The decoded message;
+        """
+        if not isinstance(message, bytes):
+            message = bytes(message)
+        flight_plan_record.set_message_bytes(message)
+        return message.decode("latin-1")
+
     @staticmethod
     def determine_message_type(f3):
         # type: (str) -> MessageTypes
@@ -409,6 +225,21 @@ class ParseMessage:
 
         return MessageTypes.ATS
 
+    def compile_parse_plans(self):
+        # type: () -> int
+        """This method compiles the parse plans for all message descriptions defined in the configuration
+        data, (see get_parse_plan()); plans are otherwise compiled the first time a message description
+        is used.
+
+        :return: The number of parse plans compiled
+        """
+        number_compiled = 0
+        for md in self.FIM.get_message_descriptions():
+            if md not in self.PARSE_PLANS:
+                self.get_parse_plan(md)
+                number_compiled += 1
+        return number_compiled
+
     def get_message_description(self, flight_plan_record, message_title):
         # type: (FlightPlanRecord, MessageTitles) -> MessageDescription | None
         """This method gets the field list for a message based on its title, adjacent unit name and message
@@ -457,6 +288,56 @@ class ParseMessage:
 
         return md
 
+    def get_consistency_rules(self):
+        # type: () -> ConsistencyRules
+        """This method returns the rule engine performing the consistency checks.
+
+        :return: The ConsistencyRules instance used by consistency_check()
+        """
+        return self.consistency_rules
+
+    def get_field_memo(self):
+        # type: () -> FieldMemo | None
+        """This method returns the memo the subfields and errors of repetitive fields are rebuilt from.
+
+        :return: A FieldMemo instance or None if every field is parsed
+        """
+        return self.field_memo
+
+    def get_short_oldi_fast_path(self):
+        # type: () -> bool
+        """This method returns whether short OLDI messages are parsed with the fast path.
+
+        :return: True if the fast path is enabled, False if all messages are parsed with the generic path
+        """
+        return self.short_oldi_fast_path
+
+    def get_geodesy_backend(self):
+        # type: () -> GeodesyBackend | None
+        """This method returns the geodesy backend performing the field 15 bearing / distance calculations.
+
+        :return: A GeodesyBackend instance or None if the default ellipsoidal calculations are used
+        """
+        return self.geodesy_backend
+
+    def get_geodesy_batch(self):
+        # type: () -> GeodesyBatch | None
+        """This method returns the batch the field 15 bearing / distance calculations are added to
+        in deferred geodesy mode.
+
+        :return: A GeodesyBatch instance or None if the calculations are performed while parsing
+        """
+        return self.geodesy_batch
+
+    def get_navigation_database(self):
+        # type: () -> NavigationDatabase | None
+        """This method returns the navigation database used to resolve the position of field 15
+        published route points and aerodromes.
+
+        :return: A NavigationDatabase instance or None if no navigation database is set
+        """
+        return self.navigation_database
+
     def is_message_valid(self, flight_plan_record, message):
         # type: (FlightPlanRecord, str) -> bool
         """This method carries out some rudimentary checks for:
@@ -551,7 +432,7 @@ class ParseMessage:
                                           tokens.get_first_token().get_token_start_index(),
                                           tokens.get_first_token().get_token_end_index())
         # Parse F3, this will assign the adjacent unit name to the FPR
-        ParseF3(flight_plan_record, self.SFIF, self.SFD).parse_field()
+        self.parse_field(flight_plan_record, FieldIdentifiers.F3, self.F3_PARSER)
 
         return self.parse_ats_or_oldi(flight_plan_record, tokens, message_title)
 
@@ -588,13 +469,18 @@ class ParseMessage:
         flight_plan_record.add_icao_field(FieldIdentifiers.ORIGINATOR, "", 0, 0)
         flight_plan_record.add_icao_field(FieldIdentifiers.ADADDRESS, "", 0, 0)
 
+        # The addressee tokens are collected and each addressee field is built once after the loop
+        addressees: [Token] = []
+        addressee_start_index: int = 0
+        additional_addressees: [Token] = []
+        additional_addressee_start_index: int = 0
+
         # The following is used to indicate the 'state' of processing:
         # 0 -> Next expected header field is the Priority Indicator
         # 1 -> Next expected header field is an addressee field
         # 2 -> Next expected header field is the Originator
         # 3 -> Next expected header field is an additional addressee
         next_field: int = 0
-        additional_addressee_available = False
         # Loop over the header fields
         for token in tokens.get_tokens():
             if next_field == 0:  # Process priority indicator
@@ -605,12 +491,8 @@ class ParseMessage:
                                                   token.get_token_start_index(),
                                                   token.get_token_end_index())
 
-                # Set up a new token for the addressee field(s)
-                flight_plan_record.add_icao_field(
-                    FieldIdentifiers.ADDRESS,
-                    flight_plan_record.get_icao_field(FieldIdentifiers.ADDRESS).get_field_text(),
-                    token.get_token_end_index() + 1,
-                    token.get_token_end_index() + 1)
+                # The addressee field(s) start after the priority indicator
+                addressee_start_index = token.get_token_end_index() + 1
 
                 # Indicates the next field is an addressee
                 next_field = 1
@@ -628,13 +510,8 @@ class ParseMessage:
                     next_field = 2
 
                 else:
-                    # Concatenate the addressees
-                    flight_plan_record.add_icao_field(
-                        FieldIdentifiers.ADDRESS,
-                        flight_plan_record.get_icao_field(
-                            FieldIdentifiers.ADDRESS).get_field_text() + token.get_token_string() + " ",
-                        flight_plan_record.get_icao_field(FieldIdentifiers.ADDRESS).get_start_index(),
-                        token.get_token_end_index())
+                    # Collect the addressees
+                    addressees.append(token)
 
             elif next_field == 2:  # Process the originator
 
@@ -644,44 +521,73 @@ class ParseMessage:
                                                   token.get_token_start_index(),
                                                   token.get_token_end_index())
 
-                # Set up a new token for the additional addressee field(s)
-                flight_plan_record.add_icao_field(
-                    FieldIdentifiers.ADADDRESS,
-                    flight_plan_record.get_icao_field(FieldIdentifiers.ADADDRESS).get_field_text(),
-                    token.get_token_end_index() + 1,
-                    token.get_token_end_index() + 1)
+                # The additional addressee field(s) start after the originator
+                additional_addressee_start_index = token.get_token_end_index() + 1
 
                 next_field = 3
 
             elif next_field == 3:  # Process additional addressees
 
-                # Concatenate the additional addressees
-                flight_plan_record.add_icao_field(
-                    FieldIdentifiers.ADADDRESS,
-                    flight_plan_record.get_icao_field(
-                        FieldIdentifiers.ADADDRESS).get_field_text() + token.get_token_string() + " ",
-                    flight_plan_record.get_icao_field(FieldIdentifiers.ADADDRESS).get_start_index(),
-                    token.get_token_end_index())
-                additional_addressee_available = True
-
-        ParsePriorityIndicator(flight_plan_record, self.SFIF, self.SFD).parse_field()
-        ParseAddressee(flight_plan_record, self.SFIF, self.SFD).parse_field()
-        ParseFilingTime(flight_plan_record, self.SFIF, self.SFD).parse_field()
-        ParseOriginator(flight_plan_record, self.SFIF, self.SFD).parse_field()
+                # Collect the additional addressees
+                additional_addressees.append(token)
+
+        # Save the addressee fields
+        self.add_addressee_field(flight_plan_record, FieldIdentifiers.ADDRESS, addressees, addressee_start_index)
+        self.add_addressee_field(flight_plan_record, FieldIdentifiers.ADADDRESS, additional_addressees,
+                                 additional_addressee_start_index)
+        additional_addressee_available = len(additional_addressees) > 0
+
+        for header_parser in self.HEADER_PARSERS:
+            header_parser.parse(FieldParseContext.for_field(flight_plan_record, header_parser.get_field_identifier()))
         if additional_addressee_available:
-            ParseAdditionalAddressee(flight_plan_record, self.SFIF, self.SFD).parse_field()
+            self.ADDITIONAL_ADDRESSEE_PARSER.parse(
+                FieldParseContext.for_field(flight_plan_record, FieldIdentifiers.ADADDRESS))
 
         return flight_plan_record.errors_detected()
 
+    @staticmethod
+    def add_addressee_field(flight_plan_record, field_id, addressees, start_index):
+        # type: (FlightPlanRecord, FieldIdentifiers, [Token], int) -> None
+        """This method adds an addressee or additional addressee field to the FPR built from the addressee
+        tokens collected from the message header. The field text is the addressee tokens each followed by
+        a space; the field starts at the given index and ends at the end of the last addressee, an empty
+        field starts and ends at the given index. The field is built once from all the tokens so a header
+        with many addressees is parsed in linear time.
+
+        :param flight_plan_record: The Flight Plan Record the field is added to;
+        :param field_id: The field identifier, either ADDRESS or ADADDRESS;
+        :param addressees: The addressee tokens in the order found in the header;
+        :param start_index: The start index of the field in the message header;
+        :return: None
+        """
+        end_index = addressees[-1].get_token_end_index() if len(addressees) > 0 else start_index
+        flight_plan_record.add_icao_field(
+            field_id, "".join([token.get_token_string() + " " for token in addressees]), start_index, end_index)
+
+    def get_parse_plan(self, md):
+        # type: (MessageDescription) -> ParsePlan
+        """This method returns the parse plan compiled from a message description; the plan is compiled
+        the first time it is needed and shared by all message parsers.
+
+        :param md: The message description;
+        :return: The parse plan for the message description
+        """
+        plan = self.PARSE_PLANS.get(md)
+        if plan is None:
+            plan = ParsePlan(md, self.SFIF, self.SFD)
+            self.PARSE_PLANS[md] = plan
+        return plan
+
     def parse_ats_or_oldi(self, flight_plan_record, tokens, message_title):
         # type: (FlightPlanRecord, Tokens, MessageTitles) -> bool
         """This method parses the message fields. The field definition list is obtained based on the
         message type, adjacent unit name and message title. The field definition list contains
         information about all the subfields in each field and is used to parse individual subfields.
 
-        The individual parser methods are implemented as callbacks and stored with the field definition
-        list. Each parser callback adds the fields and subfields to the FPR. Once this method completes,
-        The FPR is fully populated with the message field and subfield content.
+        The field definition list is executed as a parse plan compiled once per message description,
+        (see get_parse_plan()), the plan holds a field parser for each field already set up with its
+        configuration data. Each field parser adds the fields and subfields to the FPR. Once this method
+        completes, The FPR is fully populated with the message field and subfield content.
 
         :param flight_plan_record: The Flight Plan Record containing the message to parse and into
                which all the parsed data is written;
@@ -696,11 +602,26 @@ class ParseMessage:
         if md is None:
             return False
 
+        # Parse the fields with the parse plan compiled for this message
+        return self.parse_message_fields(flight_plan_record, tokens, self.get_parse_plan(md), message_title)
+
+    def parse_message_fields(self, flight_plan_record, tokens, plan, message_title):
+        # type: (FlightPlanRecord, Tokens, ParsePlan, MessageTitles) -> bool
+        """This method parses the message fields with the parse plan compiled for the message description
+        of the message, (see parse_ats_or_oldi()).
+
+        :param flight_plan_record: The Flight Plan Record containing the message to parse and into
+               which all the parsed data is written;
+        :param tokens: The tokens containing individual ICAO fields;
+        :param plan: The parse plan for the message description of the message;
+        :param message_title: The message title;
+        :return: True if the message was parsed without error, False if any errors were detected.
+        """
         # Get the list of field parsers defined for this message
-        field_parsers: [ParseFieldsCommon] = md.get_field_parsers()
+        field_parsers = plan.get_field_parsers()
 
         # Get the list of field identifiers defining fields included in this message
-        field_identifiers: [FieldIdentifiers] = md.get_message_fields()
+        field_identifiers: (FieldIdentifiers,) = plan.get_field_identifiers()
 
         # Loop over the fields in the list of tokens, (these are the fields to
         # be parsed), by calling a parse method defined for each field.
@@ -710,7 +631,7 @@ class ParseMessage:
         # list is used to control the loop and avoid accessing invalid list entries;
         # if the lists differ in size an error is reported.
         idx = 0
-        if tokens.get_number_of_tokens() < md.get_number_of_fields_in_message():
+        if tokens.get_number_of_tokens() < plan.get_number_of_fields_in_message():
             # There are fewer fields to parse than fields defined for this message
             for token in tokens.get_tokens():
                 # Save the field to be parsed to the flight plan
@@ -719,19 +640,17 @@ class ParseMessage:
                     token.get_token_string(),
                     token.get_token_start_index() + len(flight_plan_record.get_message_header()),
                     token.get_token_end_index() + len(flight_plan_record.get_message_header()))
-                # Get the appropriate field parser
-                fp = field_parsers[idx](flight_plan_record, self.SFIF, self.SFD)
-                # Parse the field
-                fp.parse_field()
+                # Parse the field with the appropriate field parser
+                self.parse_field(flight_plan_record, field_identifiers[idx], field_parsers[idx])
                 idx += 1
 
             # Check if fewer fields to parse is allowed, some messages have optional fields
-            difference = md.get_number_of_fields_in_message() - tokens.get_number_of_tokens()
+            difference = plan.get_number_of_fields_in_message() - tokens.get_number_of_tokens()
             if message_title == MessageTitles.FPL and difference == 1:
                 # This title has an optional field 19, we only report an error if more
                 # than one field is missing
                 return flight_plan_record.errors_detected()
-            Utils.add_error(flight_plan_record, str(md.get_number_of_fields_in_message()),
+            Utils.add_error(flight_plan_record, str(plan.get_number_of_fields_in_message()),
                             tokens.get_first_token().get_token_start_index() +
                             len(flight_plan_record.get_message_header()),
                             tokens.get_last_token().get_token_end_index() +
@@ -744,9 +663,8 @@ class ParseMessage:
             # have F22 as the last field that uses hyphens as field separators. For
             # these messages, the F22 fields need to be concatenated into a single field.
             # Check if the last field specified for this message is F22
-            f22_index = len(field_identifiers) - 1
-            if field_identifiers[f22_index] == FieldIdentifiers.F22 or \
-                    field_identifiers[f22_index] == FieldIdentifiers.F22_SPECIFIC:
+            f22_index = plan.get_f22_index()
+            if f22_index > -1:
                 # The last field in the list of field_identifiers is F22, so this gives
                 # us the index into the token list where F22 starts, all tokens including
                 # this one up to the end of the token list are all F22 fields.
@@ -775,14 +693,12 @@ class ParseMessage:
                     tokens.get_token_at(idx).get_token_string(),
                     tokens.get_token_at(idx).get_token_start_index() + len(flight_plan_record.get_message_header()),
                     tokens.get_token_at(idx).get_token_end_index() + len(flight_plan_record.get_message_header()))
-                # Get the appropriate field parser
-                fp = field_parser(flight_plan_record, self.SFIF, self.SFD)
-                # Parse the field
-                fp.parse_field()
+                # Parse the field with the appropriate field parser
+                self.parse_field(flight_plan_record, field_identifiers[idx], field_parser)
                 idx += 1
 
             # Check if we have more fields to parse than defined for this message
-            if tokens.get_number_of_tokens() > md.get_number_of_fields_in_message():
+            if tokens.get_number_of_tokens() > plan.get_number_of_fields_in_message():
                 Utils.add_error(flight_plan_record, tokens.get_token_at(idx).get_token_string(),
                                 tokens.get_token_at(idx).get_token_start_index(),
                                 tokens.get_token_at(idx).get_token_end_index(), self.EM,
@@ -790,18 +706,71 @@ class ParseMessage:
 
         return flight_plan_record.errors_detected()
 
+    def parse_field(self, flight_plan_record, field_identifier, field_parser):
+        # type: (FlightPlanRecord, FieldIdentifiers, type | FieldParsePlan) -> None
+        """This method parses a single message field that has been added to the FPR. The range of
+        errors added to the FPR by the field parser is recorded in the FPR so that the errors can be
+        attributed to the field, (see ReParseMessage).
+
+        If a field memo is set and the field parser is memoisable, the subfields and errors of a field
+        text already memoised are rebuilt from the memo instead of parsing the field, (see FieldMemo).
+
+        :param flight_plan_record: The Flight Plan Record containing the field to parse;
+        :param field_identifier: The field identifier of the field being parsed;
+        :param field_parser: The field parser class, a subclass of ParseFieldsCommon, or the plan
+               holding the field parser shared by all messages, (see FieldParsePlan);
+        :return: None
+        """
+        first_error = len(flight_plan_record.get_erroneous_fields())
+        field_memo = self.field_memo
+        if field_memo is not None:
+            field_parser_class = field_parser.get_field_parser() \
+                if isinstance(field_parser, FieldParsePlan) else field_parser
+            if not field_parser_class.MEMOISABLE:
+                field_memo = None
+            elif field_memo.restore(flight_plan_record, field_identifier):
+                flight_plan_record.set_field_error_range(
+                    field_identifier, first_error, len(flight_plan_record.get_erroneous_fields()))
+                return
+        if isinstance(field_parser, FieldParsePlan):
+            field_parser.parse(FieldParseContext.for_field(
+                flight_plan_record, field_identifier, self.navigation_database, self.geodesy_batch,
+                self.geodesy_backend))
+        else:
+            parser = field_parser(flight_plan_record, self.SFIF, self.SFD)
+            parser.set_navigation_database(self.navigation_database)
+            parser.set_geodesy_batch(self.geodesy_batch)
+            parser.set_geodesy_backend(self.geodesy_backend)
+            parser.parse_field()
+        if field_memo is not None:
+            field_memo.save(flight_plan_record, field_identifier, first_error)
+        flight_plan_record.set_field_error_range(
+            field_identifier, first_error, len(flight_plan_record.get_erroneous_fields()))
+
     def parse_message(self, flight_plan_record, message):
-        # type: (FlightPlanRecord, str | None) -> bool
+        # type: (FlightPlanRecord, str | bytes | bytearray | memoryview | None) -> bool
         """This method is the entry point for message parsing; the method takes an instance of FlightPlanRecord
         (for output) and a string containing the message to parse. The FlightPlanRecord is populated by the
         parser and includes all extracted fields, (if field 15 was present) is stored along with any route
         extraction any errors. It is a callers responsibility to retrieve the errors.
 
+        The message may also be given as bytes, a bytearray or a memoryview, (e.g. IA-5 / ASCII text as
+        received from an AFTN interface), see decode_message().
+
         :param flight_plan_record: A flight plan record into which all data extracted by the parser
                (including errors) are written;
         :param message: The message with or without header;
         :return: False if errors are detected, True otherwise;
         """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            message = self.decode_message(flight_plan_record, message)
+
+        # Short OLDI messages without a header are parsed by the fast path
+        if self.short_oldi_fast_path and message is not None and len(message) >= self.MINIMUM_BODY_LENGTH:
+            short_oldi = self.SHORT_OLDI_PARSER.tokenize(message)
+            if short_oldi is not None:
+                return self.parse_short_oldi(flight_plan_record, message, short_oldi[0], short_oldi[1])
+
         # Check if the message is worthy of further processing
         if not self.is_message_valid(flight_plan_record, message):
             return False
@@ -847,6 +816,49 @@ class ParseMessage:
             return True
         return True
 
+    def parse_short_oldi(self, flight_plan_record, message, message_title, tokens):
+        # type: (FlightPlanRecord, str, MessageTitles, Tokens) -> bool
+        """This method parses a short OLDI message recognised by the fast path, (see ShortOldiParser). The
+        message has no header, its message type is OLDI and its fields are already located, so this
+        method skips establishing the message type, splitting the header and tokenizing the message; the
+        fields are then parsed as by parse_oldi(), the flight plan record is the same as the one populated
+        by the generic path.
+
+        :param flight_plan_record: A flight plan record into which all data extracted by the parser
+               (including errors) are written;
+        :param message: The message, a short OLDI message without header;
+        :param message_title: The message title;
+        :param tokens: The tokens containing the message fields, (see ShortOldiParser.tokenize());
+        :return: False if errors are detected, True otherwise;
+        """
+        flight_plan_record.set_message_complete(message)
+        flight_plan_record.set_message_header("")
+        flight_plan_record.set_message_body(message)
+        flight_plan_record.set_message_type(MessageTypes.OLDI)
+
+        # Parse F3, this will assign the adjacent unit name to the FPR
+        f3 = tokens.get_first_token()
+        flight_plan_record.add_icao_field(FieldIdentifiers.F3, f3.get_token_string(),
+                                          f3.get_token_start_index(), f3.get_token_end_index())
+        self.parse_field(flight_plan_record, FieldIdentifiers.F3, self.F3_PARSER)
+
+        # Obtain the field list definition for this message title and adjacent unit
+        md = self.SHORT_OLDI_PARSER.get_message_description(
+            flight_plan_record.get_sender_adjacent_unit_name(), message_title)
+        if md is None:
+            # Not defined for the adjacent unit, report the same as the generic path
+            self.parse_ats_or_oldi(flight_plan_record, tokens, message_title)
+        else:
+            self.parse_message_fields(flight_plan_record, tokens, self.get_parse_plan(md), message_title)
+
+        # Call the consistency checking routines
+        self.consistency_check(flight_plan_record)
+
+        # Correct the Extracted route start and end indices to reference them against the message as a whole
+        self.correct_ers_indices(flight_plan_record)
+
+        return not (flight_plan_record.errors_detected() or len(flight_plan_record.get_erroneous_fields()))
+
     def set_message_body_and_header(self, flight_plan_record):
         # type: (FlightPlanRecord) -> None
         """This method determines if a message contains a header and message body or if it's a message
@@ -912,6 +924,88 @@ class ParseMessage:
                 flight_plan_record.set_message_header(msg[0:hyphen_index])
                 flight_plan_record.set_message_body(msg[hyphen_index:])
 
+    def register_consistency_rule(self, rule):
+        # type: (ConsistencyRule) -> None
+        """This method adds a consistency rule to the checks of this parser only; the first rule registered
+        replaces a read only engine, (e.g. the default engine shared by all message parsers), with a copy
+        of it, so other message parsers keep their rules.
+
+        :param rule: The rule to add, (see ConsistencyRules.register_rule());
+        :return: None
+        """
+        if self.consistency_rules.is_read_only():
+            self.consistency_rules = self.consistency_rules.copy()
+        self.consistency_rules.register_rule(rule)
+
+    def set_consistency_rules(self, consistency_rules):
+        # type: (ConsistencyRules) -> None
+        """This method sets the rule engine performing the consistency checks; an engine can be shared
+        by several message parsers.
+
+        :param consistency_rules: A ConsistencyRules instance;
+        :return: None
+        """
+        self.consistency_rules = consistency_rules
+
+    def set_field_memo(self, field_memo):
+        # type: (FieldMemo | None) -> None
+        """This method sets a memo of parsed fields; the subfields and errors of a field whose text was
+        parsed before are rebuilt from the memo instead of parsing the field again, (see FieldMemo).
+        A memo can be shared by several message parsers to collect the repetitive fields of all of them.
+
+        :param field_memo: A FieldMemo instance or None to parse every field;
+        :return: None
+        """
+        self.field_memo = field_memo
+
+    def set_short_oldi_fast_path(self, short_oldi_fast_path):
+        # type: (bool) -> None
+        """This method enables or disables the fast path parsing the short, high frequency OLDI messages,
+        i.e. LAM, ACP, ABI, ACT, REV, MAC and SBY, (see parse_short_oldi()); the fast path is enabled by
+        default.
+
+        :param short_oldi_fast_path: True to enable the fast path, False to parse all messages with the
+               generic path;
+        :return: None
+        """
+        self.short_oldi_fast_path = short_oldi_fast_path
+
+    def set_geodesy_backend(self, geodesy_backend):
+        # type: (GeodesyBackend | None) -> None
+        """This method selects the geodesy backend performing the field 15 bearing / distance and point /
+        bearing / distance calculations for messages parsed by this instance, e.g. SphericalGeodesy
+        when ellipsoidal precision is not needed, (see GeodesyBackend). The backend is not used in
+        deferred geodesy mode, (see set_geodesy_batch()).
+
+        :param geodesy_backend: A GeodesyBackend instance or None to use the default ellipsoidal calculations;
+        :return: None
+        """
+        self.geodesy_backend = geodesy_backend
+
+    def set_geodesy_batch(self, geodesy_batch):
+        # type: (GeodesyBatch | None) -> None
+        """This method sets deferred geodesy mode; the field 15 parser adds the bearing / distance
+        calculations of every message parsed to the batch instead of performing them while parsing.
+        The extracted route sequences of all messages parsed have their bearings, distances and
+        point / bearing / distance positions assigned when GeodesyBatch.compute() is called, the
+        calculations for thousands of messages are then performed together, (see GeodesyBatch).
+
+        :param geodesy_batch: A GeodesyBatch instance or None to perform the calculations while parsing;
+        :return: None
+        """
+        self.geodesy_batch = geodesy_batch
+
+    def set_navigation_database(self, navigation_database):
+        # type: (NavigationDatabase | None) -> None
+        """This method sets a navigation database used to resolve the position of field 15 published
+        route points and aerodromes, (see NavigationDatabase); when set, the extracted route sequence
+        contains the latitude / longitude of these points and the bearing / distance between them.
+
+        :param navigation_database: A NavigationDatabase instance or None to not resolve positions;
+        :return: None
+        """
+        self.navigation_database = navigation_database
+
     def set_message_type(self, flight_plan_record):
         # type: (FlightPlanRecord) -> bool
         """This method sets the message type (ICAO ATS, OLDI or ADEXP) to the FPR. When this method
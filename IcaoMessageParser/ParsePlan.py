@@ -0,0 +1,248 @@
+import copy
+import re
+import threading
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers, ErrorId
+from Configuration.MessageDescription import MessageDescription
+from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from Configuration.SubFieldsInFields import SubFieldsInFields
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon, FieldParseContext
+
+
+class FieldParsePlan:
+    """This class is the compiled plan to parse one field of a message, (see ParsePlan). The plan holds
+    the field parser of its field parser class with everything the field parser reads from the configuration
+    data, i.e. the whitespace, the subfields in the field, their compiled syntax and the errors of the field.
+    The field parser is created once per process and shared by all plans, a field is parsed by passing the
+    context of the field to parse(), (see ParseMessage.parse_field()), so nothing is created or read from
+    the configuration data for the field parser while parsing a message.
+
+    An instance can also be called like a field parser class and returns a shallow copy of the field
+    parser bound to a flight plan record.
+
+    The plan is read only and can be shared by several message parsers and threads."""
+
+    PARSERS: {type: ParseFieldsCommon} = {}
+    """The field parsers keyed on the field parser class, created once per process and shared by all plans"""
+
+    field_identifier: FieldIdentifiers = None
+    """The field identifier of the field in the message"""
+
+    field_parser: type = None
+    """The field parser class, a subclass of ParseFieldsCommon"""
+
+    parser: ParseFieldsCommon = None
+    """The field parser copied for each field parsed"""
+
+    subfield_patterns: (re.Pattern,) = None
+    """The compiled syntax of each subfield in the field, in the same order as the subfields, None for
+    a subfield without a syntax, (e.g. the field 18 keywords parsed by dedicated parsers)"""
+
+    def __init__(self, field_identifier, field_parser, sfif, sfd):
+        # type: (FieldIdentifiers, type, SubFieldsInFields, SubFieldDescriptions) -> None
+        """Constructor compiling the plan to parse a field.
+
+        :param field_identifier: The field identifier of the field in the message;
+        :param field_parser: The field parser class, a subclass of ParseFieldsCommon;
+        :param sfif: Configuration data defining the subfields in a field;
+        :param sfd: Configuration data describing the syntax of the subfields;
+        :return: None
+        """
+        self.field_identifier = field_identifier
+        self.field_parser = field_parser
+        self.parser = self.get_shared_parser(field_parser, sfif, sfd)
+        self.subfield_patterns = tuple(self.compile_subfield_pattern(subfield_id)
+                                       for subfield_id in self.get_sub_field_list())
+        # Compile the field grammar before the field parser is copied
+        self.parser.get_field_grammar()
+
+    def __call__(self, flight_plan_record, sfif=None, sfd=None):
+        # type: (FlightPlanRecord, SubFieldsInFields | None, SubFieldDescriptions | None) -> ParseFieldsCommon
+        """Creates the field parser for a field of a message.
+
+        :param flight_plan_record: The flight plan record the field parser populates;
+        :param sfif: Not used, the configuration data is read when the plan is compiled;
+        :param sfd: Not used, the configuration data is read when the plan is compiled;
+        :return: A field parser ready to parse the field
+        """
+        parser = copy.copy(self.parser)
+        parser.local = threading.local()
+        parser.set_flight_plan_record(flight_plan_record)
+        return parser
+
+    @staticmethod
+    def get_shared_parser(field_parser, sfif, sfd):
+        # type: (type, SubFieldsInFields, SubFieldDescriptions) -> ParseFieldsCommon
+        """Returns the field parser of a field parser class shared by all plans, creating it the first
+        time it is needed.
+
+        :param field_parser: The field parser class, a subclass of ParseFieldsCommon;
+        :param sfif: Configuration data defining the subfields in a field;
+        :param sfd: Configuration data describing the syntax of the subfields;
+        :return: The field parser shared by all plans
+        """
+        parser = FieldParsePlan.PARSERS.get(field_parser)
+        if parser is None:
+            parser = FieldParsePlan.PARSERS.setdefault(field_parser, field_parser(None, sfif, sfd))
+        return parser
+
+    def compile_subfield_pattern(self, subfield_id):
+        # type: (SubFieldIdentifiers) -> re.Pattern | None
+        """Compiles the syntax of a subfield in the field.
+
+        :param subfield_id: The subfield identifier;
+        :return: The compiled syntax or None if the subfield has no syntax description
+        """
+        try:
+            return self.parser.get_subfield_pattern(subfield_id)
+        except KeyError:
+            # Subfields of compound fields without a syntax description
+            return None
+
+    def get_error_list(self):
+        # type: () -> [ErrorId]
+        """Returns the errors reported by the field parser.
+
+        :return: A list of ErrorId enumeration values
+        """
+        return self.parser.get_error_list()
+
+    def get_field_identifier(self):
+        # type: () -> FieldIdentifiers
+        """Returns the field identifier of the field in the message.
+
+        :return: A FieldIdentifiers enumeration value
+        """
+        return self.field_identifier
+
+    def get_field_parser(self):
+        # type: () -> type
+        """Returns the field parser class.
+
+        :return: A subclass of ParseFieldsCommon
+        """
+        return self.field_parser
+
+    def get_parser(self):
+        # type: () -> ParseFieldsCommon
+        """Returns the field parser shared by all plans of the field parser class.
+
+        :return: The field parser
+        """
+        return self.parser
+
+    def get_sub_field_list(self):
+        # type: () -> [SubFieldIdentifiers]
+        """Returns the subfields in the field.
+
+        :return: A list of SubFieldIdentifiers enumeration values
+        """
+        return self.parser.get_sub_field_list()
+
+    def get_subfield_patterns(self):
+        # type: () -> (re.Pattern,)
+        """Returns the compiled syntax of each subfield in the field.
+
+        :return: A tuple of compiled regular expressions in the same order as the subfields, None for
+                 a subfield without a syntax
+        """
+        return self.subfield_patterns
+
+    def get_whitespace(self):
+        # type: () -> str
+        """Returns the whitespace characters used to tokenize the field.
+
+        :return: The whitespace characters
+        """
+        return self.parser.whitespace
+
+    def parse(self, context):
+        # type: (FieldParseContext) -> None
+        """Parses a field with the field parser, (see ParseFieldsCommon.parse()).
+
+        :param context: The context of the field to parse;
+        :return: None
+        """
+        self.parser.parse(context)
+
+
+class ParsePlan:
+    """This class is the compiled plan to parse the fields of the messages described by a message
+    description, i.e. an entry in FieldsInMessage for a message type, adjacent unit and message title.
+    The plan holds a FieldParsePlan for each field in the message and whether the last field is field 22,
+    whose hyphen separated subfields are concatenated into a single field before parsing, (see
+    ParseMessage.parse_ats_or_oldi()).
+
+    A plan is compiled once per message description and is read only, (see ParseMessage.get_parse_plan())."""
+
+    message_description: MessageDescription = None
+    """The message description the plan is compiled from"""
+
+    field_identifiers: (FieldIdentifiers,) = None
+    """The field identifiers of the fields in the message"""
+
+    field_parsers: (FieldParsePlan,) = None
+    """The plans to parse the fields in the message, in the same order as the field identifiers"""
+
+    f22_index: int = -1
+    """The index of field 22 if it is the last field in the message, -1 otherwise"""
+
+    def __init__(self, message_description, sfif, sfd):
+        # type: (MessageDescription, SubFieldsInFields, SubFieldDescriptions) -> None
+        """Constructor compiling the plan to parse the messages described by a message description.
+
+        :param message_description: The message description;
+        :param sfif: Configuration data defining the subfields in a field;
+        :param sfd: Configuration data describing the syntax of the subfields;
+        :return: None
+        """
+        self.message_description = message_description
+        self.field_identifiers = tuple(message_description.get_message_fields())
+        self.field_parsers = tuple(FieldParsePlan(field_identifier, field_parser, sfif, sfd)
+                                   for field_identifier, field_parser in
+                                   zip(self.field_identifiers, message_description.get_field_parsers()))
+        self.f22_index = -1
+        if len(self.field_identifiers) > 0 and \
+                self.field_identifiers[-1] in (FieldIdentifiers.F22, FieldIdentifiers.F22_SPECIFIC):
+            self.f22_index = len(self.field_identifiers) - 1
+
+    def get_f22_index(self):
+        # type: () -> int
+        """Returns the index of field 22 in the message.
+
+        :return: The index of field 22 if it is the last field in the message, -1 otherwise
+        """
+        return self.f22_index
+
+    def get_field_identifiers(self):
+        # type: () -> (FieldIdentifiers,)
+        """Returns the field identifiers of the fields in the message.
+
+        :return: A tuple of FieldIdentifiers enumeration values
+        """
+        return self.field_identifiers
+
+    def get_field_parsers(self):
+        # type: () -> (FieldParsePlan,)
+        """Returns the plans to parse the fields in the message.
+
+        :return: A tuple of FieldParsePlan instances in the same order as the field identifiers
+        """
+        return self.field_parsers
+
+    def get_message_description(self):
+        # type: () -> MessageDescription
+        """Returns the message description the plan is compiled from.
+
+        :return: The message description
+        """
+        return self.message_description
+
+    def get_number_of_fields_in_message(self):
+        # type: () -> int
+        """Returns the number of fields in the message.
+
+        :return: The number of fields
+        """
+        return len(self.field_identifiers)
@@ -0,0 +1,222 @@
+import copy
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, FieldRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParsePlan import FieldParsePlan
+
+
+class ReParseMessage(ParseMessage):
+    """This class re-parses a message held in a flight plan record after a localised edit to the message
+    text, e.g. a user correcting an erroneous field in a GUI. The edit is given as an offset into the
+    complete message, the number of characters deleted at the offset and the text inserted at the offset.
+
+    The re-parse runs the same processing as ParseMessage.parse_message() on the edited message, the
+    message header and body are split and tokenized again, the fields are identified again and the
+    consistency checks are run again. The only difference is when a field parser would be called for a
+    field whose text is unchanged by the edit; the subfields, errors, extracted route (F15) and F22 flight
+    plan (F22) from the previous parse are re-used with their indices shifted by the distance the field
+    moved in the message. Field parsers are only called for the fields touched by the edit and for the
+    fields with an error positioned outside the field, (e.g. the F19 'D' errors relative to the subfield),
+    as these errors do not move with the field as a whole. The flight plan record produced by a re-parse is
+    identical to the record produced by parsing the edited message from scratch.
+
+    Re-use relies on the FlightPlanRecord.field_error_ranges recorded by ParseMessage.parse_field(),
+    if a flight plan record does not contain these (e.g. an ADEXP message), all fields are parsed.
+    Field 3 is always parsed as its parser sets the message title and adjacent units in the flight plan.
+
+    This class holds the previous content of the flight plan record being re-parsed, an instance should
+    therefore only be used by one thread at a time.
+    """
+
+    previous_flight_plan_record: FlightPlanRecord | None = None
+    """A shallow copy of the flight plan record as it was before the re-parse started"""
+
+    def __init__(self, message_parser=None):
+        # type: (ParseMessage | None) -> None
+        """Constructor that initialises all members in this class; the fields changed by an edit are parsed
+        with the same settings as the message parser given, so the re-parsed flight plan record matches the
+        record that parser produces for the edited message.
+
+        :param message_parser: The message parser whose navigation database, geodesy backend / batch, field
+               memo, consistency rules and short OLDI fast path setting are used, None for the defaults;
+        :return: None
+        """
+        super().__init__()
+        self.previous_flight_plan_record = None
+        if message_parser is not None:
+            self.set_navigation_database(message_parser.get_navigation_database())
+            self.set_geodesy_batch(message_parser.get_geodesy_batch())
+            self.set_geodesy_backend(message_parser.get_geodesy_backend())
+            self.set_field_memo(message_parser.get_field_memo())
+            self.set_consistency_rules(message_parser.get_consistency_rules())
+            self.set_short_oldi_fast_path(message_parser.get_short_oldi_fast_path())
+
+    def reparse_message(self, flight_plan_record, offset, deleted_length, inserted_text):
+        # type: (FlightPlanRecord, int, int, str) -> bool
+        """This method is the entry point to re-parse a message after an edit; the flight plan record
+        passed to this method must have been populated by ParseMessage.parse_message() or by a previous
+        call to this method. The flight plan record is cleared and populated again from the edited message.
+
+        :param flight_plan_record: A flight plan record containing a parsed message, the record is
+               updated with the edited message along with all data extracted by the parser;
+        :param offset: The zero based index in the complete message where the edit starts;
+        :param deleted_length: The number of characters deleted from the message at 'offset';
+        :param inserted_text: The text inserted into the message at 'offset';
+        :return: False if errors are detected, True otherwise;
+        """
+        message = flight_plan_record.get_message_complete()
+        if offset < 0 or deleted_length < 0 or offset + deleted_length > len(message):
+            raise ValueError("Edit at offset " + str(offset) + " deleting " + str(deleted_length) +
+                             " characters is outside the message of length " + str(len(message)))
+        message = message[0:offset] + inserted_text + message[offset + deleted_length:]
+
+        # Detach the previous content from the flight plan record and clear it
+        self.previous_flight_plan_record = copy.copy(flight_plan_record)
+        offset_storage = flight_plan_record.is_offset_storage()
+        message_bytes = flight_plan_record.get_message_bytes()
+        flight_plan_record.__init__()
+        flight_plan_record.set_offset_storage(offset_storage)
+
+        try:
+            if message_bytes is not None:
+                return self.parse_message(flight_plan_record, message.encode("latin-1"))
+            return self.parse_message(flight_plan_record, message)
+        finally:
+            self.previous_flight_plan_record = None
+
+    def parse_field(self, flight_plan_record, field_identifier, field_parser):
+        # type: (FlightPlanRecord, FieldIdentifiers, type | FieldParsePlan) -> None
+        """This method overrides ParseMessage.parse_field() to re-use the result of parsing a field in
+        the previous flight plan record if the field text is unchanged, otherwise the field is parsed.
+
+        :param flight_plan_record: The Flight Plan Record containing the field to parse;
+        :param field_identifier: The field identifier of the field being parsed;
+        :param field_parser: The field parser class, a subclass of ParseFieldsCommon, or the plan
+               creating the field parser, (see FieldParsePlan);
+        :return: None
+        """
+        previous = self.previous_flight_plan_record
+        # The field parsers used depend on the message type, title and adjacent units set by field 3
+        if previous is None or field_identifier is FieldIdentifiers.F3 or \
+                flight_plan_record.get_message_type() is not previous.get_message_type() or \
+                flight_plan_record.get_message_title() is not previous.get_message_title() or \
+                flight_plan_record.get_sender_adjacent_unit_name() is not \
+                previous.get_sender_adjacent_unit_name() or \
+                flight_plan_record.get_receiver_adjacent_unit_name() is not \
+                previous.get_receiver_adjacent_unit_name():
+            super().parse_field(flight_plan_record, field_identifier, field_parser)
+            return
+
+        error_range = previous.get_field_error_range(field_identifier)
+        previous_field = previous.get_icao_field(field_identifier)
+        field = flight_plan_record.get_icao_field(field_identifier)
+        if error_range is None or previous_field is None or \
+                previous_field.get_field_text() != field.get_field_text():
+            super().parse_field(flight_plan_record, field_identifier, field_parser)
+            return
+
+        # Errors not positioned within the field do not move with the field, (e.g. the F19 'D' errors are
+        # relative to the subfield and the F22 errors to the nested subfields), the field is parsed again
+        for error_record in previous.get_erroneous_fields()[error_range[0]:error_range[1]]:
+            if error_record.get_start_index() < previous_field.get_start_index() or \
+                    error_record.get_end_index() > previous_field.get_end_index():
+                super().parse_field(flight_plan_record, field_identifier, field_parser)
+                return
+
+        # The field is unchanged, re-use the previous result shifted to the fields' new position
+        delta = field.get_start_index() - previous_field.get_start_index()
+        self.copy_subfields(flight_plan_record, field_identifier, previous_field, delta)
+
+        first_error = len(flight_plan_record.get_erroneous_fields())
+        for error_record in previous.get_erroneous_fields()[error_range[0]:error_range[1]]:
+            flight_plan_record.add_erroneous_field(error_record.get_field_text(),
+                                                   error_record.get_error_message(),
+                                                   error_record.get_start_index() + delta,
+                                                   error_record.get_end_index() + delta)
+        flight_plan_record.set_field_error_range(
+            field_identifier, first_error, len(flight_plan_record.get_erroneous_fields()))
+
+        match field_identifier:
+            case FieldIdentifiers.F15:
+                self.move_extracted_route(flight_plan_record, previous, previous_field.get_start_index())
+            case FieldIdentifiers.F22:
+                if previous.get_f22_flight_plan() is not None:
+                    flight_plan_record.set_f22_flight_plan(self.shift_flight_plan_record(
+                        previous.get_f22_flight_plan(), flight_plan_record.get_offset_message(), delta))
+
+    @staticmethod
+    def copy_subfields(flight_plan_record, field_identifier, previous_field, delta):
+        # type: (FlightPlanRecord, FieldIdentifiers, FieldRecord, int) -> None
+        """Copies the subfields of a field from a previous flight plan record into a field of a
+        flight plan record; the field must already exist in the flight plan record.
+
+        :param flight_plan_record: The flight plan record the subfields are copied to;
+        :param field_identifier: The field identifier of the field containing the subfields;
+        :param previous_field: The FieldRecord containing the subfields to copy;
+        :param delta: The number of characters the field has moved in the message;
+        :return: None
+        """
+        for subfield_id, subfield_list in previous_field.get_subfield_dictionary().items():
+            for subfield in subfield_list:
+                flight_plan_record.add_icao_subfield(field_identifier,
+                                                     subfield_id,
+                                                     subfield.get_field_text(),
+                                                     subfield.get_start_index() + delta,
+                                                     subfield.get_end_index() + delta)
+
+    @staticmethod
+    def move_extracted_route(flight_plan_record, previous, previous_f15_start_index):
+        # type: (FlightPlanRecord, FlightPlanRecord, int) -> None
+        """Moves the extracted route from a previous flight plan record to a flight plan record. The
+        extracted route indices in the previous record reference the message as a whole, they are
+        made relative to the start of field 15 again as ParseMessage.correct_ers_indices() adds the
+        start index of field 15 in the edited message once parsing completes.
+
+        :param flight_plan_record: The flight plan record the extracted route is moved to;
+        :param previous: The flight plan record the extracted route is moved from;
+        :param previous_f15_start_index: The start index of field 15 in the previous message;
+        :return: None
+        """
+        extracted_route = previous.get_extracted_route()
+        if extracted_route is None:
+            return
+        for ers_record in extracted_route.get_all_elements():
+            ers_record.set_start_index(ers_record.get_start_index() - previous_f15_start_index)
+            ers_record.set_end_index(ers_record.get_end_index() - previous_f15_start_index)
+        for ers_error in extracted_route.get_all_errors():
+            ers_error.set_start_index(ers_error.get_start_index() - previous_f15_start_index)
+            ers_error.set_end_index(ers_error.get_end_index() - previous_f15_start_index)
+        previous.add_extracted_route(None)
+        flight_plan_record.add_extracted_route(extracted_route)
+
+    def shift_flight_plan_record(self, previous, offset_message, delta):
+        # type: (FlightPlanRecord, str | None, int) -> FlightPlanRecord
+        """Creates a copy of a flight plan record holding the F22 fields of a message with all field,
+        subfield and error indices shifted; the extracted route of an F22 flight plan record is relative
+        to the F22 field 15 and is moved to the copy unchanged.
+
+        :param previous: The F22 flight plan record to copy;
+        :param offset_message: The message the copy indexes if offset storage is used, None otherwise;
+        :param delta: The number of characters field 22 has moved in the message;
+        :return: A copy of 'previous' with all indices shifted by 'delta'
+        """
+        shifted = copy.copy(previous)
+        shifted.icao_fields = {}
+        shifted.erroneous_fields = []
+        shifted.set_offset_message(offset_message)
+        for field_identifier, field in previous.icao_fields.items():
+            shifted.add_icao_field(field_identifier,
+                                   field.get_field_text(),
+                                   field.get_start_index() + delta,
+                                   field.get_end_index() + delta)
+            self.copy_subfields(shifted, field_identifier, field, delta)
+        for error_record in previous.get_erroneous_fields():
+            shifted.add_erroneous_field(error_record.get_field_text(),
+                                        error_record.get_error_message(),
+                                        error_record.get_start_index() + delta,
+                                        error_record.get_end_index() + delta)
+        if previous.get_f22_flight_plan() is not None:
+            shifted.set_f22_flight_plan(
+                self.shift_flight_plan_record(previous.get_f22_flight_plan(), offset_message, delta))
+        return shifted
@@ -0,0 +1,351 @@
+import math
+from array import array
+from collections.abc import Hashable, Iterable
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+
+
+class RouteSpatialIndex:
+    """This class is a spatial index over the routes of parsed messages used to find the messages
+    whose route passes through an area, given as a latitude / longitude box or a polygon.
+
+    A route is the sequence of line segments joining the consecutive points in an extracted route
+    sequence that have a valid latitude / longitude; points without a position are skipped. The segments
+    are straight lines in latitude / longitude, a segment crossing the anti-meridian is split at the
+    anti-meridian. Each route is stored with a message id given by the caller, any hashable value can be
+    used as a message id, (e.g. the index of the message in a batch, a database key, etc.).
+
+    The index is a uniform grid of cells of cell_size degrees; every cell a route passes through
+    holds the message id. A query looks up the cells overlapping the area, the messages in cells entirely
+    inside a box are returned without further checks, all other messages found are checked exactly
+    against their route segments. Inserting and deleting a route only changes the cells the route passes
+    through."""
+
+    cell_size: float = 1.0
+    """The size of a grid cell in degrees"""
+
+    number_of_columns: int = 360
+    """The number of grid cells around a circle of latitude"""
+
+    cells: dict = None
+    """The message ids in each grid cell, keyed on the cell number, each value is a set of message ids"""
+
+    routes: dict = None
+    """The routes keyed on message id, each value is a tuple containing the route segments as an array of
+    latitude / longitude pairs, (four values per segment), and a tuple of the cell numbers of the route"""
+
+    def __init__(self, cell_size=1.0):
+        # type: (float) -> None
+        """Constructor for an empty spatial index.
+
+        :param cell_size: The size of a grid cell in degrees, smaller cells give faster queries for
+               small areas at the cost of more memory and slower inserts;
+        :return: None
+        """
+        if cell_size <= 0.0:
+            raise ValueError("The cell size must be greater than zero")
+        self.cell_size = cell_size
+        self.number_of_columns = int(math.ceil(360.0 / cell_size))
+        self.cells = {}
+        self.routes = {}
+
+    def __contains__(self, message_id):
+        # type: (Hashable) -> bool
+        return message_id in self.routes
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.routes)
+
+    def bulk_load(self, flight_plan_records):
+        # type: (Iterable[(Hashable, FlightPlanRecord)]) -> int
+        """Inserts the routes of a batch of flight plan records, see insert().
+
+        :param flight_plan_records: An iterable of tuples containing a message id and a flight plan record;
+        :return: The number of routes inserted
+        """
+        count = 0
+        for message_id, flight_plan_record in flight_plan_records:
+            self.insert(message_id, flight_plan_record)
+            count += 1
+        return count
+
+    def insert(self, message_id, flight_plan_record):
+        # type: (Hashable, FlightPlanRecord) -> None
+        """Inserts the route extracted from field 15 of a flight plan record, a record without an
+        extracted route is inserted with an empty route. A route already stored with the message id
+        is replaced.
+
+        :param message_id: The message id returned by queries for this route;
+        :param flight_plan_record: A flight plan record populated by the message parser;
+        :return: None
+        """
+        self.insert_route(message_id, flight_plan_record.get_extracted_route())
+
+    def insert_route(self, message_id, ers):
+        # type: (Hashable, ExtractedRouteSequence | None) -> None
+        """Inserts the route of an extracted route sequence, see insert().
+
+        :param message_id: The message id returned by queries for this route;
+        :param ers: An extracted route sequence or None;
+        :return: None
+        """
+        latitudes = []
+        longitudes = []
+        if ers is not None:
+            for record in ers.get_all_elements():
+                if record.is_lat_long_valid():
+                    latitudes.append(record.get_latitude())
+                    longitudes.append(record.get_longitude())
+        self.insert_points(message_id, latitudes, longitudes)
+
+    def insert_points(self, message_id, latitudes, longitudes):
+        # type: (Hashable, [float], [float]) -> None
+        """Inserts a route given as the latitudes and longitudes of its points, see insert().
+
+        :param message_id: The message id returned by queries for this route;
+        :param latitudes: The point latitudes in decimal degrees;
+        :param longitudes: The point longitudes in decimal degrees;
+        :return: None
+        """
+        if message_id in self.routes:
+            self.delete(message_id)
+        segments = array("d")
+        if len(latitudes) == 1:
+            # A single point is stored as a segment of zero length
+            segments.extend((latitudes[0], longitudes[0], latitudes[0], longitudes[0]))
+        for idx in range(1, len(latitudes)):
+            self.add_segment(segments, latitudes[idx - 1], longitudes[idx - 1], latitudes[idx], longitudes[idx])
+
+        route_cells = set()
+        for idx in range(0, len(segments), 4):
+            self.segment_cells(route_cells, segments[idx], segments[idx + 1], segments[idx + 2], segments[idx + 3])
+        cells = self.cells
+        for cell in route_cells:
+            message_ids = cells.get(cell)
+            if message_ids is None:
+                cells[cell] = {message_id}
+            else:
+                message_ids.add(message_id)
+        self.routes[message_id] = (segments, tuple(route_cells))
+
+    def delete(self, message_id):
+        # type: (Hashable) -> bool
+        """Deletes a route.
+
+        :param message_id: The message id of the route;
+        :return: True if the route was deleted, False if there is no route with the message id
+        """
+        route = self.routes.pop(message_id, None)
+        if route is None:
+            return False
+        for cell in route[1]:
+            message_ids = self.cells[cell]
+            message_ids.discard(message_id)
+            if len(message_ids) == 0:
+                del self.cells[cell]
+        return True
+
+    def query_box(self, min_latitude, min_longitude, max_latitude, max_longitude):
+        # type: (float, float, float, float) -> set
+        """Finds the routes passing through a latitude / longitude box; a box with a minimum longitude
+        greater than its maximum longitude crosses the anti-meridian.
+
+        :param min_latitude: The southern edge of the box;
+        :param min_longitude: The western edge of the box;
+        :param max_latitude: The northern edge of the box;
+        :param max_longitude: The eastern edge of the box;
+        :return: A set containing the message ids of the routes passing through the box
+        """
+        if min_longitude > max_longitude:
+            return self.query_box(min_latitude, min_longitude, max_latitude, 180.0) | \
+                self.query_box(min_latitude, -180.0, max_latitude, max_longitude)
+
+        found = set()
+        candidates = set()
+        first_row, first_column = self.cell_of(min_latitude, min_longitude)
+        last_row, last_column = self.cell_of(max_latitude, max_longitude)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                message_ids = self.cells.get(row * self.number_of_columns + column)
+                if message_ids is None:
+                    continue
+                if first_row < row < last_row and first_column < column < last_column:
+                    # The cell is entirely inside the box
+                    found |= message_ids
+                else:
+                    candidates |= message_ids
+
+        for message_id in candidates - found:
+            segments = self.routes[message_id][0]
+            for idx in range(0, len(segments), 4):
+                if self.segment_intersects_box(segments[idx], segments[idx + 1], segments[idx + 2], segments[idx + 3],
+                                               min_latitude, min_longitude, max_latitude, max_longitude):
+                    found.add(message_id)
+                    break
+        return found
+
+    def query_polygon(self, polygon):
+        # type: ([(float, float)]) -> set
+        """Finds the routes passing through a polygon, (e.g. an airspace sector). The polygon edges
+        are straight lines in latitude / longitude and must not cross the anti-meridian.
+
+        :param polygon: A list of the polygon vertices as latitude / longitude tuples, the polygon
+               is closed from the last vertex to the first;
+        :return: A set containing the message ids of the routes passing through the polygon
+        """
+        if len(polygon) < 3:
+            raise ValueError("A polygon requires at least three vertices")
+        min_latitude = min(vertex[0] for vertex in polygon)
+        max_latitude = max(vertex[0] for vertex in polygon)
+        min_longitude = min(vertex[1] for vertex in polygon)
+        max_longitude = max(vertex[1] for vertex in polygon)
+
+        found = set()
+        for message_id in self.query_box(min_latitude, min_longitude, max_latitude, max_longitude):
+            segments = self.routes[message_id][0]
+            for idx in range(0, len(segments), 4):
+                if self.segment_intersects_polygon(
+                        segments[idx], segments[idx + 1], segments[idx + 2], segments[idx + 3], polygon):
+                    found.add(message_id)
+                    break
+        return found
+
+    def cell_of(self, latitude, longitude):
+        # type: (float, float) -> (int, int)
+        """Gets the grid row and column of a position.
+
+        :param latitude: The latitude in decimal degrees;
+        :param longitude: The longitude in decimal degrees;
+        :return: A tuple containing the row and column
+        """
+        row = int((min(max(latitude, -90.0), 90.0) + 90.0) / self.cell_size)
+        column = int((min(max(longitude, -180.0), 180.0) + 180.0) / self.cell_size)
+        return row, min(column, self.number_of_columns - 1)
+
+    def segment_cells(self, route_cells, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (set, float, float, float, float) -> None
+        """Adds the cells a segment passes through to a set of cells; the segment is divided into pieces
+        shorter than a cell and the cells each piece passes through are added.
+
+        :param route_cells: The set of cell numbers the cells are added to;
+        :param latitude_1: The latitude of the segment start;
+        :param longitude_1: The longitude of the segment start;
+        :param latitude_2: The latitude of the segment end;
+        :param longitude_2: The longitude of the segment end;
+        :return: None
+        """
+        pieces = int(max(abs(latitude_2 - latitude_1), abs(longitude_2 - longitude_1)) / self.cell_size) + 1
+        row, column = self.cell_of(latitude_1, longitude_1)
+        route_cells.add(row * self.number_of_columns + column)
+        for piece in range(1, pieces + 1):
+            fraction = piece / pieces
+            next_row, next_column = self.cell_of(latitude_1 + (latitude_2 - latitude_1) * fraction,
+                                                 longitude_1 + (longitude_2 - longitude_1) * fraction)
+            route_cells.add(next_row * self.number_of_columns + next_column)
+            if next_row != row and next_column != column:
+                # A piece is shorter than a cell, it passes through at most one of the two other cells
+                # in the rows and columns it spans
+                for cell_row, cell_column in ((row, next_column), (next_row, column)):
+                    if self.segment_intersects_box(
+                            latitude_1, longitude_1, latitude_2, longitude_2,
+                            cell_row * self.cell_size - 90.0, cell_column * self.cell_size - 180.0,
+                            (cell_row + 1) * self.cell_size - 90.0, (cell_column + 1) * self.cell_size - 180.0):
+                        route_cells.add(cell_row * self.number_of_columns + cell_column)
+            row, column = next_row, next_column
+
+    @staticmethod
+    def add_segment(segments, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (array, float, float, float, float) -> None
+        """Adds a segment between two points to an array of segments, a segment crossing the anti-meridian
+        is split into two segments at the anti-meridian.
+
+        :param segments: The array of segments;
+        :param latitude_1: The latitude of the first point;
+        :param longitude_1: The longitude of the first point;
+        :param latitude_2: The latitude of the second point;
+        :param longitude_2: The longitude of the second point;
+        :return: None
+        """
+        if abs(longitude_2 - longitude_1) <= 180.0:
+            segments.extend((latitude_1, longitude_1, latitude_2, longitude_2))
+            return
+        # Shift the second point by 360 degrees to get a continuous longitude, then split at +/-180
+        edge = 180.0 if longitude_1 > 0.0 else -180.0
+        shifted = longitude_2 + 2.0 * edge
+        latitude = latitude_1 + (latitude_2 - latitude_1) * (edge - longitude_1) / (shifted - longitude_1)
+        segments.extend((latitude_1, longitude_1, latitude, edge))
+        segments.extend((latitude, -edge, latitude_2, longitude_2))
+
+    @staticmethod
+    def segment_intersects_box(latitude_1, longitude_1, latitude_2, longitude_2,
+                               min_latitude, min_longitude, max_latitude, max_longitude):
+        # type: (float, float, float, float, float, float, float, float) -> bool
+        """Checks if a segment intersects a box using Liang-Barsky line clipping.
+
+        :return: True if any part of the segment is inside the box, False otherwise
+        """
+        start = 0.0
+        end = 1.0
+        delta_latitude = latitude_2 - latitude_1
+        delta_longitude = longitude_2 - longitude_1
+        for p, q in ((-delta_longitude, longitude_1 - min_longitude), (delta_longitude, max_longitude - longitude_1),
+                     (-delta_latitude, latitude_1 - min_latitude), (delta_latitude, max_latitude - latitude_1)):
+            if p == 0.0:
+                if q < 0.0:
+                    return False
+            else:
+                t = q / p
+                if p < 0.0:
+                    if t > end:
+                        return False
+                    start = max(start, t)
+                else:
+                    if t < start:
+                        return False
+                    end = min(end, t)
+        return True
+
+    @staticmethod
+    def segment_intersects_polygon(latitude_1, longitude_1, latitude_2, longitude_2, polygon):
+        # type: (float, float, float, float, [(float, float)]) -> bool
+        """Checks if a segment intersects a polygon, i.e. the segment starts inside the polygon or
+        crosses one of its edges.
+
+        :return: True if any part of the segment is inside the polygon, False otherwise
+        """
+        # Ray casting test for the segment start
+        inside = False
+        previous = polygon[-1]
+        for vertex in polygon:
+            if (vertex[0] > latitude_1) != (previous[0] > latitude_1) and \
+                    longitude_1 < (previous[1] - vertex[1]) * (latitude_1 - vertex[0]) / \
+                    (previous[0] - vertex[0]) + vertex[1]:
+                inside = not inside
+            previous = vertex
+        if inside:
+            return True
+
+        def orientation(a_lat, a_lon, b_lat, b_lon, c_lat, c_lon):
+            value = (b_lon - a_lon) * (c_lat - a_lat) - (b_lat - a_lat) * (c_lon - a_lon)
+            return (value > 0.0) - (value < 0.0)
+
+        def on_segment(a_lat, a_lon, b_lat, b_lon, c_lat, c_lon):
+            return min(a_lat, b_lat) <= c_lat <= max(a_lat, b_lat) and min(a_lon, b_lon) <= c_lon <= max(a_lon, b_lon)
+
+        previous = polygon[-1]
+        for vertex in polygon:
+            o1 = orientation(latitude_1, longitude_1, latitude_2, longitude_2, previous[0], previous[1])
+            o2 = orientation(latitude_1, longitude_1, latitude_2, longitude_2, vertex[0], vertex[1])
+            o3 = orientation(previous[0], previous[1], vertex[0], vertex[1], latitude_1, longitude_1)
+            o4 = orientation(previous[0], previous[1], vertex[0], vertex[1], latitude_2, longitude_2)
+            if o1 != o2 and o3 != o4:
+                return True
+            if (o1 == 0 and on_segment(latitude_1, longitude_1, latitude_2, longitude_2, previous[0], previous[1])) or \
+                    (o2 == 0 and on_segment(latitude_1, longitude_1, latitude_2, longitude_2, vertex[0], vertex[1])) or \
+                    (o3 == 0 and on_segment(previous[0], previous[1], vertex[0], vertex[1], latitude_1, longitude_1)) or \
+                    (o4 == 0 and on_segment(previous[0], previous[1], vertex[0], vertex[1], latitude_2, longitude_2)):
+                return True
+            previous = vertex
+        return False
@@ -0,0 +1,79 @@
+import re
+
+from Configuration.EnumerationConstants import MessageTypes, MessageTitles, AdjacentUnits
+from Configuration.FieldsInMessage import FieldsInMessage
+from Configuration.MessageDescription import MessageDescription
+from Tokenizer.Tokens import Tokens
+
+
+class ShortOldiParser:
+    """This class is the fast path used by ParseMessage.parse_message() for the short, high frequency
+    OLDI messages, i.e. LAM, ACP, ABI, ACT, REV, MAC and SBY, (see ParseMessage.parse_short_oldi()).
+    These messages are a handful of fields and arrive far more often than flight plans; the generic
+    path establishes the message type with several regular expressions, splits the header from the
+    body, tokenizes the message a character at a time and looks up the message description.
+
+    A short OLDI message without a header, i.e. a complete message of the form '(TTTSS/RR001...-...-...)',
+    is recognised with a single match; the match gives the message title and the fields are located
+    with a single scan yielding the same tokens as the generic tokenizer. The message descriptions of
+    the short titles are read once from the FieldsInMessage OLDI definitions for every adjacent unit.
+    Any other message, e.g. with a header, line breaks or an empty field, is left to the generic path.
+
+    The instance is read only and can be shared by several message parsers and threads."""
+
+    TITLES: (MessageTitles,) = (MessageTitles.LAM, MessageTitles.ACP, MessageTitles.ABI, MessageTitles.ACT,
+                                MessageTitles.REV, MessageTitles.MAC, MessageTitles.SBY)
+    """The message titles parsed by the fast path"""
+
+    MESSAGE_SYNTAX: re.Pattern = re.compile(
+        "[(](?P<title>" + "|".join(title.name for title in TITLES) + ")"
+        "[A-Z]{1,4}/[A-Z]{1,4}[0-9]{1,3}[^-()\r\n\t]*(?:-[^-()\r\n\t]+)*[)]")
+    """The layout of a complete short OLDI message, F3a followed by F3b and the remaining fields separated
+    by hyphens; F3b makes an ACP an OLDI message, (see ParseMessage.set_message_type())"""
+
+    FIELD_SYNTAX: re.Pattern = re.compile("[^-()\r\n\t]+")
+    """The fields of a message, the same as tokenizing the message body with the whitespace
+    '()-\\r\\n\\t', (see ParseMessage.parse_oldi())"""
+
+    message_descriptions: {(AdjacentUnits, MessageTitles): MessageDescription} = None
+    """The message descriptions of the short OLDI titles keyed on the adjacent unit and message title"""
+
+    def __init__(self, fim):
+        # type: (FieldsInMessage) -> None
+        """Constructor reading the message descriptions of the short OLDI titles.
+
+        :param fim: Configuration data defining the fields in a message for all message titles;
+        :return: None
+        """
+        self.message_descriptions = {}
+        for adjacent_unit in AdjacentUnits:
+            for message_title in self.TITLES:
+                md = fim.get_message_content(MessageTypes.OLDI, adjacent_unit, message_title)
+                if md is not None:
+                    self.message_descriptions[(adjacent_unit, message_title)] = md
+
+    def get_message_description(self, adjacent_unit, message_title):
+        # type: (AdjacentUnits, MessageTitles) -> MessageDescription | None
+        """Returns the message description of a short OLDI message.
+
+        :param adjacent_unit: The sending adjacent unit;
+        :param message_title: The message title;
+        :return: The message description or None if the adjacent unit does not define the message title
+        """
+        return self.message_descriptions.get((adjacent_unit, message_title))
+
+    def tokenize(self, message):
+        # type: (str) -> (MessageTitles, Tokens) | None
+        """Recognises a short OLDI message and locates its fields.
+
+        :param message: The complete message;
+        :return: The message title and the fields of the message as tokens, or None if the message
+                 is not a well-formed short OLDI message and must be parsed by the generic path
+        """
+        match = self.MESSAGE_SYNTAX.fullmatch(message)
+        if match is None:
+            return None
+        tokens = Tokens()
+        for field in self.FIELD_SYNTAX.finditer(message):
+            tokens.create_append_token(field.group(), field.start(), field.end())
+        return MessageTitles[match.group("title")], tokens
@@ -0,0 +1,332 @@
+import re
+from abc import ABC, abstractmethod
+
+from Configuration.ErrorMessages import ErrorMessages
+from Configuration.EnumerationConstants import ErrorId
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, SubFieldRecord
+from IcaoMessageParser.Utils import Utils
+
+
+class SubFieldValidator(ABC):
+    """This class is the base class of the validators of the subfields of the compound fields 18 and 19,
+    (see ParseFieldsCommon.validate_subfields()). A validator is created once per subfield identifier
+    when a compound field parser is first used, holds the compiled syntax of the subfield and the errors
+    it reports, and is shared by all field parsers and threads, (it holds no state while validating).
+
+    The error messages are read from a single ErrorMessages instance shared by all validators."""
+
+    ERROR_MESSAGES: ErrorMessages = ErrorMessages()
+    """The error messages shared by all validators"""
+
+    TOKEN_PATTERN: re.Pattern = re.compile("[^ /ntr]+|/")
+    """Splits a subfield into the same tokens as Tokenize with the whitespace ' /n/t/r' used by the
+    compound field subfield parsers, (a '/' is a token)"""
+
+    error_id: ErrorId = None
+    """The error reported when the subfield syntax is invalid"""
+
+    too_many_error_id: ErrorId | None = None
+    """The error reported when the subfield contains more than one token, None if it can contain several"""
+
+    def __init__(self, error_id, too_many_error_id=None):
+        # type: (ErrorId, ErrorId | None) -> None
+        """Constructor for a subfield validator.
+
+        :param error_id: The error reported when the subfield syntax is invalid;
+        :param too_many_error_id: The error reported when the subfield contains more than one token,
+               None if the number of tokens is not checked;
+        :return: None
+        """
+        self.error_id = error_id
+        self.too_many_error_id = too_many_error_id
+
+    def add_error(self, flight_plan_record, erroneous_field_text, start_index, end_index, error_id):
+        # type: (FlightPlanRecord, str, int, int, ErrorId) -> None
+        """Adds an error to the flight plan record.
+
+        :param flight_plan_record: The flight plan into which the error is written;
+        :param erroneous_field_text: The text in error;
+        :param start_index: Zero based start index of the text in error in the message;
+        :param end_index: Zero based end index of the text in error in the message;
+        :param error_id: The error reported;
+        :return: None
+        """
+        Utils.add_error(flight_plan_record, erroneous_field_text, start_index, end_index,
+                        self.ERROR_MESSAGES, error_id)
+
+    def add_subfield_error(self, flight_plan_record, subfield, error_id):
+        # type: (FlightPlanRecord, SubFieldRecord, ErrorId) -> None
+        """Adds an error for the whole subfield to the flight plan record.
+
+        :param flight_plan_record: The flight plan into which the error is written;
+        :param subfield: The subfield in error;
+        :param error_id: The error reported;
+        :return: None
+        """
+        self.add_error(flight_plan_record, subfield.get_field_text(), subfield.get_start_index(),
+                       subfield.get_end_index(), error_id)
+
+    def check_too_many_fields(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> bool
+        """Checks that the subfield contains a single token if the number of tokens is checked,
+        (see Utils.check_too_many_fields()).
+
+        :param flight_plan_record: The flight plan into which an error may be written;
+        :param subfield: The subfield being validated;
+        :return: True if the subfield can be validated, False if it contains too many tokens
+        """
+        if self.too_many_error_id is not None and len(subfield.get_field_text().split()) > 1:
+            self.add_subfield_error(flight_plan_record, subfield, self.too_many_error_id)
+            return False
+        return True
+
+    @abstractmethod
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        """Validates a subfield, adding any errors found to the flight plan record; every validator
+        implements this method.
+
+        :param flight_plan_record: The flight plan into which an error may be written;
+        :param subfield: The subfield being validated;
+        :return: None
+        """
+
+
+class SyntaxValidator(SubFieldValidator):
+    """Validates that the whole text of a subfield conforms to a regular expression,
+    (see Utils.parse_for_regexp()), optionally after checking the subfield length and the number of tokens."""
+
+    pattern: re.Pattern = None
+    """The compiled subfield syntax"""
+
+    strip: bool = False
+    """True if leading and trailing whitespace is removed before matching the syntax"""
+
+    minimum_length: int = 0
+    """The minimum length of the subfield text, shorter subfields are reported but still validated"""
+
+    too_short_error_id: ErrorId | None = None
+    """The error reported when the subfield text is shorter than the minimum length"""
+
+    def __init__(self, error_id, regexp, too_many_error_id=None, strip=False, minimum_length=0,
+                 too_short_error_id=None):
+        # type: (ErrorId, str, ErrorId | None, bool, int, ErrorId | None) -> None
+        """Constructor for a syntax validator.
+
+        :param error_id: The error reported when the subfield does not match the syntax;
+        :param regexp: The subfield syntax;
+        :param too_many_error_id: The error reported when the subfield contains more than one token;
+        :param strip: True to remove leading and trailing whitespace before matching the syntax;
+        :param minimum_length: The minimum length of the subfield text;
+        :param too_short_error_id: The error reported when the subfield text is too short;
+        :return: None
+        """
+        super().__init__(error_id, too_many_error_id)
+        self.pattern = re.compile(regexp)
+        self.strip = strip
+        self.minimum_length = minimum_length
+        self.too_short_error_id = too_short_error_id
+
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        text = subfield.get_field_text()
+        if len(text) < self.minimum_length:
+            self.add_subfield_error(flight_plan_record, subfield, self.too_short_error_id)
+        if not self.check_too_many_fields(flight_plan_record, subfield):
+            return
+        if self.pattern.fullmatch(text.strip() if self.strip else text) is None:
+            self.add_subfield_error(flight_plan_record, subfield, self.error_id)
+
+
+class TokenSyntaxValidator(SubFieldValidator):
+    """Validates that each token of a subfield conforms to a regular expression, an error is reported
+    for each token in error."""
+
+    pattern: re.Pattern = None
+    """The compiled token syntax"""
+
+    def __init__(self, error_id, regexp):
+        # type: (ErrorId, str) -> None
+        """Constructor for a token syntax validator.
+
+        :param error_id: The error reported for a token not matching the syntax;
+        :param regexp: The token syntax;
+        :return: None
+        """
+        super().__init__(error_id)
+        self.pattern = re.compile(regexp)
+
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        offset = subfield.get_start_index()
+        for token in self.TOKEN_PATTERN.finditer(subfield.get_field_text()):
+            if self.pattern.fullmatch(token.group()) is None:
+                self.add_error(flight_plan_record, token.group(), token.start() + offset, token.end() + offset,
+                               self.error_id)
+
+
+class PointTimeValidator(SubFieldValidator):
+    """Validates subfields consisting of a point followed by a time in HHMM format, e.g. the
+    field 18 DLE and EET subfields. The last 4 characters are the time, the rest is a point of any kind,
+    i.e. PRP, latitude/longitude or bearing distance. The subfield is either a single point / time or,
+    if tokenized, one or more point / time tokens."""
+
+    point_pattern: re.Pattern = None
+    """The compiled point syntax"""
+
+    time_pattern: re.Pattern = None
+    """The compiled time syntax"""
+
+    time_error_id: ErrorId = None
+    """The error reported when a time is invalid"""
+
+    tokenized: bool = False
+    """True if the subfield contains one or more point / time tokens"""
+
+    minimum_length: int = 0
+    """The minimum length of a single point / time subfield"""
+
+    too_short_error_id: ErrorId | None = None
+    """The error reported when a single point / time subfield is too short"""
+
+    def __init__(self, point_error_id, time_error_id, point_pattern, time_pattern, tokenized=False,
+                 too_many_error_id=None, minimum_length=0, too_short_error_id=None):
+        # type: (ErrorId, ErrorId, re.Pattern, re.Pattern, bool, ErrorId | None, int, ErrorId | None) -> None
+        """Constructor for a point / time validator.
+
+        :param point_error_id: The error reported when a point is invalid;
+        :param time_error_id: The error reported when a time is invalid;
+        :param point_pattern: The compiled point syntax;
+        :param time_pattern: The compiled time syntax;
+        :param tokenized: True if the subfield contains one or more point / time tokens;
+        :param too_many_error_id: The error reported when a single point / time subfield contains
+               more than one token;
+        :param minimum_length: The minimum length of a single point / time subfield;
+        :param too_short_error_id: The error reported when a single point / time subfield is too short;
+        :return: None
+        """
+        super().__init__(point_error_id, too_many_error_id)
+        self.time_error_id = time_error_id
+        self.point_pattern = point_pattern
+        self.time_pattern = time_pattern
+        self.tokenized = tokenized
+        self.minimum_length = minimum_length
+        self.too_short_error_id = too_short_error_id
+
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        offset = subfield.get_start_index()
+        if self.tokenized:
+            for token in self.TOKEN_PATTERN.finditer(subfield.get_field_text()):
+                self.validate_point_time(flight_plan_record, token.group(), token.start() + offset)
+            return
+
+        if len(subfield.get_field_text()) < self.minimum_length:
+            self.add_subfield_error(flight_plan_record, subfield, self.too_short_error_id)
+            return
+        if not self.check_too_many_fields(flight_plan_record, subfield):
+            return
+        self.validate_point_time(flight_plan_record, subfield.get_field_text(), offset)
+
+    def validate_point_time(self, flight_plan_record, text, start_index):
+        # type: (FlightPlanRecord, str, int) -> None
+        """Validates the point and the time of a point / time text.
+
+        :param flight_plan_record: The flight plan into which an error may be written;
+        :param text: The point / time text;
+        :param start_index: Zero based index of the text in the message;
+        :return: None
+        """
+        split_index = max(len(text) - 4, 0)
+        if self.point_pattern.fullmatch(text[0:split_index]) is None:
+            self.add_error(flight_plan_record, text[0:split_index], start_index, start_index + split_index,
+                           self.error_id)
+        if self.time_pattern.fullmatch(text[split_index:]) is None:
+            self.add_error(flight_plan_record, text[split_index:], start_index + split_index,
+                           start_index + len(text), self.time_error_id)
+
+
+class DateOfFlightValidator(SubFieldValidator):
+    """Validates that a subfield is a date of flight in YYMMDD format, (see Utils.is_dof())."""
+
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        if not Utils.is_dof(subfield.get_field_text()):
+            self.add_subfield_error(flight_plan_record, subfield, self.error_id)
+
+
+class IndicatorSetValidator(SyntaxValidator):
+    """Validates that a subfield is a set of single letter indicators, e.g. the field 19 'J', 'R' and 'S'
+    subfields; each indicator may be given once and at least one indicator must be given before the
+    subfield syntax is validated."""
+
+    indicators: str = ""
+    """The single letter indicators"""
+
+    def __init__(self, error_id, regexp, too_many_error_id, indicators):
+        # type: (ErrorId, str, ErrorId, str) -> None
+        """Constructor for an indicator set validator.
+
+        :param error_id: The error reported when the indicators are invalid;
+        :param regexp: The subfield syntax;
+        :param too_many_error_id: The error reported when the subfield contains more than one token;
+        :param indicators: The single letter indicators;
+        :return: None
+        """
+        super().__init__(error_id, "[ ]*" + regexp + "[ ]*", too_many_error_id)
+        self.indicators = indicators
+
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        if not self.check_too_many_fields(flight_plan_record, subfield):
+            return
+        text = subfield.get_field_text()
+        counts = [text.count(indicator) for indicator in self.indicators]
+        if max(counts) > 1 or sum(counts) == 0:
+            self.add_subfield_error(flight_plan_record, subfield, self.error_id)
+            return
+        if self.pattern.fullmatch(text) is None:
+            self.add_subfield_error(flight_plan_record, subfield, self.error_id)
+
+
+class DinghyValidator(SubFieldValidator):
+    """Validates the field 19 'D' subfield, the number of dinghies, their total capacity, an optional
+    'C' if they are covered and their colour, i.e. 3 or 4 tokens."""
+
+    TOKEN_SYNTAX: {int: ((ErrorId, re.Pattern),)} = {
+        3: ((ErrorId.F19_Da_SYNTAX, re.compile("[0-9]{1,2}")),
+            (ErrorId.F19_Db_SYNTAX, re.compile("[0-9]{1,3}")),
+            (ErrorId.F19_Dd_SYNTAX, re.compile("[A-Z]+"))),
+        4: ((ErrorId.F19_Da_SYNTAX, re.compile("[0-9]{1,2}")),
+            (ErrorId.F19_Db_SYNTAX, re.compile("[0-9]{1,3}")),
+            (ErrorId.F19_Dc_SYNTAX, re.compile("C")),
+            (ErrorId.F19_Dd_SYNTAX, re.compile("[A-Z]+")))}
+    """The error and syntax of each token keyed on the number of tokens, (the error_id attribute is the
+    error reported when the subfield contains fewer than 3 tokens)"""
+
+    def validate(self, flight_plan_record, subfield):
+        # type: (FlightPlanRecord, SubFieldRecord) -> None
+        text = subfield.get_field_text()
+        tokens = list(self.TOKEN_PATTERN.finditer(text))
+        if len(tokens) < 1:
+            # This gets picked up by the compound field parser
+            return
+
+        if len(tokens) < 3:
+            # The indices are relative to the subfield, the same as the original 'D' subfield parser
+            end_index = tokens[-1].end()
+            self.add_error(flight_plan_record, text[0:end_index], 0, end_index, self.error_id)
+            return
+
+        if len(tokens) > 4:
+            start_index = tokens[4].start()
+            end_index = tokens[-1].end()
+            self.add_error(flight_plan_record, text[start_index:end_index], start_index, end_index,
+                           self.too_many_error_id)
+            return
+
+        offset = subfield.get_start_index()
+        for token, (error_id, pattern) in zip(tokens, self.TOKEN_SYNTAX[len(tokens)]):
+            if pattern.fullmatch(token.group()) is None:
+                self.add_error(flight_plan_record, token.group(), token.start() + offset, token.end() + offset,
+                               error_id)
@@ -0,0 +1,293 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from Utilities.Utils import Utils
+
+
+class Trajectory:
+    """This class contains a 4D trajectory derived from an extracted route sequence (ERS); the
+    trajectory comprises the ERS points with a valid latitude / longitude stored as NumPy arrays,
+    one array element per point:
+        - point_indices: The index of the point in the ERS;
+        - latitudes, longitudes: The point coordinates in decimal degrees;
+        - levels: The level at the point in meters;
+        - speeds: The speed flown from the point to the next point in meters / second;
+        - distances: The distance from the previous point in meters, 0 for the first point;
+        - cumulative_distances: The distance along the route from the first point in meters;
+        - elapsed_times: The estimated time over the point in seconds from the time origin.
+
+    The time origin is the EOBT, (F13b) in seconds since midnight, it is 0 if the EOBT is unknown.
+    The elapsed time over the first point is 0; the time to fly a segment is the segment distance
+    divided by the speed at the start of the segment, a STAY time at a point is added to the time
+    of all subsequent points. If a segment has no speed the elapsed time of all subsequent points is
+    NaN.
+
+    Trajectories are built by the TrajectoryBuilder class; this class requires NumPy."""
+
+    names: [str] = []
+    """The ERS point names, e.g. 5030N01000E"""
+
+    point_indices = None
+    """The index of each point in the ERS as a NumPy integer array"""
+
+    latitudes = None
+    """The point latitudes in decimal degrees as a NumPy array"""
+
+    longitudes = None
+    """The point longitudes in decimal degrees as a NumPy array"""
+
+    levels = None
+    """The level at each point in meters as a NumPy array"""
+
+    speeds = None
+    """The speed from each point to the next point in meters / second as a NumPy array"""
+
+    distances = None
+    """The distance from the previous point in meters as a NumPy array"""
+
+    cumulative_distances = None
+    """The distance along the route in meters as a NumPy array"""
+
+    elapsed_times = None
+    """The estimated elapsed time over each point in seconds from the time origin as a NumPy array"""
+
+    time_origin: int = 0
+    """The EOBT in seconds since midnight, 0 if the EOBT is unknown"""
+
+    def get_number_of_points(self):
+        # type: () -> int
+        """Gets the number of points in the trajectory
+        :return: The number of points"""
+        return len(self.names)
+
+    def get_time_over_points(self):
+        # type: () -> numpy.ndarray
+        """Gets the estimated time over each point in seconds since midnight of the EOBT day, i.e.
+        the elapsed times offset by the time origin.
+        :return: A NumPy array of times in seconds"""
+        return self.elapsed_times + self.time_origin
+
+    def get_total_distance(self):
+        # type: () -> float
+        """Gets the distance along the route from the first to the last point
+        :return: The distance in meters, 0 if there are less than two points"""
+        if len(self.names) == 0:
+            return 0.0
+        return float(self.cumulative_distances[-1])
+
+    def get_total_time(self):
+        # type: () -> float
+        """Gets the estimated elapsed time from the first to the last point
+        :return: The time in seconds, 0 if there are less than two points"""
+        if len(self.names) == 0:
+            return 0.0
+        return float(self.elapsed_times[-1])
+
+
+class ResampledTrajectory:
+    """This class contains a trajectory resampled at a fixed time step, see TrajectoryBuilder.resample();
+    positions, levels and distances between the trajectory points are linearly interpolated in time.
+    All members are NumPy arrays with one element per sample."""
+
+    times = None
+    """The sample times in seconds since midnight of the EOBT day"""
+
+    latitudes = None
+    """The interpolated latitudes in decimal degrees"""
+
+    longitudes = None
+    """The interpolated longitudes in decimal degrees"""
+
+    levels = None
+    """The interpolated levels in meters"""
+
+    cumulative_distances = None
+    """The interpolated distance along the route in meters"""
+
+
+class TrajectoryBuilder:
+    """This class builds 4D trajectories from extracted route sequences, see the Trajectory class, and
+    resamples trajectories at a fixed time step. All calculations are vectorised over all points of a
+    route; resample_batch() resamples a batch of trajectories with a single interpolation.
+
+    This class requires NumPy, an ImportError is raised when an instance is created if NumPy is not
+    installed. The class contains no state and is thread safe."""
+
+    def __init__(self):
+        """Constructor, checks NumPy is available."""
+        if numpy is None:
+            raise ImportError("The trajectory calculation requires NumPy")
+
+    def build(self, ers, eobt=None):
+        # type: (ExtractedRouteSequence, str | None) -> Trajectory
+        """Builds the trajectory for an extracted route sequence.
+
+        :param ers: The extracted route sequence;
+        :param eobt: The EOBT in HHMM format, (e.g. from F13b) or None if unknown;
+        :return: The trajectory of the ERS points that have a valid latitude / longitude
+        """
+        # Extract all point data in a single pass over the ERS records
+        records = ers.get_all_elements()
+        columns = numpy.array([(idx, record.latitude, record.longitude, record.altitude_si, record.speed_si,
+                                record.stay_time * 60, record.distance)
+                               for idx, record in enumerate(records) if record.lat_long_valid],
+                              dtype=numpy.float64).reshape(-1, 7)
+        trajectory = Trajectory()
+        trajectory.time_origin = self.eobt_to_seconds(eobt)
+        trajectory.point_indices = columns[:, 0].astype(numpy.int64)
+        trajectory.names = [records[idx].get_name() for idx in trajectory.point_indices.tolist()]
+        trajectory.latitudes = columns[:, 1]
+        trajectory.longitudes = columns[:, 2]
+        trajectory.levels = columns[:, 3]
+        trajectory.speeds = columns[:, 4]
+        stay_times = columns[:, 5]
+        points = len(trajectory.names)
+
+        # The parser stores the distance to the next point with a valid latitude / longitude at the
+        # first point; points separated by more than one connector have no distance stored.
+        stored = columns[:-1, 6].copy()
+        for segment in numpy.flatnonzero(stored == 0.0):
+            if trajectory.latitudes[segment] != trajectory.latitudes[segment + 1] or \
+                    trajectory.longitudes[segment] != trajectory.longitudes[segment + 1]:
+                stored[segment] = Utils().get_bearing_distance_between_points(
+                    trajectory.latitudes[segment], trajectory.longitudes[segment],
+                    trajectory.latitudes[segment + 1], trajectory.longitudes[segment + 1])[1]
+        trajectory.distances = numpy.concatenate((numpy.zeros(min(1, points)), stored))
+        trajectory.cumulative_distances = numpy.cumsum(trajectory.distances)
+
+        # Segment times, a segment flown without a speed has no time
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            segment_times = numpy.where(trajectory.speeds[:-1] > 0.0,
+                                        stored / trajectory.speeds[:-1], numpy.nan) + stay_times[:-1]
+        trajectory.elapsed_times = numpy.concatenate((numpy.zeros(min(1, points)), numpy.cumsum(segment_times)))
+        return trajectory
+
+    def build_flight_plan(self, flight_plan_record):
+        # type: (FlightPlanRecord) -> Trajectory | None
+        """Builds the trajectory for the extracted route of a flight plan record using the EOBT
+        from F13b as the time origin.
+
+        :param flight_plan_record: A parsed flight plan record;
+        :return: The trajectory or None if the flight plan record has no extracted route
+        """
+        ers = flight_plan_record.get_extracted_route()
+        if ers is None:
+            return None
+        eobt = flight_plan_record.get_icao_subfield(FieldIdentifiers.F13, SubFieldIdentifiers.F13b)
+        return self.build(ers, None if eobt is None else eobt.get_field_text())
+
+    def build_batch(self, flight_plan_records):
+        # type: ([FlightPlanRecord]) -> [Trajectory]
+        """Builds the trajectories for a batch of flight plan records, see build_flight_plan();
+        flight plan records without an extracted route are skipped.
+
+        :param flight_plan_records: An iterable of parsed flight plan records;
+        :return: A list of trajectories
+        """
+        trajectories = []
+        for flight_plan_record in flight_plan_records:
+            trajectory = self.build_flight_plan(flight_plan_record)
+            if trajectory is not None:
+                trajectories.append(trajectory)
+        return trajectories
+
+    def resample(self, trajectory, time_step):
+        # type: (Trajectory, float) -> ResampledTrajectory
+        """Resamples a trajectory at a fixed time step from the time over the first point to the
+        time over the last point; see resample_batch().
+
+        :param trajectory: The trajectory to resample;
+        :param time_step: The time step in seconds;
+        :return: The resampled trajectory
+        """
+        return self.resample_batch([trajectory], time_step)[0]
+
+    def resample_batch(self, trajectories, time_step):
+        # type: ([Trajectory], float) -> [ResampledTrajectory]
+        """Resamples a batch of trajectories at a fixed time step, each trajectory is sampled from the
+        time over its first point to the time over its last point. The positions, levels and distances
+        are linearly interpolated in time; positions are interpolated in latitude / longitude which is
+        adequate for the short distances between route points at typical time steps.
+
+        All trajectories are resampled by a single interpolation; the trajectories are laid end to end
+        on one time axis, each trajectory shifted beyond the end of the previous trajectory. Samples
+        are only taken up to the first point with an unknown (NaN) elapsed time.
+
+        :param trajectories: A list of trajectories to resample;
+        :param time_step: The time step in seconds, must be greater than 0;
+        :return: A list of resampled trajectories, one per trajectory
+        """
+        if time_step <= 0:
+            raise ValueError("The time step must be greater than 0")
+
+        # The points with a known time and the samples of each trajectory
+        known = [self.known_points(trajectory) for trajectory in trajectories]
+        sample_counts = [0 if count == 0 else int(trajectory.elapsed_times[count - 1] // time_step) + 1
+                         for trajectory, count in zip(trajectories, known)]
+
+        # Shift each trajectory beyond the end of the previous trajectory
+        shifts = numpy.zeros(len(trajectories))
+        end = 0.0
+        for idx, (trajectory, count) in enumerate(zip(trajectories, known)):
+            shifts[idx] = end
+            if count > 0:
+                end += trajectory.elapsed_times[count - 1] + 2 * time_step
+        point_counts = numpy.array(known, dtype=numpy.int64)
+        times = numpy.concatenate([trajectory.elapsed_times[:count] for trajectory, count in zip(trajectories, known)]
+                                  + [numpy.zeros(0)]) + numpy.repeat(shifts, point_counts)
+        sample_times = numpy.concatenate([numpy.arange(count) * time_step for count in sample_counts]
+                                         + [numpy.zeros(0)])
+        shifted_sample_times = sample_times + numpy.repeat(shifts, sample_counts)
+
+        def interpolate(attribute):
+            values = numpy.concatenate([getattr(trajectory, attribute)[:count]
+                                        for trajectory, count in zip(trajectories, known)] + [numpy.zeros(0)])
+            if len(values) == 0:
+                return numpy.zeros(0)
+            return numpy.interp(shifted_sample_times, times, values)
+
+        latitudes = interpolate("latitudes")
+        longitudes = interpolate("longitudes")
+        levels = interpolate("levels")
+        cumulative_distances = interpolate("cumulative_distances")
+
+        resampled_trajectories = []
+        offsets = numpy.concatenate(([0], numpy.cumsum(sample_counts)))
+        for idx, trajectory in enumerate(trajectories):
+            samples = slice(offsets[idx], offsets[idx + 1])
+            resampled = ResampledTrajectory()
+            resampled.times = sample_times[samples] + trajectory.time_origin
+            resampled.latitudes = latitudes[samples]
+            resampled.longitudes = longitudes[samples]
+            resampled.levels = levels[samples]
+            resampled.cumulative_distances = cumulative_distances[samples]
+            resampled_trajectories.append(resampled)
+        return resampled_trajectories
+
+    @staticmethod
+    def known_points(trajectory):
+        # type: (Trajectory) -> int
+        """Gets the number of points from the start of a trajectory with a known elapsed time.
+
+        :param trajectory: The trajectory;
+        :return: The number of points before the first point with an unknown (NaN) time
+        """
+        unknown = numpy.flatnonzero(numpy.isnan(trajectory.elapsed_times))
+        return len(trajectory.elapsed_times) if len(unknown) == 0 else int(unknown[0])
+
+    @staticmethod
+    def eobt_to_seconds(eobt):
+        # type: (str | None) -> int
+        """Converts an EOBT in HHMM format to seconds since midnight.
+
+        :param eobt: The EOBT in HHMM format or None;
+        :return: The EOBT in seconds, 0 if the EOBT is None or not in HHMM format
+        """
+        if eobt is None or len(eobt) != 4 or not eobt.isdigit():
+            return 0
+        return (int(eobt[0:2]) * 60 + int(eobt[2:4])) * 60
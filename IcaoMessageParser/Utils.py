@@ -217,7 +217,4 @@ class Utils:
             :param f3: A string containing a message title;
             :return: An enumeration instance of MessageTitles or None if the message
                      title is not defined / supported."""
-        for title in MessageTitles:
-            if title.name == f3:
-                return title
-        return None
+        return MessageTitles.__members__.get(f3)
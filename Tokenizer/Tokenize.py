@@ -1,3 +1,5 @@
+import re
+
 from Tokenizer.Tokens import Tokens
 
 
@@ -6,9 +8,13 @@ class Tokenize:
     whitespace characters, storing each token along with its location where it was
     found in the input string (a tokens start and end index in the source string). The
     individual tokens along with their associated attributes are stored in a 'Tokens'
-    class instance. """
+    class instance.
+
+    The input can also be given as bytes, (e.g. IA-5 / ASCII text as received from an AFTN
+    interface), as a bytearray or a memoryview; token start and end indices are then byte
+    offsets into the input and only the token text is decoded."""
 
-    string_to_tokenize: str = ""
+    string_to_tokenize: str | bytes | bytearray | memoryview = ""
     """The input string containing the tokens to be extracted"""
 
     whitespace: str = ""
@@ -34,6 +40,9 @@ class Tokenize:
         A string given as "E1 E2 E3" will yield 3 tokens using the default whitespace character set.
 
             :return: None"""
+        if isinstance(self.string_to_tokenize, (bytes, bytearray, memoryview)):
+            self.__tokenize_bytes()
+            return
         self.tokens = Tokens()
         idx = 0
         token_text = ""
@@ -52,15 +61,16 @@ class Tokenize:
         self.__save_token(token_text, idx)
 
     def set_string_to_tokenize(self, string_to_tokenize=""):
-        # type: (str) -> None
+        # type: (str | bytes | bytearray | memoryview) -> None
         """Sets a string to tokenize
 
-            :param string_to_tokenize: A string that will be tokenized by this class;
+            :param string_to_tokenize: A string that will be tokenized by this class, may also be
+                   given as bytes, a bytearray or a memoryview;
             :return: None"""
         self.string_to_tokenize = string_to_tokenize
 
     def get_string_to_tokenize(self):
-        # type: () -> str
+        # type: () -> str | bytes | bytearray | memoryview
         """Retrieves the string that has been tokenized.
 
             :return: The string that was tokenized;"""
@@ -93,6 +103,25 @@ class Tokenize:
             :return: A list containing zero or more Token classes"""
         return self.tokens
 
+    def __tokenize_bytes(self):
+        # type: () -> None
+        """Tokenizes a bytes like input; the tokens are identical to those produced from the
+        equivalent string. The input is not decoded as a whole, the tokens are located in the
+        bytes directly and only the text of each token is decoded. Bytes are decoded as
+        'latin-1' that maps each byte to exactly one character, token indices are therefore
+        byte offsets into the input.
+
+            :return: None"""
+        self.tokens = Tokens()
+        if len(self.whitespace) == 0:
+            pattern = b"(?s).+"
+        else:
+            pattern = b"[^" + re.escape(self.whitespace.encode("latin-1")) + b"]+"
+            if "/" in self.whitespace:
+                pattern = pattern + b"|/"
+        for match in re.finditer(pattern, self.string_to_tokenize):
+            self.tokens.create_append_token(match.group().decode("latin-1"), match.start(), match.end())
+
     def __save_token(self, token_text, idx):
         # type: (str, int) -> None
         """Save a token to a local token attribute.
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from F15_Parser.AirwayDatabase import AirwayDatabase
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class TestAirwayDatabase(unittest.TestCase):
+
+    csv_text: str = "airway,point,latitude,longitude\n" \
+                    "UL607,KOK,51.0944,2.6528\n" \
+                    "UL607,ABLAN,50.5,5.0\n" \
+                    "UL607,DINKI,49.5,8.0\n" \
+                    "UL607,LNZ,48.2325,14.1094\n" \
+                    "UL607,SASAL,48.0,16.0\n" \
+                    "B9,LNZ\n" \
+                    "B9,ERNAS\n" \
+                    "B9,TIROL\n"
+    """A small airway database in CSV format"""
+
+    def test_expand(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "airways.csv")
+            with open(csv_file, "w") as file:
+                file.write(self.csv_text)
+            database = AirwayDatabase.load_csv(csv_file)
+        self.assertEqual(2, database.get_number_of_airways())
+        self.assertEqual(["LNZ", "ERNAS", "TIROL"], database.get_airway("B9"))
+        self.assertEqual([], database.get_airway("Q1"))
+        self.assertTrue(database.is_point_on_airway("UL607", "LNZ"))
+        self.assertFalse(database.is_point_on_airway("UL607", "TIROL"))
+
+        self.assertEqual(["KOK", "ABLAN", "DINKI", "LNZ"],
+                         [point[0] for point in database.expand("UL607", "KOK", "LNZ")])
+        # Flown in the opposite direction
+        self.assertEqual(["SASAL", "LNZ", "DINKI"],
+                         [point[0] for point in database.expand("UL607", "SASAL", "DINKI")])
+        self.assertEqual((("TIROL", 0.0, 0.0, False), ("ERNAS", 0.0, 0.0, False)),
+                         database.expand("B9", "TIROL", "ERNAS"))
+        self.assertIsNone(database.expand("UL607", "KOK", "TIROL"))
+        self.assertIsNone(database.expand("Q1", "KOK", "LNZ"))
+
+        # Expansions are cached, the airways or points not found are not
+        self.assertEqual(3, database.get_number_of_cached_expansions())
+        self.assertIs(database.expand("UL607", "KOK", "LNZ"), database.expand("UL607", "KOK", "LNZ"))
+        database.add_point("B9", "ELMEM")
+        self.assertEqual(0, database.get_number_of_cached_expansions())
+
+    def test_expansion_cache_bounded(self):
+        database = AirwayDatabase.read_csv_lines(self.csv_text.splitlines())
+        database.MAXIMUM_CACHED_EXPANSIONS = 4
+        points = database.get_airway("UL607")
+        for entry in points:
+            for exit_point in points:
+                self.assertEqual(entry, database.expand("UL607", entry, exit_point)[0][0])
+                self.assertLessEqual(database.get_number_of_cached_expansions(), 4)
+        for idx in range(0, 100):
+            self.assertIsNone(database.expand("Q" + str(idx), "KOK", "LNZ"))
+            self.assertIsNone(database.expand("UL607", "KOK", "X" + str(idx)))
+        self.assertLessEqual(database.get_number_of_cached_expansions(), 4)
+
+    def test_expand_ers(self):
+        database = AirwayDatabase.read_csv_lines(self.csv_text.splitlines())
+        flight_plan_record = FlightPlanRecord()
+        ParseMessage().parse_message(
+            flight_plan_record, "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 KOK UL607 LNZ/N0460F370 B9 "
+                                "TIROL UL607 XYZ Q1 ABC-EKCH0200-0)")
+        ers = flight_plan_record.get_extracted_route()
+        expanded = database.expand_ers(ers)
+
+        names = [record.get_name() for record in expanded.get_all_elements()]
+        self.assertEqual(["ADEP", "KOK", "UL607", "ABLAN", "DINKI", "LNZ", "B9", "ERNAS", "TIROL",
+                          "UL607", "XYZ", "Q1", "ABC", "ADES"], names)
+        # The ERS given is not changed
+        self.assertEqual(11, ers.get_number_of_elements())
+        self.assertFalse(ers.get_element_at(1).is_lat_long_valid())
+
+        ablan = expanded.get_element_at(3)
+        self.assertIs(TokenBaseType.F15_POINT, ablan.get_base_type())
+        self.assertIs(TokenSubType.F15_SB_PRP, ablan.get_sub_type())
+        self.assertEqual(expanded.get_element_at(2).get_start_index(), ablan.get_start_index())
+        self.assertEqual("N0450", ablan.get_speed())
+        self.assertEqual("N0460", expanded.get_element_at(7).get_speed())
+
+        # Positions are assigned from the airway database, distances between consecutive points
+        for idx in [1, 3, 4]:
+            self.assertTrue(expanded.get_element_at(idx).is_lat_long_valid())
+            self.assertGreater(expanded.get_element_at(idx).get_distance(), 0)
+        self.assertTrue(expanded.get_element_at(5).is_lat_long_valid())
+        self.assertGreater(expanded.get_element_at(1).get_distance(), 150000)
+        self.assertLess(expanded.get_element_at(1).get_distance(), 200000)
+        self.assertFalse(expanded.get_element_at(7).is_lat_long_valid())
+
+        self.assertEqual(["The point 'TIROL' is not on the ATS route it is connected to",
+                          "The point 'XYZ' is not on the ATS route it is connected to",
+                          "The ATS route 'Q1' is not in the airway database"],
+                         [error.get_error_text() for error in expanded.get_all_errors()])
+        self.assertEqual(0, ers.get_number_of_errors())
+
+
+if __name__ == '__main__':
+    unittest.main()
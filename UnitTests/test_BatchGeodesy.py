@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from F15_Parser.NavigationDatabase import NavigationDatabase, NavigationPointTypes
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Utilities.BatchGeodesy import GeodesyBatch, VectorGeodesy
+from Utilities.Utils import Utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestBatchGeodesy(unittest.TestCase):
+
+    messages: [str] = [
+        "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 LOWW ABLAN UL607 LNZ DCT LNZ180060 DCT "
+        "5100N00300E 52N004E DCT 5100N00300E090100-EKCH0200-0)",
+        "(FPL-TEST02-IS-B738/M-S/C-LOWW0800-N0450F350 4620N07805W/N0450F350 PNT B9 LNZ DCT 4620N07805W-EGLL0200-0)",
+        "(CHG-TEST03-EGLL0800-LOWW0200-221012-15/N0450F350 5030N01000E LNZ045999 5130N01100E-8/IS)",
+    ]
+    """Messages with lat/long, named and point / bearing / distance points"""
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_same_as_geographiclib(self):
+        generator = random.Random(7)
+        pairs = [(generator.uniform(-89.9, 89.9), generator.uniform(-180, 180),
+                  generator.uniform(-89.9, 89.9), generator.uniform(-180, 180)) for _ in range(2000)]
+        pairs += [(lat, lon, max(-89.9, min(89.9, lat + generator.uniform(-2, 2))), lon + generator.uniform(-2, 2))
+                  for lat, lon, _, _ in pairs[:500]]
+        # Nearly antipodal, coincident, equatorial, polar and anti-meridian crossing points
+        pairs += [(0, 0, 0.5, 179.7), (0, 0, 0, 179.5), (10, 20, 10, 20), (0, 0, 0, 10),
+                  (90, 0, 80, 10), (10, 179.5, 11, -179.5), (38.5129, 24.5199, -38.5239, -154.9795)]
+        # Nearly antipodal points for which the iteration converges
+        pairs += [(lat, lon, max(-89.9, min(89.9, generator.uniform(-1, 1) - lat)),
+                   lon + 180 + generator.uniform(-3, 3)) for lat, lon, _, _ in pairs[:500]]
+        azimuths, distances = VectorGeodesy.inverse(*zip(*pairs))
+        for idx, pair in enumerate(pairs):
+            expected = Utils().get_bearing_distance_between_points(*pair)
+            self.assertLess(abs((azimuths[idx] - expected[0] + 180) % 360 - 180), VectorGeodesy.AZIMUTH_TOLERANCE, pair)
+            self.assertLess(abs(distances[idx] - expected[1]), VectorGeodesy.DISTANCE_TOLERANCE, pair)
+
+        projections = [(generator.uniform(-89.9, 89.9), generator.uniform(-180, 180), generator.uniform(-180, 180),
+                        generator.uniform(0, 2e7)) for _ in range(2000)]
+        latitudes, longitudes = VectorGeodesy.direct(*zip(*projections))
+        for idx, projection in enumerate(projections):
+            expected = Utils().get_bearing_distance_projected_point(*projection)
+            self.assertLess(abs(latitudes[idx] - expected[0]), VectorGeodesy.POSITION_TOLERANCE, projection)
+            self.assertLess(abs((longitudes[idx] - expected[1] + 180) % 360 - 180),
+                            VectorGeodesy.POSITION_TOLERANCE, projection)
+
+    def test_deferred_same_as_immediate(self):
+        database = NavigationDatabase.from_points([
+            ("LNZ", NavigationPointTypes.NAVAID, 48.2325, 14.1094),
+            ("ABLAN", NavigationPointTypes.SIGNIFICANT_POINT, 47.5, 13.5),
+            ("LOWW", NavigationPointTypes.AERODROME, 48.1103, 16.5697)])
+        immediate_parser = ParseMessage()
+        immediate_parser.set_navigation_database(database)
+        batch = GeodesyBatch()
+        deferred_parser = ParseMessage()
+        deferred_parser.set_navigation_database(database)
+        deferred_parser.set_geodesy_batch(batch)
+        self.assertIs(batch, deferred_parser.get_geodesy_batch())
+
+        immediate = []
+        deferred = []
+        for message in self.messages:
+            immediate.append(FlightPlanRecord())
+            immediate_parser.parse_message(immediate[-1], message)
+            deferred.append(FlightPlanRecord())
+            deferred_parser.parse_message(deferred[-1], message)
+
+        # Nothing is calculated until the batch is computed
+        self.assertEqual(3, batch.get_number_of_projections())
+        self.assertEqual(9, batch.get_number_of_azimuth_distances())
+        self.assertEqual(0.0, self.get_route(deferred[0]).get_element_at(1).get_distance())
+        self.assertEqual(12, batch.compute())
+        self.assertEqual(0, batch.get_number_of_projections())
+        self.assertEqual(0, batch.get_number_of_azimuth_distances())
+
+        for expected_fpr, actual_fpr in zip(immediate, deferred):
+            self.assertEqual(0, self.get_route(actual_fpr).get_number_of_errors())
+            expected_elements = self.get_route(expected_fpr).get_all_elements()
+            actual_elements = self.get_route(actual_fpr).get_all_elements()
+            self.assertEqual(len(expected_elements), len(actual_elements))
+            for expected, actual in zip(expected_elements, actual_elements):
+                self.assertEqual(expected.get_name(), actual.get_name())
+                self.assertEqual(expected.is_lat_long_valid(), actual.is_lat_long_valid())
+                self.assertAlmostEqual(expected.get_latitude(), actual.get_latitude(), delta=1e-8)
+                self.assertAlmostEqual(expected.get_longitude(), actual.get_longitude(), delta=1e-8)
+                self.assertAlmostEqual(expected.get_bearing(), actual.get_bearing(), delta=1e-7)
+                self.assertAlmostEqual(expected.get_distance(), actual.get_distance(), delta=1e-3)
+
+    @staticmethod
+    def get_route(fpr):
+        # The route of a CHG message is in the field 22 flight plan
+        if fpr.get_extracted_route() is None:
+            return fpr.get_f22_flight_plan().get_extracted_route()
+        return fpr.get_extracted_route()
+
+
+if __name__ == '__main__':
+    unittest.main()
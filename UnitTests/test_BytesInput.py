@@ -0,0 +1,63 @@
+import pickle
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Tokenizer.Tokenize import Tokenize
+
+
+class BytesInputTest(unittest.TestCase):
+
+    def test_tokenize_bytes(self):
+        for whitespace in [" \n\t\r", " /\n\t\r", "()-\r\n\t", ""]:
+            for text in ["(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT/N0450F350 B9 LNZ-EGLL0200-0)",
+                         " A/B//C  D\n", "", "///"]:
+                expected = self.tokenize(text, whitespace)
+                self.assertEqual(expected, self.tokenize(text.encode("ascii"), whitespace))
+                self.assertEqual(expected, self.tokenize(bytearray(text.encode("ascii")), whitespace))
+                self.assertEqual(expected, self.tokenize(memoryview(text.encode("ascii")), whitespace))
+
+    def test_parse_bytes(self):
+        message = "FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n" \
+                  "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 B9 LNZ-EGLL0200-STS/HOSP)"
+        expected = FlightPlanRecord()
+        ParseMessage().parse_message(expected, message)
+        self.assertIsNone(expected.get_message_bytes())
+
+        for message_bytes in [message.encode("ascii"), bytearray(message.encode("ascii")),
+                              memoryview(message.encode("ascii"))]:
+            fpr = FlightPlanRecord()
+            ParseMessage().parse_message(fpr, message_bytes)
+            self.assertEqual(expected.as_xml(), fpr.as_xml())
+            self.assertEqual(expected.get_all_errors(), fpr.get_all_errors())
+            self.assertEqual(message.encode("ascii"), fpr.get_message_bytes())
+            self.assertIsInstance(fpr.get_message_bytes(), bytes)
+
+            # Indices are byte offsets into the message as received
+            field_record = fpr.get_icao_field(FieldIdentifiers.F9)
+            self.assertEqual(b"B737/M", bytes(message_bytes[field_record.get_start_index():
+                                                             field_record.get_end_index()]))
+
+        unpickled = pickle.loads(pickle.dumps(fpr))
+        self.assertEqual(message.encode("ascii"), unpickled.get_message_bytes())
+        self.assertEqual(fpr.as_xml(), unpickled.as_xml())
+
+    def test_parse_bytes_errors(self):
+        fpr = FlightPlanRecord()
+        self.assertFalse(ParseMessage().parse_message(fpr, b"123456789"))
+        self.assertEqual("Message is too short and cannot be considered for processing",
+                         fpr.get_erroneous_fields()[0].get_error_message())
+
+    @staticmethod
+    def tokenize(text, whitespace):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(whitespace)
+        tokenizer.set_string_to_tokenize(text)
+        tokenizer.tokenize()
+        return [(token.get_token_string(), token.get_token_start_index(), token.get_token_end_index())
+                for token in tokenizer.get_tokens().get_tokens()]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import random
+import unittest
+
+from F15_Parser.ColumnarRouteSequence import ColumnarRouteSequence
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.F15TokenSyntaxDescriptions import TokenSubType
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class TestColumnarRouteSequence(unittest.TestCase):
+
+    routes: [str] = ["N0450F350 LNZ UL607 KOK DCT 5220N01030W DCT PNT180060 C/ABC/M082F390F410 XYZ",
+                     "N0450F350 SID1A PNT VFR ABC DEF IFR LNZ/N0450F350 B9 KOK STAY1/0130 STAR1A",
+                     "N0450F350 PNT B9 VFR ABCDEFGHIJKLMNOPQ IFR KOK/N0450F350 C/PNT",
+                     "K0800S1130 PNT 52N010W 5220N $%^&"]
+    """Field 15 texts including errors, breaks, stay times and cruise climbs"""
+
+    def test_conversion_both_ways(self):
+        for route in self.routes:
+            ers = self.parse(route)
+            columnar = ColumnarRouteSequence.from_ers(ers)
+            self.assertEqual(ers.get_number_of_elements(), columnar.get_number_of_elements())
+            self.assertEqual(ers.get_number_of_errors(), columnar.get_number_of_errors())
+            self.assertEqual(ers.get_derived_flight_rules(), columnar.get_derived_flight_rules())
+            self.assertEqual(ers.as_xml(), columnar.as_xml(), route)
+
+            converted = columnar.to_ers()
+            self.assertEqual(ers.__getstate__(), converted.__getstate__(), route)
+            for record, view in zip(ers.get_all_elements() + ers.get_all_errors(),
+                                    columnar.get_all_elements() + columnar.get_all_errors()):
+                self.assertEqual(record.to_string(True), view.to_string(True))
+                for attribute in ExtractedRouteRecord.STATE_ATTRIBUTES:
+                    getter = {"string": "get_name", "lat_long_valid": "is_lat_long_valid"}.get(
+                        attribute, "get_" + attribute)
+                    self.assertEqual(getattr(record, getter)(), getattr(view, getter)())
+                    self.assertIs(type(getattr(record, getter)()), type(getattr(view, getter)()))
+
+    def test_strings_interned(self):
+        first = ColumnarRouteSequence.from_ers(self.parse(self.routes[0]))
+        second = ColumnarRouteSequence.from_ers(self.parse(self.routes[0]))
+        self.assertIs(first.get_element_at(1).get_name(), second.get_element_at(1).get_name())
+        self.assertIs(first.get_element_at(1).get_speed(), second.get_element_at(1).get_speed())
+
+    def test_views(self):
+        columnar = ColumnarRouteSequence.from_ers(self.parse(self.routes[0]))
+        self.assertEqual("ADEP", columnar.get_first_element().get_name())
+        self.assertEqual("ADES", columnar.get_last_element().get_name())
+        self.assertEqual("XYZ", columnar.get_previous_to_last_element().get_name())
+        self.assertIsNone(columnar.get_element_at(columnar.get_number_of_elements()))
+        self.assertEqual(columnar.get_element_at(1), columnar.get_all_elements()[1])
+
+        view = columnar.get_element_at(1)
+        self.assertEqual("LNZ", view.get_name())
+        self.assertIs(TokenSubType.F15_SB_PRP, view.get_sub_type())
+        view.set_name("LNZVOR")
+        view.set_speed_si(231.5)
+        view.set_lat_long_valid(True)
+        view.set_latitude(48.2325)
+        self.assertEqual("LNZVOR", columnar.get_element_at(1).get_name())
+        self.assertEqual(231.5, columnar.get_element_at(1).get_speed_si())
+        view.set_speed_si(232)
+        self.assertIs(int, type(columnar.get_element_at(1).get_speed_si()))
+        record = columnar.to_ers().get_element_at(1)
+        self.assertEqual(("LNZVOR", True, 48.2325), (record.get_name(), record.is_lat_long_valid(),
+                                                     record.get_latitude()))
+
+    def test_set_values(self):
+        ers = self.parse(self.routes[0])
+        columnar = ColumnarRouteSequence.from_ers(ers)
+        states = [list(record.__getstate__()) for record in ers.get_all_elements()]
+        generator = random.Random(37)
+        values = ["LNZ", "ABC", "", 0, 1, 70000, -5, 2 ** 40, 0.0, 1.5, -2.25, True, False, TokenSubType.F15_SB_PRP]
+        for _ in range(0, 2000):
+            index = generator.randrange(0, len(states))
+            member = generator.randrange(0, len(ExtractedRouteRecord.STATE_ATTRIBUTES))
+            value = generator.choice(values + [states[generator.randrange(0, len(states))][member]])
+            columnar.elements.set_value(index, member, value)
+            states[index][member] = value
+            stored = columnar.elements.get_value(index, member)
+            self.assertEqual(value, stored)
+            self.assertIs(value.__class__, stored.__class__)
+        self.assertEqual([tuple(state) for state in states], columnar.elements.get_states())
+
+    def test_set_values_in_place(self):
+        # Writing back the bearing of each point encodes the columns once, the other values are written in place
+        columnar = ColumnarRouteSequence.from_ers(self.parse(self.routes[0]))
+        data = []
+        for index, view in enumerate(columnar.get_all_elements()):
+            view.set_bearing(10.5 * index + 0.25)
+            view.set_name(columnar.get_first_element().get_name())
+            if len(data) == 0 or data[-1] is not columnar.elements.data:
+                data.append(columnar.elements.data)
+        self.assertEqual(1, len(data))
+        self.assertEqual([10.5 * index + 0.25 for index in range(0, columnar.get_number_of_elements())],
+                         [view.get_bearing() for view in columnar.get_all_elements()])
+        self.assertEqual({"ADEP"}, {view.get_name() for view in columnar.get_all_elements()})
+
+    @staticmethod
+    def parse(route):
+        flight_plan_record = FlightPlanRecord()
+        ParseMessage().parse_message(flight_plan_record,
+                                     "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-" + route + "-EKCH0200-0)")
+        return flight_plan_record.get_extracted_route()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import pickle
+import unittest
+
+from Configuration.EnumerationConstants import DifferenceTypes, FieldIdentifiers, SubFieldIdentifiers
+from IcaoMessageParser.CompareFlightPlans import CompareFlightPlans
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class CompareFlightPlansTest(unittest.TestCase):
+
+    message: str = "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200 EGGW-" \
+                   "STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND)"
+
+    def test_identical(self):
+        differences = CompareFlightPlans().compare(self.parse(self.message), self.parse(self.message))
+        self.assertFalse(differences.has_differences())
+        self.assertEqual([], differences.as_list())
+
+    def test_field_changed(self):
+        differences = CompareFlightPlans().compare(
+            self.parse(self.message), self.parse(self.message.replace("B737/M", "A320/H")))
+        self.assertEqual([["CHANGED", "F9", None, "B737/M", "A320/H"],
+                          ["CHANGED", "F9", "F9b", "B737", "A320"],
+                          ["CHANGED", "F9", "F9c", "M", "H"]], differences.as_list())
+        self.assertEqual(3, len(differences.get_field_differences(FieldIdentifiers.F9)))
+        self.assertEqual([], differences.get_route_differences())
+
+    def test_field_added_and_removed(self):
+        old = self.parse(self.message)
+        new = self.parse(self.message.replace("-STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND)", ")"))
+        differences = CompareFlightPlans().compare(old, new)
+        self.assertEqual(DifferenceTypes.REMOVED, differences.get_field_differences()[0].get_difference_type())
+        self.assertEqual(FieldIdentifiers.F18, differences.get_field_differences()[0].get_field_id())
+        self.assertEqual(1, len(differences.get_field_differences()))
+
+        differences = CompareFlightPlans().compare(new, old)
+        self.assertEqual([["ADDED", "F18", None, None, "STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND"]],
+                         differences.as_list())
+
+    def test_repeated_subfields_as_multiset(self):
+        # Reordering repeated STS/ and RMK/ subfields is not a difference in the subfields
+        old = self.parse(self.message)
+        new = self.parse(self.message.replace("STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND",
+                                              "RMK/SECOND STS/ATFMX DOF/221212 RMK/FIRST STS/HOSP"))
+        differences = CompareFlightPlans().compare(old, new)
+        self.assertEqual(1, len(differences.get_field_differences()))
+        self.assertIsNone(differences.get_field_differences()[0].get_subfield_id())
+
+        new = self.parse(self.message.replace("RMK/FIRST RMK/SECOND", "RMK/SECOND RMK/THIRD RMK/THIRD"))
+        differences = CompareFlightPlans().compare(old, new)
+        self.assertEqual([["CHANGED", "F18", None, "STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND",
+                           "STS/HOSP STS/ATFMX DOF/221212 RMK/SECOND RMK/THIRD RMK/THIRD"],
+                          ["REMOVED", "F18", "F18rmk", "FIRST", None],
+                          ["ADDED", "F18", "F18rmk", None, "THIRD"],
+                          ["ADDED", "F18", "F18rmk", None, "THIRD"]], differences.as_list())
+        self.assertIs(SubFieldIdentifiers.F18rmk, differences.get_field_differences()[1].get_subfield_id())
+
+    def test_route_differences(self):
+        old = self.parse(self.message)
+        new = self.parse(self.message.replace("PNT B9 LNZ", "PNT B9 KOK UL607 LNZ").replace("N0450F350", "N0460F350"))
+        differences = CompareFlightPlans().compare(old, new)
+        self.assertEqual([["CHANGED", "F15", None, "ADEP", "ADEP", 0, 0, ["speed", "speed_si"]],
+                          ["CHANGED", "F15", None, "PNT", "PNT", 1, 1, ["speed", "speed_si"]],
+                          ["CHANGED", "F15", None, "B9", "B9", 2, 2, ["speed", "speed_si"]],
+                          ["ADDED", "F15", None, None, "KOK", None, 3, []],
+                          ["ADDED", "F15", None, None, "UL607", None, 4, []],
+                          ["CHANGED", "F15", None, "LNZ", "LNZ", 3, 5, ["speed", "speed_si"]]],
+                         [difference.as_list() for difference in differences.get_route_differences()])
+
+        new = self.parse(self.message.replace("PNT B9 LNZ", "PNT"))
+        differences = CompareFlightPlans().compare(old, new)
+        self.assertEqual([["REMOVED", "B9", 2], ["REMOVED", "LNZ", 3]],
+                         [[d.get_difference_type().name, d.get_old_text(), d.get_old_index()]
+                          for d in differences.get_route_differences()])
+
+    def test_fields_in_new_only(self):
+        stored = self.parse(self.message)
+        chg = self.parse("(CHG-TEST01-LOWW0800-EGLL0200-221212-8/IS-9/A320/M)")
+        differences = CompareFlightPlans().compare(stored, chg.get_f22_flight_plan(), True)
+        self.assertEqual([["CHANGED", "F9", None, "B737/M", "A320/M"],
+                          ["CHANGED", "F9", "F9b", "B737", "A320"]], differences.as_list())
+
+    def test_serialisable(self):
+        differences = CompareFlightPlans().compare(
+            self.parse(self.message), self.parse(self.message.replace("PNT B9", "PNT DCT")))
+        self.assertTrue(differences.has_differences())
+        restored = pickle.loads(pickle.dumps(differences))
+        self.assertEqual(differences.as_list(), restored.as_list())
+        self.assertEqual(differences.as_xml(), restored.as_xml())
+        self.assertEqual(differences.as_list(), json.loads(json.dumps(differences.as_list())))
+
+    @staticmethod
+    def parse(message):
+        flight_plan_record = FlightPlanRecord()
+        ParseMessage().parse_message(flight_plan_record, message)
+        return flight_plan_record
+
+
+if __name__ == '__main__':
+    unittest.main()
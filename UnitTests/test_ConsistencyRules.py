@@ -0,0 +1,96 @@
+import unittest
+
+from Configuration.EnumerationConstants import MessageTitles, FieldIdentifiers, SubFieldIdentifiers, ErrorId
+from IcaoMessageParser.ConsistencyRules import ConsistencyRules, ConsistencyRule, ConsistencyFacts
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class TestConsistencyRules(unittest.TestCase):
+
+    def test_compiled_rules(self):
+        rules = ConsistencyRules()
+        self.assertEqual(11, len(rules.get_rules()))
+        for title in ConsistencyRules.TITLES:
+            self.assertEqual(rules.get_rules(), rules.get_rules(title))
+        self.assertEqual((), rules.get_rules(MessageTitles.CHG))
+        self.assertIsNone(rules.rules_by_title.get(MessageTitles.CHG))
+
+    def test_facts(self):
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, "(FPL-TEST01-IS-B737/M-DGRS/C-LOWW0800-N0450F350 AAA B9 BBB-"
+                                          "EDDF0200-PBN/A1B2 COM/TCAS)")
+        facts = ConsistencyFacts(fpr, ParseMessage.EM)
+        self.assertEqual({"S", "D", "G", "R"}, facts.f10a)
+        self.assertEqual({"A1", "B2"}, facts.pbn)
+        self.assertEqual({SubFieldIdentifiers.F18pbn, SubFieldIdentifiers.F18com}, facts.f18)
+
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 AAA B9 BBB-EDDF0200-0)")
+        facts = ConsistencyFacts(fpr, ParseMessage.EM)
+        self.assertEqual(set(), facts.pbn)
+        self.assertEqual(set(), facts.f18)
+
+    def test_register_rule(self):
+        message = "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 AAA B9 BBB-EDDF0200-0)"
+        rules = ConsistencyRules()
+        rules.register_rule(ConsistencyRule({MessageTitles.FPL}, (FieldIdentifiers.F7,),
+                                            lambda facts: SubFieldIdentifiers.F18typ in facts.f18,
+                                            "", ErrorId.CONSISTENCY_F9B_TYP))
+        self.assertEqual(12, len(rules.get_rules(MessageTitles.FPL)))
+        self.assertEqual(11, len(rules.get_rules(MessageTitles.CPL)))
+
+        pm = ParseMessage()
+        pm.set_consistency_rules(rules)
+        self.assertIs(rules, pm.get_consistency_rules())
+        fpr = FlightPlanRecord()
+        pm.parse_message(fpr, message)
+        self.assertEqual(1, len(fpr.get_erroneous_fields()))
+        self.assertEqual("Field 9b contains 'ZZZZ' and the field 18 'TYP' subfield is missing, enter a 'TYP' "
+                         "subfield in field 18.", fpr.get_erroneous_fields()[0].get_error_message())
+        self.assertFalse(pm.consistency_check(fpr))
+
+        # The rules of other message parsers are unchanged
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, message)
+        self.assertFalse(fpr.errors_detected())
+
+    def test_register_rule_on_one_parser(self):
+        message = "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 AAA B9 BBB-EDDF0200-0)"
+        rule = ConsistencyRule({MessageTitles.FPL}, (FieldIdentifiers.F7,),
+                               lambda facts: SubFieldIdentifiers.F18typ in facts.f18, "", ErrorId.CONSISTENCY_F9B_TYP)
+
+        # The default rules are shared by all message parsers and cannot be changed
+        pm = ParseMessage()
+        other = ParseMessage()
+        self.assertTrue(pm.get_consistency_rules().is_read_only())
+        self.assertRaises(ValueError, pm.get_consistency_rules().register_rule, rule)
+        self.assertEqual(11, len(other.get_consistency_rules().get_rules(MessageTitles.FPL)))
+
+        # Registering a rule with a parser copies the default rules
+        pm.register_consistency_rule(rule)
+        self.assertIsNot(pm.get_consistency_rules(), other.get_consistency_rules())
+        self.assertEqual(12, len(pm.get_consistency_rules().get_rules(MessageTitles.FPL)))
+        self.assertEqual(11, len(other.get_consistency_rules().get_rules(MessageTitles.FPL)))
+        self.assertEqual(11, len(ParseMessage().get_consistency_rules().get_rules(MessageTitles.FPL)))
+
+        fpr = FlightPlanRecord()
+        pm.parse_message(fpr, message)
+        self.assertEqual(1, len(fpr.get_erroneous_fields()))
+        fpr = FlightPlanRecord()
+        other.parse_message(fpr, message)
+        self.assertFalse(fpr.errors_detected())
+
+    def test_rule_not_applied(self):
+        # The required field is absent, the rule is not evaluated
+        rules = ConsistencyRules(())
+        rules.register_rule(ConsistencyRule({MessageTitles.FPL}, (FieldIdentifiers.F22,), lambda facts: False,
+                                            "", ErrorId.CONSISTENCY_F9B_TYP))
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 AAA B9 BBB-EDDF0200-0)")
+        self.assertTrue(rules.check(fpr, ParseMessage.EM))
+        self.assertFalse(fpr.errors_detected())
+
+
+if __name__ == '__main__':
+    unittest.main()
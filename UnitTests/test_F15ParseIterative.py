@@ -0,0 +1,74 @@
+import random
+import sys
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15ParseIterative import ParseF15Iterative
+from Tokenizer.Tokenize import Tokenize
+
+
+class TestParseF15Iterative(unittest.TestCase):
+
+    elements: [str] = [
+        "N0450F350", "M082F350", "K0800S1000", "N0450VFR", "/", "//", "PNT", "LNZ", "EGLL", "5220N",
+        "52N010W", "5220N01030W", "PNT180060", "5220N01030W180060", "B9", "UL607", "DCT", "VFR", "IFR",
+        "OAT", "GAT", "IFPSTOP", "IFPSTART", "STAY", "STAY1", "0130", "STAY1/0130", "C/PNT/N0450F350F390", "T", "C", "SID", "STAR", "KOK1A",
+        "LNZ1A", "N0450F350F390", "N0450F350PLUS", "ABCDEFGHIJKLMNOPQ", "$%^&", "F350"]
+    """Field 15 elements used to generate random field 15 texts"""
+
+    def test_iterative_same_as_recursive(self):
+        generator = random.Random(31)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 20000))
+        try:
+            for idx in range(0, 1500):
+                length = generator.randrange(1, 30)
+                f15 = " ".join(generator.choice(self.elements) for _ in range(length))
+                if generator.random() < 0.7:
+                    f15 = generator.choice(["N0450F350 ", "N0450VFR ", "M082F350 "]) + f15
+                self.do_compare_test(f15)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_iterative_same_as_recursive_examples(self):
+        for f15 in ["N0450F350 PNT B9 LNZ DCT 5220N01030W",
+                    "N0450F350 SID1A PNT VFR ABC DEF IFR LNZ/N0450F350 B9 KOK STAR1A",
+                    "N0450F350 PNT OAT XYZ GAT LNZ IFPSTOP ABC IFPSTART KOK",
+                    "N0450F350 PNT C/LNZ/N0450F350F390 KOK C/PNT/N0450F350PLUS T",
+                    "N0450F350 PNT STAY1/0130 LNZ VFR IFR PNT/N0450VFR ABC IFR KOK/M082F350",
+                    "N0450VFR PNT IFR LNZ/N0450F350 B9 5220N01030W B9 C C DCT C",
+                    "N0450F350 PNT B9 VFR ABCDEFGHIJKLMNOPQ IFR KOK/N0450F350 C/PNT",
+                    "N0450F350"]:
+            self.do_compare_test(f15)
+
+    def test_long_route(self):
+        # A route far longer than the recursion limit allows for the recursive parser
+        points = ["".join(chr(65 + (idx // 26 ** digit) % 26) for digit in range(0, 4)) for idx in range(0, 5000)]
+        f15 = "N0450F350 " + " ".join([point + " B" + str(idx % 99) for idx, point in enumerate(points)]) + \
+              " LNZ VFR " + " ".join(points) + " IFR LNZ/N0450F350 KOK"
+        ers = self.parse(ParseF15Iterative(), f15)
+        self.assertEqual(0, ers.get_number_of_errors())
+        self.assertEqual(10006, ers.get_number_of_elements())
+        self.assertEqual("KOK", ers.get_previous_to_last_element().get_name())
+        self.assertEqual("Y", ers.get_derived_flight_rules())
+
+    def do_compare_test(self, f15):
+        expected = self.parse(ParseF15(), f15)
+        actual = self.parse(ParseF15Iterative(), f15)
+        self.assertEqual(expected.as_xml(), actual.as_xml(), f15)
+        self.assertEqual(expected.__getstate__(), actual.__getstate__(), f15)
+
+    @staticmethod
+    def parse(parser, f15):
+        tokenizer = Tokenize()
+        tokenizer.set_string_to_tokenize(f15)
+        tokenizer.set_whitespace(" /\n\t\r")
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        parser.parse_f15(ers, tokenizer.get_tokens())
+        return ers
+
+
+if __name__ == '__main__':
+    unittest.main()
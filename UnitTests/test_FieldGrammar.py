@@ -0,0 +1,94 @@
+import importlib
+import random
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from Configuration.SubFieldsInFields import SubFieldsInFields
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+
+
+class TestFieldGrammar(unittest.TestCase):
+
+    fields: {str: [str]} = {
+        "F3": ["FPL", "FPLAA/BB001", "FPLAA/BB001CC/DD002", "FPL AA/BB001"],
+        "F5": ["INCERFA/EGLLZZZZ/TEXT MORE/TEXT", "ALERFA/ABCDEFGH/X", "DETRESFA/EGLLZZZZ/"],
+        "F7": ["TEST01", "TEST01/A1234", "ABC/C7777", "A/A 1234"],
+        "F8": ["IS", "I S", "VG"],
+        "F9": ["B738/M", "2B738/H", "12 A320/L", "123B738/M"],
+        "F10": ["DFGHIORWY/LB1", "N/N", "SDE3FGHIJ1J2J3J4J5RWXY/LB1D1"],
+        "F13": ["LOWW0800", "LOWW 0800"],
+        "F14": ["LNZ/1200F350", "LNZ/1200F350F310A", "5130N01000E/1200A040B", "LNZ/1200 F350",
+                "LNZ/1200F350 F310", "LNZ/1200F350F310"],
+        "F16": ["EKCH0200", "EKCH0200 EDDF", "EKCH0200 EDDF EDDM", "EKCH 0200 EDDF"],
+        "F17": ["EGLL1200", "EGLL1200 RMK TEXT/MORE"],
+        "F20": ["OPS PILOT 1200 121.5 LNZ RESCUE FUEL NIL"],
+        "F21": ["1200 121.5 LNZ 1300 ALL NIL", "1200 1215.55 5130N LNZ010020 0000 A B"],
+        "F80": ["S"],
+        "F81": ["W/EQ", "S/EQ/Y", "ADSB/NO/RW", "W/UN/"],
+    }
+    """Well-formed and erroneous fields mutated by the tests, keyed on the field identifier name"""
+
+    sfif: SubFieldsInFields = SubFieldsInFields()
+    """Configuration data defining the subfields in a field"""
+
+    sfd: SubFieldDescriptions = SubFieldDescriptions()
+    """Configuration data describing the syntax of the subfields"""
+
+    characters: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 /\n.-"
+    """The characters inserted into the mutated fields"""
+
+    def test_same_as_subfield_parser(self):
+        generator = random.Random(1)
+        for field, texts in self.fields.items():
+            parser = self.get_parser(field)
+            subfield_parser = type("Subfield" + parser.__name__, (parser,), {"FIELD_GRAMMAR": None})
+            for _ in range(500):
+                text = self.mutate(generator, generator.choice(texts))
+                expected = self.parse(subfield_parser, field, text)
+                actual = self.parse(parser, field, text)
+                self.assertEqual(expected.as_xml(), actual.as_xml(), field + " " + repr(text))
+                self.assertEqual(expected.get_message_title(), actual.get_message_title())
+
+    def test_well_formed_fields_are_not_tokenized(self):
+        for field, texts in self.fields.items():
+            parser = self.get_parser(field)(self.create_fpr(field, texts[0]), self.sfif, self.sfd)
+            self.assertIsNotNone(parser.get_field_grammar(), field)
+            parser.parse_field()
+            self.assertIsNone(parser.get_context().tokens, field)
+            self.assertFalse(parser.get_flight_plan_record().errors_detected())
+
+    def mutate(self, generator, text):
+        # Insert, delete, replace characters or insert whitespace at random positions
+        characters = list(text)
+        for _ in range(generator.randint(0, 3)):
+            operation = generator.randint(0, 3)
+            idx = generator.randint(0, len(characters))
+            if operation == 0:
+                characters.insert(idx, generator.choice(self.characters))
+            elif operation == 1 and len(characters) > 0:
+                del characters[min(idx, len(characters) - 1)]
+            elif operation == 2 and len(characters) > 0:
+                characters[min(idx, len(characters) - 1)] = generator.choice(self.characters)
+            else:
+                characters.insert(idx, " ")
+        return "".join(characters)
+
+    def parse(self, parser, field, text):
+        fpr = self.create_fpr(field, text)
+        parser(fpr, self.sfif, self.sfd).parse_field()
+        return fpr
+
+    @staticmethod
+    def create_fpr(field, text):
+        fpr = FlightPlanRecord()
+        fpr.add_icao_field(FieldIdentifiers[field], text, 10, 10 + len(text))
+        return fpr
+
+    @staticmethod
+    def get_parser(field):
+        return getattr(importlib.import_module("IcaoMessageParser.Parse" + field), "Parse" + field)
+
+
+if __name__ == '__main__':
+    unittest.main()
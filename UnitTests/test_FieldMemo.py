@@ -0,0 +1,94 @@
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FieldMemo import FieldMemo
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class TestFieldMemo(unittest.TestCase):
+
+    messages: [str] = [
+        "FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n"
+        "(FPL-TEST01-IS-B737/M-DFGHIORWY/LB1-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200 EGGW-STS/HOSP "
+        "DOF/221212 RMK/FIRST PBN/B1D1-E/0300 P/3)",
+        "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200)",
+        "(FPL-TEST03-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-STS/HOSP DOF/221212 RMK/FIRST)",
+        "(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 LNZ-8/IS-9/B738/M)",
+        "(ACT-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(FPL-TEST03-IX-B737/Q-S/C-LOWW08-N0450F350 PNT-EGLL0200-0-X-Y)",
+        "(FPL-TEST04-IX-B737/Q-S/C-LOWW08-N0450F350 PNT-EGLL0200-0-X-Y)",
+    ]
+    """Messages with and without errors sharing field texts at different positions"""
+
+    def test_same_as_without_memo(self):
+        parser = ParseMessage()
+        parser_with_memo = ParseMessage()
+        parser_with_memo.set_field_memo(FieldMemo())
+        # Parse the messages twice so that the second pass is rebuilt from the memo
+        for message in self.messages + self.messages:
+            expected = FlightPlanRecord()
+            parser.parse_message(expected, message)
+            actual = FlightPlanRecord()
+            parser_with_memo.parse_message(actual, message)
+            self.assertEqual(expected.as_xml(), actual.as_xml(), message)
+            self.assertEqual(expected.field_error_ranges, actual.field_error_ranges, message)
+        self.assertGreater(parser_with_memo.get_field_memo().get_hits(), 0)
+
+    def test_field_at_different_offsets(self):
+        # The same field 19 text at two different offsets, the 'D' errors are relative to the subfield
+        # and a field 19 whose errors are not within the field is not memoised
+        messages = ["(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0-"
+                    "E/0300 P/TGN R/E S/P/L D/1  C)",
+                    "(FPL-TEST0001-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0-"
+                    "E/0300 P/TGN R/E S/P/L D/1  C)",
+                    "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0-E/0300 P/TGN R/E)",
+                    "(FPL-TEST0001-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0-E/0300 P/TGN R/E)"]
+        parser = ParseMessage()
+        parser_with_memo = ParseMessage()
+        parser_with_memo.set_field_memo(FieldMemo())
+        for message in messages:
+            expected = FlightPlanRecord()
+            parser.parse_message(expected, message)
+            actual = FlightPlanRecord()
+            parser_with_memo.parse_message(actual, message)
+            self.assertEqual(expected.as_xml(), actual.as_xml(), message)
+            self.assertEqual(expected.field_error_ranges, actual.field_error_ranges, message)
+        self.assertEqual(1, parser_with_memo.get_field_memo().get_hits(FieldIdentifiers.F19))
+
+    def test_statistics(self):
+        memo = FieldMemo()
+        parser = ParseMessage()
+        parser.set_field_memo(memo)
+        parser.parse_message(FlightPlanRecord(), self.messages[1])
+        self.assertEqual(0, memo.get_hits())
+        self.assertEqual(0.0, memo.get_hit_rate())
+        parser.parse_message(FlightPlanRecord(), self.messages[2])
+        # F7 differs, F8, F9, F13, F15 text is the same
+        self.assertEqual(0, memo.get_hits(FieldIdentifiers.F7))
+        self.assertEqual(2, memo.get_misses(FieldIdentifiers.F7))
+        self.assertEqual(1, memo.get_hits(FieldIdentifiers.F8))
+        self.assertEqual(0.5, memo.get_hit_rate(FieldIdentifiers.F8))
+        self.assertEqual((1, 1, 0.5), memo.get_statistics()[FieldIdentifiers.F9])
+        # Fields 3 and 15 change the flight plan record, they are never memoised
+        self.assertNotIn(FieldIdentifiers.F3, memo.get_statistics())
+        self.assertNotIn(FieldIdentifiers.F15, memo.get_statistics())
+        memo.clear()
+        self.assertEqual(0, memo.get_size())
+        self.assertEqual(0, memo.get_misses())
+
+    def test_maximum_size(self):
+        self.assertRaises(ValueError, FieldMemo, 0)
+        memo = FieldMemo(2)
+        self.assertEqual(2, memo.get_maximum_size())
+        parser = ParseMessage()
+        parser.set_field_memo(memo)
+        parser.parse_message(FlightPlanRecord(), self.messages[1])
+        self.assertEqual(2, memo.get_size())
+        # The least recently used entries are discarded, F13 and F16 remain
+        self.assertIn((FieldIdentifiers.F16, "EGLL0200"), memo.entries)
+        self.assertIn((FieldIdentifiers.F13, "LOWW0800"), memo.entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
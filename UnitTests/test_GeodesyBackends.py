@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Utilities.GeodesyBackends import GeodesyBackend, EllipsoidalGeodesy, SphericalGeodesy
+from Utilities.Utils import Utils
+
+
+class TestGeodesyBackends(unittest.TestCase):
+
+    def test_spherical_maximum_error(self):
+        generator = random.Random(11)
+        spherical = SphericalGeodesy()
+        for _ in range(0, 5000):
+            latitude_1 = generator.uniform(-90, 90)
+            longitude_1 = generator.uniform(-180, 180)
+            latitude_2 = generator.uniform(-90, 90)
+            longitude_2 = generator.uniform(-180, 180)
+            pair = (latitude_1, longitude_1, latitude_2, longitude_2)
+            expected = Utils().get_bearing_distance_between_points(*pair)
+            actual = spherical.get_bearing_distance_between_points(*pair)
+            self.assertLessEqual(abs(actual[1] - expected[1]), SphericalGeodesy.MAXIMUM_DISTANCE_ERROR * expected[1], pair)
+            if expected[1] <= SphericalGeodesy.MAXIMUM_BEARING_DISTANCE:
+                self.assertLessEqual(abs((actual[0] - expected[0] + 180) % 360 - 180),
+                                     SphericalGeodesy.MAXIMUM_BEARING_ERROR, pair)
+
+            bearing = generator.uniform(-180, 180)
+            distance = generator.uniform(0, 5000000)
+            expected = Utils().get_bearing_distance_projected_point(latitude_1, longitude_1, bearing, distance)
+            actual = spherical.get_bearing_distance_projected_point(latitude_1, longitude_1, bearing, distance)
+            error = Utils().get_bearing_distance_between_points(expected[0], expected[1], actual[0], actual[1])[1]
+            self.assertLessEqual(error, SphericalGeodesy.MAXIMUM_DISTANCE_ERROR * distance,
+                                 (latitude_1, longitude_1, bearing, distance))
+
+    def test_select_backend_per_parser(self):
+        message = "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 5100N00300E 5200N00400E090100-EKCH0200-0)"
+        ellipsoidal = FlightPlanRecord()
+        ParseMessage().parse_message(ellipsoidal, message)
+        parser = ParseMessage()
+        parser.set_geodesy_backend(SphericalGeodesy())
+        self.assertIsInstance(parser.get_geodesy_backend(), SphericalGeodesy)
+        spherical = FlightPlanRecord()
+        parser.parse_message(spherical, message)
+        default = FlightPlanRecord()
+        ParseMessage().parse_message(default, message)
+
+        expected = ellipsoidal.get_extracted_route().get_element_at(1)
+        actual = spherical.get_extracted_route().get_element_at(1)
+        self.assertNotEqual(expected.get_distance(), actual.get_distance())
+        self.assertAlmostEqual(expected.get_distance(), actual.get_distance(),
+                               delta=SphericalGeodesy.MAXIMUM_DISTANCE_ERROR * expected.get_distance())
+        self.assertAlmostEqual(expected.get_bearing(), actual.get_bearing(), delta=SphericalGeodesy.MAXIMUM_BEARING_ERROR)
+        # Selecting a backend on one parser does not change other parsers
+        self.assertEqual(expected.get_distance(), default.get_extracted_route().get_element_at(1).get_distance())
+
+        pair = (50.0, 3.0, 51.0, 4.0)
+        self.assertEqual(Utils().get_bearing_distance_between_points(*pair),
+                         EllipsoidalGeodesy().get_bearing_distance_between_points(*pair))
+
+        # A backend implementing only one of the calculations cannot be instantiated
+        class IncompleteGeodesy(GeodesyBackend):
+            def get_bearing_distance_between_points(self, latitude_1, longitude_1, latitude_2, longitude_2):
+                return [0.0, 0.0]
+        self.assertRaises(TypeError, IncompleteGeodesy)
+
+
+if __name__ == '__main__':
+    unittest.main()
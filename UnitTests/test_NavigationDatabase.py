@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from F15_Parser.NavigationDatabase import NavigationDatabase, NavigationPointTypes
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class TestNavigationDatabase(unittest.TestCase):
+
+    csv_text: str = "designator,type,latitude,longitude\n" \
+                    "LNZ,NAVAID,48.2325,14.1094\n" \
+                    "KOK,NAVAID,51.0944,2.6528\n" \
+                    "KOK,SIGNIFICANT_POINT,-20.0,150.0\n" \
+                    "ABLAN,SIGNIFICANT_POINT,47.5,13.5\n" \
+                    "LOWW,AERODROME,48.1103,16.5697\n" \
+                    "EKCH,AERODROME,55.6179,12.6560\n"
+    """A small navigation database in CSV format"""
+
+    def test_csv_and_binary_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "points.csv")
+            binary_file = os.path.join(directory, "points.bin")
+            with open(csv_file, "w") as file:
+                file.write(self.csv_text)
+            self.assertEqual(6, NavigationDatabase.write_binary(csv_file, binary_file))
+
+            from_csv = NavigationDatabase.load_csv(csv_file)
+            from_binary = NavigationDatabase.open(binary_file)
+            try:
+                for database in [from_csv, from_binary]:
+                    self.assertEqual(6, database.get_number_of_points())
+                    self.assertEqual([(NavigationPointTypes.NAVAID, 48.2325, 14.1094)], database.lookup("LNZ"))
+                    self.assertEqual(2, len(database.lookup("KOK")))
+                    self.assertEqual([], database.lookup("XYZ"))
+                    self.assertEqual([], database.lookup("LNZ1"))
+                    self.assertEqual((48.1103, 16.5697), database.resolve("LOWW", True))
+                    self.assertIsNone(database.resolve("LOWW", False))
+                    self.assertIsNone(database.resolve("LNZ", True))
+            finally:
+                from_binary.close()
+
+    def test_resolve_closest(self):
+        database = NavigationDatabase.from_points([
+            ("KOK", NavigationPointTypes.NAVAID, 51.0944, 2.6528),
+            ("KOK", NavigationPointTypes.SIGNIFICANT_POINT, -20.0, 150.0),
+            ("KOK", NavigationPointTypes.SIGNIFICANT_POINT, 10.0, -179.0)])
+        self.assertEqual((51.0944, 2.6528), database.resolve("KOK", False, 50.0, 3.0))
+        self.assertEqual((-20.0, 150.0), database.resolve("KOK", False, -25.0, 155.0))
+        # Closest across the anti-meridian
+        self.assertEqual((10.0, -179.0), database.resolve("KOK", False, 10.0, 179.0))
+        self.assertEqual(0, NavigationDatabase.from_points([]).get_number_of_points())
+        self.assertEqual([], NavigationDatabase.from_points([]).lookup("KOK"))
+
+    def test_resolve_field_15_points(self):
+        message = "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 LOWW ABLAN UL607 LNZ DCT KOK180060 DCT " \
+                  "XYZ DCT 5100N00300E-EKCH0200-0)"
+        database = NavigationDatabase.from_points(NavigationDatabase.read_csv_lines(self.csv_text.splitlines()))
+        without_database = FlightPlanRecord()
+        ParseMessage().parse_message(without_database, message)
+
+        parser = ParseMessage()
+        parser.set_navigation_database(database)
+        self.assertIs(database, parser.get_navigation_database())
+        with_database = FlightPlanRecord()
+        parser.parse_message(with_database, message)
+
+        # The same route is extracted, only the positions are added
+        self.assertEqual(without_database.get_icao_field(FieldIdentifiers.F15).get_field_text(),
+                         with_database.get_icao_field(FieldIdentifiers.F15).get_field_text())
+        ers = with_database.get_extracted_route()
+        names = [ers.get_element_at(idx).get_name() for idx in range(0, ers.get_number_of_elements())]
+        self.assertEqual(names, [without_database.get_extracted_route().get_element_at(idx).get_name()
+                                 for idx in range(0, ers.get_number_of_elements())])
+        self.assertEqual(0, ers.get_number_of_errors())
+
+        valid = {name: ers.get_element_at(idx) for idx, name in enumerate(names)
+                 if ers.get_element_at(idx).is_lat_long_valid()}
+        self.assertEqual({"LOWW", "ABLAN", "LNZ", "KOK180060", "5100N00300E"}, set(valid.keys()))
+        self.assertAlmostEqual(48.2325, valid["LNZ"].get_latitude())
+        # The bearing / distance point is projected from the closest KOK
+        self.assertGreater(valid["KOK180060"].get_latitude(), 49.9)
+        self.assertLess(valid["KOK180060"].get_latitude(), 50.2)
+        # Distances are set between consecutive resolved points
+        self.assertGreater(valid["ABLAN"].get_distance(), 0)
+        self.assertGreater(valid["LOWW"].get_distance(), 0)
+        self.assertEqual(0, without_database.get_extracted_route().get_element_at(
+            names.index("ABLAN")).get_distance())
+
+
+if __name__ == '__main__':
+    unittest.main()
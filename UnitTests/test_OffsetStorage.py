@@ -0,0 +1,62 @@
+import pickle
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, SubFieldRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class OffsetStorageTest(unittest.TestCase):
+
+    def test_SubFieldRecord_offsets(self):
+        message = "(FPL-TEST01-IS)"
+        sfr = SubFieldRecord("TEST01", 5, 11, message)
+        self.assertIsNone(sfr.field_text)
+        self.assertEqual("TEST01", sfr.get_field_text())
+        # Text that is not in the message at the indices is stored as a copy
+        sfr = SubFieldRecord("TEST02", 5, 11, message)
+        self.assertEqual("TEST02", sfr.field_text)
+        self.assertEqual("TEST02", sfr.get_field_text())
+
+    def test_offset_storage_fpl(self):
+        fpr = self.do_test("FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n"
+                           "(FPL-TEST01-IS-B737/M-DFGHIORWY/LB1-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200 EGGW-"
+                           "STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST-E/0300 P/3)")
+        self.assertIsNone(fpr.message_header)
+        self.assertIsNone(fpr.message_body)
+        self.assertIsNone(fpr.get_icao_field(FieldIdentifiers.F9).field_text)
+        self.assertIsNone(fpr.get_icao_subfield(FieldIdentifiers.F9, SubFieldIdentifiers.F9b).field_text)
+        self.assertEqual("ATFMX", fpr.get_all_icao_subfields(
+            FieldIdentifiers.F18, SubFieldIdentifiers.F18sts)[1].get_field_text())
+
+    def test_offset_storage_errors(self):
+        fpr = self.do_test("(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 B9 /N0450F350-EGLL02X0-0)")
+        self.assertTrue(fpr.errors_detected())
+
+    def test_offset_storage_f22(self):
+        fpr = self.do_test("(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 LNZ-8/IX)")
+        f22_fpr = fpr.get_f22_flight_plan()
+        self.assertTrue(f22_fpr.is_offset_storage())
+        self.assertEqual("EGFF", f22_fpr.get_icao_subfield(FieldIdentifiers.F16, SubFieldIdentifiers.F16a).get_field_text())
+
+    def do_test(self, message):
+        # type: (str) -> FlightPlanRecord
+        fpr_copy = FlightPlanRecord()
+        ParseMessage().parse_message(fpr_copy, message)
+
+        fpr = FlightPlanRecord()
+        fpr.set_offset_storage(True)
+        ParseMessage().parse_message(fpr, message)
+        self.assertTrue(fpr.is_offset_storage())
+        self.assertEqual(fpr_copy.as_xml(), fpr.as_xml())
+        self.assertEqual(fpr_copy.get_all_errors(), fpr.get_all_errors())
+
+        # Offset storage survives pickling
+        unpickled = pickle.loads(pickle.dumps(fpr))
+        self.assertTrue(unpickled.is_offset_storage())
+        self.assertEqual(fpr.as_xml(), unpickled.as_xml())
+        return fpr
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -117,6 +117,23 @@ class TestParseF22(unittest.TestCase):
                       "F22 - The first Field 15 element must be a SPEED/LEVEL and not 'N0450f350'",
                       "F22 - The element 'F*F' is an unrecognised Field 15 element"])
 
+    def test_subfield_parsers(self):
+        sfif = SubFieldsInFields()
+        sfd = SubFieldDescriptions()
+        subfield_parsers = ParseF22(None, sfif, sfd).get_subfield_parsers()
+        self.assertIs(subfield_parsers, ParseF22(None, sfif, sfd).get_subfield_parsers())
+        self.assertEqual(set(ParseF22.SUBFIELD_PARSERS), set(subfield_parsers))
+        self.assertIs(ParseF22, subfield_parsers[SubFieldIdentifiers.F22_f22].get_field_parser())
+        self.assertEqual(FieldIdentifiers.F18, subfield_parsers[SubFieldIdentifiers.F22_f18].get_field_identifier())
+
+        # The errors of the F22 fields are moved to the flight plan record
+        fpr = self.do_f22_test(True, 2, "-8/XX-18/DOF/221312-9/B738/M",
+                               ["F22 - Expecting flight rules 'I', 'V', 'Y' or 'Z' instead of 'X'",
+                                "F22 - Expecting DOF in the format YYMMDD instead of '221312'"])
+        self.assertEqual([], fpr.get_f22_flight_plan().get_erroneous_fields())
+        self.assertEqual("B738", fpr.get_f22_flight_plan().get_icao_subfield(
+            FieldIdentifiers.F9, SubFieldIdentifiers.F9b).get_field_text())
+
     def do_f22_test(self, errors_detected, number_of_errors, string_to_parse, expected_error_text):
         # type: (bool, int, str, [str]) -> FlightPlanRecord
         fpr = FlightPlanRecord()
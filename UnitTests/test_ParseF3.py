@@ -1,6 +1,6 @@
 import unittest
 
-from Configuration.EnumerationConstants import AdjacentUnits, FieldIdentifiers
+from Configuration.EnumerationConstants import AdjacentUnits, FieldIdentifiers, MessageTitles, SubFieldIdentifiers
 from Configuration.SubFieldDescriptions import SubFieldDescriptions
 from Configuration.SubFieldsInFields import SubFieldsInFields
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
@@ -102,6 +102,23 @@ class TestParseF3(unittest.TestCase):
         self.do_f3_test(True, 1, AdjacentUnits.DEFAULT, "FPLRTH/SWY EXTRA MORE EXTRA",
                         ["Expecting channel sequence number as 3 digits instead 'EXTRA'"])
 
+    def test_oldi_decomposition(self):
+        fpr = self.do_f3_test(False, 0, AdjacentUnits.AA, " LAMAA / L001 CC/BB002 ", [])
+        self.assertEqual(MessageTitles.LAM, fpr.get_message_title())
+        self.assertEqual(AdjacentUnits.L, fpr.get_receiver_adjacent_unit_name())
+        self.assertEqual([("LAM", 1, 4), ("AA", 4, 6), ("/", 7, 8), ("L", 9, 10), ("001", 10, 13), ("CC", 14, 16),
+                          ("/", 16, 17), ("BB", 17, 19), ("002", 19, 22)],
+                         [(subfield.get_field_text(), subfield.get_start_index(), subfield.get_end_index())
+                          for subfield_list in fpr.get_icao_field(FieldIdentifiers.F3).get_subfield_dictionary().values()
+                          for subfield in subfield_list])
+
+        # Unknown units and titles
+        fpr = self.do_f3_test(False, 0, AdjacentUnits.DEFAULT, "ABIXY/ZZ001", [])
+        self.assertEqual(AdjacentUnits.DEFAULT, fpr.get_receiver_adjacent_unit_name())
+        self.assertEqual("XY", fpr.get_icao_subfield(FieldIdentifiers.F3, SubFieldIdentifiers.F3b1).get_field_text())
+        self.assertEqual(MessageTitles.UNKNOWN, MessageTitles.get_message_title("XYZ"))
+        self.assertEqual(AdjacentUnits.DEFAULT, AdjacentUnits.get_adjacent_unit("name"))
+
     def do_f3_test(self, errors_detected, number_of_errors, expected_adj_unit,
                    string_to_parse, expected_error_text):
         # type: (bool, int, AdjacentUnits, str, [str]) -> FlightPlanRecord
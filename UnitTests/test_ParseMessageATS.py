@@ -193,6 +193,37 @@ class ParseMessageTests(unittest.TestCase):
         self.assertEqual(19, fpr.get_icao_subfield(FieldIdentifiers.F3, SubFieldIdentifiers.F3c4).get_start_index())
         self.assertEqual(22, fpr.get_icao_subfield(FieldIdentifiers.F3, SubFieldIdentifiers.F3c4).get_end_index())
 
+    # Ensure the header fields are written to the FPR, the addressees are saved as a single field
+    def test_header_storage_in_fpr(self):
+        addressees = " ".join([letter * 8 for letter in "ABCDEFGHIJ"])
+        fpr = self.do_test(
+            True, 1, "FF " + addressees + "\r\n121212 LOWWZPZX\r\nEDDFZQZX LOWWZZZZ\r\n"
+                     "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0)",
+            ["Remove the extra field(s) 'IIIIIIII JJJJJJJJ' in the addressee field"])
+        self.assertEqual(75, fpr.get_erroneous_fields()[0].get_start_index())
+        self.assertEqual(92, fpr.get_erroneous_fields()[0].get_end_index())
+        self.assertEqual("FF", fpr.get_icao_field(FieldIdentifiers.PRIORITY_INDICATOR).get_field_text())
+        self.assertEqual(addressees + " ", fpr.get_icao_field(FieldIdentifiers.ADDRESS).get_field_text())
+        self.assertEqual(3, fpr.get_icao_field(FieldIdentifiers.ADDRESS).get_start_index())
+        self.assertEqual(92, fpr.get_icao_field(FieldIdentifiers.ADDRESS).get_end_index())
+        self.assertEqual("121212", fpr.get_icao_field(FieldIdentifiers.FILING_TIME).get_field_text())
+        self.assertEqual("LOWWZPZX", fpr.get_icao_field(FieldIdentifiers.ORIGINATOR).get_field_text())
+        self.assertEqual("EDDFZQZX LOWWZZZZ ", fpr.get_icao_field(FieldIdentifiers.ADADDRESS).get_field_text())
+        self.assertEqual(110, fpr.get_icao_field(FieldIdentifiers.ADADDRESS).get_start_index())
+        self.assertEqual(128, fpr.get_icao_field(FieldIdentifiers.ADADDRESS).get_end_index())
+
+        # Without additional addressees the field is empty and starts after the originator
+        fpr = self.do_test(False, 0, "FF AAAAAAAA\r\n121212 LOWWZPZX\r\n"
+                                     "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0)", [""])
+        self.assertEqual("", fpr.get_icao_field(FieldIdentifiers.ADADDRESS).get_field_text())
+        self.assertEqual(29, fpr.get_icao_field(FieldIdentifiers.ADADDRESS).get_start_index())
+        self.assertEqual(29, fpr.get_icao_field(FieldIdentifiers.ADADDRESS).get_end_index())
+
+        # The header fields are stored in the order they appear in the header
+        self.assertEqual([FieldIdentifiers.PRIORITY_INDICATOR, FieldIdentifiers.ADDRESS, FieldIdentifiers.FILING_TIME,
+                          FieldIdentifiers.ORIGINATOR, FieldIdentifiers.ADADDRESS], list(fpr.icao_fields)[0:5])
+        self.assertLess(fpr.as_xml().find('id="ADDRESS"'), fpr.as_xml().find('id="FILING_TIME"'))
+
     def test_ParseMessage_ATS_check_f22_variants(self):
         # The ACH and CHG messages have a field 22 as the last field. The issue is that F22 uses
         # the same field separators (hyphen) as is used for all messages. This implies that
@@ -0,0 +1,75 @@
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers, MessageTitles, MessageTypes, AdjacentUnits
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParsePlan import FieldParsePlan
+
+
+class ParseMessageWithoutPlans(ParseMessage):
+    """Creates each field parser from its class as the message parser did before parse plans"""
+
+    def parse_field(self, flight_plan_record, field_identifier, field_parser):
+        if isinstance(field_parser, FieldParsePlan):
+            field_parser = field_parser.get_field_parser()
+        super().parse_field(flight_plan_record, field_identifier, field_parser)
+
+
+class TestParsePlan(unittest.TestCase):
+
+    messages: [str] = [
+        "(FPL-TEST01-IS-B737/M-DFGHIORWY/LB1-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200 EGGW-STS/HOSP "
+        "DOF/221212 RMK/FIRST PBN/B1D1-E/0300 P/3)",
+        "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200)",
+        "(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 LNZ-8/IS-9/B738/M)",
+        "(ARR-TEST01-EGLL0800-LOWW0200-RGRG0200 DEN HELDER-221013)",
+        "(CNL-TEST01-EGLL0800-LOWL-221013)",
+        "(ACT-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(ACH-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130)",
+        "(FPL-TEST03-IX-B737/Q-S/C-LOWW08-N0450F350 PNT-EGLL0200-0-X-Y)",
+        "(SBYNN/MM999SS/AA099)",
+    ]
+    """Messages with and without errors, too few and too many fields and field 22"""
+
+    def test_same_as_field_parser_classes(self):
+        parser = ParseMessage()
+        parser_without_plans = ParseMessageWithoutPlans()
+        for message in self.messages:
+            expected = FlightPlanRecord()
+            parser_without_plans.parse_message(expected, message)
+            actual = FlightPlanRecord()
+            parser.parse_message(actual, message)
+            self.assertEqual(expected.as_xml(), actual.as_xml(), message)
+
+    def test_plan(self):
+        parser = ParseMessage()
+        parser.compile_parse_plans()
+        self.assertEqual(0, parser.compile_parse_plans())
+
+        md = parser.FIM.get_message_content(MessageTypes.ATS, AdjacentUnits.DEFAULT, MessageTitles.CHG)
+        plan = parser.get_parse_plan(md)
+        self.assertIs(plan, parser.get_parse_plan(md))
+        self.assertIs(md, plan.get_message_description())
+        self.assertEqual(tuple(md.get_message_fields()), plan.get_field_identifiers())
+        self.assertEqual(plan.get_number_of_fields_in_message() - 1, plan.get_f22_index())
+        md = parser.FIM.get_message_content(MessageTypes.ATS, AdjacentUnits.DEFAULT, MessageTitles.FPL)
+        self.assertEqual(-1, parser.get_parse_plan(md).get_f22_index())
+
+        # Each call creates a field parser bound to the flight plan record sharing the configuration data
+        field_plan: FieldParsePlan = parser.get_parse_plan(md).get_field_parsers()[1]
+        self.assertEqual(FieldIdentifiers.F7, field_plan.get_field_identifier())
+        self.assertEqual(len(field_plan.get_sub_field_list()), len(field_plan.get_subfield_patterns()))
+        self.assertEqual(" /\n\t\r", field_plan.get_whitespace())
+        fpr_1 = FlightPlanRecord()
+        fpr_2 = FlightPlanRecord()
+        field_parser_1 = field_plan(fpr_1)
+        field_parser_2 = field_plan(fpr_2)
+        self.assertIsNot(field_parser_1, field_parser_2)
+        self.assertIs(fpr_1, field_parser_1.get_flight_plan_record())
+        self.assertIs(fpr_2, field_parser_2.get_flight_plan_record())
+        self.assertIs(field_parser_1.get_error_list(), field_parser_2.get_error_list())
+        self.assertIs(field_parser_1.error_messages, field_parser_2.error_messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import pickle
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, FieldRecord, ErrorRecord, SubFieldRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class PickleTest(unittest.TestCase):
+
+    def test_pickle_fpl(self):
+        self.do_test("FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n"
+                     "(FPL-TEST01-IS-B737/M-SDFGHIRWY/LB1-LOWW0800-N0450F350 "
+                     "4620N07805W/N0450F350 PNT B9 LNZ DCT 4620N07805W-EGLL0200 EGGW-"
+                     "STS/HOSP STS/ATFMX DOF/221212 RMK/FIRST RMK/SECOND PBN/B1D1-E/0300 P/3)")
+
+    def test_pickle_fpl_with_errors(self):
+        self.do_test("(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 B9 /N0450F350-EGLL02X0-0)")
+
+    def test_pickle_cpl(self):
+        self.do_test("(CPL-TEST01-IS-B737/M-S/C-EGLL0800-PNT/1234F350F200A-N0450F350 "
+                     "PNT B9 NMB-LOWL0100 LOWZ LOWG-0)")
+
+    def test_pickle_chg_f22(self):
+        fpr = self.do_test("(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 B9-8/IX)")
+        self.assertIsNotNone(fpr.get_f22_flight_plan())
+        self.assertEqual("EGFF0130", fpr.get_f22_flight_plan().get_icao_field(FieldIdentifiers.F16).get_field_text())
+
+    def test_pickle_records(self):
+        field_record = FieldRecord("STS/HOSP STS/ATFMX", 10, 28)
+        field_record.add_subfield(SubFieldIdentifiers.F18sts, SubFieldRecord("HOSP", 14, 18))
+        field_record.add_subfield(SubFieldIdentifiers.F18sts, SubFieldRecord("ATFMX", 23, 28))
+        copy = pickle.loads(pickle.dumps(field_record))
+        self.assertEqual(field_record.field_as_xml(FieldIdentifiers.F18), copy.field_as_xml(FieldIdentifiers.F18))
+
+        error_record = ErrorRecord("B9", "Error", 3, 5)
+        copy = pickle.loads(pickle.dumps(error_record))
+        self.assertEqual(error_record.field_error_as_xml(), copy.field_error_as_xml())
+
+        ers = ExtractedRouteSequence()
+        ers.add_error("B9", 1, 3, 0, 0, "Bad '!'")
+        copy = pickle.loads(pickle.dumps(ers))
+        self.assertEqual(ers.as_xml(), copy.as_xml())
+
+    def do_test(self, message):
+        # type: (str) -> FlightPlanRecord
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, message)
+        copy = pickle.loads(pickle.dumps(fpr))
+        self.assertEqual(fpr.as_xml(), copy.as_xml())
+        self.assertEqual(fpr.get_all_errors(), copy.get_all_errors())
+        self.assertEqual(fpr.get_message_title(), copy.get_message_title())
+        if fpr.get_f22_flight_plan() is not None:
+            self.assertEqual(fpr.get_f22_flight_plan().as_xml(), copy.get_f22_flight_plan().as_xml())
+        return copy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from F15_Parser.NavigationDatabase import NavigationDatabase, NavigationPointTypes
+from F15_Parser.RouteExtractor import RouteExtractor
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class TestRouteExtractor(unittest.TestCase):
+
+    routes: [str] = [
+        "N0450F350 PNT B9 LNZ DCT 5220N01030W",
+        "N0450F350 SID1A PNT VFR ABC DEF IFR LNZ/N0450F350 B9 KOK STAR1A",
+        "N0450F350 LNZ180060 C/PNT/N0450F350F390 KOK T",
+        "N0450F350 PNT B9 $%^& LNZ",
+        "PNT B9 LNZ",
+        "N0450F350  4620N07805W/M082F350   DCT KOK",
+    ]
+    """Field 15 strings, some containing errors"""
+
+    def test_same_as_message_parser(self):
+        extractor = RouteExtractor()
+        for f15, ers in zip(self.routes, extractor.extract_routes(self.routes)):
+            message = "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-" + f15 + "-EKCH0200-0)"
+            fpr = FlightPlanRecord()
+            ParseMessage().parse_message(fpr, message)
+            # The indices in a message are offsets into the message
+            offset = message.index(f15)
+            expected = fpr.get_extracted_route()
+            self.assertEqual(self.get_states(expected.get_all_elements(), offset),
+                             self.get_states(ers.get_all_elements(), 0), f15)
+            self.assertEqual(self.get_states(expected.get_all_errors(), offset),
+                             self.get_states(ers.get_all_errors(), 0), f15)
+
+    def test_errors_per_route(self):
+        extractor = RouteExtractor()
+        routes = list(extractor.extract_routes(iter(self.routes)))
+        self.assertEqual(len(self.routes), len(routes))
+        self.assertEqual([0, 0, 0, 1, 1, 0], [ers.get_number_of_errors() for ers in routes])
+        error = routes[3].get_all_errors()[0]
+        self.assertEqual("$%^&", error.get_name())
+        self.assertEqual(self.routes[3].index("$"), error.get_start_index())
+
+    def test_parallel_same_as_sequential(self):
+        database = NavigationDatabase.from_points([("LNZ", NavigationPointTypes.NAVAID, 48.2325, 14.1094),
+                                                   ("KOK", NavigationPointTypes.NAVAID, 51.0944, 2.6528)])
+        extractor = RouteExtractor(database)
+        routes = self.routes * 20
+        sequential = [ers.__getstate__() for ers in extractor.extract_routes(routes)]
+        parallel = [ers.__getstate__() for ers in extractor.extract_routes(routes, processes=2, chunk_size=7)]
+        self.assertEqual(sequential, parallel)
+        self.assertTrue(extractor.extract_route(self.routes[0]).get_element_at(3).is_lat_long_valid())
+
+    @staticmethod
+    def get_states(records, offset):
+        return [(record.get_name(), record.get_start_index() - offset, record.get_end_index() - offset) +
+                record.__getstate__()[3:] for record in records]
+
+
+if __name__ == '__main__':
+    unittest.main()
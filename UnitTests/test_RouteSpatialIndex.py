@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.RouteSpatialIndex import RouteSpatialIndex
+
+
+class TestRouteSpatialIndex(unittest.TestCase):
+
+    def test_flight_plan_records(self):
+        parser = ParseMessage()
+        records = []
+        for route in ["5000N00500E 5000N01500E 4500N01500E",  # Through central Europe
+                      "6000N02000W 6000N01000W",  # North Atlantic
+                      "PNT DCT XYZ"]:  # No positions
+            flight_plan_record = FlightPlanRecord()
+            parser.parse_message(flight_plan_record,
+                                 "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 " + route + "-EKCH0200-0)")
+            records.append(flight_plan_record)
+
+        index = RouteSpatialIndex()
+        self.assertEqual(3, index.bulk_load(enumerate(records)))
+        self.assertEqual(3, len(index))
+        self.assertEqual({0}, index.query_box(49.0, 9.0, 51.0, 11.0))
+        self.assertEqual({0}, index.query_box(46.0, 14.0, 48.0, 16.0))
+        self.assertEqual(set(), index.query_box(46.0, 6.0, 48.0, 14.0))
+        self.assertEqual({0, 1}, index.query_box(40.0, -30.0, 70.0, 30.0))
+        sector = [(48.0, 9.0), (58.0, -5.0), (52.0, 12.0)]
+        self.assertEqual({0}, index.query_polygon(sector))
+        self.assertEqual(set(), index.query_polygon([(46.0, 6.0), (48.0, 6.0), (47.0, 14.0)]))
+
+        self.assertTrue(index.delete(0))
+        self.assertFalse(index.delete(0))
+        self.assertNotIn(0, index)
+        self.assertEqual({1}, index.query_box(40.0, -30.0, 70.0, 30.0))
+        index.insert("again", records[0])
+        self.assertEqual({1, "again"}, index.query_box(40.0, -30.0, 70.0, 30.0))
+
+    def test_anti_meridian(self):
+        index = RouteSpatialIndex(cell_size=5.0)
+        index.insert_points("pacific", [10.0, 20.0], [170.0, -170.0])
+        self.assertEqual({"pacific"}, index.query_box(14.0, 178.0, 16.0, -178.0))
+        self.assertEqual({"pacific"}, index.query_box(14.0, -180.0, 16.0, -179.0))
+        self.assertEqual(set(), index.query_box(10.0, -10.0, 20.0, 10.0))
+
+    def test_same_as_linear_scan(self):
+        generator = random.Random(36)
+        index = RouteSpatialIndex(cell_size=2.0)
+        routes = {}
+        for message_id in range(0, 300):
+            length = generator.randrange(1, 6)
+            latitudes = [generator.uniform(-60.0, 60.0) for _ in range(0, length)]
+            longitudes = [generator.uniform(-60.0, 60.0) for _ in range(0, length)]
+            index.insert_points(message_id, latitudes, longitudes)
+            routes[message_id] = (latitudes, longitudes)
+        for message_id in range(0, 300, 3):
+            index.delete(message_id)
+            del routes[message_id]
+
+        for _ in range(0, 200):
+            latitude = generator.uniform(-70.0, 60.0)
+            longitude = generator.uniform(-70.0, 60.0)
+            size = generator.uniform(0.1, 30.0)
+            box = (latitude, longitude, latitude + size, longitude + size)
+            polygon = [(box[0], box[1]), (box[2], box[1] + size / 2.0), (box[0] + size / 3.0, box[3])]
+            expected_box = set()
+            expected_polygon = set()
+            for message_id, (latitudes, longitudes) in routes.items():
+                segments = [(latitudes[0], longitudes[0], latitudes[0], longitudes[0])] + \
+                    [(latitudes[idx - 1], longitudes[idx - 1], latitudes[idx], longitudes[idx])
+                     for idx in range(1, len(latitudes))]
+                if any(index.segment_intersects_box(*segment, *box) for segment in segments):
+                    expected_box.add(message_id)
+                if any(index.segment_intersects_polygon(*segment, polygon) for segment in segments):
+                    expected_polygon.add(message_id)
+            self.assertEqual(expected_box, index.query_box(*box))
+            self.assertEqual(expected_polygon, index.query_polygon(polygon))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import threading
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers, MessageTitles, MessageTypes, AdjacentUnits, \
+    SubFieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseF7 import ParseF7
+from IcaoMessageParser.ParseFieldsCommon import FieldParseContext
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParsePlan import FieldParsePlan
+
+
+class TestSharedFieldParsers(unittest.TestCase):
+
+    messages: [str] = [
+        "FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n"
+        "(FPL-TEST01-IS-B737/M-DFGHIORWY/LB1-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200 EGGW-STS/HOSP "
+        "DOF/221212 RMK/FIRST PBN/B1D1-E/0300 P/3)",
+        "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200)",
+        "(CHG-TEST01-EGLL0800-LOWW0200-221012-16/EGFF0130-15/N0450F350 PNT B9 LNZ-8/IS-9/B738/M)",
+        "(CHG-TEST02-EGLL0800-LOWW0200-221012-22/7/TEST03-9/B73X/M)",
+        "(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(FPL-TEST03-IX-B737/Q-S/C-LOWW08-N0450F350 PNT-EGLL0200-0-X-Y)",
+    ]
+    """Messages with and without errors, field 22 and a field 22 containing a field 22"""
+
+    def test_parsers_shared_by_plans(self):
+        parser = ParseMessage()
+        parser.compile_parse_plans()
+        fim = parser.FIM
+        fpl = parser.get_parse_plan(fim.get_message_content(MessageTypes.ATS, AdjacentUnits.DEFAULT, MessageTitles.FPL))
+        chg = parser.get_parse_plan(fim.get_message_content(MessageTypes.ATS, AdjacentUnits.DEFAULT, MessageTitles.CHG))
+        self.assertEqual(FieldIdentifiers.F7, fpl.get_field_parsers()[1].get_field_identifier())
+        self.assertEqual(FieldIdentifiers.F7, chg.get_field_parsers()[1].get_field_identifier())
+        self.assertIs(fpl.get_field_parsers()[1].get_parser(), chg.get_field_parsers()[1].get_parser())
+        self.assertIs(FieldParsePlan.PARSERS[ParseF7], fpl.get_field_parsers()[1].get_parser())
+
+        # Parsing a message creates no field parser
+        created = []
+        original_init = ParseF7.__init__
+
+        def counting_init(*args, **kwargs):
+            created.append(args[0])
+            original_init(*args, **kwargs)
+        ParseF7.__init__ = counting_init
+        try:
+            parser.parse_message(FlightPlanRecord(), self.messages[1])
+        finally:
+            ParseF7.__init__ = original_init
+        self.assertEqual([], created)
+
+    def test_context(self):
+        fpr = FlightPlanRecord()
+        fpr.add_icao_field(FieldIdentifiers.F7, "  TEST01/A1234", 10, 24)
+        field_parser = FieldParsePlan.get_shared_parser(ParseF7, ParseMessage.SFIF, ParseMessage.SFD)
+        self.assertIsNone(field_parser.get_context())
+        context = FieldParseContext.for_field(fpr, FieldIdentifiers.F7)
+        self.assertEqual("  TEST01/A1234", context.field_text)
+        self.assertEqual(10, context.start_index)
+        field_parser.parse(context)
+        self.assertIsNone(field_parser.get_context())
+        self.assertEqual("TEST01", fpr.get_icao_subfield(FieldIdentifiers.F7, SubFieldIdentifiers.F7a).get_field_text())
+        self.assertEqual(12, fpr.get_icao_subfield(FieldIdentifiers.F7, SubFieldIdentifiers.F7a).get_start_index())
+        self.assertEqual("1234", fpr.get_icao_subfield(FieldIdentifiers.F7, SubFieldIdentifiers.F7c).get_field_text())
+
+    def test_threads(self):
+        parser = ParseMessage()
+        expected = []
+        for message in self.messages:
+            fpr = FlightPlanRecord()
+            parser.parse_message(fpr, message)
+            expected.append(fpr.as_xml())
+
+        failures = []
+
+        def parse_messages():
+            for _ in range(20):
+                for message, xml in zip(self.messages, expected):
+                    fpr = FlightPlanRecord()
+                    parser.parse_message(fpr, message)
+                    if fpr.as_xml() != xml:
+                        failures.append(message)
+
+        threads = [threading.Thread(target=parse_messages) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], failures)
+
+
+if __name__ == '__main__':
+    unittest.main()
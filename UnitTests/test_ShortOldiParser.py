@@ -0,0 +1,87 @@
+import unittest
+
+from Configuration.EnumerationConstants import MessageTitles, MessageTypes, AdjacentUnits
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ShortOldiParser import ShortOldiParser
+
+
+class TestShortOldiParser(unittest.TestCase):
+
+    messages: [str] = [
+        "(LAML/E012E/L001)",
+        "(LAMZZ/TT654)",
+        "(SBYNN/MM999SS/AA099)",
+        "(SBYAA/BB001CC/DD002)",
+        "(ACPAA/LL098-TEST01-SAGE-LOWL-13/KATE0900)",
+        "(ACPAX/VB001)",
+        "(ACPXX/YY234)",
+        "(ABIAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(ABIAX/VB001-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(ABIL/E001-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900-9/B738/M)",
+        "(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL)",
+        "(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900-TOO-MANY-FIELDS)",
+        "(MACAA/LL098-TEST01-SAGE-LOWL-PETE-13/KATE0900)",
+        "(REVAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(REVAA/LL098-TEST 01-SAGE-PNT/1234F350F200A-LOWL)",
+        "(REVAA/LL098-TEST01-SA GE-PNT/1234F350F200A-LOWL )",
+        "(SBYL/E001)",
+    ]
+    """Short OLDI messages recognised by the fast path, with and without errors, the last one is too short
+    and left to the generic path to report"""
+
+    generic_messages: [str] = [
+        "FF EGLLZZZZ EDDFZZZZ\r\n121212 LOWWZZZZ\r\n(LAML/E012E/L001)",
+        "(LAML/E012E/L001)\r\n",
+        "(ACPAA/LL098-TEST01-SAGE-LOWL\r\n-13/KATE0900)",
+        "(ACPAA/LL098--TEST01-SAGE-LOWL-13/KATE0900)",
+        "(ACP-TEST01-EGLL0800-LOWL0100 LOWZ LOWG)",
+        "(ACT-TEST01-SAGE-PNT/1234F350F200A-LOWL-13/KATE0900)",
+        "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200)",
+    ]
+    """Messages left to the generic path"""
+
+    def test_same_as_generic_path(self):
+        parser = ParseMessage()
+        generic_parser = ParseMessage()
+        generic_parser.set_short_oldi_fast_path(False)
+        self.assertTrue(parser.get_short_oldi_fast_path())
+        self.assertFalse(generic_parser.get_short_oldi_fast_path())
+        for message in self.messages + self.generic_messages:
+            expected = FlightPlanRecord()
+            expected_result = generic_parser.parse_message(expected, message)
+            actual = FlightPlanRecord()
+            self.assertEqual(expected_result, parser.parse_message(actual, message), message)
+            self.assertEqual(expected.as_xml(), actual.as_xml(), message)
+            self.assertEqual(expected.get_message_type(), actual.get_message_type(), message)
+            self.assertEqual(expected.get_message_header(), actual.get_message_header(), message)
+            self.assertEqual(expected.field_error_ranges, actual.field_error_ranges, message)
+
+    def test_tokenize(self):
+        short_oldi_parser = ParseMessage.SHORT_OLDI_PARSER
+        for message in self.messages:
+            self.assertIsNotNone(short_oldi_parser.tokenize(message), message)
+        for message in self.generic_messages:
+            self.assertIsNone(short_oldi_parser.tokenize(message), message)
+
+        message_title, tokens = short_oldi_parser.tokenize("(ACTAA/LL098-TEST01-SAGE-PNT/1234F350F200A-LOWL)")
+        self.assertEqual(MessageTitles.ACT, message_title)
+        self.assertEqual(5, tokens.get_number_of_tokens())
+        self.assertEqual("ACTAA/LL098", tokens.get_first_token().get_token_string())
+        self.assertEqual(1, tokens.get_first_token().get_token_start_index())
+        self.assertEqual("LOWL", tokens.get_last_token().get_token_string())
+        self.assertEqual(43, tokens.get_last_token().get_token_start_index())
+        self.assertEqual(47, tokens.get_last_token().get_token_end_index())
+
+    def test_message_descriptions(self):
+        short_oldi_parser = ShortOldiParser(ParseMessage.FIM)
+        self.assertIs(ParseMessage.FIM.get_message_content(MessageTypes.OLDI, AdjacentUnits.AA, MessageTitles.ACT),
+                      short_oldi_parser.get_message_description(AdjacentUnits.AA, MessageTitles.ACT))
+        self.assertIsNone(short_oldi_parser.get_message_description(AdjacentUnits.AX, MessageTitles.ACT))
+        self.assertIsNotNone(short_oldi_parser.get_message_description(AdjacentUnits.AX, MessageTitles.ACP))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from Utilities.Constants import Constants
+from Utilities.SpeedLevelConversions import SpeedLevelConversions
+from Utilities.Utils import Utils
+
+
+class TestSpeedLevelConversions(unittest.TestCase):
+
+    def test_speed_to_si(self):
+        for speed in range(0, 10000):
+            self.assertEqual(int(speed * Constants.KNOTS_TO_METERS_SECOND + 0.5),
+                             SpeedLevelConversions.speed_to_si("N" + str(speed).zfill(4), 0))
+            self.assertEqual(int(speed * Constants.KMH_TO_METERS_SECOND + 0.5),
+                             SpeedLevelConversions.speed_to_si("K" + str(speed).zfill(4), 0))
+        # Converting again uses the table
+        self.assertEqual(231, SpeedLevelConversions.speed_to_si("N0450", 10668))
+        self.assertEqual(231, SpeedLevelConversions.SPEED_SI["N0450"])
+
+    def test_mach_speed_to_si(self):
+        # Mach speeds at sea level, all flight levels and altitudes above the constant temperature altitude
+        altitudes = [0, 0.0, 11000, 11001, 15000, 20000] + \
+                    [SpeedLevelConversions.level_to_si("F" + str(level).zfill(3))[0] for level in range(0, 1000, 5)]
+        for altitude in altitudes:
+            for mach in range(0, 1000, 7):
+                self.assertEqual(int(Utils.mach_to_ms_speed(mach, altitude) + 0.5),
+                                 SpeedLevelConversions.speed_to_si("M" + str(mach).zfill(3), altitude))
+        self.assertEqual(SpeedLevelConversions.speed_to_si("M082", 11000),
+                         SpeedLevelConversions.speed_to_si("M082", 12500))
+
+    def test_level_to_si(self):
+        for level in range(0, 1000):
+            level_string = str(level).zfill(3)
+            self.assertEqual((int((level * 100) * Constants.FEET_TO_METERS + 0.5), level % 5 == 0),
+                             SpeedLevelConversions.level_to_si("F" + level_string))
+            self.assertEqual((int((level * 100) * Constants.FEET_TO_METERS + 0.5), True),
+                             SpeedLevelConversions.level_to_si("A" + level_string))
+        for level in range(0, 10000):
+            level_string = str(level).zfill(4)
+            self.assertEqual((level * 10, True), SpeedLevelConversions.level_to_si("S" + level_string))
+            self.assertEqual((level * 10, True), SpeedLevelConversions.level_to_si("M" + level_string))
+
+    def test_unknown_types(self):
+        # The parser assigns 'X' speeds and levels for elements it cannot decode
+        self.assertEqual(0, SpeedLevelConversions.speed_to_si("X0000", 0))
+        self.assertEqual((0, True), SpeedLevelConversions.level_to_si("X000"))
+
+
+if __name__ == '__main__':
+    unittest.main()
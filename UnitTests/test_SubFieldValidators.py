@@ -0,0 +1,84 @@
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers, ErrorId
+from Configuration.SubFieldDescriptions import SubFieldDescriptions
+from Configuration.SubFieldsInFields import SubFieldsInFields
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseF18 import ParseF18
+from IcaoMessageParser.ParseF19 import ParseF19
+from IcaoMessageParser.SubFieldValidators import SyntaxValidator, SubFieldValidator
+
+
+class CountingValidator(SyntaxValidator):
+    """Counts the subfields validated"""
+
+    validated: [str] = []
+
+    def validate(self, flight_plan_record, subfield):
+        self.validated.append(subfield.get_field_text())
+        super().validate(flight_plan_record, subfield)
+
+
+class CountingParseF18(ParseF18):
+    """Validates the RMK subfields with a counting validator"""
+
+    def compile_subfield_validators(self):
+        validators = super().compile_subfield_validators()
+        validators[SubFieldIdentifiers.F18rmk] = CountingValidator(ErrorId.F18_RMK_SYNTAX, "[A-Z0-9:;., ]+")
+        return validators
+
+
+class TestSubFieldValidators(unittest.TestCase):
+
+    sfif: SubFieldsInFields = SubFieldsInFields()
+
+    sfd: SubFieldDescriptions = SubFieldDescriptions()
+
+    def parse(self, parser, field_identifier, text):
+        # type: (type, FieldIdentifiers, str) -> FlightPlanRecord
+        fpr = FlightPlanRecord()
+        fpr.add_icao_field(field_identifier, text, 10, 10 + len(text))
+        parser(fpr, self.sfif, self.sfd).parse_field()
+        return fpr
+
+    def test_validators_shared(self):
+        validators = ParseF18(None, self.sfif, self.sfd).get_subfield_validators()
+        self.assertIs(validators, ParseF18(None, self.sfif, self.sfd).get_subfield_validators())
+        self.assertNotIn(SubFieldIdentifiers.F18est, validators)
+        self.assertIn(SubFieldIdentifiers.F18stayinfo9, validators)
+        self.assertIn(SubFieldIdentifiers.F19d, ParseF19(None, self.sfif, self.sfd).get_subfield_validators())
+        self.assertEqual(set(), ParseF19(None, self.sfif, self.sfd).get_subfield_validators().keys() &
+                         validators.keys())
+
+    def test_validator_must_validate(self):
+        # A validator without a validate() method cannot be instantiated
+        class IncompleteValidator(SubFieldValidator):
+            pass
+        self.assertRaises(TypeError, IncompleteValidator, ErrorId.F18_PER_SYNTAX)
+
+    def test_only_present_subfields_validated(self):
+        CountingValidator.validated = []
+        fpr = self.parse(CountingParseF18, FieldIdentifiers.F18, "DOF/221212 RMK/FIRST STS/HOSP RMK/SECOND")
+        self.assertFalse(fpr.errors_detected())
+        self.assertEqual(["FIRST", "SECOND"], CountingValidator.validated)
+
+        CountingValidator.validated = []
+        self.parse(CountingParseF18, FieldIdentifiers.F18, "DOF/221212 STS/HOSP")
+        self.assertEqual([], CountingValidator.validated)
+
+    def test_errors(self):
+        # A point / time token too short to contain a point is reported as a point and time error
+        fpr = self.parse(ParseF18, FieldIdentifiers.F18, "EET/EDDF0100 LNZ01 EDDF STS/HOSP XXX")
+        self.assertEqual([("L", 23, 24), ("NZ01", 24, 28), ("", 29, 29), ("EDDF", 29, 33), ("XXX", 43, 46)],
+                         [(error.get_field_text(), error.get_start_index(), error.get_end_index())
+                          for error in fpr.get_erroneous_fields()])
+
+        fpr = self.parse(ParseF19, FieldIdentifiers.F19, "D/2 8 X YELLOW R/UU")
+        self.assertEqual(["Expecting 'C' to indicate dinghies are covered instead of 'X' in F19 'D'",
+                          "Expecting frequency availability on board as one or more of 'E', 'U' or 'V' "
+                          "instead of 'UU' in F19 'R'"],
+                         [error.get_error_message() for error in fpr.get_erroneous_fields()])
+
+
+if __name__ == '__main__':
+    unittest.main()
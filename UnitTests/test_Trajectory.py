@@ -0,0 +1,88 @@
+import unittest
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+try:
+    import numpy
+    from IcaoMessageParser.Trajectory import TrajectoryBuilder
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestTrajectory(unittest.TestCase):
+
+    message: str = "(FPL-TEST05-IS-B738/M-S/C-LOWW0800-N0450F350 5030N01000E 5130N01100E/N0460F370 5230N01200E " \
+                   "DCT 5330N01300E STAY1/0010 PNT DCT 5330N01400E-EKCH0200-0)"
+
+    def test_build(self):
+        fpr = self.parse(self.message)
+        trajectory = TrajectoryBuilder().build_flight_plan(fpr)
+        ers = fpr.get_extracted_route().get_all_elements()
+        self.assertEqual(["5030N01000E", "5130N01100E", "5230N01200E", "5330N01300E", "5330N01400E"], trajectory.names)
+        self.assertEqual([1, 2, 3, 5, 8], trajectory.point_indices.tolist())
+        self.assertEqual(8 * 3600, trajectory.time_origin)
+        self.assertEqual([10668, 11278, 11278, 11278, 11278], trajectory.levels.tolist())
+        self.assertEqual([231, 237, 237, 237, 237], trajectory.speeds.tolist())
+
+        # Distances stored by the parser, 5330N01300E and 5330N01400E are separated by PNT and DCT
+        self.assertEqual([ers[1].get_distance(), ers[2].get_distance(), ers[3].get_distance()],
+                         trajectory.distances[1:4].tolist())
+        self.assertEqual(0.0, ers[5].get_distance())
+        self.assertAlmostEqual(66359.0, trajectory.distances[4], 0)
+        self.assertEqual(numpy.cumsum(trajectory.distances).tolist(), trajectory.cumulative_distances.tolist())
+
+        # Elapsed times including the 10 minute STAY at 5330N01300E
+        expected = numpy.cumsum(numpy.concatenate(([0.0], trajectory.distances[1:] / trajectory.speeds[:-1])))
+        expected[4] += 600
+        numpy.testing.assert_allclose(expected, trajectory.elapsed_times)
+        numpy.testing.assert_allclose(expected + 8 * 3600, trajectory.get_time_over_points())
+        self.assertAlmostEqual(trajectory.cumulative_distances[-1], trajectory.get_total_distance())
+
+    def test_no_points(self):
+        trajectory = TrajectoryBuilder().build_flight_plan(self.parse(
+            "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0)"))
+        self.assertEqual(0, trajectory.get_number_of_points())
+        self.assertEqual(0.0, trajectory.get_total_time())
+        resampled = TrajectoryBuilder().resample(trajectory, 60)
+        self.assertEqual(0, len(resampled.times))
+
+    def test_resample(self):
+        builder = TrajectoryBuilder()
+        trajectory = builder.build_flight_plan(self.parse(self.message))
+        resampled = builder.resample(trajectory, 60)
+        self.assertEqual(int(trajectory.get_total_time() // 60) + 1, len(resampled.times))
+        self.assertEqual(8 * 3600, resampled.times[0])
+        self.assertEqual(trajectory.latitudes[0], resampled.latitudes[0])
+        self.assertEqual(8 * 3600 + 60, resampled.times[1])
+        # Positions are interpolated between the first two points
+        fraction = 60 / trajectory.elapsed_times[1]
+        self.assertAlmostEqual(50.5 + fraction, resampled.latitudes[1])
+        self.assertAlmostEqual(10.0 + fraction, resampled.longitudes[1])
+        self.assertAlmostEqual(trajectory.distances[1] * fraction, resampled.cumulative_distances[1], 3)
+        self.assertRaises(ValueError, builder.resample, trajectory, 0)
+
+    def test_resample_batch(self):
+        builder = TrajectoryBuilder()
+        messages = [self.message,
+                    "(FPL-TEST02-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 LNZ-EGLL0200-0)",
+                    self.message.replace("LOWW0800", "LOWW1230").replace("N0450F350", "M078F350")]
+        trajectories = builder.build_batch([self.parse(message) for message in messages])
+        batch = builder.resample_batch(trajectories, 30)
+        self.assertEqual(3, len(batch))
+        for trajectory, resampled in zip(trajectories, batch):
+            single = builder.resample(trajectory, 30)
+            for attribute in ["times", "latitudes", "longitudes", "levels", "cumulative_distances"]:
+                numpy.testing.assert_allclose(getattr(single, attribute), getattr(resampled, attribute))
+        self.assertEqual(12.5 * 3600, batch[2].times[0])
+
+    @staticmethod
+    def parse(message):
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, message)
+        return fpr
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,319 @@
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from Utilities.Utils import Utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class VectorGeodesy:
+    """This class solves the direct and inverse geodesic problems on the WGS84 ellipsoid for arrays of
+    points at once using Vincenty's formulae vectorised with NumPy.
+
+    The results agree with geographiclib, (used by the Utils class), to within DISTANCE_TOLERANCE meters
+    and AZIMUTH_TOLERANCE / POSITION_TOLERANCE degrees. Vincenty's inverse iteration does not converge,
+    or converges to an imprecise azimuth, for nearly antipodal points; these points, (see ANTIPODAL_SIGMA),
+    and coincident points for which the azimuth is undefined, are solved individually by geographiclib so
+    that all results are within the tolerances.
+
+    NumPy is an optional dependency, the methods in this class raise an ImportError if NumPy is
+    not installed, see is_available()."""
+
+    A: float = Utils.geode.a
+    """The WGS84 semi-major axis in meters"""
+
+    F: float = Utils.geode.f
+    """The WGS84 flattening"""
+
+    B: float = A * (1.0 - F)
+    """The WGS84 semi-minor axis in meters"""
+
+    MAX_ITERATIONS: int = 200
+    """The maximum number of iterations before an element is considered not to converge"""
+
+    CONVERGENCE: float = 1e-12
+    """The change in radians below which an iteration has converged"""
+
+    ANTIPODAL_SIGMA: float = 179.5
+    """The angular distance in degrees above which points are nearly antipodal; Vincenty's inverse iteration
+    converges for some of these points but the azimuth is not within AZIMUTH_TOLERANCE"""
+
+    DISTANCE_TOLERANCE: float = 1e-3
+    """The maximum difference in meters between a distance calculated by this class and geographiclib"""
+
+    AZIMUTH_TOLERANCE: float = 1e-7
+    """The maximum difference in degrees between an azimuth calculated by this class and geographiclib"""
+
+    POSITION_TOLERANCE: float = 1e-8
+    """The maximum difference in degrees between a projected latitude or longitude calculated by
+    this class and geographiclib"""
+
+    @staticmethod
+    def is_available():
+        # type: () -> bool
+        """Checks if NumPy is installed and the vectorised calculations can be used.
+
+        :return: True if NumPy is installed, False otherwise
+        """
+        return numpy is not None
+
+    @staticmethod
+    def check_available():
+        # type: () -> None
+        """Raises an ImportError if NumPy is not installed.
+
+        :return: None
+        """
+        if numpy is None:
+            raise ImportError("The vectorised geodesy calculations require NumPy to be installed")
+
+    @staticmethod
+    def inverse(latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> (numpy.ndarray, numpy.ndarray)
+        """Calculates the azimuth and distance from each point 1 to the corresponding point 2,
+        (see Utils.get_bearing_distance_between_points()).
+
+        :param latitude_1: The latitudes of the first points in degrees;
+        :param longitude_1: The longitudes of the first points in degrees;
+        :param latitude_2: The latitudes of the second points in degrees;
+        :param longitude_2: The longitudes of the second points in degrees;
+        :return: A tuple of two arrays, the azimuths in degrees from point 1 to point 2 in the
+                 range -180 to 180 and the distances in meters
+        """
+        VectorGeodesy.check_available()
+        latitude_1 = numpy.asarray(latitude_1, dtype=numpy.float64)
+        longitude_1 = numpy.asarray(longitude_1, dtype=numpy.float64)
+        latitude_2 = numpy.asarray(latitude_2, dtype=numpy.float64)
+        longitude_2 = numpy.asarray(longitude_2, dtype=numpy.float64)
+        a = VectorGeodesy.A
+        b = VectorGeodesy.B
+        f = VectorGeodesy.F
+
+        delta_longitude = numpy.radians(numpy.remainder(longitude_2 - longitude_1 + 180.0, 360.0) - 180.0)
+        u_1 = numpy.arctan((1.0 - f) * numpy.tan(numpy.radians(latitude_1)))
+        u_2 = numpy.arctan((1.0 - f) * numpy.tan(numpy.radians(latitude_2)))
+        sin_u1 = numpy.sin(u_1)
+        cos_u1 = numpy.cos(u_1)
+        sin_u2 = numpy.sin(u_2)
+        cos_u2 = numpy.cos(u_2)
+
+        lam = delta_longitude
+        change = numpy.full(lam.shape, numpy.inf)
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            for _ in range(VectorGeodesy.MAX_ITERATIONS):
+                sin_lam = numpy.sin(lam)
+                cos_lam = numpy.cos(lam)
+                sin_sigma = numpy.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+                cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+                sigma = numpy.arctan2(sin_sigma, cos_sigma)
+                sin_alpha = numpy.where(sin_sigma == 0.0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+                cos2_alpha = 1.0 - sin_alpha * sin_alpha
+                # Points on the equator have cos2_alpha of zero
+                cos_2sigma_m = numpy.where(cos2_alpha == 0.0, 0.0, cos_sigma - 2.0 * sin_u1 * sin_u2 / cos2_alpha)
+                c = f / 16.0 * cos2_alpha * (4.0 + f * (4.0 - 3.0 * cos2_alpha))
+                next_lam = delta_longitude + (1.0 - c) * f * sin_alpha * (
+                    sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (2.0 * cos_2sigma_m * cos_2sigma_m - 1.0)))
+                change = numpy.abs(next_lam - lam)
+                lam = next_lam
+                if not numpy.any(change > VectorGeodesy.CONVERGENCE):
+                    break
+
+            u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+            big_a = 1.0 + u_sq / 16384.0 * (4096.0 + u_sq * (-768.0 + u_sq * (320.0 - 175.0 * u_sq)))
+            big_b = u_sq / 1024.0 * (256.0 + u_sq * (-128.0 + u_sq * (74.0 - 47.0 * u_sq)))
+            delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4.0 * (
+                cos_sigma * (2.0 * cos_2sigma_m * cos_2sigma_m - 1.0) - big_b / 6.0 * cos_2sigma_m *
+                (4.0 * sin_sigma * sin_sigma - 3.0) * (4.0 * cos_2sigma_m * cos_2sigma_m - 3.0)))
+            distance = b * big_a * (sigma - delta_sigma)
+            azimuth = numpy.degrees(numpy.arctan2(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam))
+
+        # Solve the points that did not converge, are nearly antipodal or have an undefined azimuth individually
+        unsolved = numpy.flatnonzero(~(change <= VectorGeodesy.CONVERGENCE) | (sin_sigma == 0.0) |
+                                     ~(sigma <= numpy.radians(VectorGeodesy.ANTIPODAL_SIGMA)) |
+                                     ~numpy.isfinite(distance) | ~numpy.isfinite(azimuth))
+        for idx in unsolved:
+            azimuth[idx], distance[idx] = Utils().get_bearing_distance_between_points(
+                float(latitude_1[idx]), float(longitude_1[idx]), float(latitude_2[idx]), float(longitude_2[idx]))
+        return azimuth, distance
+
+    @staticmethod
+    def direct(latitude, longitude, azimuth, distance):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> (numpy.ndarray, numpy.ndarray)
+        """Calculates the points projected from each point along an azimuth at a distance,
+        (see Utils.get_bearing_distance_projected_point()).
+
+        :param latitude: The latitudes of the points in degrees;
+        :param longitude: The longitudes of the points in degrees;
+        :param azimuth: The azimuths in degrees along which the points are projected;
+        :param distance: The distances in meters the points are projected;
+        :return: A tuple of two arrays, the latitudes and longitudes of the projected points in
+                 degrees, longitudes in the range -180 to 180
+        """
+        VectorGeodesy.check_available()
+        latitude = numpy.asarray(latitude, dtype=numpy.float64)
+        longitude = numpy.asarray(longitude, dtype=numpy.float64)
+        azimuth = numpy.asarray(azimuth, dtype=numpy.float64)
+        distance = numpy.asarray(distance, dtype=numpy.float64)
+        a = VectorGeodesy.A
+        b = VectorGeodesy.B
+        f = VectorGeodesy.F
+
+        alpha_1 = numpy.radians(azimuth)
+        sin_alpha1 = numpy.sin(alpha_1)
+        cos_alpha1 = numpy.cos(alpha_1)
+        u_1 = numpy.arctan((1.0 - f) * numpy.tan(numpy.radians(latitude)))
+        sin_u1 = numpy.sin(u_1)
+        cos_u1 = numpy.cos(u_1)
+        sigma_1 = numpy.arctan2(numpy.tan(u_1), cos_alpha1)
+        sin_alpha = cos_u1 * sin_alpha1
+        cos2_alpha = 1.0 - sin_alpha * sin_alpha
+        u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+        big_a = 1.0 + u_sq / 16384.0 * (4096.0 + u_sq * (-768.0 + u_sq * (320.0 - 175.0 * u_sq)))
+        big_b = u_sq / 1024.0 * (256.0 + u_sq * (-128.0 + u_sq * (74.0 - 47.0 * u_sq)))
+
+        sigma = distance / (b * big_a)
+        for _ in range(VectorGeodesy.MAX_ITERATIONS):
+            cos_2sigma_m = numpy.cos(2.0 * sigma_1 + sigma)
+            sin_sigma = numpy.sin(sigma)
+            cos_sigma = numpy.cos(sigma)
+            delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4.0 * (
+                cos_sigma * (2.0 * cos_2sigma_m * cos_2sigma_m - 1.0) - big_b / 6.0 * cos_2sigma_m *
+                (4.0 * sin_sigma * sin_sigma - 3.0) * (4.0 * cos_2sigma_m * cos_2sigma_m - 3.0)))
+            next_sigma = distance / (b * big_a) + delta_sigma
+            converged = not numpy.any(numpy.abs(next_sigma - sigma) > VectorGeodesy.CONVERGENCE)
+            sigma = next_sigma
+            if converged:
+                break
+
+        cos_2sigma_m = numpy.cos(2.0 * sigma_1 + sigma)
+        sin_sigma = numpy.sin(sigma)
+        cos_sigma = numpy.cos(sigma)
+        tmp = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+        latitude_2 = numpy.arctan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                                   (1.0 - f) * numpy.hypot(sin_alpha, tmp))
+        lam = numpy.arctan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+        c = f / 16.0 * cos2_alpha * (4.0 + f * (4.0 - 3.0 * cos2_alpha))
+        delta_longitude = lam - (1.0 - c) * f * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (2.0 * cos_2sigma_m * cos_2sigma_m - 1.0)))
+        longitude_2 = numpy.remainder(longitude + numpy.degrees(delta_longitude) + 180.0, 360.0) - 180.0
+        return numpy.degrees(latitude_2), longitude_2
+
+
+class GeodesyBatch:
+    """This class collects the bearing / distance calculations requested by the field 15 parser
+    when parsing in deferred geodesy mode, (see ParseMessage.set_geodesy_batch()), and performs them
+    together for all the routes parsed, typically thousands of messages, in a single call to compute().
+
+    Two types of calculation are collected:
+        - Projections: A point given by a point / bearing / distance has its latitude / longitude
+          calculated from the point latitude / longitude;
+        - Azimuth / distance: The bearing and distance from a point to the next point with a valid
+          latitude / longitude, stored on the first point.
+    The projections are calculated first, the azimuth / distance calculations then use the projected
+    positions. Until compute() is called the extracted route records of points given by a bearing /
+    distance contain the position of the point the bearing / distance relate to and no point has a
+    bearing / distance assigned.
+
+    The calculations are vectorised with NumPy if installed, (see VectorGeodesy), otherwise each
+    calculation is performed individually by geographiclib. The results are the same as parsing
+    without deferring the calculations to within the VectorGeodesy tolerances.
+
+    An instance is not thread safe, use one instance per thread."""
+
+    projections: list = None
+    """A list of tuples containing a record, bearing in degrees and distance in meters"""
+
+    azimuth_distances: dict = None
+    """Tuples containing the records from / to which the azimuth and distance is calculated, keyed on
+    the identity of the 'from' record; a later request for the same 'from' record replaces an earlier one"""
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor creating an empty batch.
+
+        :return: None
+        """
+        self.projections = []
+        self.azimuth_distances = {}
+
+    def add_projection(self, record, bearing, distance):
+        # type: (ExtractedRouteRecord, float, float) -> None
+        """Adds a projection of a point along a bearing and distance; the point is projected from the
+        latitude / longitude the record contains when compute() is called.
+
+        :param record: The extracted route record of the point to project;
+        :param bearing: The bearing in degrees;
+        :param distance: The distance in meters;
+        :return: None
+        """
+        self.projections.append((record, bearing, distance))
+
+    def add_azimuth_distance(self, point_1, point_2):
+        # type: (ExtractedRouteRecord, ExtractedRouteRecord) -> None
+        """Adds a calculation of the azimuth and distance from point_1 to point_2 to be set on point_1.
+
+        :param point_1: The point that will have the azimuth and distance set;
+        :param point_2: The point the azimuth and distance are calculated to;
+        :return: None
+        """
+        self.azimuth_distances[id(point_1)] = (point_1, point_2)
+
+    def get_number_of_projections(self):
+        # type: () -> int
+        """Gets the number of projections waiting to be calculated
+        :return: The number of projections"""
+        return len(self.projections)
+
+    def get_number_of_azimuth_distances(self):
+        # type: () -> int
+        """Gets the number of azimuth / distance calculations waiting to be calculated
+        :return: The number of azimuth / distance calculations"""
+        return len(self.azimuth_distances)
+
+    def compute(self):
+        # type: () -> int
+        """Performs all the calculations collected, writing the results into the extracted route
+        records, and empties the batch.
+
+        :return: The number of calculations performed
+        """
+        projections = self.projections
+        pairs = list(self.azimuth_distances.values())
+        self.projections = []
+        self.azimuth_distances = {}
+
+        if len(projections) > 0:
+            if numpy is not None:
+                latitudes, longitudes = VectorGeodesy.direct(
+                    [projection[0].get_latitude() for projection in projections],
+                    [projection[0].get_longitude() for projection in projections],
+                    [projection[1] for projection in projections],
+                    [projection[2] for projection in projections])
+                for record, latitude, longitude in zip([projection[0] for projection in projections],
+                                                       latitudes.tolist(), longitudes.tolist()):
+                    record.set_latitude(latitude)
+                    record.set_longitude(longitude)
+            else:
+                for record, bearing, distance in projections:
+                    result = Utils().get_bearing_distance_projected_point(
+                        record.get_latitude(), record.get_longitude(), bearing, distance)
+                    record.set_latitude(result[0])
+                    record.set_longitude(result[1])
+
+        if len(pairs) > 0:
+            if numpy is not None:
+                azimuths, distances = VectorGeodesy.inverse(
+                    [pair[0].get_latitude() for pair in pairs], [pair[0].get_longitude() for pair in pairs],
+                    [pair[1].get_latitude() for pair in pairs], [pair[1].get_longitude() for pair in pairs])
+                for pair, azimuth, distance in zip(pairs, azimuths.tolist(), distances.tolist()):
+                    pair[0].set_bearing(azimuth)
+                    pair[0].set_distance(distance)
+            else:
+                for point_1, point_2 in pairs:
+                    azimuth_distance = Utils().get_bearing_distance_between_points(
+                        point_1.get_latitude(), point_1.get_longitude(),
+                        point_2.get_latitude(), point_2.get_longitude())
+                    point_1.set_bearing(azimuth_distance[0])
+                    point_1.set_distance(azimuth_distance[1])
+        return len(projections) + len(pairs)
@@ -0,0 +1,109 @@
+import math
+from abc import ABC, abstractmethod
+
+from Utilities.Utils import Utils
+
+
+class GeodesyBackend(ABC):
+    """This class defines the interface of the geodesy calculations used by the field 15 parser to
+    calculate the bearing / distance between points and the position of point / bearing / distance
+    points, (see ParseMessage.set_geodesy_backend()). The calculations are selected per parser
+    instance by setting an instance of one of these subclasses:
+        - EllipsoidalGeodesy: The default, geodesics on the WGS84 ellipsoid calculated by geographiclib;
+        - SphericalGeodesy: Great circles on a sphere, much faster but less accurate.
+
+    A backend holds no state and can be shared by several parsers and threads. A backend must implement
+    both calculations, a subclass missing one of them cannot be instantiated."""
+
+    @abstractmethod
+    def get_bearing_distance_between_points(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> []
+        """Calculates the bearing and distance from point 1 to point 2.
+
+        :param latitude_1: The latitude of the first point in degrees;
+        :param longitude_1: The longitude of the first point in degrees;
+        :param latitude_2: The latitude of the second point in degrees;
+        :param longitude_2: The longitude of the second point in degrees;
+        :return: A list containing the azimuth in degrees from point 1 to point 2 and the distance
+                 in meters between point 1 and point 2
+        """
+
+    @abstractmethod
+    def get_bearing_distance_projected_point(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> []
+        """Calculates the point projected from a point along a bearing at a distance.
+
+        :param latitude: The latitude of the point in degrees;
+        :param longitude: The longitude of the point in degrees;
+        :param bearing: The bearing in degrees along which the point is projected;
+        :param distance: The distance in meters the point is projected;
+        :return: A list containing the latitude and longitude in degrees of the projected point
+        """
+
+
+class EllipsoidalGeodesy(GeodesyBackend):
+    """The default geodesy backend calculating geodesics on the WGS84 ellipsoid with geographiclib,
+    (see Utils); the results are accurate to a few nanometers."""
+
+    utils: Utils = Utils()
+    """The utilities performing the geographiclib calculations"""
+
+    def get_bearing_distance_between_points(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> []
+        return self.utils.get_bearing_distance_between_points(latitude_1, longitude_1, latitude_2, longitude_2)
+
+    def get_bearing_distance_projected_point(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> []
+        return self.utils.get_bearing_distance_projected_point(latitude, longitude, bearing, distance)
+
+
+class SphericalGeodesy(GeodesyBackend):
+    """A fast geodesy backend calculating great circles on a sphere with the WGS84 mean radius, suitable
+    when ellipsoidal precision is not needed, e.g. for display or approximate sector entry.
+
+    Compared with EllipsoidalGeodesy the maximum errors are:
+        - Distance: MAXIMUM_DISTANCE_ERROR times the distance, (about 5.6 km over 1000 km);
+        - Bearing: MAXIMUM_BEARING_ERROR degrees for points up to MAXIMUM_BEARING_DISTANCE meters
+          apart; the bearing between nearly antipodal points is not defined by the approximation;
+        - Projected point: MAXIMUM_DISTANCE_ERROR times the distance projected."""
+
+    EARTH_RADIUS: float = 6371008.8
+    """The mean radius of the WGS84 ellipsoid in meters"""
+
+    MAXIMUM_DISTANCE_ERROR: float = 0.0056
+    """The maximum distance error as a fraction of the distance"""
+
+    MAXIMUM_BEARING_ERROR: float = 0.2
+    """The maximum bearing error in degrees, (approximately the WGS84 flattening in degrees)"""
+
+    MAXIMUM_BEARING_DISTANCE: float = 10000000.0
+    """The distance in meters up to which the bearing error does not exceed MAXIMUM_BEARING_ERROR"""
+
+    def get_bearing_distance_between_points(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> []
+        phi_1 = math.radians(latitude_1)
+        phi_2 = math.radians(latitude_2)
+        delta_lambda = math.radians(longitude_2 - longitude_1)
+        cos_phi_1 = math.cos(phi_1)
+        cos_phi_2 = math.cos(phi_2)
+        # Haversine formula
+        haversine = math.sin((phi_2 - phi_1) * 0.5) ** 2 + cos_phi_1 * cos_phi_2 * math.sin(delta_lambda * 0.5) ** 2
+        distance = 2.0 * self.EARTH_RADIUS * math.asin(min(1.0, math.sqrt(haversine)))
+        bearing = math.degrees(math.atan2(
+            math.sin(delta_lambda) * cos_phi_2,
+            cos_phi_1 * math.sin(phi_2) - math.sin(phi_1) * cos_phi_2 * math.cos(delta_lambda)))
+        return [bearing, distance]
+
+    def get_bearing_distance_projected_point(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> []
+        phi_1 = math.radians(latitude)
+        theta = math.radians(bearing)
+        delta = distance / self.EARTH_RADIUS
+        sin_phi_1 = math.sin(phi_1)
+        cos_phi_1 = math.cos(phi_1)
+        sin_delta = math.sin(delta)
+        cos_delta = math.cos(delta)
+        sin_phi_2 = max(-1.0, min(1.0, sin_phi_1 * cos_delta + cos_phi_1 * sin_delta * math.cos(theta)))
+        delta_lambda = math.atan2(math.sin(theta) * sin_delta * cos_phi_1, cos_delta - sin_phi_1 * sin_phi_2)
+        longitude_2 = (longitude + math.degrees(delta_lambda) + 180.0) % 360.0 - 180.0
+        return [math.degrees(math.asin(sin_phi_2)), longitude_2]
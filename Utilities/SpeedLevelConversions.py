@@ -0,0 +1,101 @@
+from Utilities.Constants import Constants
+from Utilities.Utils import Utils
+
+
+class SpeedLevelConversions:
+    """This class converts field 15 speeds and levels to SI units, speeds in meters / second and
+    levels in meters, both rounded to the nearest integer.
+
+    The speeds and levels that can occur in field 15 form a small finite set (e.g. N0000 to N9999,
+    F000 to F999), each distinct speed or level is converted once and the result stored in a table
+    keyed on the speed or level string, subsequent conversions are a single dictionary lookup. A Mach
+    speed depends on the altitude it is flown at, Mach speeds are stored keyed on the Mach speed and
+    altitude; the speed of sound is constant above Constants.CONSTANT_TEMP_ALTITUDE, all altitudes
+    above it share the same table entries.
+
+    The tables are shared by all instances of the field 15 parser; the conversions give exactly the
+    same results as converting each speed and level individually."""
+
+    SPEED_SI: dict = {}
+    """Converted speeds keyed on the speed string, e.g. 'N0450', Mach speeds are not stored here"""
+
+    MACH_SPEED_SI: dict = {}
+    """Converted Mach speeds keyed on a tuple of the speed string and altitude in meters"""
+
+    LEVEL_SI: dict = {}
+    """Converted levels keyed on the level string, e.g. 'F350', the value is a tuple containing the
+    level in meters and a boolean set False for a flight level that is not a multiple of 5"""
+
+    @staticmethod
+    def speed_to_si(speed_string, altitude_si):
+        # type: (str, float) -> int
+        """Converts a speed to meters / second rounded to the nearest integer:
+            - 'K' Kilometres per hour
+            - 'N' Knots
+            - 'M' True Mach number, converted at the speed of sound at the altitude given
+
+        :param speed_string: A speed as a string extracted from field 15, e.g. N0450;
+        :param altitude_si: The altitude in meters used to convert a Mach number;
+        :return: The speed in meters / second
+        """
+        speed_si = SpeedLevelConversions.SPEED_SI.get(speed_string)
+        if speed_si is not None:
+            return speed_si
+
+        if speed_string[0:1] == "M":
+            # The speed of sound does not change above the constant temperature altitude
+            if altitude_si > Constants.CONSTANT_TEMP_ALTITUDE:
+                altitude_si = Constants.CONSTANT_TEMP_ALTITUDE
+            key = (speed_string, altitude_si)
+            speed_si = SpeedLevelConversions.MACH_SPEED_SI.get(key)
+            if speed_si is None:
+                speed_si = int(Utils.mach_to_ms_speed(int(speed_string[1:]), altitude_si) + 0.5)
+                SpeedLevelConversions.MACH_SPEED_SI[key] = speed_si
+            return speed_si
+
+        speed = int(speed_string[1:])
+        match speed_string[0:1]:
+            case "K":
+                # Kilometers / hour
+                speed = speed * Constants.KMH_TO_METERS_SECOND
+            case "N":
+                # Knots
+                speed = speed * Constants.KNOTS_TO_METERS_SECOND
+        speed_si = int(speed + 0.5)
+        SpeedLevelConversions.SPEED_SI[speed_string] = speed_si
+        return speed_si
+
+    @staticmethod
+    def level_to_si(level_string):
+        # type: (str) -> (int, bool)
+        """Converts a level to meters rounded to the nearest integer:
+            - 'F' Flight level in hundreds of feet
+            - 'S' Standard metric level in tens of metres
+            - 'A' Altitude in hundreds of feet
+            - 'M' Altitude in tens of metres
+
+        :param level_string: A level as a string extracted from field 15, e.g. F350;
+        :return: A tuple containing the level in meters and a boolean that is False for a
+                 flight level that is not a multiple of 5, True otherwise
+        """
+        level_si = SpeedLevelConversions.LEVEL_SI.get(level_string)
+        if level_si is not None:
+            return level_si
+
+        level = int(level_string[1:])
+        valid = True
+        match level_string[0:1]:
+            case "A":
+                # A = Altitude in hundreds of feet, e.g. A045 = 4,500 feet (1,372 Meters)
+                level = (level * 100) * Constants.FEET_TO_METERS
+            case "F":
+                # F = Flight Level in hundreds of feet, e.g. F350 = 35,000 feet (10,668 Meters)
+                valid = level % 5 == 0
+                level = (level * 100) * Constants.FEET_TO_METERS
+            case "S" | "M":
+                # S = Flight Level in tens of meters, e.g. S1130 = 11,300 meters
+                # M = Altitude in tens of meters, e.g. M0840 = 8,400 meters
+                level = level * 10
+        level_si = (int(level + 0.5), valid)
+        SpeedLevelConversions.LEVEL_SI[level_string] = level_si
+        return level_si